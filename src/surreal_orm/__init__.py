@@ -9,16 +9,24 @@ This package provides:
 - CLI tools for schema management
 """
 
-# Re-export LiveAction and TableNotFoundError from SDK for convenience
-from surreal_sdk.exceptions import TableNotFoundError
+# Re-export LiveAction, AdaptiveLimiter, query_priority and SDK errors for convenience
+from surreal_sdk.connection.lanes import query_priority
+from surreal_sdk.connection.limiter import AdaptiveLimiter
+from surreal_sdk.exceptions import OverloadedError, QueryTimeoutError, TableNotFoundError
 from surreal_sdk.streaming.live_select import LiveAction
 
+from .accumulator import Accumulator
 from .aggregations import Aggregation, Avg, Count, Max, Min, Sum
 from .auth import AuthenticatedUserMixin, AuthResult
+from .batch import batch
+from .buffered_writer import BufferedWriter
 from .cache import QueryCache
+from .cache_backends import CacheBackend, CacheInvalidation, LocalCacheBackend
 from .connection_config import ConnectionConfig
 from .connection_manager import SurrealDBConnectionManager
+from .deadline import query_deadline
 from .debug import QueryLogger
+from .disk_cache import DiskCacheTier
 from .enum import OrderBy
 from .fields import (
     Computed,
@@ -41,6 +49,8 @@ from .fields import (
     is_relation_field,
 )
 from .geo import GeoDistance
+from .hedging import HedgedReads
+from .identity_map import IdentityMap
 from .introspection import generate_models_from_db, schema_diff
 from .live import ChangeModelStream, LiveModelStream, ModelChangeEvent
 from .migrations.operations import (
@@ -63,7 +73,9 @@ from .model_base import (
 from .prefetch import Prefetch
 from .q import Q
 from .query_set import QuerySet
+from .record_cache import RecordCache
 from .search import SearchHighlight, SearchScore
+from .session import Session
 from .signals import (
     # Around signals (generator-based middleware pattern)
     AroundSignal,
@@ -94,16 +106,26 @@ __all__ = [
     # Connection
     "ConnectionConfig",
     "SurrealDBConnectionManager",
+    "HedgedReads",
+    "AdaptiveLimiter",
+    "OverloadedError",
+    "query_priority",
+    "query_deadline",
+    "QueryTimeoutError",
     # Models
     "BaseSurrealModel",
     "SurrealConfigDict",
     "SurrealDbError",
     "TableNotFoundError",
     "get_registered_models",
+    "Session",
+    "BufferedWriter",
+    "Accumulator",
     # Query
     "QuerySet",
     "OrderBy",
     "Q",
+    "batch",
     # Aggregations
     "Aggregation",
     "Count",
@@ -165,6 +187,12 @@ __all__ = [
     "Subquery",
     # Cache
     "QueryCache",
+    "CacheBackend",
+    "CacheInvalidation",
+    "LocalCacheBackend",
+    "DiskCacheTier",
+    "RecordCache",
+    "IdentityMap",
     # Prefetch
     "Prefetch",
     # Search
@@ -0,0 +1,239 @@
+"""
+Write-combining layer for hot counters and atomic array updates.
+
+``atomic_append()``, ``atomic_set_add()``, ``atomic_remove()`` and counter
+updates such as ``UPDATE post:1 SET views += 1`` cost one request each. On hot
+records (views, likes, scores) most of those requests only repeat the previous
+one. An :class:`Accumulator` merges them in memory instead: increments of the
+same field are summed, the set-adds/appends/removes of a record are sent as the
+assignments of one UPDATE, and everything buffered is written at most
+``max_delay_ms`` later in a single request. Records whose combined increments are identical
+share one ``UPDATE [a, b, ...] SET views += $n`` statement.
+
+Example:
+    ```python
+    from surreal_orm import Accumulator
+
+    async with Accumulator(Post, max_delay_ms=200) as counters:
+        counters.increment(post_id, "views")          # no request
+        counters.increment(post_id, "likes", 2)
+        counters.set_add(post_id, "viewers", user_id)
+    # flushed on exit, even if the block raised
+    ```
+
+Buffered operations are lost if the process dies before a flush, and a
+failing background flush is logged and dropped; call :meth:`Accumulator.flush`
+to write (and see errors) synchronously.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Literal
+
+from .connection_manager import SurrealDBConnectionManager
+from .debug import _elapsed_ms, _log_query, _start_timer
+from .model_base import SurrealDbError
+from .utils import format_thing, parse_record_id, validate_identifier
+
+if TYPE_CHECKING:
+    from .model_base import BaseSurrealModel
+
+logger = logging.getLogger(__name__)
+
+_ArrayOp = Literal["append", "set_add", "remove"]
+
+# SET assignment per array operation, the same ones atomic_append(),
+# atomic_set_add() and atomic_remove() send; ``{field}`` and ``{value}`` are
+# filled in per buffered value.
+_ARRAY_ASSIGNMENTS: dict[str, str] = {
+    "append": "{field} = array::append({field}, {value})",
+    "set_add": "{field} += {value}",
+    "remove": "{field} -= {value}",
+}
+
+
+@dataclass
+class _FieldOps:
+    """Pending operations on one field of one record."""
+
+    increment: int | float | None = None
+    segments: list[tuple[_ArrayOp, list[Any]]] = field(default_factory=list)
+
+
+class Accumulator:
+    """
+    Merge counter increments and array updates per record and write them in batches.
+
+    Args:
+        model: The model class whose records are updated.
+        max_delay_ms: Longest time an operation stays buffered before it is
+            written (bounded staleness).
+        max_records: Number of distinct buffered records that triggers an
+            immediate flush.
+    """
+
+    def __init__(self, model: type[BaseSurrealModel], *, max_delay_ms: float = 100, max_records: int = 1000) -> None:
+        self.model = model
+        self.max_delay = max_delay_ms / 1000
+        self.max_records = max_records
+        self._ops: dict[str, dict[str, _FieldOps]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> Accumulator:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of records with buffered operations."""
+        return len(self._ops)
+
+    def increment(self, record_id: str, field: str, amount: int | float = 1) -> None:
+        """Add ``amount`` to a numeric field (``SET field += amount``)."""
+        ops = self._field_ops(record_id, field)
+        if ops.segments:
+            raise ValueError(f"Field {field!r} has buffered array operations; it cannot also be incremented.")
+        ops.increment = (ops.increment or 0) + amount
+        self._schedule()
+
+    def append(self, record_id: str, field: str, value: Any) -> None:
+        """Append ``value`` to an array field (duplicates allowed), like ``atomic_append()``."""
+        self._add_array_op(record_id, field, "append", value)
+
+    def set_add(self, record_id: str, field: str, value: Any) -> None:
+        """Add ``value`` to an array field unless present, like ``atomic_set_add()``."""
+        self._add_array_op(record_id, field, "set_add", value)
+
+    def remove(self, record_id: str, field: str, value: Any) -> None:
+        """Remove every occurrence of ``value`` from an array field, like ``atomic_remove()``."""
+        self._add_array_op(record_id, field, "remove", value)
+
+    async def flush(self) -> None:
+        """
+        Write every buffered operation now and wait for in-flight flushes.
+
+        Raises:
+            SurrealDbError: If a statement fails.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        ops, self._ops = self._ops, {}
+        in_flight = list(self._tasks)
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        if ops:
+            await self._write(ops)
+
+    # ── Internal ─────────────────────────────────────────────────────────
+
+    def _field_ops(self, record_id: str, field: str) -> _FieldOps:
+        validate_identifier(field, "field name")
+        _, id_part = parse_record_id(str(record_id))
+        return self._ops.setdefault(id_part, {}).setdefault(field, _FieldOps())
+
+    def _add_array_op(self, record_id: str, field: str, kind: _ArrayOp, value: Any) -> None:
+        ops = self._field_ops(record_id, field)
+        if ops.increment is not None:
+            raise ValueError(f"Field {field!r} has a buffered increment; it cannot also take array operations.")
+        if ops.segments and ops.segments[-1][0] == kind:
+            values = ops.segments[-1][1]
+            if kind == "append" or value not in values:
+                values.append(value)
+        else:
+            ops.segments.append((kind, [value]))
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if len(self._ops) >= self.max_records:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        ops, self._ops = self._ops, {}
+        if ops:
+            task = asyncio.get_running_loop().create_task(self._write_logged(ops))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _write_logged(self, ops: dict[str, dict[str, _FieldOps]]) -> None:
+        try:
+            await self._write(ops)
+        except Exception as e:
+            logger.error(f"Accumulator flush for '{self.model.get_table_name()}' failed, {len(ops)} records dropped: {e}")
+
+    async def _write(self, ops: dict[str, dict[str, _FieldOps]]) -> None:
+        """Send the buffered operations as one request."""
+        table = self.model.get_table_name()
+
+        # Records with identical pure increments share one statement.
+        groups: dict[tuple[tuple[str, int | float], ...], list[str]] = {}
+        others: list[str] = []
+        for record_id, fields in ops.items():
+            if all(f.increment is not None for f in fields.values()):
+                key = tuple(sorted((name, f.increment or 0) for name, f in fields.items()))
+                groups.setdefault(key, []).append(record_id)
+            else:
+                others.append(record_id)
+
+        statements: list[str] = []
+        variables: dict[str, Any] = {}
+
+        def bind(value: Any) -> str:
+            name = f"_a{len(variables)}"
+            variables[name] = value
+            return f"${name}"
+
+        for increments, record_ids in groups.items():
+            things = ", ".join(format_thing(table, record_id) for record_id in record_ids)
+            target = things if len(record_ids) == 1 else f"[{things}]"
+            set_clause = ", ".join(f"{name} += {bind(amount)}" for name, amount in increments)
+            statements.append(f"UPDATE {target} SET {set_clause} RETURN NONE;")
+        for record_id in others:
+            parts: list[str] = []
+            for name, f in ops[record_id].items():
+                if f.increment is not None:
+                    parts.append(f"{name} += {bind(f.increment)}")
+                    continue
+                # One assignment per value, applied in order within the UPDATE.
+                for kind, values in f.segments:
+                    parts.extend(_ARRAY_ASSIGNMENTS[kind].format(field=name, value=bind(v)) for v in values)
+            statements.append(f"UPDATE {format_thing(table, record_id)} SET {', '.join(parts)} RETURN NONE;")
+
+        sql = "\n".join(statements)
+        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
+        start = _start_timer()
+        response = await client.query(sql, variables)
+        _log_query(sql, variables, _elapsed_ms(start))
+        self._invalidate_caches(list(ops))
+
+        errors = [str(result.result) for result in response.results if result.is_error]
+        if errors:
+            raise SurrealDbError(f"Accumulator flush failed: {'; '.join(errors)}")
+
+    def _invalidate_caches(self, record_ids: list[str]) -> None:
+        from .cache import QueryCache
+        from .record_cache import RecordCache
+
+        QueryCache.invalidate(self.model)
+        for record_id in record_ids:
+            RecordCache.invalidate(self.model, record_id)
+
+
+__all__ = ["Accumulator"]
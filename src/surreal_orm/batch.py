@@ -0,0 +1,297 @@
+"""
+Multi-query batching: run several QuerySets in a single round-trip.
+
+A dashboard that needs a page of records, a couple of counts and a sum would
+otherwise issue one ``client.query`` per call. :func:`batch` compiles every
+item into its SurrealQL statements, prefixes each item's variables so they
+cannot collide, sends all statements as one multi-statement request and splits
+the per-statement results back into per-item return values.
+
+Example:
+    ```python
+    from surreal_orm import batch
+
+    orders, paid, revenue = await batch(
+        Order.objects().filter(status="open").limit(20),
+        Order.objects().filter(status="paid").count(),
+        Order.objects().filter(status="paid").sum("amount"),
+    )
+    ```
+
+Items may be QuerySets (executed like :meth:`QuerySet.exec`) or *unawaited*
+calls to ``exec()``, ``first()``, ``count()``, ``sum()``, ``avg()``, ``min()``,
+``max()`` or ``aggregate()``. Items on different connections are grouped and sent
+concurrently, one request per connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import inspect
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from types import CodeType
+from typing import TYPE_CHECKING, Any
+
+from surreal_sdk.transaction import namespace_variables
+
+from .aggregations import Aggregation
+from .connection_manager import SurrealDBConnectionManager
+from .deadline import check_timeout, deadline_scope, with_timeout
+from .model_base import SurrealDbError, _statement_results
+from .subquery import Subquery
+from .utils import remove_quotes_for_variables
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: query_set imports from the package root,
+    # which imports this module.
+    from .query_set import QuerySet
+
+
+# QuerySet methods decorated with @_batchable, keyed by their code object.
+_BATCHABLE: dict[CodeType, str] = {}
+
+
+def _batchable[F: Callable[..., Coroutine[Any, Any, Any]]](method: F) -> F:
+    """
+    Register the QuerySet ``method`` so batch() can defer calls to it.
+
+    The method itself is returned unchanged, so ordinary calls cost nothing
+    extra: batch() recognises an unawaited call by its code object and reads
+    the queryset and arguments from the coroutine's not-yet-started frame.
+    """
+    _BATCHABLE[method.__code__] = method.__name__
+    return method
+
+
+@dataclass
+class _BatchItem:
+    """One compiled batch entry: its statements, variables and result parser."""
+
+    statements: list[str]
+    variables: dict[str, Any]
+    parse: Callable[[list[Any]], Awaitable[Any]]
+    connection: str
+    timeout: float | None = None
+    cache_key: str | None = None
+    cache_table: str = ""
+    cache_ttl: int | None = None
+    cache_stale_ttl: int | None = None
+    cache_jitter: float | None = None
+    result: Any = None
+    from_cache: bool = False
+
+
+def _unwrap(item: Any) -> tuple[QuerySet[Any], str, dict[str, Any]]:
+    """Resolve a batch argument into (queryset, method name, method arguments)."""
+    from .query_set import QuerySet
+
+    if isinstance(item, QuerySet):
+        return item, "exec", {}
+
+    if inspect.iscoroutine(item):
+        name = _BATCHABLE.get(item.cr_code)
+        if name is None:
+            item.close()
+            raise TypeError(
+                f"batch() cannot defer {item.__qualname__}(); supported QuerySet methods are: {', '.join(sorted(_BATCHABLE.values()))}"
+            )
+        frame = item.cr_frame
+        if frame is None or inspect.getcoroutinestate(item) != inspect.CORO_CREATED:
+            raise TypeError("batch() items must be unawaited QuerySet calls")
+        # Before it starts, a coroutine's frame holds exactly its bound arguments.
+        arguments = dict(frame.f_locals)
+        queryset = arguments.pop("self")
+        # The call is compiled and executed by batch() instead; discard the coroutine
+        # so it is not reported as "never awaited".
+        item.close()
+        return queryset, name, arguments
+
+    raise TypeError(f"batch() items must be QuerySets or unawaited QuerySet calls, got {type(item).__name__}")
+
+
+def _compile(item: Any) -> _BatchItem:
+    """Compile one batch argument into its statements and result parser."""
+    qs, name, arguments = _unwrap(item)
+    entry = _compile_call(qs, name, arguments)
+    entry.timeout = qs._timeout
+    return entry
+
+
+def _compile_call(qs: QuerySet[Any], name: str, arguments: dict[str, Any]) -> _BatchItem:
+    """Compile the ``name`` call on ``qs`` into its statements and result parser."""
+    from .query_set import QuerySet
+
+    connection = qs.model.get_connection_name()
+
+    if name == "count":
+        statements = [qs._compile_count_query()]
+        return _BatchItem(statements, qs._variables, _sync(qs._parse_count), connection)
+
+    if name == "aggregate":
+        aggregations = arguments["aggregations"]
+        statement = qs._compile_aggregate_query(aggregations)
+        entry = _BatchItem([statement], qs._variables, _sync(lambda r: QuerySet._parse_aggregate(aggregations, r)), connection)
+        entry.cache_key = qs._exec_cache_key(statement)
+        entry.cache_table = qs._model_table
+        entry.cache_ttl = qs._cache_ttl
+        entry.cache_stale_ttl = qs._cache_stale_ttl
+        entry.cache_jitter = qs._cache_jitter
+        return entry
+
+    if name in QuerySet._SCALAR_AGGREGATES:
+        statements = [qs._compile_scalar_aggregate(name, arguments["field"])]
+        return _BatchItem(statements, qs._variables, _sync(lambda r: QuerySet._parse_scalar_aggregate(name, r)), connection)
+
+    if name == "first":
+        # Compile from a copy: the caller's QuerySet keeps its own limit.
+        qs = copy.copy(qs)
+        qs._limit = 1
+
+    has_group_annotations = any(isinstance(a, (Aggregation, Subquery)) for a in qs._annotations.values())
+    if qs._annotations and has_group_annotations:
+        statements = qs._compile_annotate_statements()
+        return _BatchItem(statements, qs._variables, _sync(lambda r: r), connection)
+
+    statements = qs._compile_statements()
+    parse: Callable[[list[Any]], Awaitable[Any]] = qs._process_results
+    if name == "first":
+
+        async def parse_first(records: list[Any]) -> Any:
+            results = await qs._process_results(records)
+            if results:
+                return results[0]
+            raise qs.model.DoesNotExist("Query returned no results.")
+
+        parse = parse_first
+
+    entry = _BatchItem(statements, qs._variables, parse, connection)
+    if name == "exec":
+        entry.cache_key = qs._exec_cache_key(" ".join(statements))
+        entry.cache_table = qs._model_table
+        entry.cache_ttl = qs._cache_ttl
+        entry.cache_stale_ttl = qs._cache_stale_ttl
+        entry.cache_jitter = qs._cache_jitter
+    return entry
+
+
+def _sync(func: Callable[[list[Any]], Any]) -> Callable[[list[Any]], Awaitable[Any]]:
+    """Adapt a synchronous result parser to the async parser signature."""
+
+    async def parse(records: list[Any]) -> Any:
+        return func(records)
+
+    return parse
+
+
+async def _run_group(connection: str, entries: list[_BatchItem]) -> None:
+    """
+    Send the statements of ``entries`` as one request and parse each item's result.
+
+    The request runs under the tightest ``.timeout()`` of its items and the
+    current deadline; each item's last statement gets the matching
+    ``TIMEOUT`` clause.
+    """
+    from surreal_sdk.exceptions import TableNotFoundError
+
+    from .debug import _elapsed_ms, _log_query, _start_timer
+
+    timeouts = [entry.timeout for entry in entries if entry.timeout is not None]
+    async with deadline_scope(min(timeouts, default=None)):
+        sql_parts: list[str] = []
+        variables: dict[str, Any] = {}
+        for i, entry in enumerate(entries):
+            prefix = f"_b{i}_"
+            *prelude, last = entry.statements
+            for statement in [*prelude, with_timeout(last)]:
+                sql_parts.append(namespace_variables(remove_quotes_for_variables(statement), entry.variables, prefix))
+            for key, value in entry.variables.items():
+                variables[prefix + key] = value
+
+        client = await SurrealDBConnectionManager.get_read_client(connection)
+        sql = "\n".join(sql_parts)
+        start = _start_timer()
+        response = check_timeout(await client.query(sql, variables))
+        _log_query(sql, variables, _elapsed_ms(start))
+
+        results = _statement_results(response.results, len(sql_parts), False)
+        position = 0
+        for entry in entries:
+            statement_results = results[position : position + len(entry.statements)]
+            position += len(entry.statements)
+            for result in statement_results:
+                if not result.is_error:
+                    continue
+                if isinstance(result.result, str) and TableNotFoundError.is_table_not_found(result.result):
+                    raise TableNotFoundError(message=result.result, query=sql)
+                raise SurrealDbError(f"Batch query failed: {result.result}")
+            # The item's value is the result of its last statement (LET preludes return nothing).
+            entry.result = await entry.parse(statement_results[-1].records)
+
+
+async def batch(*items: QuerySet[Any] | Coroutine[Any, Any, Any]) -> list[Any]:
+    """
+    Execute several QuerySet operations in a single round-trip per connection.
+
+    Args:
+        *items: QuerySets, or unawaited ``exec()``/``first()``/``count()``/
+            ``sum()``/``avg()``/``min()``/``max()``/``aggregate()`` calls on QuerySets.
+
+    Returns:
+        list[Any]: One result per item, in order, typed as the corresponding
+        awaited call would return it.
+
+    Raises:
+        TypeError: If an item cannot be batched.
+        DoesNotExist: If a ``first()`` item matches no record.
+        TableNotFoundError: If an item queries a missing table.
+        SurrealDbError: If a statement of an item fails.
+        QueryTimeoutError: If the request exceeds an item's ``.timeout()``
+            or the current deadline.
+
+    Example:
+        ```python
+        users, total, oldest = await batch(
+            User.objects().filter(active=True).limit(10),
+            User.objects().count(),
+            User.objects().max("age"),
+        )
+        ```
+    """
+    entries: list[_BatchItem] = []
+    try:
+        for item in items:
+            entries.append(_compile(item))
+    finally:
+        # Close any coroutines left unprocessed after a compile error.
+        for item in items[len(entries) :]:
+            if inspect.iscoroutine(item):
+                item.close()
+
+    from .cache import QueryCache
+
+    pending: dict[str, list[_BatchItem]] = {}
+    for entry in entries:
+        if entry.cache_key is not None:
+            cached = QueryCache.get(entry.cache_key)
+            if cached is not None:
+                entry.result = cached
+                entry.from_cache = True
+                continue
+        pending.setdefault(entry.connection, []).append(entry)
+
+    await asyncio.gather(*(_run_group(name, group) for name, group in pending.items()))
+
+    for entry in entries:
+        if entry.cache_key is not None and not entry.from_cache:
+            QueryCache.set(
+                entry.cache_key,
+                entry.result,
+                entry.cache_table,
+                entry.cache_ttl,
+                stale_ttl=entry.cache_stale_ttl,
+                jitter=entry.cache_jitter,
+            )
+
+    return [entry.result for entry in entries]
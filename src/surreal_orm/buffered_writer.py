@@ -0,0 +1,345 @@
+"""
+Write-behind buffer that batches high-volume saves and upserts.
+
+A producer that calls ``save()`` from thousands of coroutines sends one request
+per call. A :class:`BufferedWriter` queues those writes instead and sends them
+in batches, when ``max_batch`` writes are waiting or ``max_delay_ms`` after the
+first one arrived:
+
+- records without an id are created with a single ``INSERT INTO table $rows``;
+- records with an id become ``UPSERT table:id SET ... RETURN NONE`` statements,
+  all sent in the same request.
+
+Repeated writes to the same record id while it is still buffered are collapsed
+into one statement (later field values win). A write carrying a
+:class:`~surreal_orm.SurrealFunc` expression is never merged into an earlier
+one, since expressions such as ``n + 1`` must run once per write. Every caller gets a future that
+resolves once its write is stored, or fails with that statement's error. When
+``max_pending`` writes are buffered, new writes wait for a batch to finish
+(backpressure). Closing the writer flushes everything still buffered.
+
+Example:
+    ```python
+    from surreal_orm import BufferedWriter
+
+    async with BufferedWriter(Reading, max_batch=500, max_delay_ms=20) as writer:
+        # from many coroutines:
+        await writer.save(Reading(sensor="s1", value=21.5))
+        await writer.upsert("s1", {"last_value": 21.5})
+    # flushed on exit
+    ```
+
+``post_save`` is sent for each written instance, so caches stay coherent;
+``pre_save``/``around_save`` are not, since the write happens later in a batch.
+Buffered upserts skip the "no record updated" check of ``save()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from surreal_sdk.transaction import namespace_variables
+
+from . import signals as model_signals
+from .connection_manager import SurrealDBConnectionManager
+from .debug import _elapsed_ms, _log_query, _start_timer
+from .model_base import SurrealDbError
+from .surreal_function import SurrealFunc
+from .utils import format_thing, parse_record_id, validate_identifier
+
+if TYPE_CHECKING:
+    from .model_base import BaseSurrealModel
+
+T = TypeVar("T", bound="BaseSurrealModel")
+
+
+@dataclass
+class _BufferedWrite:
+    """One buffered record write and everyone waiting on it."""
+
+    record_id: str | None
+    data: dict[str, Any]
+    instances: list[BaseSurrealModel] = field(default_factory=list)
+    snapshot: dict[str, Any] | None = None
+    created: bool = False
+    ok: bool = False
+    futures: list[asyncio.Future[None]] = field(default_factory=list)
+
+
+class BufferedWriter(Generic[T]):
+    """
+    Coalesce writes for one model into batched INSERT/UPSERT requests.
+
+    Args:
+        model: The model class whose records are written.
+        max_batch: Maximum number of records per request; a full batch is
+            sent immediately.
+        max_delay_ms: How long the first buffered write may wait for the
+            batch to fill up.
+        max_pending: Maximum number of buffered records before writers wait
+            (default: ``10 * max_batch``).
+    """
+
+    def __init__(
+        self,
+        model: type[T],
+        *,
+        max_batch: int = 500,
+        max_delay_ms: float = 50,
+        max_pending: int | None = None,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        self.model = model
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.max_pending = max(max_pending if max_pending is not None else 10 * max_batch, max_batch)
+
+        self._buffer: dict[Any, _BufferedWrite] = {}
+        self._keys = itertools.count()  # keys for records without an id
+        self._space = asyncio.Condition()
+        self._timer: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flushing = 0  # callers of flush() waiting for an empty buffer
+        self._closed = False
+
+    async def __aenter__(self) -> BufferedWriter[T]:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered records not yet sent."""
+        return len(self._buffer)
+
+    async def submit(self, instance: T) -> asyncio.Future[None]:
+        """
+        Buffer a save of ``instance`` and return its completion future.
+
+        The fields written are those ``save()`` would send, taken now. Waits
+        while the buffer is full.
+        """
+        if not isinstance(instance, self.model):
+            raise TypeError(f"BufferedWriter for {self.model.__name__} cannot write {type(instance).__name__}.")
+        instance._check_not_view()
+        data = instance._build_save_data()
+        if instance._db_persisted and not data and instance._db_snapshot is not None:
+            # Unchanged persisted record: nothing to write, as in save().
+            done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            done.set_result(None)
+            return done
+        snapshot = instance._dump_persistable() if instance.tracks_changes() else None
+        return await self._enqueue(instance.get_id(), data, instance, snapshot)
+
+    async def submit_upsert(self, record_id: str, data: dict[str, Any]) -> asyncio.Future[None]:
+        """
+        Buffer an upsert of ``data`` into ``record_id`` and return its completion future.
+
+        ``record_id`` may be bare (``"abc"``) or full (``"table:abc"``). Values
+        may be :class:`~surreal_orm.SurrealFunc` expressions.
+
+        Raises:
+            ValueError: If a key of ``data`` is not a valid field name.
+        """
+        for field_name in data:
+            validate_identifier(field_name, "field name")
+        _, id_part = parse_record_id(str(record_id))
+        return await self._enqueue(id_part, dict(data), None, None)
+
+    async def save(self, instance: T) -> T:
+        """Buffer a save of ``instance`` and wait until it is written."""
+        await (await self.submit(instance))
+        return instance
+
+    async def upsert(self, record_id: str, data: dict[str, Any]) -> None:
+        """Buffer an upsert into ``record_id`` and wait until it is written."""
+        await (await self.submit_upsert(record_id, data))
+
+    async def flush(self) -> None:
+        """Send every buffered write and wait until all batches are done."""
+        self._flushing += 1
+        try:
+            while self._buffer or self._flush_task is not None:
+                self._start_flush()
+                if self._flush_task is not None:
+                    await asyncio.shield(self._flush_task)
+        finally:
+            self._flushing -= 1
+
+    async def close(self) -> None:
+        """Stop accepting writes and flush the buffer."""
+        self._closed = True
+        await self.flush()
+
+    # ── Internal ─────────────────────────────────────────────────────────
+
+    async def _enqueue(
+        self,
+        record_id: str | None,
+        data: dict[str, Any],
+        instance: BaseSurrealModel | None,
+        snapshot: dict[str, Any] | None,
+    ) -> asyncio.Future[None]:
+        if self._closed:
+            raise SurrealDbError("BufferedWriter is closed.")
+        key: Any = record_id if record_id is not None else ("new", next(self._keys))
+        # Expressions are not idempotent: they get a statement of their own.
+        separate = any(isinstance(value, SurrealFunc) for value in data.values())
+
+        if (separate or key not in self._buffer) and len(self._buffer) >= self.max_pending:
+            async with self._space:
+                await self._space.wait_for(
+                    lambda: (not separate and key in self._buffer) or len(self._buffer) < self.max_pending
+                )
+            if self._closed:
+                raise SurrealDbError("BufferedWriter is closed.")
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if separate and key in self._buffer:
+            self._seal(key)
+        write = self._buffer.get(key)
+        if write is None:
+            write = self._buffer[key] = _BufferedWrite(record_id=record_id, data=data)
+        else:
+            write.data.update(data)
+        if instance is not None:
+            write.created = write.created or not instance._db_persisted
+            if all(existing is not instance for existing in write.instances):
+                write.instances.append(instance)
+        if snapshot is not None:
+            write.snapshot = snapshot
+        write.futures.append(future)
+
+        if len(self._buffer) >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None and self._flush_task is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._start_flush)
+        return future
+
+    def _seal(self, key: Any) -> None:
+        """Move the buffered write of ``key`` to a key of its own, keeping its place in the batch order."""
+        sealed = ("sealed", next(self._keys))
+        self._buffer = {sealed if k == key else k: write for k, write in self._buffer.items()}
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._flush_task is None and self._buffer:
+            self._flush_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        """Send batches until only a partial batch remains (or the buffer is empty when flushing)."""
+        try:
+            while self._buffer:
+                keys = list(itertools.islice(self._buffer, self.max_batch))
+                batch = [self._buffer.pop(key) for key in keys]
+                async with self._space:
+                    self._space.notify_all()
+                await self._write(batch)
+                if len(self._buffer) < self.max_batch and not self._flushing and not self._closed:
+                    break
+        finally:
+            self._flush_task = None
+            if self._buffer and self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._start_flush)
+
+    async def _write(self, batch: list[_BufferedWrite]) -> None:
+        """Send one batch and resolve its futures; errors go to the waiting callers."""
+        table = self.model.get_table_name()
+        inserts = [w for w in batch if w.record_id is None]
+        upserts = [w for w in batch if w.record_id is not None]
+
+        statements: list[str] = []
+        variables: dict[str, Any] = {}
+        try:
+            if inserts:
+                statements.append(f"INSERT INTO {table} $_w_rows RETURN id;")
+                variables["_w_rows"] = [w.data for w in inserts]
+            for i, write in enumerate(upserts):
+                set_clause, write_vars = self.model._build_set_clause(write.data)
+                prefix = f"_w{i}_"
+                statement = f"UPSERT {format_thing(table, write.record_id or '')}"
+                statement += f" SET {set_clause} RETURN NONE;" if set_clause else " RETURN NONE;"
+                statements.append(namespace_variables(statement, write_vars, prefix))
+                variables.update({prefix + key: value for key, value in write_vars.items()})
+
+            sql = "\n".join(statements)
+            client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
+            start = _start_timer()
+            response = await client.query(sql, variables)
+            _log_query(sql, variables, _elapsed_ms(start))
+        except Exception as e:
+            for write in batch:
+                self._resolve(write, e)
+            return
+
+        results = response.results
+        if inserts:
+            result = results[0] if results else None
+            if result is None or result.is_error:
+                error = SurrealDbError(f"BufferedWriter insert failed: {result.result if result else 'no result'}")
+                for write in inserts:
+                    self._resolve(write, error)
+            else:
+                for write, record in zip(inserts, result.records, strict=False):
+                    for instance in write.instances:
+                        instance._update_from_db(record)
+                for write in inserts:
+                    self._resolve(write, None)
+        offset = 1 if inserts else 0
+        for i, write in enumerate(upserts):
+            result = results[offset + i] if offset + i < len(results) else None
+            if result is None or result.is_error:
+                thing = format_thing(table, write.record_id or "")
+                self._resolve(write, SurrealDbError(f"{thing}: {result.result if result else 'no result returned'}"))
+                continue
+            for instance in write.instances:
+                instance._db_persisted = True
+                if write.snapshot is not None:
+                    instance._db_snapshot = write.snapshot
+            self._resolve(write, None)
+
+        await self._send_post_signals(batch)
+
+    @staticmethod
+    def _resolve(write: _BufferedWrite, error: BaseException | None) -> None:
+        write.ok = error is None
+        for future in write.futures:
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+    async def _send_post_signals(self, batch: list[_BufferedWrite]) -> None:
+        """Send ``post_save`` for written instances; evict caches for raw upserts."""
+        from .cache import QueryCache
+        from .record_cache import RecordCache
+
+        raw_upserts = False
+        for write in batch:
+            if not write.ok:
+                continue
+            for instance in write.instances:
+                await model_signals.post_save.send(sender=instance.__class__, instance=instance, created=write.created, tx=None)
+            if not write.instances and write.record_id is not None:
+                raw_upserts = True
+                RecordCache.invalidate(self.model, write.record_id)
+        if raw_upserts:
+            QueryCache.invalidate(self.model)
+
+
+__all__ = ["BufferedWriter"]
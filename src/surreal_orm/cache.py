@@ -21,28 +21,95 @@ Example::
 
     # Disable cache globally
     QueryCache.configure(enabled=False)
+
+Stampede protection: concurrent misses on the same key share one database
+query (single-flight), ``stale_ttl`` lets an expired entry be served while one
+background task refreshes it, and ``jitter`` spreads the expiry of entries
+written together::
+
+    QueryCache.configure(default_ttl=60, stale_ttl=30, jitter=0.1)
+    feed = await Post.objects().order_by("-created_at").limit(20).cache(ttl=10, stale_ttl=5).exec()
+
+Invalidation is record-granular where possible: an entry remembers the ids of
+the records it returned and, for simple keyword filters, the filter itself.
+Saving or deleting one record only evicts the entries that contained it or
+whose filter the saved record satisfies; other writes flush the whole table.
+
+Sharing across processes: with a :class:`~surreal_orm.cache_backends.CacheBackend`
+the raw records of each result are also stored in a shared tier, and
+invalidations are broadcast to every process using the same backend::
+
+    QueryCache.configure(backend=LocalCacheBackend())  # or a Redis-backed implementation
+
+Spilling to disk: with a :class:`~surreal_orm.disk_cache.DiskCacheTier`,
+entries evicted from memory are kept as compressed raw records in a file, and
+promoted back to memory on a hit::
+
+    QueryCache.configure(max_size=200, disk_tier=DiskCacheTier("/var/cache/myapp/queries.bin"))
 """
 
 from __future__ import annotations
 
+import asyncio
 import copy
 import hashlib
 import json
 import logging
+import random
 import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
+from surreal_sdk.protocol.cbor import decode as cbor_decode
+from surreal_sdk.protocol.cbor import encode as cbor_encode
+
+from .cache_backends import CacheBackend, CacheInvalidation
+from .deadline import _detached_context
+from .disk_cache import DiskCacheTier
+
 logger = logging.getLogger(__name__)
 
+RecordPredicate = Callable[[dict[str, Any]], bool]
+
 
 @dataclass(slots=True)
 class _CacheEntry:
-    """A single cached query result with expiration timestamp."""
+    """A single cached query result with expiration timestamps."""
 
     data: Any
     table: str
     expires_at: float
+    stale_until: float  # may be served (and refreshed) until then
+    record_ids: frozenset[str] | None = None  # ids of the returned records, if known
+    predicate: RecordPredicate | None = None  # could a written record match the query?
+    blob: bytes | None = None  # CBOR raw records, kept for spilling to the disk tier
+
+
+@dataclass(slots=True)
+class _Fill:
+    """How to (re)compute one cache entry."""
+
+    compute: Callable[[], Awaitable[Any]]
+    table: str
+    ttl: int | None
+    stale_ttl: int | None
+    jitter: float | None
+    build: Callable[[Any], Awaitable[Any]] | None
+    predicate: RecordPredicate | None
+
+
+@dataclass(frozen=True, slots=True)
+class _Write:
+    """A write seen while a computation was running (``record_id=None``: whole table)."""
+
+    seq: int
+    table: str
+    record_id: str | None
+    record: dict[str, Any] | None
+    deleted: bool
 
 
 class QueryCache:
@@ -58,11 +125,26 @@ class QueryCache:
     _default_ttl: int = 60  # seconds
     _max_size: int = 1000
     _enabled: bool = True
+    _stale_ttl: int = 0  # seconds an expired entry may still be served
+    _jitter: float = 0.0  # fraction of the TTL randomised per entry
+    _single_flight: bool = True
+    _backend: CacheBackend | None = None  # shared tier and invalidation channel
+    _disk: DiskCacheTier | None = None  # spill tier for entries evicted from memory
 
     # ── State ────────────────────────────────────────────────────────────
 
     _cache: dict[str, _CacheEntry] = {}
     _table_keys: dict[str, set[str]] = {}  # table → set of cache keys
+    _inflight: dict[str, asyncio.Future[Any]] = {}  # key → result of the running computation
+    _refresh_tasks: set[asyncio.Task[None]] = set()
+    _sequence: int = 0  # bumped by every invalidation
+    _writes: deque[_Write] = deque(maxlen=10_000)  # invalidations seen while computing
+    _computing: int = 0  # computations currently running
+    _epoch: int = 0  # bumped by clear()
+    _hits: int = 0
+    _misses: int = 0
+    _origin: str = uuid.uuid4().hex  # identifies this process on the backend channel
+    _broadcast_tasks: set[asyncio.Task[None]] = set()
     _signals_connected: bool = False
 
     # ── Public API ───────────────────────────────────────────────────────
@@ -74,6 +156,11 @@ class QueryCache:
         default_ttl: int = 60,
         max_size: int = 1000,
         enabled: bool = True,
+        stale_ttl: int = 0,
+        jitter: float = 0.0,
+        single_flight: bool = True,
+        backend: CacheBackend | None = None,
+        disk_tier: DiskCacheTier | None = None,
     ) -> None:
         """
         Configure global cache settings.
@@ -85,10 +172,38 @@ class QueryCache:
             default_ttl: Default time-to-live in seconds for cache entries.
             max_size: Maximum number of cached entries (FIFO eviction).
             enabled: Whether the cache is active.
+            stale_ttl: Seconds after expiry during which an entry is still
+                returned while one background task refreshes it
+                (stale-while-revalidate).  ``0`` disables it.
+            jitter: Fraction of the TTL by which each entry's lifetime is
+                randomly shortened or lengthened (``0.1`` → ±10%), so entries
+                written together do not expire together.
+            single_flight: Whether concurrent misses on the same key wait for
+                one shared database query instead of each running it.
+            backend: Shared tier consulted on local misses, whose channel
+                carries invalidations between processes.  ``None`` keeps the
+                cache purely in-process.
+            disk_tier: Second tier receiving the entries evicted from memory
+                (``max_size``), promoted back on a hit.  ``None`` drops them.
+
+        Raises:
+            ValueError: If ``jitter`` is not between 0 and 1 or ``stale_ttl``
+                is negative.
         """
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be >= 0 and < 1")
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl must be >= 0")
         cls._default_ttl = default_ttl
         cls._max_size = max_size
         cls._enabled = enabled
+        cls._stale_ttl = stale_ttl
+        cls._jitter = jitter
+        cls._single_flight = single_flight
+        if backend is not None and backend is not cls._backend:
+            backend.subscribe(lambda message: cls._on_invalidation(backend, message))
+        cls._backend = backend
+        cls._disk = disk_tier
         cls._connect_signals()
 
     @classmethod
@@ -117,7 +232,8 @@ class QueryCache:
         Retrieve a cached result by key.
 
         Returns ``None`` if the cache is disabled, the key is missing, or
-        the entry has expired (expired entries are removed on access).
+        the entry has expired (expired entries are removed on access once
+        their stale window has passed as well).
 
         A deep copy of the stored data is returned so that callers cannot
         accidentally mutate the cached value.
@@ -126,12 +242,97 @@ class QueryCache:
             return None
         entry = cls._cache.get(key)
         if entry is None:
+            cls._misses += 1
             return None
-        if time.monotonic() > entry.expires_at:
-            cls._remove_key(key)
+        now = time.monotonic()
+        if now > entry.expires_at:
+            if now > entry.stale_until:
+                cls._remove_key(key)
+            cls._misses += 1
             return None
+        cls._hits += 1
         return copy.deepcopy(entry.data)
 
+    @classmethod
+    async def get_or_compute(
+        cls,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        table: str,
+        ttl: int | None = None,
+        *,
+        stale_ttl: int | None = None,
+        jitter: float | None = None,
+        build: Callable[[Any], Awaitable[Any]] | None = None,
+        predicate: RecordPredicate | None = None,
+    ) -> Any:
+        """
+        Return the cached result for ``key``, computing and storing it on a miss.
+
+        - A fresh entry is returned as a deep copy.
+        - An expired entry still inside its stale window is returned as well,
+          and one background task re-runs ``compute`` to refresh it.
+        - On a miss, concurrent callers share a single ``compute`` call
+          (single-flight); only the first one runs it.
+
+        A result computed while a write affecting it happened is returned to
+        its callers but not stored, so a racing write never leaves a pre-write
+        result in the cache.
+
+        With ``build``, ``compute`` returns raw records and ``build`` turns
+        them into the result.  Only such entries use the disk tier and the
+        shared backend: their raw records are read on a memory miss (skipping
+        ``compute``), and computed records are written back to the backend.  When every raw record has an
+        ``id`` and a ``predicate`` is given, the entry is only evicted by writes
+        to records it contains or that ``predicate`` accepts (see
+        :meth:`invalidate_record`).
+
+        Args:
+            key: The cache key (from ``make_key``).
+            compute: Coroutine function producing the result on a miss.
+            table: The table name (used for targeted invalidation).
+            ttl: Time-to-live in seconds.  Defaults to ``_default_ttl``.
+            stale_ttl: Stale window in seconds.  Defaults to ``_stale_ttl``.
+            jitter: TTL jitter fraction.  Defaults to ``_jitter``.
+            build: Coroutine function turning raw records into the result.
+            predicate: Function telling whether a written record (a dict of
+                field values, possibly partial) could match the query.  It
+                must return ``True`` when unsure.
+
+        Returns:
+            The (cached or freshly computed) result.
+        """
+        fill = _Fill(compute, table, ttl, stale_ttl, jitter, build, predicate)
+        if not cls._enabled:
+            data, _, _ = await cls._load(key, fill, None)
+            return data
+
+        entry = cls._cache.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if now <= entry.expires_at:
+                cls._hits += 1
+                return copy.deepcopy(entry.data)
+            if now <= entry.stale_until:
+                if key not in cls._inflight:
+                    cls._start_refresh(key, fill)
+                cls._hits += 1
+                return copy.deepcopy(entry.data)
+            cls._remove_key(key)
+        cls._misses += 1
+
+        if cls._single_flight:
+            pending = cls._inflight.get(key)
+            if pending is not None:
+                try:
+                    return copy.deepcopy(await asyncio.shield(pending))
+                except asyncio.CancelledError:
+                    task = asyncio.current_task()
+                    if not pending.cancelled() or (task is not None and task.cancelling()):
+                        raise
+                    # The computing caller was cancelled, not us: compute ourselves.
+        return await cls._compute(key, cls._begin_flight(key), fill)
+
     @classmethod
     def set(
         cls,
@@ -139,6 +340,9 @@ class QueryCache:
         data: Any,
         table: str,
         ttl: int | None = None,
+        *,
+        stale_ttl: int | None = None,
+        jitter: float | None = None,
     ) -> None:
         """
         Store a query result in the cache.
@@ -148,43 +352,73 @@ class QueryCache:
             data: The query result to cache.
             table: The table name (used for targeted invalidation).
             ttl: Time-to-live in seconds.  Defaults to ``_default_ttl``.
+            stale_ttl: Stale window in seconds.  Defaults to ``_stale_ttl``.
+            jitter: TTL jitter fraction.  Defaults to ``_jitter``.
         """
-        if not cls._enabled:
-            return
-
-        # Evict oldest entries if at capacity
-        while len(cls._cache) >= cls._max_size:
-            cls._evict_oldest()
-
-        expires_at = time.monotonic() + (ttl if ttl is not None else cls._default_ttl)
-        cls._cache[key] = _CacheEntry(data=copy.deepcopy(data), table=table, expires_at=expires_at)
-
-        if table not in cls._table_keys:
-            cls._table_keys[table] = set()
-        cls._table_keys[table].add(key)
+        cls._store(key, data, table, ttl, stale_ttl, jitter)
 
     @classmethod
     def invalidate(cls, model: Any) -> int:
         """
         Remove all cached entries for a model's table.
 
+        With a backend, the table is also dropped from the shared tier and the
+        invalidation is broadcast to the other processes.
+
         Args:
             model: The model class whose table entries should be cleared.
 
         Returns:
             The number of entries removed.
         """
-        table = model.get_table_name()
-        keys = cls._table_keys.pop(table, set())
-        for key in keys:
-            cls._cache.pop(key, None)
-        return len(keys)
+        return cls._invalidate_table(model.get_table_name(), connection=model.get_connection_name())
+
+    @classmethod
+    def invalidate_record(
+        cls,
+        model: Any,
+        record_id: str,
+        record: dict[str, Any] | None = None,
+        *,
+        deleted: bool = False,
+    ) -> int:
+        """
+        Remove the cached entries a write to one record can affect.
+
+        An entry is removed if it contained ``record_id``, or if ``record``
+        (the record's field values after the write) may satisfy its filter.
+        A deleted record only affects entries that contained it.  Entries
+        without known ids or filter, and writes without ``record``, fall back
+        to removing every entry of the table.
+
+        Args:
+            model: The model class of the written record.
+            record_id: The record id (bare or ``table:id``).
+            record: Field values after the write; missing fields are treated
+                as possibly matching.
+            deleted: Whether the record was deleted.
+
+        Returns:
+            The number of entries removed.
+        """
+        return cls._invalidate_record(
+            model.get_table_name(),
+            _bare_id(record_id),
+            record,
+            deleted=deleted,
+            connection=model.get_connection_name(),
+        )
 
     @classmethod
     def clear(cls) -> None:
-        """Remove all entries from the cache."""
+        """Remove all entries from the cache, including the disk tier, and reset the hit counters."""
+        cls._epoch += 1
         cls._cache.clear()
         cls._table_keys.clear()
+        cls._hits = 0
+        cls._misses = 0
+        if cls._disk is not None:
+            cls._disk.clear()
 
     @classmethod
     def stats(cls) -> dict[str, Any]:
@@ -192,19 +426,314 @@ class QueryCache:
         Return cache statistics.
 
         Returns:
-            Dict with ``entries``, ``tables``, ``max_size``, ``default_ttl``,
-            and ``enabled``.
+            Dict with ``entries``, ``tables``, ``inflight``, ``max_size``,
+            ``default_ttl``, ``stale_ttl``, ``jitter``, ``backend``,
+            ``enabled``, and per tier: ``memory`` (``entries``, ``max_size``,
+            ``hits``, ``misses``, ``hit_ratio``) and ``disk`` (see
+            :meth:`DiskCacheTier.stats`, ``None`` without a disk tier).
         """
+        lookups = cls._hits + cls._misses
         return {
             "entries": len(cls._cache),
             "tables": len(cls._table_keys),
+            "inflight": len(cls._inflight),
             "max_size": cls._max_size,
             "default_ttl": cls._default_ttl,
+            "stale_ttl": cls._stale_ttl,
+            "jitter": cls._jitter,
+            "backend": type(cls._backend).__name__ if cls._backend is not None else None,
             "enabled": cls._enabled,
+            "memory": {
+                "entries": len(cls._cache),
+                "max_size": cls._max_size,
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "hit_ratio": cls._hits / lookups if lookups else 0.0,
+            },
+            "disk": cls._disk.stats() if cls._disk is not None else None,
         }
 
     # ── Internal ─────────────────────────────────────────────────────────
 
+    @classmethod
+    def _store(
+        cls,
+        key: str,
+        data: Any,
+        table: str,
+        ttl: int | None,
+        stale_ttl: int | None,
+        jitter: float | None,
+        record_ids: frozenset[str] | None = None,
+        predicate: RecordPredicate | None = None,
+        blob: bytes | None = None,
+    ) -> Any:
+        """Store a deep copy of ``data`` and return it (``None`` when the cache is disabled)."""
+        if not cls._enabled:
+            return None
+
+        cls._remove_key(key)  # re-inserted at the end for FIFO eviction
+        if cls._disk is not None:
+            cls._disk.discard(key)  # superseded by the new result
+        # Evict oldest entries if at capacity
+        while len(cls._cache) >= cls._max_size:
+            cls._evict_oldest()
+
+        lifetime = float(ttl if ttl is not None else cls._default_ttl)
+        spread = jitter if jitter is not None else cls._jitter
+        if spread:
+            lifetime *= random.uniform(1 - spread, 1 + spread)
+        expires_at = time.monotonic() + lifetime
+        stale_until = expires_at + (stale_ttl if stale_ttl is not None else cls._stale_ttl)
+        stored = copy.deepcopy(data)
+        cls._cache[key] = _CacheEntry(
+            data=stored,
+            table=table,
+            expires_at=expires_at,
+            stale_until=stale_until,
+            record_ids=record_ids,
+            predicate=predicate,
+            blob=blob if cls._disk is not None else None,
+        )
+
+        if table not in cls._table_keys:
+            cls._table_keys[table] = set()
+        cls._table_keys[table].add(key)
+        return stored
+
+    @classmethod
+    def _begin_flight(cls, key: str) -> asyncio.Future[Any]:
+        """Register the computation of ``key`` so concurrent callers can await it."""
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting: mark a failure as retrieved to avoid a warning.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        cls._inflight[key] = future
+        return future
+
+    @classmethod
+    async def _compute(cls, key: str, future: asyncio.Future[Any], fill: _Fill) -> Any:
+        """Load the result, store it unless invalidated meanwhile, and resolve ``future``."""
+        start = (cls._epoch, cls._sequence)
+        cls._computing += 1
+        try:
+            data, record_ids, blob = await cls._load(key, fill, start)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        finally:
+            cls._computing -= 1
+            if cls._inflight.get(key) is future:
+                del cls._inflight[key]
+
+        stored = None
+        if not cls._changed_since(start, fill.table, record_ids, fill.predicate):
+            stored = cls._store(key, data, fill.table, fill.ttl, fill.stale_ttl, fill.jitter, record_ids, fill.predicate, blob)
+        # Waiters deep-copy from a private snapshot, never from the caller's objects.
+        future.set_result(stored if stored is not None else copy.deepcopy(data))
+        return data
+
+    @classmethod
+    async def _load(
+        cls, key: str, fill: _Fill, start: tuple[int, int] | None
+    ) -> tuple[Any, frozenset[str] | None, bytes | None]:
+        """
+        Produce the result for ``key`` from the disk tier, the shared backend or ``fill.compute``.
+
+        Returns the result, the ids of its raw records (``None`` if unknown)
+        and the CBOR-encoded raw records (``None`` unless a tier needs them).
+        Freshly computed raw records are written to the backend unless a write
+        affecting them happened since ``start``.
+        """
+        if fill.build is None:
+            return await fill.compute(), None, None
+        disk = cls._disk if start is not None else None
+        if disk is not None:
+            blob = disk.get(key)
+            if blob is not None:
+                raw = cbor_decode(blob)
+                return await fill.build(raw), _record_ids(raw), blob
+        backend = cls._backend if start is not None else None
+        if backend is not None:
+            try:
+                blob = await backend.get(key)
+            except Exception as e:
+                logger.warning(f"QueryCache: backend read failed: {e}")
+                blob = None
+            if blob is not None:
+                raw = cbor_decode(blob)
+                return await fill.build(raw), _record_ids(raw), blob
+
+        raw = await fill.compute()
+        record_ids = _record_ids(raw)
+        blob = None
+        if disk is not None or backend is not None:
+            try:
+                blob = cbor_encode(raw)
+            except Exception as e:
+                logger.warning(f"QueryCache: result for table '{fill.table}' cannot be encoded: {e}")
+        if (
+            backend is not None
+            and blob is not None
+            and start is not None
+            and not cls._changed_since(start, fill.table, record_ids, fill.predicate)
+        ):
+            try:
+                ttl = fill.ttl if fill.ttl is not None else cls._default_ttl
+                # Without a predicate, writes to records outside the result can change it.
+                shared_ids = record_ids if fill.predicate is not None else None
+                await backend.set(key, blob, fill.table, ttl, shared_ids)
+            except Exception as e:
+                logger.warning(f"QueryCache: backend write failed: {e}")
+        return await fill.build(raw), record_ids, blob
+
+    @classmethod
+    def _start_refresh(cls, key: str, fill: _Fill) -> None:
+        """Refresh a stale entry in the background; concurrent misses join it."""
+        future = cls._begin_flight(key)
+
+        async def _refresh() -> None:
+            try:
+                await cls._compute(key, future, fill)
+            except Exception as e:
+                logger.warning(f"QueryCache: background refresh for table '{fill.table}' failed: {e}")
+
+        task = asyncio.get_running_loop().create_task(_refresh(), context=_detached_context())
+        cls._refresh_tasks.add(task)
+        task.add_done_callback(cls._refresh_tasks.discard)
+
+    @classmethod
+    def _invalidate_table(
+        cls,
+        table: str,
+        *,
+        record_ids: tuple[str, ...] = (),
+        connection: str = "default",
+        broadcast: bool = True,
+    ) -> int:
+        """Drop the local entries of ``table`` and, if ``broadcast``, propagate through the backend."""
+        cls._log_write(table, None, None, False)
+        keys = cls._table_keys.pop(table, set())
+        for key in keys:
+            cls._cache.pop(key, None)
+        if cls._disk is not None:
+            cls._disk.invalidate_table(table)
+        if broadcast and cls._backend is not None:
+            message = CacheInvalidation(table=table, record_ids=record_ids, connection=connection, origin=cls._origin)
+            cls._broadcast(cls._backend, message)
+        return len(keys)
+
+    @classmethod
+    def _invalidate_record(
+        cls,
+        table: str,
+        record_id: str,
+        record: dict[str, Any] | None,
+        *,
+        deleted: bool,
+        connection: str = "default",
+        broadcast: bool = True,
+    ) -> int:
+        """Drop the local entries of ``table`` affected by one record write; optionally propagate it."""
+        cls._log_write(table, record_id, record, deleted)
+        removed = 0
+        for key in list(cls._table_keys.get(table, ())):
+            entry = cls._cache[key]
+            if _affects(entry.record_ids, entry.predicate, record_id, record, deleted):
+                cls._remove_key(key)
+                removed += 1
+        if cls._disk is not None:
+            for key, ids, predicate in cls._disk.entries(table):
+                if _affects(ids, predicate, record_id, record, deleted):
+                    cls._disk.discard(key)
+        if broadcast and cls._backend is not None:
+            message = CacheInvalidation(
+                table=table, record_ids=(record_id,), deleted=deleted, connection=connection, origin=cls._origin
+            )
+            cls._broadcast(cls._backend, message)
+        return removed
+
+    @classmethod
+    def _log_write(cls, table: str, record_id: str | None, record: dict[str, Any] | None, deleted: bool) -> None:
+        """Count an invalidation and remember it for the computations now running."""
+        cls._sequence += 1
+        if cls._computing:
+            cls._writes.append(_Write(cls._sequence, table, record_id, record, deleted))
+        else:
+            cls._writes.clear()
+
+    @classmethod
+    def _changed_since(
+        cls,
+        start: tuple[int, int],
+        table: str,
+        record_ids: frozenset[str] | None,
+        predicate: RecordPredicate | None,
+    ) -> bool:
+        """Whether a write since ``start`` (epoch, sequence) may affect a result of ``table``."""
+        epoch, sequence = start
+        if epoch != cls._epoch:
+            return True
+        if sequence == cls._sequence:
+            return False
+        if not cls._writes or cls._writes[0].seq > sequence + 1:
+            return True  # the log was trimmed: assume the worst
+        return any(
+            write.seq > sequence
+            and write.table == table
+            and _affects(record_ids, predicate, write.record_id, write.record, write.deleted)
+            for write in cls._writes
+        )
+
+    @classmethod
+    def _broadcast(cls, backend: CacheBackend, message: CacheInvalidation) -> None:
+        """
+        Drop what ``message`` affects from the shared tier and publish it, in the background.
+
+        Deletions are dropped per record id. Other writes drop the whole table,
+        since the shared tier cannot tell which stored filters the changed
+        record now matches.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning(f"QueryCache: no event loop, invalidation of '{message.table}' not broadcast")
+            return
+
+        async def _send() -> None:
+            try:
+                granular = message.deleted and message.record_ids
+                await backend.invalidate(message.table, message.record_ids if granular else None)
+                await backend.publish(message)
+            except Exception as e:
+                logger.warning(f"QueryCache: broadcasting invalidation of '{message.table}' failed: {e}")
+
+        task = loop.create_task(_send())
+        cls._broadcast_tasks.add(task)
+        task.add_done_callback(cls._broadcast_tasks.discard)
+
+    @classmethod
+    def _on_invalidation(cls, backend: CacheBackend, message: CacheInvalidation) -> None:
+        """Apply an invalidation received from another process."""
+        if backend is not cls._backend or message.origin == cls._origin:
+            return
+        if message.record_ids:
+            # The new field values are not sent, so only deletions stay granular.
+            for record_id in message.record_ids:
+                cls._invalidate_record(message.table, record_id, None, deleted=message.deleted, broadcast=False)
+        else:
+            cls._invalidate_table(message.table, broadcast=False)
+
+        from .record_cache import RecordCache
+
+        if message.record_ids:
+            for record_id in message.record_ids:
+                RecordCache._drop(message.connection, message.table, record_id)
+        else:
+            RecordCache._drop(message.connection, message.table)
+
     @classmethod
     def _remove_key(cls, key: str) -> None:
         entry = cls._cache.pop(key, None)
@@ -217,11 +746,16 @@ class QueryCache:
 
     @classmethod
     def _evict_oldest(cls) -> None:
-        """Evict the oldest cache entry based on insertion order (FIFO)."""
+        """Evict the oldest cache entry based on insertion order (FIFO), spilling it to the disk tier."""
         if not cls._cache:
             return
         # dict preserves insertion order in Python 3.7+
         oldest_key = next(iter(cls._cache))
+        entry = cls._cache[oldest_key]
+        remaining = entry.expires_at - time.monotonic()
+        if cls._disk is not None and entry.blob is not None and remaining > 0:
+            # The disk tier outlives the process: convert to a wall-clock deadline.
+            cls._disk.put(oldest_key, entry.blob, entry.table, entry.record_ids, time.time() + remaining, entry.predicate)
         cls._remove_key(oldest_key)
 
     @classmethod
@@ -232,14 +766,22 @@ class QueryCache:
 
         from .signals import SignalHandler, post_delete, post_save, post_update
 
+        def _invalidate(sender: Any, instance: Any, deleted: bool) -> None:
+            record_id = instance.get_id() if instance is not None else None
+            if not record_id:
+                cls.invalidate(sender)
+                return
+            record = None if deleted else instance._known_values()
+            cls.invalidate_record(sender, str(record_id), record, deleted=deleted)
+
         async def _invalidate_on_save(sender: type, **kwargs: Any) -> None:
-            cls.invalidate(sender)
+            _invalidate(sender, kwargs.get("instance"), False)
 
         async def _invalidate_on_delete(sender: type, **kwargs: Any) -> None:
-            cls.invalidate(sender)
+            _invalidate(sender, kwargs.get("instance"), True)
 
         async def _invalidate_on_update(sender: type, **kwargs: Any) -> None:
-            cls.invalidate(sender)
+            _invalidate(sender, kwargs.get("instance"), False)
 
         _on_save: SignalHandler = _invalidate_on_save
         _on_delete: SignalHandler = _invalidate_on_delete
@@ -252,4 +794,45 @@ class QueryCache:
         cls._signals_connected = True
 
 
+def _bare_id(record_id: Any) -> str:
+    """Normalize ``table:id``, ``RecordId`` and escaped ids to the bare id string."""
+    from .model_base import _parse_record_id
+
+    return (_parse_record_id(record_id) or "").strip("⟨⟩`")
+
+
+def _record_ids(raw: Any) -> frozenset[str] | None:
+    """Ids of raw records, or ``None`` unless every record has one."""
+    if not isinstance(raw, list):
+        return None
+    ids: set[str] = set()
+    for record in raw:
+        if not isinstance(record, dict) or record.get("id") is None:
+            return None
+        ids.add(_bare_id(record["id"]))
+    return frozenset(ids)
+
+
+def _affects(
+    record_ids: frozenset[str] | None,
+    predicate: RecordPredicate | None,
+    record_id: str | None,
+    record: dict[str, Any] | None,
+    deleted: bool,
+) -> bool:
+    """Whether a write to ``record_id`` (``None``: whole table) can change a cached result."""
+    if record_id is None or record_ids is None or predicate is None:
+        return True
+    if record_id in record_ids:
+        return True
+    if deleted:
+        return False  # a record the result did not contain cannot leave it
+    if record is None:
+        return True
+    try:
+        return bool(predicate(record))
+    except Exception:
+        return True
+
+
 __all__ = ["QueryCache"]
@@ -0,0 +1,170 @@
+"""
+Shared backends for :class:`~surreal_orm.cache.QueryCache`.
+
+``QueryCache`` always keeps an in-process store, so every worker process warms
+its own copy and an invalidation in one process is never seen by the others.
+A :class:`CacheBackend` adds a tier shared by all processes:
+
+- a key-value store holding query results as compact CBOR-encoded raw records
+  (model instances are rebuilt locally on a hit);
+- a broadcast channel carrying table/record invalidations, so a write in one
+  process evicts the matching entries everywhere.
+
+A deleted record only evicts the shared values that contained it. Other
+writes evict the whole table from the shared tier, because a changed record
+may now match any stored query.
+
+Implement the abstract methods on top of a real store (e.g. Redis ``GET``/
+``SET PX``/``PUBLISH``; :meth:`CacheInvalidation.to_bytes` gives the wire
+format). :class:`LocalCacheBackend` is an in-process stand-in with the same
+behaviour, useful for tests and single-process deployments.
+
+Example::
+
+    from surreal_orm import LocalCacheBackend, QueryCache
+
+    QueryCache.configure(default_ttl=60, backend=LocalCacheBackend())
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+
+InvalidationHandler = Callable[["CacheInvalidation"], None]
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInvalidation:
+    """
+    An invalidation broadcast to every process sharing a backend.
+
+    Attributes:
+        table: The table whose cached results are stale.
+        record_ids: Ids of the changed records, or empty when unknown.
+        deleted: Whether the records were deleted (the only record writes
+            receivers can apply granularly, since field values are not sent).
+        connection: Name of the connection the table belongs to.
+        origin: Id of the sending process; a process ignores its own messages.
+    """
+
+    table: str
+    record_ids: tuple[str, ...] = ()
+    deleted: bool = False
+    connection: str = "default"
+    origin: str = ""
+
+    def to_bytes(self) -> bytes:
+        """Encode the message for a transport such as a pub/sub channel."""
+        payload = {"t": self.table, "r": list(self.record_ids), "d": self.deleted, "c": self.connection, "o": self.origin}
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CacheInvalidation:
+        """Decode a message produced by :meth:`to_bytes`."""
+        payload = json.loads(data)
+        return cls(
+            table=payload["t"],
+            record_ids=tuple(payload["r"]),
+            deleted=payload["d"],
+            connection=payload["c"],
+            origin=payload["o"],
+        )
+
+
+class CacheBackend(ABC):
+    """Shared storage and invalidation channel behind ``QueryCache``."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the stored value for ``key``, or ``None`` if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, table: str, ttl: float, record_ids: frozenset[str] | None = None) -> None:
+        """
+        Store ``value`` under ``key`` for ``ttl`` seconds, indexed by ``table``.
+
+        ``record_ids`` are the ids of the records in ``value``. It is ``None``
+        when a write to any record of ``table`` may change the value.
+        """
+
+    @abstractmethod
+    async def invalidate(self, table: str, record_ids: Collection[str] | None = None) -> None:
+        """
+        Delete the stored values of ``table`` a write can affect.
+
+        Without ``record_ids`` every value of ``table`` is deleted. Otherwise
+        only values containing one of ``record_ids`` and values stored
+        without ids are deleted.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Delete every stored value."""
+
+    @abstractmethod
+    async def publish(self, message: CacheInvalidation) -> None:
+        """Send ``message`` to every subscribed process, including this one."""
+
+    @abstractmethod
+    def subscribe(self, handler: InvalidationHandler) -> None:
+        """Call ``handler`` for every message published on the channel."""
+
+    async def close(self) -> None:  # noqa: B027 - optional hook
+        """Release connections held by the backend."""
+
+
+@dataclass(slots=True)
+class _StoredValue:
+    value: bytes
+    table: str
+    expires_at: float
+    record_ids: frozenset[str] | None = None
+
+
+class LocalCacheBackend(CacheBackend):
+    """
+    In-process :class:`CacheBackend` standing in for an external store.
+
+    Values are kept as bytes with their expiry, and published messages are
+    encoded and decoded like on a real channel before reaching subscribers.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, _StoredValue] = {}
+        self._handlers: list[InvalidationHandler] = []
+
+    async def get(self, key: str) -> bytes | None:
+        stored = self._values.get(key)
+        if stored is None:
+            return None
+        if time.monotonic() > stored.expires_at:
+            del self._values[key]
+            return None
+        return stored.value
+
+    async def set(self, key: str, value: bytes, table: str, ttl: float, record_ids: frozenset[str] | None = None) -> None:
+        self._values[key] = _StoredValue(value, table, time.monotonic() + ttl, record_ids)
+
+    async def invalidate(self, table: str, record_ids: Collection[str] | None = None) -> None:
+        for key in [key for key, stored in self._values.items() if stored.table == table]:
+            stored_ids = self._values[key].record_ids
+            if record_ids is None or stored_ids is None or not stored_ids.isdisjoint(record_ids):
+                del self._values[key]
+
+    async def clear(self) -> None:
+        self._values.clear()
+
+    async def publish(self, message: CacheInvalidation) -> None:
+        data = message.to_bytes()
+        for handler in list(self._handlers):
+            handler(CacheInvalidation.from_bytes(data))
+
+    def subscribe(self, handler: InvalidationHandler) -> None:
+        self._handlers.append(handler)
+
+
+__all__ = ["CacheBackend", "CacheInvalidation", "LocalCacheBackend"]
@@ -20,6 +20,14 @@ Usage::
     # Context-manager override (async-safe via contextvars)
     async with SurrealDBConnectionManager.using("analytics"):
         events = await AnalyticsEvent.objects().all()
+
+    # Read replicas: QuerySet reads go to the least busy replica, writes to
+    # the primary; reads stick to the primary for 5s after a write.
+    SurrealDBConnectionManager.set_replicas("default", ["replica1", "replica2"], read_your_writes=5.0)
+
+    # Adaptive concurrency limit: excess queries queue, then fail fast with
+    # OverloadedError instead of piling up on an overloaded server.
+    SurrealDBConnectionManager.set_concurrency_limit("default", AdaptiveLimiter(max_limit=200))
 """
 
 from __future__ import annotations
@@ -27,13 +35,15 @@ from __future__ import annotations
 import asyncio
 import contextvars
 import logging
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from typing import Any, Literal
 
-from surreal_sdk import HTTPConnection, WebSocketConnection
+from surreal_sdk import AdaptiveLimiter, HTTPConnection, WebSocketConnection
 from surreal_sdk.exceptions import SurrealDBError
 from surreal_sdk.transaction import HTTPTransaction
+from surreal_sdk.types import QueryResponse
 
 from .connection_config import ConnectionConfig
 
@@ -42,6 +52,9 @@ logger = logging.getLogger(__name__)
 # Async-safe context variable for ``using()`` overrides.
 _active_connection: contextvars.ContextVar[str | None] = contextvars.ContextVar("active_connection", default=None)
 
+# Time of the last write per primary connection in the current context (read-your-writes).
+_last_writes: contextvars.ContextVar[dict[str, float] | None] = contextvars.ContextVar("last_writes", default=None)
+
 
 class SurrealDbConnectionError(Exception):
     """Connection error for SurrealDB."""
@@ -62,6 +75,14 @@ class SurrealDBConnectionManager:
     _ws_clients: dict[str, WebSocketConnection] = {}
     _connection_lock: asyncio.Lock | None = None
 
+    # --- read replicas -----------------------------------------------------
+    _replicas: dict[str, tuple[str, ...]] = {}  # primary → replica connection names
+    _read_your_writes: dict[str, float] = {}  # primary → seconds reads stick to it after a write
+    _replica_cursor: int = 0  # rotates the tie-break between equally busy replicas
+
+    # --- concurrency limits ------------------------------------------------
+    _limiters: dict[str, AdaptiveLimiter] = {}  # connection → limiter shared by its clients
+
     # --- legacy class-level getters (kept in sync for backward compat) -----
     # These mirror the "default" config so that code like
     # ``SurrealDBConnectionManager.get_url()`` keeps working.
@@ -142,11 +163,23 @@ class SurrealDBConnectionManager:
 
     @classmethod
     async def remove_connection(cls, name: str) -> None:
-        """Remove a named connection and properly close its clients."""
+        """Remove a named connection and properly close its clients.
+
+        The connection is also removed from replica routing, as a primary or
+        as a replica.
+        """
         await cls._close_single(name)
         cls._configs.pop(name, None)
         cls._clients.pop(name, None)
         cls._ws_clients.pop(name, None)
+        cls._limiters.pop(name, None)
+        if name in cls._replicas:
+            cls.set_replicas(name, [])
+        for primary, replicas in list(cls._replicas.items()):
+            if name in replicas:
+                cls._replicas[primary] = tuple(r for r in replicas if r != name)
+                if not cls._replicas[primary]:
+                    cls.set_replicas(primary, [])
 
         if name == "default":
             cls._clear_legacy_vars()
@@ -189,6 +222,135 @@ class SurrealDBConnectionManager:
         finally:
             _active_connection.reset(token)
 
+    # -----------------------------------------------------------------------
+    # Read-replica routing
+    # -----------------------------------------------------------------------
+
+    @classmethod
+    def set_replicas(cls, primary: str, replicas: Sequence[str], *, read_your_writes: float = 5.0) -> None:
+        """Route QuerySet reads of *primary* to the *replicas* connections.
+
+        Reads go to the replica with the fewest requests in flight.  Writes
+        (``save``, ``merge``, ``delete``, bulk operations, transactions, raw
+        queries) keep using *primary*.  For *read_your_writes* seconds after
+        an ORM write completes (``save``, ``merge``, ``delete``, bulk
+        operations, a committed transaction), reads in the same context go to
+        *primary* as well, so they see the write even if the replicas lag
+        behind.  Raw queries do not start this window.
+
+        Args:
+            primary: Name of the primary connection (models' ``connection``).
+            replicas: Names of the replica connections; empty to stop routing.
+            read_your_writes: Seconds reads stick to the primary after a write.
+
+        Raises:
+            ValueError: If a connection is not registered or
+                *read_your_writes* is negative.
+        """
+        for name in (primary, *replicas):
+            if name not in cls._configs:
+                raise ValueError(f"Unknown connection: {name!r}. Register it with add_connection() first.")
+        if read_your_writes < 0:
+            raise ValueError("read_your_writes must be >= 0")
+        if replicas:
+            cls._replicas[primary] = tuple(replicas)
+            cls._read_your_writes[primary] = read_your_writes
+        else:
+            cls._replicas.pop(primary, None)
+            cls._read_your_writes.pop(primary, None)
+
+    @classmethod
+    def get_replicas(cls, primary: str = "default") -> tuple[str, ...]:
+        """Return the replica connection names of *primary* (empty if not routed)."""
+        return cls._replicas.get(primary, ())
+
+    @classmethod
+    def get_read_connection_name(cls, name: str | None = None, *, exclude: str | None = None) -> str:
+        """Return the connection a read on *name* should use.
+
+        Args:
+            name: Connection name.  ``None`` means use the active connection
+                  (context var → ``"default"``).
+            exclude: A replica to avoid if another one is available (e.g.
+                  the one a hedged read was first sent to).
+
+        Returns:
+            *name* itself without replicas or within the read-your-writes
+            window, otherwise its replica with the fewest requests in flight.
+        """
+        name = name or cls.get_active_connection_name() or "default"
+        replicas = cls._replicas.get(name)
+        if not replicas:
+            return name
+        last_write = (_last_writes.get() or {}).get(name)
+        if last_write is not None and time.monotonic() - last_write < cls._read_your_writes[name]:
+            return name
+        replicas = tuple(r for r in replicas if r != exclude) or replicas
+        cls._replica_cursor = (cls._replica_cursor + 1) % len(replicas)
+        ordered = replicas[cls._replica_cursor :] + replicas[: cls._replica_cursor]
+        return min(ordered, key=cls._outstanding_requests)
+
+    @classmethod
+    async def get_read_client(cls, name: str | None = None) -> HTTPConnection:
+        """Return the HTTP client a read on *name* should use (see ``get_read_connection_name()``)."""
+        return await cls.get_client(cls.get_read_connection_name(name))
+
+    @classmethod
+    def _outstanding_requests(cls, name: str) -> int:
+        client = cls._clients.get(name)
+        limiter = cls._limiters.get(name)
+        return (client.in_flight if client is not None else 0) + (limiter.queued if limiter is not None else 0)
+
+    @classmethod
+    def _note_write(cls, name: str) -> None:
+        """Start the read-your-writes window of primary *name* in the current context.
+
+        Called by the ORM write paths once the write has completed, so the
+        window covers the time the replicas may still lag behind it.
+        """
+        if name in cls._replicas:
+            _last_writes.set({**(_last_writes.get() or {}), name: time.monotonic()})
+
+    # -----------------------------------------------------------------------
+    # Concurrency limits
+    # -----------------------------------------------------------------------
+
+    @classmethod
+    def set_concurrency_limit(cls, name: str, limiter: AdaptiveLimiter | None) -> None:
+        """Cap the queries in flight on connection *name* with an adaptive limit.
+
+        The limit adapts to the latency the server answers with.  Queries
+        beyond it wait up to the limiter's ``queue_timeout`` for a slot, then
+        fail fast with ``OverloadedError``.  The HTTP and WebSocket clients of
+        the connection share the limit.
+
+        Args:
+            name: Connection name.
+            limiter: The limiter to use, or ``None`` to remove the limit.
+
+        Raises:
+            ValueError: If the connection is not registered.
+        """
+        if name not in cls._configs:
+            raise ValueError(f"Unknown connection: {name!r}. Register it with add_connection() first.")
+        if limiter is None:
+            cls._limiters.pop(name, None)
+        else:
+            cls._limiters[name] = limiter
+        for clients in (cls._clients, cls._ws_clients):
+            client = clients.get(name)
+            if client is not None:
+                client.limiter = limiter
+
+    @classmethod
+    def get_concurrency_limit(cls, name: str = "default") -> AdaptiveLimiter | None:
+        """Return the limiter of connection *name* (``None`` if unlimited).
+
+        ``get_concurrency_limit(name).stats()`` reports the current limit,
+        queue length and shed count.
+        """
+        return cls._limiters.get(name)
+
     # -----------------------------------------------------------------------
     # Legacy single-connection API (delegates to "default")
     # -----------------------------------------------------------------------
@@ -319,6 +481,7 @@ class SurrealDBConnectionManager:
                     config.database,
                     protocol=config.protocol,
                 )
+                _client.limiter = cls._limiters.get(name)
                 await _client.connect()
                 await _client.signin(config.user, config.password)
 
@@ -404,6 +567,7 @@ class SurrealDBConnectionManager:
                 config.database,
                 protocol=config.protocol,
             )
+            _ws_client.limiter = cls._limiters.get(name)
             await _ws_client.connect()
             await _ws_client.signin(config.user, config.password)
 
@@ -771,8 +935,9 @@ class SurrealDBConnectionManager:
 
         :return: HTTPTransaction context manager
         """
-        client = await cls.get_client()
-        return client.transaction()
+        name = cls.get_active_connection_name() or "default"
+        client = await cls.get_client(name)
+        return _WriteTransaction(client, name)
 
     # -----------------------------------------------------------------------
     # Internal helpers
@@ -818,3 +983,17 @@ class SurrealDBConnectionManager:
                 # Some HTTP client implementations may not support close();
                 # ignore to maintain compatibility.
                 logger.debug("HTTP client for connection '%s' does not implement close().", name)
+
+
+class _WriteTransaction(HTTPTransaction):
+    """HTTPTransaction that starts the read-your-writes window of its connection once committed."""
+
+    def __init__(self, connection: HTTPConnection, name: str):
+        super().__init__(connection)
+        self._name = name
+
+    async def commit(self) -> QueryResponse:
+        """Commit the queued statements, then start the read-your-writes window."""
+        result = await super().commit()
+        SurrealDBConnectionManager._note_write(self._name)
+        return result
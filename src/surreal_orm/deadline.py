@@ -0,0 +1,167 @@
+"""
+Query deadlines and server-side timeouts.
+
+A deadline bounds how long ORM queries may run.  It is set per QuerySet with
+``QuerySet.timeout(seconds)`` or for a whole block with ``query_deadline()``,
+which propagates through ``contextvars`` to every query started inside it
+(``exec()``, ``count()``, aggregates, prefetches, ``bulk_*``).
+
+Each query is sent with a SurrealQL ``TIMEOUT`` clause set to the time left,
+so the server stops working on it once the deadline passes.  The awaiting
+call is also cancelled shortly after the deadline, which aborts the
+in-flight request.  Both raise :class:`QueryTimeoutError`.
+
+Example::
+
+    from surreal_orm import query_deadline
+
+    async with query_deadline(2.0):  # e.g. the budget of an API request
+        user = await User.objects().get("alice")
+        orders = await Order.objects().filter(user=user.id).exec()
+
+    report = await Report.objects().timeout(30).exec()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from surreal_sdk.exceptions import QueryTimeoutError
+from surreal_sdk.types import QueryResponse
+
+# Deadline (time.monotonic()) of the queries in the current context.
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("query_deadline", default=None)
+
+# Extra seconds the client waits past the deadline, so the server's TIMEOUT
+# error (which names the statement) normally arrives before the cancellation.
+_CLIENT_GRACE = 0.25
+
+
+def remaining_time() -> float | None:
+    """Return the seconds left before the current deadline (``None`` without one)."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@asynccontextmanager
+async def query_deadline(seconds: float) -> AsyncIterator[None]:
+    """
+    Bound the ORM queries of the block to ``seconds`` from now.
+
+    Nested deadlines can only shorten the enclosing one.  Code outside ORM
+    queries is not interrupted.
+
+    Args:
+        seconds: Time budget, in seconds.
+
+    Raises:
+        ValueError: If ``seconds`` is not positive.
+    """
+    if seconds <= 0:
+        raise ValueError("seconds must be > 0")
+    token = _deadline.set(_tighten(_deadline.get(), seconds))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@asynccontextmanager
+async def deadline_scope(timeout: float | None = None) -> AsyncIterator[None]:
+    """
+    Run one ORM operation within ``timeout`` and the current deadline.
+
+    Queries sent inside the scope get a matching ``TIMEOUT`` clause (see
+    :func:`timeout_clause`) and the scope is cancelled, in-flight request
+    included, once the deadline has passed.
+
+    Raises:
+        QueryTimeoutError: If the deadline has already passed or passes
+            before the operation completes.
+    """
+    deadline = _deadline.get() if timeout is None else _tighten(_deadline.get(), timeout)
+    if deadline is None:
+        yield
+        return
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise QueryTimeoutError("Query deadline exceeded before the query was sent")
+
+    token = _deadline.set(deadline)
+    scope = asyncio.timeout(left + _CLIENT_GRACE)
+    try:
+        async with scope:
+            yield
+    except TimeoutError as e:
+        if not scope.expired():
+            raise
+        raise QueryTimeoutError(f"Query cancelled: deadline of {left:.3f}s exceeded") from e
+    finally:
+        _deadline.reset(token)
+
+
+def _detached_context() -> contextvars.Context:
+    """
+    Return a copy of the current context without its deadline.
+
+    Background tasks (cache refreshes, live watchers) outlive the request that
+    starts them, so they must not inherit that request's deadline.
+    """
+    context = contextvars.copy_context()
+    context.run(_deadline.set, None)
+    return context
+
+
+def timeout_clause() -> str:
+    """Return the ``TIMEOUT`` clause for the current deadline (empty without one)."""
+    left = remaining_time()
+    if left is None:
+        return ""
+    return f" TIMEOUT {max(1, math.ceil(left * 1000))}ms"
+
+
+def with_timeout(query: str) -> str:
+    """Append the current ``TIMEOUT`` clause to the last statement of ``query``."""
+    clause = timeout_clause()
+    if not clause:
+        return query
+    body = query.rstrip()
+    if body.endswith(";"):
+        return f"{body[:-1].rstrip()}{clause};"
+    return body + clause
+
+
+def check_timeout(response: QueryResponse) -> QueryResponse:
+    """
+    Raise if a statement of ``response`` hit its ``TIMEOUT``.
+
+    Returns:
+        The response, unchanged.
+
+    Raises:
+        QueryTimeoutError: If SurrealDB reports a statement timeout.
+    """
+    for result in response.results:
+        if result.is_error and isinstance(result.result, str) and QueryTimeoutError.is_query_timeout(result.result):
+            raise QueryTimeoutError(result.result)
+    return response
+
+
+def _tighten(deadline: float | None, seconds: float) -> float:
+    candidate = time.monotonic() + seconds
+    return candidate if deadline is None else min(deadline, candidate)
+
+
+__all__ = [
+    "check_timeout",
+    "deadline_scope",
+    "query_deadline",
+    "remaining_time",
+    "timeout_clause",
+    "with_timeout",
+]
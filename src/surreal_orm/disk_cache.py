@@ -0,0 +1,314 @@
+"""
+On-disk second tier for :class:`~surreal_orm.cache.QueryCache`.
+
+``QueryCache`` keeps results as live model instances, capped by entry count.
+Large, rarely changing result sets (catalogs, reference data) are better kept
+out of RAM: with a :class:`DiskCacheTier`, entries evicted from memory are
+written to a file as compressed CBOR raw records, and a later hit reads them
+back (through a memory map), rebuilds the instances and promotes the entry to
+memory again.
+
+The file is an append-only log of entries and deletion markers. Its index is
+rebuilt from the entry headers when the file is opened, so a restarted
+process starts warm; entries whose TTL passed meanwhile are skipped.
+Space taken by deleted or replaced entries is reclaimed by compaction once it
+outweighs the live data.
+
+Example::
+
+    from surreal_orm import DiskCacheTier, QueryCache
+
+    QueryCache.configure(
+        max_size=200,  # live entries in memory
+        disk_tier=DiskCacheTier("/var/cache/myapp/query-cache.bin", max_bytes=512 * 1024 * 1024),
+    )
+
+A file must be used by one process at a time.  Reads and writes are
+synchronous local file I/O.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"SQC1"
+# magic, kind, key length, metadata length, expires_at (epoch seconds), payload length
+_HEADER = struct.Struct("<4sBIIdI")
+_PUT = 1
+_DELETE = 2
+
+# Compact only files larger than this whose dead space exceeds the live data.
+_COMPACT_MIN_BYTES = 1024 * 1024
+
+
+@dataclass(slots=True)
+class _DiskEntry:
+    """Index entry of one stored result."""
+
+    offset: int  # of the compressed payload
+    length: int  # of the compressed payload
+    size: int  # of the whole record
+    table: str
+    record_ids: frozenset[str] | None
+    expires_at: float  # time.time() deadline
+    predicate: Any = None  # from QueryCache; not persisted
+
+
+class DiskCacheTier:
+    """
+    Compressed, memory-mapped on-disk store of query results.
+
+    Args:
+        path: File holding the entries (created if missing).
+        max_bytes: Maximum size of the live entries; the oldest are dropped
+            beyond it.
+        compression_level: zlib level, 1 (fastest) to 9 (smallest).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        compression_level: int = 1,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self._index: dict[str, _DiskEntry] = {}  # insertion order = age
+        self._live_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._map: mmap.mmap | None = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a+b")  # noqa: SIM115 - kept open for the tier's lifetime
+        self._load_index()
+
+    # ── Public API ───────────────────────────────────────────────────────
+
+    def get(self, key: str) -> bytes | None:
+        """Return the (decompressed) stored value for ``key``, or ``None`` if missing or expired."""
+        entry = self._index.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if time.time() > entry.expires_at:
+            self.discard(key)
+            self._misses += 1
+            return None
+        view = self._view(entry.offset + entry.length)
+        try:
+            value = zlib.decompress(view[entry.offset : entry.offset + entry.length])
+        except zlib.error as e:
+            logger.warning(f"DiskCacheTier: dropping unreadable entry: {e}")
+            self.discard(key)
+            self._misses += 1
+            return None
+        self._hits += 1
+        return value
+
+    def put(
+        self,
+        key: str,
+        value: bytes,
+        table: str,
+        record_ids: frozenset[str] | None,
+        expires_at: float,
+        predicate: Any = None,
+    ) -> None:
+        """
+        Store ``value`` (CBOR bytes) for ``key`` until ``expires_at`` (a ``time.time()`` deadline).
+
+        ``record_ids`` and ``predicate`` are kept for record-granular
+        invalidation; the predicate is only held in memory.
+        """
+        if expires_at <= time.time():
+            return
+        payload = zlib.compress(value, self.compression_level)
+        meta = json.dumps({"t": table, "i": sorted(record_ids) if record_ids is not None else None}).encode()
+        key_bytes = key.encode()
+        size = _HEADER.size + len(key_bytes) + len(meta) + len(payload)
+        if size > self.max_bytes:
+            return
+
+        self._drop(key)
+        offset = self._append(
+            _HEADER.pack(_MAGIC, _PUT, len(key_bytes), len(meta), expires_at, len(payload)) + key_bytes + meta + payload
+        )
+        self._index[key] = _DiskEntry(
+            offset=offset + size - len(payload),
+            length=len(payload),
+            size=size,
+            table=table,
+            record_ids=record_ids,
+            expires_at=expires_at,
+            predicate=predicate,
+        )
+        self._live_bytes += size
+        while self._live_bytes > self.max_bytes:
+            self.discard(next(iter(self._index)))
+        self._maybe_compact()
+
+    def discard(self, key: str) -> bool:
+        """Delete the entry for ``key``; return whether there was one."""
+        if not self._drop(key):
+            return False
+        key_bytes = key.encode()
+        self._append(_HEADER.pack(_MAGIC, _DELETE, len(key_bytes), 0, 0.0, 0) + key_bytes)
+        return True
+
+    def entries(self, table: str) -> list[tuple[str, frozenset[str] | None, Any]]:
+        """Return ``(key, record_ids, predicate)`` for every stored entry of ``table``."""
+        return [(key, e.record_ids, e.predicate) for key, e in self._index.items() if e.table == table]
+
+    def invalidate_table(self, table: str) -> int:
+        """Delete every entry of ``table``; return how many were deleted."""
+        keys = [key for key, entry in self._index.items() if entry.table == table]
+        for key in keys:
+            self.discard(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Delete every entry, truncate the file and reset the hit counters."""
+        self._close_map()
+        self._file.truncate(0)
+        self._index.clear()
+        self._live_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def close(self) -> None:
+        """Close the file; the entries stay on disk for the next start."""
+        self._close_map()
+        self._file.close()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return tier statistics.
+
+        Returns:
+            Dict with ``entries``, ``bytes`` (live entries), ``file_bytes``,
+            ``max_bytes``, ``hits``, ``misses`` and ``hit_ratio``.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._index),
+            "bytes": self._live_bytes,
+            "file_bytes": self._file_size(),
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+        }
+
+    # ── Internal ─────────────────────────────────────────────────────────
+
+    def _drop(self, key: str) -> bool:
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return False
+        self._live_bytes -= entry.size
+        return True
+
+    def _append(self, record: bytes) -> int:
+        """Append ``record`` to the file and return its offset."""
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        self._file.write(record)
+        self._file.flush()
+        return offset
+
+    def _file_size(self) -> int:
+        self._file.seek(0, os.SEEK_END)
+        return self._file.tell()
+
+    def _view(self, end: int) -> mmap.mmap:
+        """Return a read-only map of the file covering at least ``end`` bytes."""
+        if self._map is None or len(self._map) < end:
+            self._close_map()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _close_map(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _load_index(self) -> None:
+        """Rebuild the index from the file; a truncated or corrupt tail is cut off."""
+        size = self._file_size()
+        if not size:
+            return
+        view = self._view(size)
+        now = time.time()
+        position = 0
+        while position < size:
+            if position + _HEADER.size > size:
+                break
+            magic, kind, key_length, meta_length, expires_at, payload_length = _HEADER.unpack_from(view, position)
+            record_size = _HEADER.size + key_length + meta_length + payload_length
+            if magic != _MAGIC or kind not in (_PUT, _DELETE) or position + record_size > size:
+                break
+            start = position + _HEADER.size
+            key = bytes(view[start : start + key_length]).decode()
+            self._drop(key)
+            if kind == _PUT and expires_at > now:
+                meta = json.loads(view[start + key_length : start + key_length + meta_length])
+                ids = meta["i"]
+                self._index[key] = _DiskEntry(
+                    offset=position + record_size - payload_length,
+                    length=payload_length,
+                    size=record_size,
+                    table=meta["t"],
+                    record_ids=frozenset(ids) if ids is not None else None,
+                    expires_at=expires_at,
+                )
+                self._live_bytes += record_size
+            position += record_size
+
+        if position < size:
+            logger.warning(f"DiskCacheTier: ignoring {size - position} unreadable bytes at the end of {self.path}")
+            self._close_map()
+            self._file.truncate(position)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the file with only the live entries once dead space outweighs them."""
+        size = self._file_size()
+        if size < _COMPACT_MIN_BYTES or size < 2 * self._live_bytes:
+            return
+        view = self._view(size)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        now = time.time()
+        index: dict[str, _DiskEntry] = {}
+        live_bytes = 0
+        with open(tmp_path, "wb") as tmp:
+            for key, entry in self._index.items():
+                if now > entry.expires_at:
+                    continue
+                start = entry.offset + entry.length - entry.size
+                tmp_offset = tmp.tell()
+                tmp.write(view[start : start + entry.size])
+                entry.offset = tmp_offset + entry.size - entry.length
+                index[key] = entry
+                live_bytes += entry.size
+        self._close_map()
+        self._file.close()
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "a+b")  # noqa: SIM115 - kept open for the tier's lifetime
+        self._index = index
+        self._live_bytes = live_bytes
+
+
+__all__ = ["DiskCacheTier"]
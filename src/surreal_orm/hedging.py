@@ -0,0 +1,264 @@
+"""
+Hedged reads to cut tail latency.
+
+A hedged read sends an idempotent query, and if no answer arrives within a
+delay taken from recent latencies (e.g. their 95th percentile), sends the same
+query a second time — to another read replica when there is one, otherwise
+over a second HTTP request to the same connection.  The first answer wins;
+the other request is cancelled.
+
+Hedging is opt-in and capped by a budget: each read earns ``budget`` hedge
+tokens and each hedge spends one, so hedges stay below that fraction of the
+reads even when the database is slow across the board.
+
+Example::
+
+    from surreal_orm import HedgedReads
+
+    HedgedReads.configure(enabled=True, percentile=95, budget=0.05)
+
+    users = await User.objects().filter(active=True).exec()  # hedged
+    report = await Report.objects().hedge(False).exec()  # opted out
+
+    HedgedReads.stats()  # reads, hedged, hedge_rate, hedge_wins, win_rate, ...
+
+Hedging applies to ``QuerySet.exec()``, ``count()`` and ``get()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Hedge tokens that can be saved up for bursts of slow reads.
+_MAX_TOKENS = 10.0
+# Latency samples needed before the percentile replaces the initial delay.
+_MIN_SAMPLES = 20
+# New samples after which the delay percentile is recomputed.
+_RECOMPUTE_EVERY = 16
+
+
+class HedgedReads:
+    """
+    Global hedging policy for idempotent reads.
+
+    This is a class-level singleton — call ``configure()`` once at startup.
+    """
+
+    # ── Configuration ────────────────────────────────────────────────────
+
+    _enabled: bool = False
+    _percentile: float = 95.0
+    _min_delay: float = 0.005  # seconds
+    _initial_delay: float = 0.05  # seconds, until enough latencies are known
+    _budget: float = 0.05  # hedges per read
+    _window: int = 1000  # latency samples kept per connection
+
+    # ── State ────────────────────────────────────────────────────────────
+
+    _latencies: dict[str, deque[float]] = {}
+    _delays: dict[str, float] = {}
+    _pending_samples: dict[str, int] = {}
+    _tokens: float = 0.0
+    _reads: int = 0
+    _hedges: int = 0
+    _hedge_wins: int = 0
+    _budget_denied: int = 0
+
+    # ── Public API ───────────────────────────────────────────────────────
+
+    @classmethod
+    def configure(
+        cls,
+        *,
+        enabled: bool = True,
+        percentile: float = 95.0,
+        min_delay: float = 0.005,
+        initial_delay: float = 0.05,
+        budget: float = 0.05,
+        window: int = 1000,
+    ) -> None:
+        """
+        Configure the hedging policy.
+
+        Args:
+            enabled: Whether reads are hedged by default (``QuerySet.hedge()``
+                overrides it per query).
+            percentile: Latency percentile (of recent reads on the same
+                connection) after which a read is hedged.
+            min_delay: Lower bound of the hedge delay, in seconds.
+            initial_delay: Hedge delay used until enough latencies are known.
+            budget: Maximum hedges per read (``0.05`` → at most 5% extra
+                queries).
+            window: Number of recent latencies kept per connection.
+
+        Raises:
+            ValueError: If ``percentile`` is not in (0, 100], ``budget`` is
+                not in [0, 1], a delay is negative or ``window`` is not positive.
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be > 0 and <= 100")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+        if min_delay < 0 or initial_delay < 0:
+            raise ValueError("delays must be >= 0")
+        if window <= 0:
+            raise ValueError("window must be > 0")
+        cls._enabled = enabled
+        cls._percentile = percentile
+        cls._min_delay = min_delay
+        cls._initial_delay = initial_delay
+        cls._budget = budget
+        if window != cls._window:
+            cls._window = window
+            cls._latencies = {name: deque(samples, maxlen=window) for name, samples in cls._latencies.items()}
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget the recorded latencies, the saved-up budget and the counters."""
+        cls._latencies = {}
+        cls._delays = {}
+        cls._pending_samples = {}
+        cls._tokens = 0.0
+        cls._reads = 0
+        cls._hedges = 0
+        cls._hedge_wins = 0
+        cls._budget_denied = 0
+
+    @classmethod
+    def delay(cls, connection: str) -> float:
+        """Return the current hedge delay, in seconds, for reads on ``connection``."""
+        return max(cls._delays.get(connection, cls._initial_delay), cls._min_delay)
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        Return hedging statistics.
+
+        Returns:
+            Dict with ``enabled``, ``reads``, ``hedged``, ``hedge_rate``,
+            ``hedge_wins``, ``win_rate`` (share of hedges answering first),
+            ``budget_denied`` (hedges skipped for lack of budget), ``budget``,
+            ``percentile`` and ``delays`` (current delay per connection).
+        """
+        return {
+            "enabled": cls._enabled,
+            "reads": cls._reads,
+            "hedged": cls._hedges,
+            "hedge_rate": cls._hedges / cls._reads if cls._reads else 0.0,
+            "hedge_wins": cls._hedge_wins,
+            "win_rate": cls._hedge_wins / cls._hedges if cls._hedges else 0.0,
+            "budget_denied": cls._budget_denied,
+            "budget": cls._budget,
+            "percentile": cls._percentile,
+            "delays": {name: cls.delay(name) for name in cls._latencies},
+        }
+
+    @classmethod
+    async def run(
+        cls,
+        connection: str,
+        operation: Callable[[Any], Awaitable[T]],
+        *,
+        enabled: bool | None = None,
+    ) -> T:
+        """
+        Run the read ``operation`` (given a client) on ``connection``, hedged if enabled.
+
+        Args:
+            connection: Name of the connection the model reads from.
+            operation: Coroutine function running the read on a client.  It
+                may run twice concurrently and must not have side effects.
+            enabled: Overrides the global setting for this read.
+
+        Returns:
+            The result of the first successful attempt.
+        """
+        from .connection_manager import SurrealDBConnectionManager
+
+        if not (cls._enabled if enabled is None else enabled):
+            return await operation(await SurrealDBConnectionManager.get_read_client(connection))
+
+        cls._reads += 1
+        cls._tokens = min(cls._tokens + cls._budget, _MAX_TOKENS)
+        first_name = SurrealDBConnectionManager.get_read_connection_name(connection)
+        first = asyncio.create_task(cls._attempt(connection, first_name, operation, primary=True))
+        attempts = [first]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=cls.delay(connection))
+            if done:
+                return first.result()
+            if cls._tokens < 1:
+                cls._budget_denied += 1
+                return await first
+
+            cls._tokens -= 1
+            cls._hedges += 1
+            hedge_name = SurrealDBConnectionManager.get_read_connection_name(connection, exclude=first_name)
+            hedge = asyncio.create_task(cls._attempt(connection, hedge_name, operation, primary=False))
+            attempts.append(hedge)
+            pending: set[asyncio.Task[T]] = {first, hedge}
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    error = attempt.exception()
+                    if error is None:
+                        if attempt is hedge:
+                            cls._hedge_wins += 1
+                        return attempt.result()
+            assert error is not None
+            raise error
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
+    # ── Internal ─────────────────────────────────────────────────────────
+
+    @classmethod
+    async def _attempt(cls, connection: str, name: str, operation: Callable[[Any], Awaitable[T]], *, primary: bool) -> T:
+        """
+        Run one attempt of a read and record its latency.
+
+        The primary attempt is always recorded, even when it fails or is
+        cancelled after losing to the hedge: its elapsed time is then a lower
+        bound of the real latency.  Leaving slow primaries out would pull the
+        percentile, and so the hedge delay, below the latency it should track.
+        A hedge is only recorded when it completes.
+        """
+        from .connection_manager import SurrealDBConnectionManager
+
+        client = await SurrealDBConnectionManager.get_client(name)
+        start = time.perf_counter()
+        completed = False
+        try:
+            result = await operation(client)
+            completed = True
+            return result
+        finally:
+            if primary or completed:
+                cls._record(connection, time.perf_counter() - start)
+
+    @classmethod
+    def _record(cls, connection: str, latency: float) -> None:
+        """Add a latency sample, recomputing the delay percentile every few samples."""
+        samples = cls._latencies.get(connection)
+        if samples is None:
+            samples = cls._latencies[connection] = deque(maxlen=cls._window)
+        samples.append(latency)
+        count = cls._pending_samples.get(connection, 0) + 1
+        if len(samples) < _MIN_SAMPLES or (count < _RECOMPUTE_EVERY and connection in cls._delays):
+            cls._pending_samples[connection] = count
+            return
+        cls._pending_samples[connection] = 0
+        ordered = sorted(samples)
+        cls._delays[connection] = ordered[min(len(ordered) - 1, int(len(ordered) * cls._percentile / 100))]
+
+
+__all__ = ["HedgedReads"]
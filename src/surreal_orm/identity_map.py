@@ -0,0 +1,161 @@
+"""
+Request-scoped identity map for model instances.
+
+Within one request the same record is often loaded several times — through
+``get()``, ``first()``, relations and prefetches — each time with a fresh query
+and a fresh Pydantic instance. While an :class:`IdentityMap` is active, every
+record loaded by the ORM is registered under its ``table:id`` key: later loads
+of the same record return the *same* instance (skipping validation), and
+``QuerySet.get(id=...)`` is answered from the map without a query.
+
+The map is activated with ``async with`` and scoped with ``contextvars``
+(like :class:`~surreal_orm.debug.QueryLogger`), so concurrent requests each
+see only their own instances.
+
+Example::
+
+    from surreal_orm import IdentityMap
+
+    async with IdentityMap() as identity:
+        author = await User.objects().get("alice")
+        post = await Post.objects().get("p1")
+        same = await User.objects().get(id="alice")  # no query
+        assert same is author
+
+    print(identity.hits)  # 1
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from .model_base import BaseSurrealModel
+
+_active_identity_map: ContextVar[IdentityMap | None] = ContextVar("_active_identity_map", default=None)
+
+
+class IdentityMap:
+    """
+    Async context manager holding one instance per ``table:id``.
+
+    Loads keep the instance already in the map, so unsaved changes made to it
+    are not overwritten by a later query; call ``refresh()`` on the instance
+    to reload it explicitly.  Partial loads (``select()`` projections) are
+    never registered, so ``get()`` is not answered with missing fields.
+
+    Attributes:
+        hits: Number of loads answered with an instance already in the map.
+    """
+
+    def __init__(self) -> None:
+        self._instances: dict[str, BaseSurrealModel] = {}
+        self.hits = 0
+        self._token: Any = None
+
+    async def __aenter__(self) -> Self:
+        self._token = _active_identity_map.set(self)
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        if self._token is not None:
+            _active_identity_map.reset(self._token)
+            self._token = None
+
+    @staticmethod
+    def _key(model: type[BaseSurrealModel], record_id: str) -> str:
+        return f"{model.get_table_name()}:{record_id}"
+
+    def get(self, model: type[BaseSurrealModel], record_id: str) -> BaseSurrealModel | None:
+        """Return the instance of ``model`` registered for ``record_id``, if any."""
+        instance = self._instances.get(self._key(model, record_id))
+        # Two models may map the same table; only hand out instances of the requested class.
+        if instance is None or not isinstance(instance, model):
+            return None
+        self.hits += 1
+        return instance
+
+    def add(self, instance: BaseSurrealModel) -> None:
+        """Register ``instance`` under its ``table:id`` key (ignored without an id or after a partial load)."""
+        record_id = instance.get_id()
+        if record_id and not instance._db_partial:
+            self._instances[self._key(instance.__class__, record_id)] = instance
+
+    def discard(self, model: type[BaseSurrealModel], record_id: str) -> None:
+        """Forget the instance registered for ``record_id``."""
+        self._instances.pop(self._key(model, record_id), None)
+
+    def clear(self) -> None:
+        """Forget all registered instances."""
+        self._instances.clear()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._instances
+
+    def __repr__(self) -> str:
+        return f"IdentityMap({len(self._instances)} instances, {self.hits} hits)"
+
+
+def _identity_get(model: type[BaseSurrealModel], record_id: Any) -> BaseSurrealModel | None:
+    """Look ``record_id`` up in the active IdentityMap, if any."""
+    identity = _active_identity_map.get(None)
+    if identity is None or not record_id:
+        return None
+    return identity.get(model, str(record_id))
+
+
+def _identity_add(instance: BaseSurrealModel) -> None:
+    """Register ``instance`` in the active IdentityMap, if any."""
+    identity = _active_identity_map.get(None)
+    if identity is not None:
+        identity.add(instance)
+
+
+def _identity_discard(model: type[BaseSurrealModel], record_id: str) -> None:
+    """Remove ``record_id`` from the active IdentityMap, if any."""
+    identity = _active_identity_map.get(None)
+    if identity is not None:
+        identity.discard(model, record_id)
+
+
+@contextmanager
+def _identity_suspended() -> Iterator[None]:
+    """Load without the active IdentityMap (for results shared beyond this request)."""
+    token = _active_identity_map.set(None)
+    try:
+        yield
+    finally:
+        _active_identity_map.reset(token)
+
+
+def _identity_resolve(result: Any) -> Any:
+    """
+    Map the instances of a list result through the active IdentityMap, if any.
+
+    Instances already in the map are replaced by the mapped ones; the others
+    are registered.
+    """
+    from .model_base import BaseSurrealModel
+
+    identity = _active_identity_map.get(None)
+    if identity is None or not isinstance(result, list):
+        return result
+    resolved = []
+    for item in result:
+        if isinstance(item, BaseSurrealModel) and (record_id := item.get_id()):
+            existing = identity.get(type(item), record_id)
+            if existing is None:
+                identity.add(item)
+            else:
+                item = existing
+        resolved.append(item)
+    return resolved
+
+
+__all__ = ["IdentityMap"]
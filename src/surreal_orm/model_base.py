@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import (
     TYPE_CHECKING,
@@ -16,13 +17,15 @@ from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
 from . import signals as model_signals
 from .connection_manager import SurrealDBConnectionManager
 from .debug import _elapsed_ms, _log_query, _start_timer
+from .identity_map import _identity_add, _identity_discard, _identity_get
 from .surreal_function import SurrealFunc
-from .types import SchemaMode, TableType
+from .types import Returning, SchemaMode, TableType
 from .utils import SAFE_IDENTIFIER_RE as _SAFE_IDENTIFIER_RE
-from .utils import format_thing, parse_record_id
+from .utils import format_thing, parse_record_id, return_clause
 
 if TYPE_CHECKING:
     from surreal_sdk.transaction import BaseTransaction, HTTPTransaction
+    from surreal_sdk.types import QueryResult
 
     from .query_set import QuerySet
 
@@ -93,6 +96,21 @@ def _parse_record_id(record_id: Any) -> str | None:
     return record_str
 
 
+def _statement_results(results: list["QueryResult"], statements: int, transactional: bool) -> list["QueryResult"]:
+    """
+    Return the results of the ``statements`` sent, dropping BEGIN/COMMIT ones.
+
+    Some servers report ``BEGIN``/``COMMIT TRANSACTION`` as statements of their
+    own, others do not; any other count means the results can't be matched to
+    the statements and raises ``SurrealDbError``.
+    """
+    if len(results) == statements:
+        return results
+    if transactional and len(results) == statements + 2:
+        return results[1:-1]
+    raise SurrealDbError(f"Expected {statements} statement result(s), got {len(results)}.")
+
+
 def _parse_datetime(value: Any) -> Any:
     """
     Parse a datetime value from SurrealDB.
@@ -206,6 +224,15 @@ class SurrealConfigDict(ConfigDict):
         grant_duration: Lifetime of refresh tokens (SurrealDB 3.0+, e.g.,
             ``"30d"``).  Only relevant when ``with_refresh=True``.  Maps to
             ``DURATION FOR GRANT`` in the access definition.
+        track_changes: Snapshot loaded records so ``save()`` only sends fields
+            whose value actually changed and skips the request entirely when
+            nothing did (default: True).  Set to False to fall back to sending
+            every explicitly set field.
+        in_chunk_size: Opt-in: largest ``__in`` list a query sends as one
+            value.  Keyword ``__in`` filters with longer lists are split into
+            chunks of this size that are queried concurrently and merged
+            (``exec()``, ``count()``, ``sum()``, ``min()``, ``max()`` and
+            ``aggregate()`` without ``Avg``).  Default: ``None`` (no chunking).
     """
 
     primary_key: str | None
@@ -228,6 +255,8 @@ class SurrealConfigDict(ConfigDict):
     flexible_fields: list[str] | None
     with_refresh: bool | None
     grant_duration: str | None
+    track_changes: bool | None
+    in_chunk_size: int | None
 
 
 class BaseSurrealModel(BaseModel):
@@ -268,6 +297,18 @@ class BaseSurrealModel(BaseModel):
     # This helps distinguish between create (first save) and update (subsequent saves).
     _db_persisted: bool = PrivateAttr(default=False)
 
+    # Field values as last read from / written to the database (keyed by alias,
+    # excluding id and server fields). Used by save() to send only changed fields.
+    _db_snapshot: dict[str, Any] | None = PrivateAttr(default=None)
+
+    # Database names of the fields read from the database, so partially loaded
+    # instances do not report defaults as stored values (see _known_values()).
+    _db_fields: frozenset[str] = PrivateAttr(default=frozenset())
+
+    # Loaded with a projection (select()): only _db_fields are known, so the
+    # snapshot covers just those and every other field counts as dirty.
+    _db_partial: bool = PrivateAttr(default=False)
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """Register subclasses and process computed field defaults."""
         # Process computed fields BEFORE Pydantic processes the class.
@@ -594,7 +635,7 @@ class BaseSurrealModel(BaseModel):
         return None  # pragma: no cover
 
     @classmethod
-    def from_db(cls, record: dict[str, Any] | list[Any] | None) -> Self | list[Self]:
+    def from_db(cls, record: dict[str, Any] | list[Any] | None, *, partial: bool = False) -> Self | list[Self]:
         """
         Create an instance from a SurrealDB record.
 
@@ -602,22 +643,34 @@ class BaseSurrealModel(BaseModel):
         - datetime fields: SurrealDB may return ISO strings or Python datetime objects
           with timezone info that needs normalization for Pydantic validation.
         - id field: RecordId objects from CBOR responses are converted to strings.
+
+        Set ``partial`` when the record holds only some fields (a projection):
+        the fields it lacks are then treated as changed by ``save()``.
         """
         if record is None:
             raise cls.DoesNotExist("Record not found.")
 
         if isinstance(record, list):
-            return [cls.from_db(rs) for rs in record]  # type: ignore
+            return [cls.from_db(rs, partial=partial) for rs in record]  # type: ignore
 
         # Preprocess record data before Pydantic validation
         # This handles datetime parsing and RecordId conversion
         processed_record = cls._preprocess_db_record(record)
 
+        # Within an active IdentityMap, reuse the instance already loaded for this record
+        existing = _identity_get(cls, processed_record.get("id"))
+        if existing is not None:
+            return existing  # type: ignore[return-value]
+
         instance = cls(**processed_record)
         instance._db_persisted = True
         # Clear fields_set so DB-loaded fields aren't considered "user-set"
         # This allows exclude_unset=True to work correctly on subsequent saves
         object.__setattr__(instance, "__pydantic_fields_set__", set())
+        instance._db_fields = frozenset(processed_record)
+        instance._db_partial = partial
+        instance._take_snapshot()
+        _identity_add(instance)
         return instance
 
     @classmethod
@@ -708,6 +761,83 @@ class BaseSurrealModel(BaseModel):
 
         # Mark as persisted since we just loaded data from DB
         self._db_persisted = True
+        self._db_fields = self._db_fields | record.keys()
+        self._take_snapshot()
+        _identity_add(self)
+
+    @classmethod
+    def tracks_changes(cls) -> bool:
+        """Return True if instances snapshot their persisted state (``track_changes``)."""
+        return cls.model_config.get("track_changes", True) is not False
+
+    @classmethod
+    def get_in_chunk_size(cls) -> int | None:
+        """Return the ``__in`` list size above which queries are chunked, or None if disabled."""
+        size = cls.model_config.get("in_chunk_size")
+        return int(size) if isinstance(size, int) and size > 0 else None
+
+    def _dump_persistable(self, exclude_unset: bool = False) -> dict[str, Any]:
+        """Dump the fields save() may write: everything but ``id`` and server fields, by alias."""
+        exclude_fields = {"id"} | self.get_server_fields()
+        return self.model_dump(exclude=exclude_fields, exclude_unset=exclude_unset, by_alias=True)
+
+    def _known_values(self) -> dict[str, Any]:
+        """Field values (by database name) known to match the stored record: read from it or set explicitly."""
+        fields = type(self).model_fields
+        known = self._db_fields | {fields[name].alias or name for name in self.model_fields_set if name in fields}
+        return {key: value for key, value in self.model_dump(by_alias=True).items() if key in known}
+
+    def _take_snapshot(self) -> None:
+        """Record the current field values as the persisted state (only the loaded ones after a partial load)."""
+        if self.tracks_changes():
+            snapshot = self._dump_persistable()
+            if self._db_partial:
+                snapshot = {key: value for key, value in snapshot.items() if key in self._db_fields}
+            self._db_snapshot = snapshot
+
+    @classmethod
+    def _db_names(cls, names: Iterable[str]) -> list[str]:
+        """Map attribute names to database names (aliases)."""
+        fields = cls.model_fields
+        return [(fields[name].alias or name) if name in fields else name for name in names]
+
+    def _mark_stored(self, keys: Iterable[str]) -> None:
+        """Record the current values of the fields ``keys`` (database names) as stored."""
+        stored = frozenset(keys)
+        self._db_fields = self._db_fields | stored
+        if self._db_snapshot is not None:
+            current = self._dump_persistable()
+            self._db_snapshot.update({key: current[key] for key in stored if key in current})
+
+    def get_dirty_fields(self) -> dict[str, Any]:
+        """
+        Return the fields whose value differs from the last loaded/saved state.
+
+        Keys are database names (aliases). Mutations of nested values (e.g.
+        ``user.tags.append("x")``) are detected as well. Without a snapshot
+        (new instances, or ``track_changes=False``) every explicitly set field
+        is considered dirty.  After a partial load (``select()``), a field
+        that was not loaded is dirty once it is assigned, whatever its value.
+
+        Example:
+            user = await User.objects().get("alice")
+            user.age += 1
+            user.get_dirty_fields()  # {"age": 31}
+        """
+        snapshot = self._db_snapshot
+        if snapshot is None or not self._db_persisted:
+            return self._dump_persistable(exclude_unset=True)
+        # Fields outside the snapshot were not loaded: dirty once set explicitly.
+        set_fields = set(self._db_names(self.model_fields_set))
+        return {
+            key: value
+            for key, value in self._dump_persistable().items()
+            if (snapshot[key] != value if key in snapshot else key in set_fields)
+        }
+
+    def is_dirty(self) -> bool:
+        """Return True if save() would write any field."""
+        return bool(self.get_dirty_fields())
 
     async def refresh(self) -> None:
         """
@@ -717,7 +847,7 @@ class BaseSurrealModel(BaseModel):
         if not record_id:
             raise SurrealDbError("Can't refresh data, not recorded yet.")  # pragma: no cover
 
-        client = await SurrealDBConnectionManager.get_client(self.get_connection_name())
+        client = await SurrealDBConnectionManager.get_read_client(self.get_connection_name())
         thing = format_thing(self.get_table_name(), record_id)
         result = await client.select(thing)
 
@@ -730,6 +860,7 @@ class BaseSurrealModel(BaseModel):
             raise SurrealDbError("Can't refresh data, no record found.")  # pragma: no cover
 
         # Update instance fields without marking them as user-set
+        self._db_partial = False
         self._update_from_db(record)
         return None
 
@@ -766,12 +897,15 @@ class BaseSurrealModel(BaseModel):
         tx: "BaseTransaction | None" = None,
         server_values: dict[str, "SurrealFunc"] | None = None,
         extra_vars: dict[str, Any] | None = None,
+        returning: Returning | None = None,
     ) -> Self:
         """
         Save the model instance to the database.
 
         For persisted records: uses merge() for partial update, only sending
-        explicitly set fields (preserving server-side values like timestamps).
+        fields that changed since the record was loaded or last saved
+        (preserving server-side values like timestamps). When nothing changed
+        and no ``server_values`` are given, no request is sent at all.
         For new records with ID: uses upsert() to create or fully replace.
         For new records without ID: uses create() to auto-generate an ID.
 
@@ -791,11 +925,21 @@ class BaseSurrealModel(BaseModel):
                 Use this when ``server_values`` contain ``SurrealFunc`` expressions
                 that reference bound parameters (e.g.,
                 ``SurrealFunc("crypto::argon2::generate($password)")``).
+            returning: What the server sends back. ``None`` (default) keeps
+                the SDK's full-record response. ``"none"`` returns nothing
+                (a denied or missing update is then not detected),
+                ``"count"`` only the record id, ``"diff"`` the changes,
+                ``"after"`` the full record and a list of field names only
+                those fields; returned fields are applied to the instance.
+                A record created without an id always gets its id back.
 
         Example:
             # Without transaction
             await user.save()
 
+            # Only pick up a server-computed field
+            await post.save(returning=["updated_at"])
+
             # With server-side functions
             from surreal_orm import SurrealFunc
             await player.save(server_values={
@@ -828,25 +972,9 @@ class BaseSurrealModel(BaseModel):
             tx=tx,
         )
 
-        # Build exclude set: always exclude 'id' and any server-generated fields
-        exclude_fields = {"id"} | self.get_server_fields()
         id = self.get_id()
         table = self.get_table_name()
-        data = self.model_dump(exclude=exclude_fields, exclude_unset=True, by_alias=True)
-        data = self._restore_datetime_fields(data)
-
-        # Merge server-side function values
-        if server_values:
-            for key, val in server_values.items():
-                if not _SAFE_IDENTIFIER_RE.match(key):
-                    raise ValueError(f"Invalid server_values key {key!r}; keys must be valid identifiers.")
-                if key in exclude_fields:
-                    raise ValueError(f"server_values may not set reserved or server-generated field: {key!r}")
-                if not isinstance(val, SurrealFunc):
-                    raise TypeError(
-                        f"All server_values must be SurrealFunc instances; got {type(val).__name__!r} for key {key!r}."
-                    )
-            data.update(server_values)
+        data = self._build_save_data(server_values)
 
         # Wrap the DB operation with around_save signal
         async with model_signals.around_save.wrap(
@@ -855,7 +983,15 @@ class BaseSurrealModel(BaseModel):
             created=created,
             tx=tx,
         ):
-            await self._execute_save(tx, table, id, data, created, extra_vars)
+            # An unchanged persisted record needs no round-trip.
+            if created or data or self._db_snapshot is None:
+                await self._execute_save(tx, table, id, data, created, extra_vars, returning)
+                # Transactions may still roll back; keep the old snapshot so a
+                # retried save() resends the changes.
+                if tx is None:
+                    self._db_fields = self._db_fields | {k for k, v in data.items() if not isinstance(v, SurrealFunc)}
+                    self._take_snapshot()
+                    SurrealDBConnectionManager._note_write(self.get_connection_name())
 
         # Send post_save signal
         await model_signals.post_save.send(
@@ -866,6 +1002,26 @@ class BaseSurrealModel(BaseModel):
         )
         return self
 
+    def _build_save_data(self, server_values: dict[str, "SurrealFunc"] | None = None) -> dict[str, Any]:
+        """Collect the fields save() writes: the dirty fields plus validated ``server_values``."""
+        # Always exclude 'id' and any server-generated fields
+        exclude_fields = {"id"} | self.get_server_fields()
+        data = self._restore_datetime_fields(self.get_dirty_fields())
+
+        # Merge server-side function values
+        if server_values:
+            for key, val in server_values.items():
+                if not _SAFE_IDENTIFIER_RE.match(key):
+                    raise ValueError(f"Invalid server_values key {key!r}; keys must be valid identifiers.")
+                if key in exclude_fields:
+                    raise ValueError(f"server_values may not set reserved or server-generated field: {key!r}")
+                if not isinstance(val, SurrealFunc):
+                    raise TypeError(
+                        f"All server_values must be SurrealFunc instances; got {type(val).__name__!r} for key {key!r}."
+                    )
+            data.update(server_values)
+        return data
+
     @staticmethod
     def _has_surreal_funcs(data: dict[str, Any]) -> bool:
         """Check if any values in the data dict are SurrealFunc instances."""
@@ -922,11 +1078,12 @@ class BaseSurrealModel(BaseModel):
         id: str | None,
         data: dict[str, Any],
         extra_vars: dict[str, Any] | None = None,
+        returning: Returning | None = None,
     ) -> None:
         """Build a SET-clause query from *data* and execute it.
 
-        Shared implementation for :meth:`_execute_save_with_funcs` and
-        :meth:`_execute_save_with_set_clause`.
+        Shared implementation for :meth:`_execute_save_with_funcs`,
+        :meth:`_execute_save_with_set_clause` and saves with ``returning``.
         """
         set_clause, variables = self._build_set_clause(data)
         if extra_vars:
@@ -940,15 +1097,22 @@ class BaseSurrealModel(BaseModel):
             variables.update(extra_vars)
 
         is_update = self._db_persisted and id is not None
+        if returning is not None and id is None and returning != "after":
+            # A created record must at least send back its generated id.
+            if not isinstance(returning, (list, tuple)):
+                returning = "count"
+            elif "id" not in returning:
+                returning = ["id", *returning]
+        tail = (f" SET {set_clause}" if set_clause else "") + (f" {return_clause(returning)}" if returning else "")
         thing: str | None = None
         if is_update:
             thing = format_thing(table, id)  # type: ignore[arg-type]
-            query = f"UPDATE {thing} SET {set_clause};"
+            query = f"UPDATE {thing}{tail};"
         elif id is not None:
             thing = format_thing(table, id)
-            query = f"UPSERT {thing} SET {set_clause};"
+            query = f"UPSERT {thing}{tail};"
         else:
-            query = f"CREATE {table} SET {set_clause};"
+            query = f"CREATE {table}{tail};"
 
         if tx is not None:
             start = _start_timer()
@@ -963,10 +1127,11 @@ class BaseSurrealModel(BaseModel):
         # A persisted UPDATE that affects no rows is a denied/missing write —
         # surface it (skipped for deferred HTTP transactions). Mirrors the
         # plain merge guard for the SurrealFunc / complex-nested-data paths.
-        if is_update:
+        if is_update and returning != "none":
             self._raise_if_no_record_affected(result, thing or table, tx)
 
-        if not self._db_persisted and result.all_records:
+        writes_back = not self._db_persisted or returning == "after" or isinstance(returning, (list, tuple))
+        if writes_back and result.all_records:
             record = result.all_records[0]
             if isinstance(record, dict):
                 self._update_from_db(record)
@@ -1037,8 +1202,14 @@ class BaseSurrealModel(BaseModel):
         data: dict[str, Any],
         created: bool,
         extra_vars: dict[str, Any] | None = None,
+        returning: Returning | None = None,
     ) -> None:
         """Execute the actual save operation (wrapped by around_save signal)."""
+        # An explicit RETURN clause needs the raw query path
+        if returning is not None:
+            await self._execute_save_using_query(tx, table, id, data, extra_vars, returning)
+            return
+
         # If data contains SurrealFunc values, use raw query path
         if self._has_surreal_funcs(data):
             await self._execute_save_with_funcs(tx, table, id, data, created, extra_vars)
@@ -1165,6 +1336,7 @@ class BaseSurrealModel(BaseModel):
                 result = await client.merge(thing, data)
                 _log_query(f"UPDATE MERGE {thing}", data, _elapsed_ms(start))
                 result_records = result.records
+                SurrealDBConnectionManager._note_write(self.get_connection_name())
 
         # Send post_update signal
         await model_signals.post_update.send(
@@ -1187,6 +1359,7 @@ class BaseSurrealModel(BaseModel):
         tx: "BaseTransaction | None" = None,
         refresh: bool = True,
         extra_vars: dict[str, Any] | None = None,
+        returning: Returning | None = None,
         **data: Any,
     ) -> Self:
         """
@@ -1211,6 +1384,11 @@ class BaseSurrealModel(BaseModel):
             extra_vars: Optional dict of additional query variables to bind.
                 Use this when data contains :class:`SurrealFunc` expressions
                 that reference bound parameters.
+            returning: What the UPDATE sends back (``"none"``, ``"count"``,
+                ``"diff"``, ``"after"`` or a list of field names). ``"after"``
+                and field lists are applied to the instance in place of the
+                ``refresh`` SELECT; with the other modes no refresh is done.
+                ``None`` (default) keeps the behaviour described above.
             **data: Fields to update. Values may be :class:`SurrealFunc` instances
                 for server-side expressions.
 
@@ -1243,8 +1421,8 @@ class BaseSurrealModel(BaseModel):
             tx=tx,
         ):
             result: Any
-            if self._has_surreal_funcs(data_set):
-                # Use raw query path for SurrealFunc values
+            if returning is not None or self._has_surreal_funcs(data_set):
+                # Use raw query path for SurrealFunc values or a RETURN clause
                 set_clause, variables = self._build_set_clause(data_set)
                 if extra_vars:
                     conflicting = set(variables) & set(extra_vars)
@@ -1255,7 +1433,8 @@ class BaseSurrealModel(BaseModel):
                             "Use different variable names."
                         )
                     variables.update(extra_vars)
-                query = f"UPDATE {thing} SET {set_clause};"
+                query = f"UPDATE {thing}" + (f" SET {set_clause}" if set_clause else "")
+                query += f" {return_clause(returning)};" if returning is not None else ";"
                 if tx is not None:
                     start = _start_timer()
                     result = await tx.query(query, variables)
@@ -1266,15 +1445,29 @@ class BaseSurrealModel(BaseModel):
                     result = await client.query(query, variables)
                     _log_query(query, variables, _elapsed_ms(start))
                 # Surface a denied/missing update (skipped for deferred HTTP tx).
-                self._raise_if_no_record_affected(result, thing, tx)
-                if refresh:
-                    await self.refresh()
+                if returning != "none":
+                    self._raise_if_no_record_affected(result, thing, tx)
+                if returning is None:
+                    if refresh:
+                        await self.refresh()
+                elif (returning == "after" or isinstance(returning, (list, tuple))) and result.all_records:
+                    record = result.all_records[0]
+                    if isinstance(record, dict):
+                        self._update_from_db(record)
+                else:
+                    # Nothing to refresh from; mirror the plain values locally.
+                    mirrored = [k for k, v in data_set.items() if hasattr(self, k) and not isinstance(v, SurrealFunc)]
+                    for key in mirrored:
+                        setattr(self, key, data_set[key])
+                    if tx is None:
+                        self._mark_stored(self._db_names(mirrored))
             elif tx is not None:
                 start = _start_timer()
                 result = await tx.merge(thing, data_set)
                 _log_query(f"MERGE {thing}", data_set, _elapsed_ms(start))
                 self._raise_if_no_record_affected(result, thing, tx)
-                # Update local instance with merged data
+                # Update local instance with merged data; the snapshot is kept
+                # until the transaction commits, as in save().
                 for key, value in data_set.items():
                     if hasattr(self, key):
                         setattr(self, key, value)
@@ -1290,6 +1483,9 @@ class BaseSurrealModel(BaseModel):
                 if refresh:
                     await self.refresh()
 
+        if tx is None:
+            SurrealDBConnectionManager._note_write(self.get_connection_name())
+
         # Send post_update signal
         await model_signals.post_update.send(
             sender=self.__class__,
@@ -1347,6 +1543,9 @@ class BaseSurrealModel(BaseModel):
                     raise SurrealDbError(f"Can't delete Record id -> '{record_id}' not found!")
 
                 logger.info(f"Record deleted -> {result.deleted!r}.")
+                SurrealDBConnectionManager._note_write(self.get_connection_name())
+
+            _identity_discard(self.__class__, record_id)
 
         # Send post_delete signal
         await model_signals.post_delete.send(
@@ -1928,7 +2127,7 @@ class BaseSurrealModel(BaseModel):
         source_table = self.get_table_name()
         source_thing = format_thing(source_table, source_id)
 
-        client = await SurrealDBConnectionManager.get_client(self.get_connection_name())
+        client = await SurrealDBConnectionManager.get_read_client(self.get_connection_name())
         records: list[dict[str, Any]] = []
 
         # Query edge table and fetch related records
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar, cast
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Generic, Literal, Self, TypeVar, cast, overload
 
 from pydantic_core import ValidationError
 
 from . import BaseSurrealModel, SurrealDBConnectionManager
 from .aggregations import Aggregation
+from .batch import _batchable
 from .constants import LOOKUP_OPERATORS, like_to_regex
+from .deadline import check_timeout, deadline_scope, timeout_clause, with_timeout
 from .enum import OrderBy
 from .geo import GeoDistance
+from .hedging import HedgedReads
+from .identity_map import _identity_get, _identity_resolve, _identity_suspended
 from .prefetch import Prefetch
 from .q import Q
+from .record_cache import RecordCache
 from .search import SearchHighlight, SearchScore
 from .subquery import Subquery
+from .types import Returning
 from .utils import (
     SAFE_IDENTIFIER_RE as _SAFE_IDENTIFIER_RE,
 )
@@ -22,6 +30,7 @@ from .utils import (
     format_thing,
     parse_record_id,
     remove_quotes_for_variables,
+    return_clause,
     validate_identifier,
 )
 
@@ -32,12 +41,129 @@ if TYPE_CHECKING:
 
 import logging
 
-from .model_base import SurrealDbError
+from .model_base import SurrealDbError, _parse_record_id, _statement_results
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound="BaseSurrealModel")
 
+# Lookups whose SurrealQL semantics _filter_could_match() reproduces in Python.
+_PREDICATE_LOOKUPS = frozenset(
+    {
+        "exact",
+        "gt",
+        "gte",
+        "lt",
+        "lte",
+        "in",
+        "not_in",
+        "contains",
+        "not_contains",
+        "containsall",
+        "containsany",
+        "icontains",
+        "startswith",
+        "istartswith",
+        "endswith",
+        "iendswith",
+        "isnull",
+    }
+)
+_PLAIN_SCALARS = (str, int, float, Decimal, datetime, type(None))
+
+
+def _is_plain_value(value: Any) -> bool:
+    """Whether a filter value is a literal (or collection of literals) Python can compare."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(_is_plain_value(item) for item in value)
+    if isinstance(value, str):
+        return not value.startswith("$")
+    return isinstance(value, _PLAIN_SCALARS)
+
+
+def _same_kind(a: Any, b: Any) -> bool:
+    """Whether ``a`` and ``b`` compare in Python the way SurrealDB compares them."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b)
+    if isinstance(a, (int, float, Decimal)) and isinstance(b, (int, float, Decimal)):
+        return True
+    return type(a) is type(b)
+
+
+def _has_item(items: Any, value: Any) -> bool:
+    """Whether ``items`` may contain ``value`` (``True`` if types make it uncertain)."""
+    return any(not _same_kind(item, value) or item == value for item in items)
+
+
+def _filter_could_match(record: dict[str, Any], field_name: str, lookup: str, value: Any) -> bool:
+    """
+    Evaluate one keyword filter against the field values of a written record.
+
+    Answers ``True`` whenever the outcome is uncertain (missing field,
+    mismatched types): a wrong ``False`` would leave a stale cache entry.
+    """
+    current: Any = record
+    for part in field_name.split("."):
+        if not isinstance(current, dict) or part not in current:
+            return True
+        current = current[part]
+
+    if lookup == "isnull":
+        return (current is None) is value
+    if field_name == "id":
+        bare = _parse_record_id(current)
+        if lookup == "exact":
+            return bare == _parse_record_id(value)
+        if lookup in ("in", "not_in"):
+            found = bare in {_parse_record_id(v) for v in value}
+            return found if lookup == "in" else not found
+        return True
+
+    try:
+        if lookup in ("exact", "gt", "gte", "lt", "lte"):
+            if not _same_kind(current, value):
+                return True
+            if lookup == "exact":
+                return bool(current == value)
+            if lookup == "gt":
+                return bool(current > value)
+            if lookup == "gte":
+                return bool(current >= value)
+            if lookup == "lt":
+                return bool(current < value)
+            return bool(current <= value)
+        if lookup == "in":
+            return _has_item(value, current)
+        if lookup == "not_in":
+            return any(not _same_kind(item, current) for item in value) or current not in value
+        if isinstance(current, str) and isinstance(value, str):
+            if lookup == "contains":
+                return value in current
+            if lookup == "not_contains":
+                return value not in current
+            if lookup == "icontains":
+                return value.lower() in current.lower()
+            if lookup == "startswith":
+                return current.startswith(value)
+            if lookup == "istartswith":
+                return current.lower().startswith(value.lower())
+            if lookup == "endswith":
+                return current.endswith(value)
+            if lookup == "iendswith":
+                return current.lower().endswith(value.lower())
+        if isinstance(current, list):
+            if lookup == "contains":
+                return _has_item(current, value)
+            if lookup == "not_contains":
+                return any(not _same_kind(item, value) for item in current) or value not in current
+            if lookup == "containsall":
+                return all(_has_item(current, v) for v in value)
+            if lookup == "containsany":
+                return any(_has_item(current, v) for v in value)
+    except TypeError:
+        pass
+    return True
+
 
 class QuerySet(Generic[T]):
     """
@@ -105,6 +231,12 @@ class QuerySet(Generic[T]):
         self._traversal_path: str | None = None
         # Cache
         self._cache_ttl: int | None = None
+        self._cache_stale_ttl: int | None = None
+        self._cache_jitter: float | None = None
+        # Hedged reads (None: HedgedReads default)
+        self._hedge: bool | None = None
+        # Time budget of the query in seconds (see timeout())
+        self._timeout: float | None = None
 
     def select(self, *fields: str) -> Self:
         """
@@ -481,7 +613,7 @@ class QuerySet(Generic[T]):
         self._fetch_fields = list(fields)
         return self
 
-    def cache(self, ttl: int | None = None) -> Self:
+    def cache(self, ttl: int | None = None, *, stale_ttl: int | None = None, jitter: float | None = None) -> Self:
         """
         Enable caching for this query.
 
@@ -489,10 +621,16 @@ class QuerySet(Generic[T]):
         variables are hashed to produce a cache key.  If a cached result
         exists and has not expired, it is returned without hitting the
         database.  Otherwise the result is stored for future calls.
+        Concurrent misses on the same key share one database query.
 
         Args:
             ttl: Time-to-live in seconds.  If ``None``, the global default
                 from ``QueryCache.configure()`` is used.
+            stale_ttl: Seconds after expiry during which the old result is
+                still returned while one background query refreshes it.
+                If ``None``, the global default is used.
+            jitter: Fraction by which the TTL is randomly varied per entry
+                (``0.1`` → ±10%).  If ``None``, the global default is used.
 
         Returns:
             Self: The current instance of QuerySet to allow method chaining.
@@ -504,12 +642,70 @@ class QuerySet(Generic[T]):
 
             # Cache with default TTL
             users = await User.objects().cache().exec()
+
+            # Serve a result up to 10s past expiry while it is refreshed
+            feed = await Post.objects().limit(20).cache(ttl=5, stale_ttl=10).exec()
         """
         from .cache import QueryCache
 
         if not QueryCache._enabled:
             logger.warning("QueryCache is disabled — .cache() has no effect")
+        if jitter is not None and not 0 <= jitter < 1:
+            raise ValueError("jitter must be >= 0 and < 1")
         self._cache_ttl = ttl if ttl is not None else QueryCache._default_ttl
+        self._cache_stale_ttl = stale_ttl
+        self._cache_jitter = jitter
+        return self
+
+    def hedge(self, enabled: bool = True) -> Self:
+        """
+        Enable or disable hedged reads for this query.
+
+        A hedged read is sent a second time (to another replica when there
+        is one) if it is slower than recent reads, and the first answer wins.
+        Applies to :meth:`exec`, :meth:`count` and :meth:`get`.  Without
+        this call, the global ``HedgedReads.configure(enabled=...)`` setting
+        is used.
+
+        Args:
+            enabled: Whether to hedge this query.
+
+        Returns:
+            Self: The current instance of QuerySet to allow method chaining.
+
+        Example::
+
+            user = await User.objects().hedge().get("alice")
+        """
+        self._hedge = enabled
+        return self
+
+    def timeout(self, seconds: float) -> Self:
+        """
+        Bound the execution time of this query.
+
+        The query is sent with a SurrealQL ``TIMEOUT`` clause, so the server
+        gives up on it after ``seconds``, and the call is cancelled shortly
+        after.  An enclosing ``query_deadline()`` that ends sooner wins.
+        Applies to :meth:`exec`, :meth:`get`, :meth:`count`, the aggregates
+        and the ``bulk_*`` operations, prefetches included.
+
+        Args:
+            seconds: Time budget, in seconds.
+
+        Returns:
+            Self: The current instance of QuerySet to allow method chaining.
+
+        Raises:
+            ValueError: If ``seconds`` is not positive.
+
+        Example::
+
+            report = await Order.objects().filter(year=2025).timeout(5).exec()
+        """
+        if seconds <= 0:
+            raise ValueError("seconds must be > 0")
+        self._timeout = seconds
         return self
 
     def similar_to(
@@ -707,7 +903,7 @@ class QuerySet(Generic[T]):
             f"ORDER BY _rrf_score DESC;"
         )
 
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
+        client = await SurrealDBConnectionManager.get_read_client(self.model.get_connection_name())
         result = await client.query(remove_quotes_for_variables(query), variables)
         return result.all_records
 
@@ -772,7 +968,7 @@ class QuerySet(Generic[T]):
                 source_id = value
                 break
 
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
+        client = await SurrealDBConnectionManager.get_read_client(self.model.get_connection_name())
 
         if source_id:
             # Use specific record as starting point with proper escaping
@@ -824,8 +1020,8 @@ class QuerySet(Generic[T]):
         """
         query = self._compile_annotate_query()
 
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-        result = await client.query(remove_quotes_for_variables(query), self._variables)
+        client = await SurrealDBConnectionManager.get_read_client(self.model.get_connection_name())
+        result = check_timeout(await client.query(remove_quotes_for_variables(with_timeout(query)), self._variables))
 
         return result.all_records
 
@@ -833,12 +1029,21 @@ class QuerySet(Generic[T]):
         """
         Compile the GROUP BY / aggregation query used by :meth:`_execute_annotate`.
 
+        Returns:
+            str: The compiled SurrealQL, including any ``LET`` prelude.
+        """
+        return " ".join(self._compile_annotate_statements())
+
+    def _compile_annotate_statements(self) -> list[str]:
+        """
+        Compile the GROUP BY / aggregation query into its individual statements.
+
         Aggregations render inline; ``Subquery`` annotations are hoisted into a
         ``LET`` prelude, exactly as in :meth:`_compile_query` (see
         :meth:`Subquery.to_surql` for why).
 
         Returns:
-            str: The compiled SurrealQL, including any ``LET`` prelude.
+            list[str]: The ``LET`` prelude statements followed by the SELECT.
         """
         prelude: list[str] = []
 
@@ -878,9 +1083,7 @@ class QuerySet(Generic[T]):
 
         query = f"SELECT {select_clause} FROM {self._model_table}{where_clause}{group_clause};"
 
-        if prelude:
-            return " ".join(prelude) + " " + query
-        return query
+        return [*prelude, query]
 
     async def _execute_prefetch(
         self,
@@ -899,7 +1102,7 @@ class QuerySet(Generic[T]):
         if not instances:
             return
 
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
+        client = await SurrealDBConnectionManager.get_read_client(self.model.get_connection_name())
 
         for item in self._prefetch_related:
             if isinstance(item, Prefetch):
@@ -945,7 +1148,7 @@ class QuerySet(Generic[T]):
                     extra_vars = fvars
                 query = f"SELECT in, out.* FROM {relation_name} WHERE in IN [{id_list}]{extra_where};"
 
-            result = await client.query(remove_quotes_for_variables(query), extra_vars)
+            result = check_timeout(await client.query(remove_quotes_for_variables(with_timeout(query)), extra_vars))
 
             # Group results by source (the 'in' field)
             grouped: dict[str, list[dict[str, Any]]] = {}
@@ -1175,6 +1378,18 @@ class QuerySet(Generic[T]):
         """
         Compile the QuerySet parameters into a parameterized SQL query string.
 
+        See :meth:`_compile_statements`; the ``LET`` prelude (if any) is joined
+        ahead of the SELECT.
+
+        Returns:
+            str: The compiled SQL query string.
+        """
+        return " ".join(self._compile_statements())
+
+    def _compile_statements(self) -> list[str]:
+        """
+        Compile the QuerySet into its individual SurrealQL statements.
+
         Filter values are bound as ``$_fN`` variables (merged into ``self._variables``)
         to prevent injection. This method constructs the final SQL query by combining
         the selected fields, filters, ordering, limit, and offset parameters.
@@ -1185,7 +1400,7 @@ class QuerySet(Generic[T]):
         - Full-text search (``@N@`` operator)
 
         Returns:
-            str: The compiled SQL query string.
+            list[str]: The ``LET`` prelude statements followed by the SELECT.
         """
         # ── LET prelude ─────────────────────────────────────────────────
         # Uncorrelated subqueries are hoisted into `LET $_sqN = (...);`
@@ -1204,16 +1419,7 @@ class QuerySet(Generic[T]):
             if isinstance(annotation, (SearchScore, SearchHighlight, GeoDistance)):
                 extra_select.append(annotation.to_surql(alias))
 
-        if self.select_item:
-            fields = ", ".join(self.select_item)
-            if extra_select:
-                fields += ", " + ", ".join(extra_select)
-            query = f"SELECT {fields} FROM {self._model_table}"
-        else:
-            if extra_select:
-                query = f"SELECT *, {', '.join(extra_select)} FROM {self._model_table}"
-            else:
-                query = f"SELECT * FROM {self._model_table}"
+        query = f"SELECT {self._projection(extra_select)} FROM {self._model_table}"
 
         # ── WHERE clause ────────────────────────────────────────────────
         where_parts, filter_vars = self._build_where_parts(prelude)
@@ -1261,27 +1467,29 @@ class QuerySet(Generic[T]):
         if self._offset is not None:
             query += f" START {self._offset}"
 
-        # Append FETCH clause.
-        # Both explicit fetch() calls and select_related() paths are emitted
-        # as SurrealQL FETCH targets, causing SurrealDB to eagerly resolve
-        # record links inline.  Dedup while preserving order.
-        fetch_targets: list[str] = []
-        seen: set[str] = set()
-        for t in list(self._fetch_fields) + list(self._select_related):
-            if t not in seen:
-                fetch_targets.append(t)
-                seen.add(t)
-        if fetch_targets:
-            query += f" FETCH {', '.join(fetch_targets)}"
-
-        query += ";"
+        query += self._fetch_clause() + ";"
 
         # A LET statement returns no records, so prepending the prelude does
         # not affect QueryResponse.all_records — only the SELECT contributes.
-        if prelude:
-            return " ".join(prelude) + " " + query
-        return query
+        return [*prelude, query]
+
+    def _projection(self, extra_select: list[str] | None = None) -> str:
+        """Return the SELECT field list: ``select()`` fields (or ``*``) plus ``extra_select``."""
+        fields = list(self.select_item) if self.select_item else ["*"]
+        return ", ".join(fields + (extra_select or []))
+
+    def _fetch_clause(self) -> str:
+        """
+        Return the ``FETCH`` clause (empty without fetch targets).
+
+        Both explicit fetch() calls and select_related() paths are emitted
+        as SurrealQL FETCH targets, causing SurrealDB to eagerly resolve
+        record links inline.  Dedup while preserving order.
+        """
+        fetch_targets = list(dict.fromkeys([*self._fetch_fields, *self._select_related]))
+        return f" FETCH {', '.join(fetch_targets)}" if fetch_targets else ""
 
+    @_batchable
     async def exec(self) -> list[T]:
         """
         Execute the compiled query and return the results.
@@ -1315,46 +1523,234 @@ class QuerySet(Generic[T]):
             ).exec()
             ```
         """
-        # If annotations are set with Aggregation or Subquery, execute as GROUP BY query.
-        # SearchScore / SearchHighlight are handled inline by _compile_query().
-        has_group_annotations = any(isinstance(a, (Aggregation, Subquery)) for a in self._annotations.values())
-        if self._annotations and has_group_annotations:
-            # _execute_annotate() only applies filter/Q-object WHERE parts.
-            # search() and similar_to() constraints are not supported in this path.
-            if self._search_fields or self._knn_field:
-                raise ValueError(
-                    "Combining .search() or .similar_to() with aggregation/subquery "
-                    "annotations is not supported. Execute them as separate queries."
-                )
-            return await self._execute_annotate()  # type: ignore[return-value]
-
-        query = self._compile_query()
-
-        # ── Cache: check for hit ────────────────────────────────────────
-        cache_key: str | None = None
-        if self._cache_ttl is not None:
-            from .cache import QueryCache
-
-            # Include prefetch config in key so different prefetch combos
-            # get separate cache entries.
-            prefetch_fp = ""
-            if self._prefetch_related:
-                parts = []
-                for p in self._prefetch_related:
-                    if isinstance(p, Prefetch):
-                        parts.append(f"{p.relation_name}:{p.to_attr}")
-                    else:
-                        parts.append(str(p))
-                prefetch_fp = "|".join(parts)
+        async with deadline_scope(self._timeout):
+            # If annotations are set with Aggregation or Subquery, execute as GROUP BY query.
+            # SearchScore / SearchHighlight are handled inline by _compile_query().
+            has_group_annotations = any(isinstance(a, (Aggregation, Subquery)) for a in self._annotations.values())
+            if self._annotations and has_group_annotations:
+                # _execute_annotate() only applies filter/Q-object WHERE parts.
+                # search() and similar_to() constraints are not supported in this path.
+                if self._search_fields or self._knn_field:
+                    raise ValueError(
+                        "Combining .search() or .similar_to() with aggregation/subquery "
+                        "annotations is not supported. Execute them as separate queries."
+                    )
+                return await self._execute_annotate()  # type: ignore[return-value]
+
+            query = self._compile_query()
+
+            async def fetch() -> list[Any]:
+                chunked = await self._execute_chunked()
+                if chunked is not None:
+                    return chunked
+                return await self._execute_query(query)
+
+            # Cached after prefetch, so hits include prefetched data.
+            return await self._cached(  # type: ignore[no-any-return]
+                self._exec_cache_key(query), fetch, self._process_results, self._cache_predicate()
+            )
 
-            key_vars = {**self._variables, "_pfp": prefetch_fp} if prefetch_fp else self._variables
-            cache_key = QueryCache.make_key(query, key_vars, self._model_table)
-            cached = QueryCache.get(cache_key)
-            if cached is not None:
-                return cached  # type: ignore[no-any-return]
+    def _oversized_in_filter(self) -> tuple[int, list[Any], int] | None:
+        """
+        Find the first keyword ``__in`` filter whose list exceeds the model's ``in_chunk_size``.
+
+        Only top-level keyword filters are considered (they are AND-joined, so
+        the query can be split on them), and KNN queries are never split.
+        ``__not_in`` lists are not split either: every chunk query would
+        return nearly the whole table.
+
+        Returns:
+            ``(filter_index, deduplicated_values, chunk_size)`` or ``None``.
+        """
+        chunk_size = self.model.get_in_chunk_size()
+        if not chunk_size or self._knn_field:
+            return None
+        for index, (_, lookup_name, value) in enumerate(self._filters):
+            if lookup_name != "in" or not isinstance(value, (list, tuple, set)) or len(value) <= chunk_size:
+                continue
+            try:
+                values = list(dict.fromkeys(value))
+            except TypeError:  # unhashable values (e.g. dicts)
+                values = list(value)
+            if len(values) > chunk_size:
+                return index, values, chunk_size
+        return None
+
+    def _chunk_statements(self, compile_statement: Callable[[], str]) -> list[tuple[str, dict[str, Any]]] | None:
+        """
+        Compile ``compile_statement()`` once per chunk of the oversized ``__in`` filter.
+
+        The chunks hold distinct values, so they match disjoint records.
+
+        Returns:
+            ``(query, variables)`` per chunk, or ``None`` when no filter needs chunking.
+        """
+        oversized = self._oversized_in_filter()
+        if oversized is None:
+            return None
+        index, values, chunk_size = oversized
+        field_name, lookup_name, _ = self._filters[index]
+        filters, variables = self._filters, self._variables
+
+        statements: list[tuple[str, dict[str, Any]]] = []
+        try:
+            for start in range(0, len(values), chunk_size):
+                self._filters = [
+                    *filters[:index],
+                    (field_name, lookup_name, values[start : start + chunk_size]),
+                    *filters[index + 1 :],
+                ]
+                self._variables = dict(variables)
+                statements.append((compile_statement(), self._variables))
+        finally:
+            self._filters, self._variables = filters, variables
+        return statements
+
+    async def _run_chunks(self, statements: list[tuple[str, dict[str, Any]]]) -> list[list[Any]]:
+        """Run the chunk statements of :meth:`_chunk_statements` concurrently on a read client."""
+        client = await SurrealDBConnectionManager.get_read_client(self.model.get_connection_name())
+        return list(await asyncio.gather(*(self._run_query_on_client(client, q, v) for q, v in statements)))
+
+    async def _execute_chunked(self) -> list[Any] | None:
+        """
+        Run the query once per chunk of an oversized ``__in`` list, concurrently.
+
+        Each chunk query keeps ``LIMIT offset + limit``; the results are
+        concatenated and re-sorted by the ``order_by`` field, then offset and
+        limit are applied to the merged list.
+
+        Returns:
+            The merged records, or ``None`` when no filter needs chunking.
+        """
+        limit, offset = self._limit, self._offset
+        try:
+            self._limit = limit + (offset or 0) if limit is not None else None
+            self._offset = None
+            statements = self._chunk_statements(self._compile_query)
+        finally:
+            self._limit, self._offset = limit, offset
+        if statements is None:
+            return None
+
+        records = [record for part in await self._run_chunks(statements) for record in part]
+        if self._order_by:
+            records = self._sort_records(records, self._order_by)
+        start = offset or 0
+        return records[start : None if limit is None else start + limit]
+
+    @staticmethod
+    def _sort_records(records: list[Any], order_by: str) -> list[Any]:
+        """Sort raw records like ``ORDER BY <field> ASC|DESC`` (NULL/NONE first when ascending)."""
+        field_name, _, direction = order_by.partition(" ")
+
+        def sort_key(record: Any) -> tuple[bool, Any]:
+            value: Any = record
+            for part in field_name.split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            return value is not None, value
+
+        try:
+            return sorted(records, key=sort_key, reverse=direction.strip().upper() == "DESC")
+        except TypeError:
+            logger.warning(f"Cannot merge-sort chunked results on mixed-type field '{field_name}'; order not preserved.")
+            return records
+
+    def _exec_cache_key(self, query: str) -> str | None:
+        """
+        Return the query-cache key for ``query``, or ``None`` when caching is off.
+
+        The key covers the compiled SQL, bound variables and the prefetch
+        configuration, so different prefetch combos get separate entries.
+        """
+        if self._cache_ttl is None:
+            return None
+
+        from .cache import QueryCache
+
+        prefetch_fp = ""
+        if self._prefetch_related:
+            parts = []
+            for p in self._prefetch_related:
+                if isinstance(p, Prefetch):
+                    parts.append(f"{p.relation_name}:{p.to_attr}")
+                else:
+                    parts.append(str(p))
+            prefetch_fp = "|".join(parts)
+
+        key_vars = {**self._variables, "_pfp": prefetch_fp} if prefetch_fp else self._variables
+        return QueryCache.make_key(query, key_vars, self._model_table)
+
+    async def _cached(
+        self,
+        cache_key: str | None,
+        fetch: Callable[[], Awaitable[list[Any]]],
+        build: Callable[[list[Any]], Awaitable[Any]],
+        predicate: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Any:
+        """
+        Return ``build(await fetch())``, going through the query cache when caching is on for this query.
+
+        ``fetch`` returns raw records, which is what a shared cache backend
+        stores; ``predicate`` enables record-granular invalidation.  Cached
+        results are built outside the active IdentityMap, so the entry never
+        holds this request's instances (or their unsaved changes); the
+        instances returned are then mapped through it.
+        """
+        if cache_key is None:
+            return await build(await fetch())
+
+        from .cache import QueryCache
+
+        with _identity_suspended():
+            result = await QueryCache.get_or_compute(
+                cache_key,
+                fetch,
+                self._model_table,
+                self._cache_ttl,
+                stale_ttl=self._cache_stale_ttl,
+                jitter=self._cache_jitter,
+                build=build,
+                predicate=predicate,
+            )
+        return _identity_resolve(result)
 
-        results = await self._execute_query(query)
+    def _cache_predicate(self) -> Callable[[dict[str, Any]], bool] | None:
+        """
+        Return a Python version of this query's filter, for record-granular cache invalidation.
+
+        Only plain keyword filters are supported.  ``None`` (flush the entry on
+        any write to the table) is returned for Q objects, search/KNN/geo
+        constraints, annotations, grouping, traversals, and an offset, since a
+        write before the window shifts it.
+        """
+        if (
+            self._q_filters
+            or self._knn_field
+            or self._search_fields
+            or self._geo_field
+            or self._annotations
+            or self._group_by_fields
+            or self._traversal_path
+            or self._offset
+        ):
+            return None
+        filters = list(self._filters)
+        if any(lookup not in _PREDICATE_LOOKUPS or not _is_plain_value(value) for _, lookup, value in filters):
+            return None
+
+        def predicate(record: dict[str, Any]) -> bool:
+            return all(_filter_could_match(record, field, lookup, value) for field, lookup, value in filters)
+
+        return predicate
 
+    async def _process_results(self, results: list[Any]) -> list[T]:
+        """
+        Turn raw SELECT records into model instances.
+
+        Extracts KNN distance / search annotation values, parses the records
+        with :meth:`BaseSurrealModel.from_db` (falling back to dicts when they
+        do not validate), re-attaches the extra values and runs prefetches.
+        """
         # ── KNN / Search annotations: extract extra fields before model parsing
         extra_fields_per_record: list[dict[str, Any]] = []
         extra_keys: set[str] = set()
@@ -1375,7 +1771,8 @@ class QuerySet(Generic[T]):
 
         try:
             # surrealdb SDK 1.0.8 returns records directly, not wrapped in {"result": ...}
-            parsed = self.model.from_db(cast(dict[str, Any] | list[Any] | None, results))
+            partial = bool(self.select_item) and "*" not in self.select_item
+            parsed = self.model.from_db(cast(dict[str, Any] | list[Any] | None, results), partial=partial)
         except ValidationError as e:
             logger.info(f"Pydantic invalid format for the class, returning dict value: {e}")
             parsed = results
@@ -1391,14 +1788,9 @@ class QuerySet(Generic[T]):
         if self._prefetch_related and isinstance(parsed, list):
             await self._execute_prefetch(parsed)
 
-        # ── Cache: store result (after prefetch, so hits include prefetched data)
-        if cache_key is not None:
-            from .cache import QueryCache
-
-            QueryCache.set(cache_key, parsed, self._model_table, self._cache_ttl)
-
         return parsed  # type: ignore[return-value]
 
+    @_batchable
     async def first(self) -> T:
         """
         Execute the query and return the first result.
@@ -1461,28 +1853,115 @@ class QuerySet(Generic[T]):
             user = await queryset.get('7abc123')
             ```
         """
-        # Allow 'id' keyword to be used as alias for 'id_item'
-        record_id = id if id is not None else id_item
-        if record_id:
-            record_id_str = str(record_id)
-            # Handle full SurrealDB format (table:id) - extract just the ID part
-            _, id_part = parse_record_id(record_id_str)
-            # Format the thing reference with proper escaping for special IDs
-            thing = format_thing(self._model_table, id_part)
-            client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-            result = await client.select(thing)
-            # SDK returns RecordsResponse
-            if result.is_empty:
-                raise self.model.DoesNotExist("Record not found.")
-            return self.model.from_db(cast(dict[str, Any] | list[Any] | None, result.first))  # type: ignore[return-value]
-        else:
-            result = await self.exec()
-            if len(result) > 1:
-                raise SurrealDbError("More than one result found.")
+        async with deadline_scope(self._timeout):
+            # Allow 'id' keyword to be used as alias for 'id_item'
+            record_id = id if id is not None else id_item
+            if record_id:
+                record_id_str = str(record_id)
+                # Handle full SurrealDB format (table:id) - extract just the ID part
+                _, id_part = parse_record_id(record_id_str)
+                # Served without a query when already loaded in the active IdentityMap
+                existing = _identity_get(self.model, id_part)
+                if existing is not None:
+                    return existing  # type: ignore[return-value]
+                cached = RecordCache.get(self.model, id_part)
+                if cached is not None:
+                    return self.model.from_db(cached)  # type: ignore[return-value]
+                # Format the thing reference with proper escaping for special IDs
+                thing = format_thing(self._model_table, id_part)
+                result = await HedgedReads.run(
+                    self.model.get_connection_name(), lambda client: client.select(thing), enabled=self._hedge
+                )
+                # SDK returns RecordsResponse
+                if result.is_empty:
+                    raise self.model.DoesNotExist("Record not found.")
+                record = result.first
+                if isinstance(record, dict):
+                    await RecordCache.set(self.model, id_part, record)
+                return self.model.from_db(cast(dict[str, Any] | list[Any] | None, record))  # type: ignore[return-value]
+            else:
+                result = await self.exec()
+                if len(result) > 1:
+                    raise SurrealDbError("More than one result found.")
+
+                if len(result) == 0:
+                    raise self.model.DoesNotExist("Record not found.")
+                return result[0]
+
+    async def in_bulk(self, ids: Iterable[Any], *, chunk_size: int = 1000) -> dict[str, T]:
+        """
+        Fetch many records by id, addressing them directly instead of scanning the table.
+
+        Ids are sent as a record-id list (``SELECT * FROM [users:a, users:b, ...]``),
+        so the server looks each record up by key. Large id sets are split into
+        chunks of ``chunk_size`` ids that are queried concurrently. Filters on
+        the QuerySet are applied to the fetched records.
 
-            if len(result) == 0:
-                raise self.model.DoesNotExist("Record not found.")
-            return result[0]
+        ``select()`` and ``fetch()``/``select_related()`` shape the fetched
+        records as in :meth:`exec`. Without filters, projections, fetches or
+        prefetches, ids already present in the active
+        :class:`~surreal_orm.identity_map.IdentityMap` or in the
+        :class:`~surreal_orm.record_cache.RecordCache` are not queried.
+
+        Args:
+            ids: Record ids, bare (``"abc"``) or full (``"users:abc"``).
+            chunk_size: Maximum number of ids per query.
+
+        Returns:
+            dict[str, BaseSurrealModel]: Found records keyed by bare id. Missing
+            ids are absent from the result.
+
+        Example:
+            ```python
+            users = await User.objects().in_bulk(["alice", "bob", "carol"])
+            alice = users["alice"]
+            ```
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+        id_parts = list(dict.fromkeys(parse_record_id(str(i))[1] for i in ids if i is not None and str(i)))
+        where_clause = self._compile_where_clause()
+        fetch_clause = self._fetch_clause()
+        projection = self._projection()
+        if self.select_item and "*" not in self.select_item and "id" not in self.select_item:
+            projection = f"id, {projection}"  # results are keyed by id
+        plain = not where_clause and not self._prefetch_related and not fetch_clause and projection == "*"
+
+        found: dict[str, T] = {}
+        missing: list[str] = []
+        for id_part in id_parts:
+            cached: Any = _identity_get(self.model, id_part) if plain else None
+            if cached is None and plain:
+                record = RecordCache.get(self.model, id_part)
+                cached = self.model.from_db(record) if record is not None else None
+            if cached is not None:
+                found[id_part] = cached
+            else:
+                missing.append(id_part)
+        if not missing:
+            return found
+
+        async with deadline_scope(self._timeout):
+            client = await SurrealDBConnectionManager.get_read_client(self.model.get_connection_name())
+
+            async def fetch(chunk: list[str]) -> list[Any]:
+                things = ", ".join(format_thing(self._model_table, id_part) for id_part in chunk)
+                query = f"SELECT {projection} FROM [{things}]{where_clause}{fetch_clause};"
+                return await self._run_query_on_client(client, query)
+
+            chunks = [missing[start : start + chunk_size] for start in range(0, len(missing), chunk_size)]
+            records = [record for chunk in await asyncio.gather(*(fetch(c) for c in chunks)) for record in chunk]
+            if plain:
+                for record in records:
+                    if isinstance(record, dict) and record.get("id") is not None:
+                        await RecordCache.set(self.model, str(_parse_record_id(record["id"])), record)
+
+            for instance in await self._process_results(records):
+                raw_id = instance.get_id() if isinstance(instance, BaseSurrealModel) else _parse_record_id(instance.get("id"))
+                if raw_id is not None:
+                    found[str(raw_id)] = instance
+            return found
 
     async def all(self) -> list[T]:
         """
@@ -1501,7 +1980,7 @@ class QuerySet(Generic[T]):
             all_users = await queryset.all()
             ```
         """
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
+        client = await SurrealDBConnectionManager.get_read_client(self.model.get_connection_name())
         result = await client.select(self._model_table)
         return self.model.from_db(cast(dict[str, Any] | list[Any] | None, result.records))  # type: ignore[return-value]
 
@@ -1539,6 +2018,7 @@ class QuerySet(Generic[T]):
 
         return " WHERE " + " AND ".join(where_parts)
 
+    @_batchable
     async def count(self) -> int:
         """
         Count the number of records matching the current filters.
@@ -1552,18 +2032,36 @@ class QuerySet(Generic[T]):
             active = await User.objects().filter(active=True).count()
             ```
         """
-        where_clause = self._compile_where_clause()
-        query = f"SELECT count() FROM {self._model_table}{where_clause} GROUP ALL;"
+        async with deadline_scope(self._timeout):
+            chunks = self._chunk_statements(self._compile_count_query)
+            if chunks is not None:
+                return sum(self._parse_count(part) for part in await self._run_chunks(chunks))
 
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-        result = await client.query(remove_quotes_for_variables(query), self._variables)
+            query = remove_quotes_for_variables(self._compile_count_query())
+
+            result = await HedgedReads.run(
+                self.model.get_connection_name(),
+                lambda client: client.query(with_timeout(query), self._variables),
+                enabled=self._hedge,
+            )
 
-        if result.all_records:
-            record = result.all_records[0]
+            return self._parse_count(check_timeout(result).all_records)
+
+    def _compile_count_query(self) -> str:
+        """Compile the ``SELECT count() ... GROUP ALL`` statement used by :meth:`count`."""
+        where_clause = self._compile_where_clause()
+        return f"SELECT count() FROM {self._model_table}{where_clause} GROUP ALL;"
+
+    @staticmethod
+    def _parse_count(records: list[Any]) -> int:
+        """Extract the count from the records returned by :meth:`_compile_count_query`."""
+        if records:
+            record = records[0]
             if isinstance(record, dict) and "count" in record:
                 return int(record["count"])
         return 0
 
+    @_batchable
     async def sum(self, field: str) -> float | int:
         """
         Calculate the sum of a numeric field.
@@ -1579,20 +2077,9 @@ class QuerySet(Generic[T]):
             total = await Order.objects().filter(status="paid").sum("amount")
             ```
         """
-        validate_identifier(field, "aggregation field")
-        where_clause = self._compile_where_clause()
-        query = f"SELECT math::sum({field}) AS total FROM {self._model_table}{where_clause} GROUP ALL;"
-
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-        result = await client.query(remove_quotes_for_variables(query), self._variables)
-
-        if result.all_records:
-            record = result.all_records[0]
-            if isinstance(record, dict) and "total" in record:
-                value = record["total"]
-                return value if value is not None else 0
-        return 0
+        return cast(float | int, await self._scalar_aggregate("sum", field))
 
+    @_batchable
     async def avg(self, field: str) -> float | None:
         """
         Calculate the average of a numeric field.
@@ -1608,20 +2095,9 @@ class QuerySet(Generic[T]):
             avg_age = await User.objects().filter(active=True).avg("age")
             ```
         """
-        validate_identifier(field, "aggregation field")
-        where_clause = self._compile_where_clause()
-        query = f"SELECT math::mean({field}) AS average FROM {self._model_table}{where_clause} GROUP ALL;"
-
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-        result = await client.query(remove_quotes_for_variables(query), self._variables)
-
-        if result.all_records:
-            record = result.all_records[0]
-            if isinstance(record, dict) and "average" in record:
-                value = record["average"]
-                return float(value) if value is not None else None
-        return None
+        return cast(float | None, await self._scalar_aggregate("avg", field))
 
+    @_batchable
     async def min(self, field: str) -> Any:
         """
         Get the minimum value of a field.
@@ -1637,19 +2113,9 @@ class QuerySet(Generic[T]):
             min_price = await Product.objects().min("price")
             ```
         """
-        validate_identifier(field, "aggregation field")
-        where_clause = self._compile_where_clause()
-        query = f"SELECT math::min({field}) AS minimum FROM {self._model_table}{where_clause} GROUP ALL;"
-
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-        result = await client.query(remove_quotes_for_variables(query), self._variables)
-
-        if result.all_records:
-            record = result.all_records[0]
-            if isinstance(record, dict) and "minimum" in record:
-                return record["minimum"]
-        return None
+        return await self._scalar_aggregate("min", field)
 
+    @_batchable
     async def max(self, field: str) -> Any:
         """
         Get the maximum value of a field.
@@ -1665,18 +2131,152 @@ class QuerySet(Generic[T]):
             max_price = await Product.objects().max("price")
             ```
         """
-        validate_identifier(field, "aggregation field")
+        return await self._scalar_aggregate("max", field)
+
+    async def _scalar_aggregate(self, name: str, field: str) -> Any:
+        """
+        Run the :meth:`_compile_scalar_aggregate` statement of ``name`` and parse its value.
+
+        With an oversized ``__in`` filter, ``sum``, ``min`` and ``max`` run
+        once per chunk and are combined; a mean cannot be combined from the
+        chunk means, so ``avg`` always sends the list whole.
+        """
+        async with deadline_scope(self._timeout):
+            chunks = None if name == "avg" else self._chunk_statements(lambda: self._compile_scalar_aggregate(name, field))
+            if chunks is not None:
+                _, alias = self._SCALAR_AGGREGATES[name]
+                values = [self._parse_scalar_aggregate(name, part) for part in await self._run_chunks(chunks)]
+                return self._parse_scalar_aggregate(name, [{alias: self._combine_chunk_values(name, values)}])
+
+            query = self._compile_scalar_aggregate(name, field)
+            client = await SurrealDBConnectionManager.get_read_client(self.model.get_connection_name())
+            result = check_timeout(await client.query(remove_quotes_for_variables(with_timeout(query)), self._variables))
+            return self._parse_scalar_aggregate(name, result.all_records)
+
+    @staticmethod
+    def _combine_chunk_values(name: str, values: list[Any]) -> Any:
+        """Combine the per-chunk results of a ``count``/``sum``/``min``/``max`` aggregate."""
+        present = [value for value in values if value is not None]
+        if not present:
+            return None
+        if name in ("sum", "count", "math::sum"):
+            return sum(present)
+        return min(present) if name in ("min", "math::min") else max(present)
+
+    @_batchable
+    async def aggregate(self, **aggregations: Aggregation) -> dict[str, Any]:
+        """
+        Compute several aggregations over the filtered records in one query.
+
+        All aggregations are rendered into a single ``SELECT ... GROUP ALL``
+        statement that reuses the QuerySet's WHERE clause, so the stats need
+        one round-trip and one scan instead of one per value. Combined with
+        :meth:`cache`, the resulting dict is served from the query cache.
+
+        Args:
+            **aggregations: Result alias -> ``Aggregation`` (``Count``, ``Sum``,
+                ``Avg``, ``Min``, ``Max``).
+
+        Returns:
+            dict[str, Any]: One value per alias. When no record matches,
+            ``Count`` and ``Sum`` are 0 and the others ``None``.
+
+        Raises:
+            ValueError: If no aggregation is given, an alias is not a valid
+                identifier, or a value is not an ``Aggregation``.
+
+        Example:
+            ```python
+            stats = await Order.objects().filter(status="paid").aggregate(
+                n=Count(),
+                total=Sum("amount"),
+                avg=Avg("amount"),
+                hi=Max("amount"),
+            )
+            # {"n": 42, "total": 5000, "avg": 119.0, "hi": 900}
+            ```
+        """
+        async with deadline_scope(self._timeout):
+            query = self._compile_aggregate_query(aggregations)
+
+            async def fetch() -> list[Any]:
+                # Count/Sum/Min/Max combine across chunks of an oversized __in list; Avg does not.
+                combinable = all(a.function_name in self._CHUNKABLE_AGGREGATES for a in aggregations.values())
+                chunks = self._chunk_statements(lambda: self._compile_aggregate_query(aggregations)) if combinable else None
+                if chunks is not None:
+                    parts = [self._parse_aggregate(aggregations, part) for part in await self._run_chunks(chunks)]
+                    return [
+                        {
+                            alias: self._combine_chunk_values(aggregation.function_name, [part[alias] for part in parts])
+                            for alias, aggregation in aggregations.items()
+                        }
+                    ]
+                client = await SurrealDBConnectionManager.get_read_client(self.model.get_connection_name())
+                result = check_timeout(await client.query(remove_quotes_for_variables(with_timeout(query)), self._variables))
+                return result.all_records
+
+            async def build(records: list[Any]) -> dict[str, Any]:
+                return self._parse_aggregate(aggregations, records)
+
+            return cast(dict[str, Any], await self._cached(self._exec_cache_key(query), fetch, build))
+
+    def _compile_aggregate_query(self, aggregations: dict[str, Aggregation]) -> str:
+        """Compile the single ``GROUP ALL`` statement used by :meth:`aggregate`."""
+        if not aggregations:
+            raise ValueError("aggregate() requires at least one aggregation")
+        select_parts: list[str] = []
+        for alias, aggregation in aggregations.items():
+            validate_identifier(alias, "aggregate alias")
+            if not isinstance(aggregation, Aggregation):
+                raise ValueError(f"aggregate() value for '{alias}' must be an Aggregation, got {type(aggregation).__name__}")
+            select_parts.append(aggregation.to_surql(alias))
         where_clause = self._compile_where_clause()
-        query = f"SELECT math::max({field}) AS maximum FROM {self._model_table}{where_clause} GROUP ALL;"
+        return f"SELECT {', '.join(select_parts)} FROM {self._model_table}{where_clause} GROUP ALL;"
 
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-        result = await client.query(remove_quotes_for_variables(query), self._variables)
+    @staticmethod
+    def _parse_aggregate(aggregations: dict[str, Aggregation], records: list[Any]) -> dict[str, Any]:
+        """Map the :meth:`_compile_aggregate_query` record to ``{alias: value}``."""
+        record = records[0] if records and isinstance(records[0], dict) else {}
+        values: dict[str, Any] = {}
+        for alias, aggregation in aggregations.items():
+            value = record.get(alias)
+            if value is None and aggregation.function_name in ("count", "math::sum"):
+                value = 0
+            values[alias] = value
+        return values
+
+    # Aggregation functions whose per-chunk results can be combined
+    _CHUNKABLE_AGGREGATES = frozenset({"count", "math::sum", "math::min", "math::max"})
+
+    # Terminal aggregate name -> (SurrealQL function, result alias)
+    _SCALAR_AGGREGATES: dict[str, tuple[str, str]] = {
+        "sum": ("math::sum", "total"),
+        "avg": ("math::mean", "average"),
+        "min": ("math::min", "minimum"),
+        "max": ("math::max", "maximum"),
+    }
+
+    def _compile_scalar_aggregate(self, name: str, field: str) -> str:
+        """Compile the ``GROUP ALL`` statement for :meth:`sum`, :meth:`avg`, :meth:`min` or :meth:`max`."""
+        validate_identifier(field, "aggregation field")
+        function, alias = self._SCALAR_AGGREGATES[name]
+        where_clause = self._compile_where_clause()
+        return f"SELECT {function}({field}) AS {alias} FROM {self._model_table}{where_clause} GROUP ALL;"
 
-        if result.all_records:
-            record = result.all_records[0]
-            if isinstance(record, dict) and "maximum" in record:
-                return record["maximum"]
-        return None
+    @classmethod
+    def _parse_scalar_aggregate(cls, name: str, records: list[Any]) -> Any:
+        """Extract the value of a :meth:`_compile_scalar_aggregate` statement (``sum`` defaults to 0)."""
+        _, alias = cls._SCALAR_AGGREGATES[name]
+        value = None
+        if records:
+            record = records[0]
+            if isinstance(record, dict) and alias in record:
+                value = record[alias]
+        if name == "sum":
+            return value if value is not None else 0
+        if name == "avg":
+            return float(value) if value is not None else None
+        return value
 
     async def _execute_query(self, query: str) -> list[Any]:
         """
@@ -1699,10 +2299,13 @@ class QuerySet(Generic[T]):
             results = await self._execute_query("SELECT * FROM users;")
             ```
         """
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-        return await self._run_query_on_client(client, query)
+        return await HedgedReads.run(
+            self.model.get_connection_name(),
+            lambda client: self._run_query_on_client(client, query),
+            enabled=self._hedge,
+        )
 
-    async def _run_query_on_client(self, client: Any, query: str) -> list[Any]:
+    async def _run_query_on_client(self, client: Any, query: str, variables: dict[str, Any] | None = None) -> list[Any]:
         """
         Run the SQL query on the provided SurrealDB client.
 
@@ -1712,6 +2315,7 @@ class QuerySet(Generic[T]):
         Args:
             client: The active SurrealDB client instance.
             query (str): The SQL query string to execute.
+            variables (dict | None): Bindings to send instead of the QuerySet's own variables.
 
         Returns:
             list[Any]: A list of query response objects containing the query results.
@@ -1728,10 +2332,11 @@ class QuerySet(Generic[T]):
 
         from .debug import _elapsed_ms, _log_query, _start_timer
 
-        final_query = remove_quotes_for_variables(query)
+        final_query = remove_quotes_for_variables(with_timeout(query))
+        bound = self._variables if variables is None else variables
         start = _start_timer()
-        result = await client.query(final_query, self._variables)
-        _log_query(final_query, self._variables, _elapsed_ms(start))
+        result = check_timeout(await client.query(final_query, bound))
+        _log_query(final_query, bound, _elapsed_ms(start))
 
         # SurrealDB 3.0: detect table-not-found in query results
         for qr in result.results:
@@ -1840,46 +2445,69 @@ class QuerySet(Generic[T]):
             created = await User.objects().bulk_create(users, batch_size=100)
             ```
         """
-        if not instances:
-            return []
-
-        created: list[T] = []
-
-        if atomic:
-            # Use transaction for atomicity
-            async with await SurrealDBConnectionManager.transaction() as tx:
+        async with deadline_scope(self._timeout):
+            if not instances:
+                return []
+
+            created: list[T] = []
+
+            if atomic:
+                # Use transaction for atomicity
+                async with await SurrealDBConnectionManager.transaction() as tx:
+                    for instance in instances:
+                        await instance.save(tx=tx)
+                        created.append(instance)
+            elif batch_size:
+                # Process in batches
+                for i in range(0, len(instances), batch_size):
+                    batch = instances[i : i + batch_size]
+                    for instance in batch:
+                        await instance.save()
+                        created.append(instance)
+            else:
+                # Simple sequential create
                 for instance in instances:
-                    await instance.save(tx=tx)
-                    created.append(instance)
-        elif batch_size:
-            # Process in batches
-            for i in range(0, len(instances), batch_size):
-                batch = instances[i : i + batch_size]
-                for instance in batch:
                     await instance.save()
                     created.append(instance)
-        else:
-            # Simple sequential create
-            for instance in instances:
-                await instance.save()
-                created.append(instance)
 
-        return created
+            return created
+
+    @overload
+    async def bulk_update(self, data: dict[str, Any], atomic: bool = ..., *, returning: Literal["count"] = ...) -> int: ...
+
+    @overload
+    async def bulk_update(self, data: dict[str, Any], atomic: bool = ..., *, returning: Literal["none"]) -> None: ...
+
+    @overload
+    async def bulk_update(
+        self,
+        data: dict[str, Any],
+        atomic: bool = ...,
+        *,
+        returning: Literal["diff", "after"] | list[str] | tuple[str, ...],
+    ) -> list[Any]: ...
 
     async def bulk_update(
         self,
         data: dict[str, Any],
         atomic: bool = False,
-    ) -> int:
+        *,
+        returning: Returning = "count",
+    ) -> int | list[Any] | None:
         """
         Update all records matching the current filters.
 
         Args:
             data: A dictionary of field names and values to update.
             atomic: If True, all updates are wrapped in a transaction.
+            returning: What to send back. ``"count"`` (default) counts the
+                updated records on the server and returns the number;
+                ``"none"`` returns ``None``; ``"diff"``, ``"after"`` or a list
+                of field names return the raw records in that shape.
 
         Returns:
-            int: The number of records updated.
+            int | list | None: The number of records updated, or the
+            requested records.
 
         Example:
             ```python
@@ -1893,6 +2521,9 @@ class QuerySet(Generic[T]):
                 {"verified": True},
                 atomic=True
             )
+
+            # Fire and forget: nothing is sent back
+            await Token.objects().filter(expired=True).bulk_update({"active": False}, returning="none")
             ```
         """
         where_clause = self._compile_where_clause()
@@ -1908,28 +2539,33 @@ class QuerySet(Generic[T]):
         set_clause = ", ".join(set_parts)
         self._variables.update(update_vars)
 
-        query = f"UPDATE {self._model_table} SET {set_clause}{where_clause};"
+        return await self._execute_mutation(f"UPDATE {self._model_table} SET {set_clause}{where_clause}", atomic, returning)
 
-        if atomic:
-            # For atomic operations, count first then update in transaction
-            current_count = await self.count()
-            async with await SurrealDBConnectionManager.transaction() as tx:
-                await tx.query(remove_quotes_for_variables(query), self._variables)
-            return current_count
+    @overload
+    async def bulk_delete(self, atomic: bool = ..., *, returning: Literal["count"] = ...) -> int: ...
 
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-        result = await client.query(remove_quotes_for_variables(query), self._variables)
-        return len(result.all_records)
+    @overload
+    async def bulk_delete(self, atomic: bool = ..., *, returning: Literal["none"]) -> None: ...
 
-    async def bulk_delete(self, atomic: bool = False) -> int:
+    @overload
+    async def bulk_delete(
+        self, atomic: bool = ..., *, returning: Literal["diff", "after"] | list[str] | tuple[str, ...]
+    ) -> list[Any]: ...
+
+    async def bulk_delete(self, atomic: bool = False, *, returning: Returning = "count") -> int | list[Any] | None:
         """
         Delete all records matching the current filters.
 
         Args:
             atomic: If True, all deletes are wrapped in a transaction.
+            returning: What to send back. ``"count"`` (default) counts the
+                deleted records on the server and returns the number, so no
+                record is transferred; ``"none"`` returns ``None``; ``"diff"``,
+                ``"after"`` or a list of field names return the raw records.
 
         Returns:
-            int: The number of records deleted.
+            int | list | None: The number of records deleted, or the
+            requested records.
 
         Example:
             ```python
@@ -1943,30 +2579,95 @@ class QuerySet(Generic[T]):
             ```
         """
         where_clause = self._compile_where_clause()
-        # Use RETURN BEFORE to get deleted records count
-        query = f"DELETE FROM {self._model_table}{where_clause} RETURN BEFORE;"
+        return await self._execute_mutation(f"DELETE FROM {self._model_table}{where_clause}", atomic, returning)
 
-        if atomic:
-            # For atomic operations, count first then delete in transaction
-            current_count = await self.count()
-            delete_query = f"DELETE FROM {self._model_table}{where_clause};"
-            async with await SurrealDBConnectionManager.transaction() as tx:
-                await tx.query(remove_quotes_for_variables(delete_query), self._variables)
-            return current_count
+    async def _execute_mutation(self, statement: str, atomic: bool, returning: Returning) -> int | list[Any] | None:
+        """
+        Run a bulk UPDATE/DELETE statement, fetching only what ``returning`` asks for.
 
-        client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-        result = await client.query(remove_quotes_for_variables(query), self._variables)
-        return len(result.all_records)
+        ``"count"`` wraps the statement in ``RETURN array::len((... RETURN VALUE id))``
+        so only the affected ids are built and none leave the server. ``atomic`` wraps the query in
+        ``BEGIN``/``COMMIT`` and sends it as a single request on the model's
+        connection.
+        """
+        async with deadline_scope(self._timeout):
+            from .debug import _elapsed_ms, _log_query, _start_timer
+
+            timeout = timeout_clause()
+            if returning == "count":
+                query = f"RETURN array::len(({statement} RETURN VALUE id{timeout}));"
+            else:
+                query = f"{statement} {return_clause(returning)}{timeout};"
+            if atomic:
+                query = f"BEGIN TRANSACTION; {query} COMMIT TRANSACTION;"
+
+            client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
+            final_query = remove_quotes_for_variables(query)
+            start = _start_timer()
+            response = check_timeout(await client.query(final_query, self._variables))
+            _log_query(final_query, self._variables, _elapsed_ms(start))
+
+            errors = [str(qr.result) for qr in response.results if qr.is_error]
+            if errors:
+                raise SurrealDbError(f"{statement.split(' ', 1)[0]} failed: {errors[0]}")
+            SurrealDBConnectionManager._note_write(self.model.get_connection_name())
+            (result,) = (qr.result for qr in _statement_results(response.results, 1, atomic))
+            if returning == "none":
+                return None
+            if returning == "count":
+                return int(result) if isinstance(result, int) else 0
+            return list(result) if isinstance(result, list) else []
 
     # ==================== Upsert Methods ====================
 
+    @overload
+    async def upsert(
+        self,
+        defaults: dict[str, Any],
+        *,
+        id: str | None = ...,
+        on_conflict: dict[str, Any] | None = ...,
+        returning: Literal["after"] = ...,
+    ) -> T: ...
+
+    @overload
+    async def upsert(
+        self,
+        defaults: dict[str, Any],
+        *,
+        id: str | None = ...,
+        on_conflict: dict[str, Any] | None = ...,
+        returning: Literal["none"],
+    ) -> None: ...
+
+    @overload
+    async def upsert(
+        self,
+        defaults: dict[str, Any],
+        *,
+        id: str | None = ...,
+        on_conflict: dict[str, Any] | None = ...,
+        returning: Literal["count"],
+    ) -> int: ...
+
+    @overload
+    async def upsert(
+        self,
+        defaults: dict[str, Any],
+        *,
+        id: str | None = ...,
+        on_conflict: dict[str, Any] | None = ...,
+        returning: Literal["diff"] | list[str] | tuple[str, ...],
+    ) -> list[Any]: ...
+
     async def upsert(
         self,
         defaults: dict[str, Any],
         *,
         id: str | None = None,
         on_conflict: dict[str, Any] | None = None,
-    ) -> T:
+        returning: Returning = "after",
+    ) -> T | int | list[Any] | None:
         """
         Insert a record or update it on conflict (SurrealDB 3.0+).
 
@@ -1981,9 +2682,13 @@ class QuerySet(Generic[T]):
                 If omitted, SurrealDB auto-generates the ID.
             on_conflict: Dict of field -> value/SurrealFunc to apply when
                 the record already exists.
+            returning: What to send back. ``"after"`` (default) returns the
+                model instance; ``"none"`` returns ``None``; ``"count"`` the
+                number of written records; ``"diff"`` or a list of field names
+                the raw records in that shape.
 
         Returns:
-            The created or updated model instance.
+            The created or updated model instance (see ``returning``).
 
         Note:
             ``on_conflict`` expressions run in the context of the **existing**
@@ -2055,10 +2760,20 @@ class QuerySet(Generic[T]):
                     variables[var_name] = value
             query = f"UPSERT {thing} SET {', '.join(set_parts)};"
 
+        if returning != "after":
+            query = f"{query[:-1]} {return_clause(returning)};"
+
         client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
         result = await client.query(remove_quotes_for_variables(query), variables)
+        SurrealDBConnectionManager._note_write(self.model.get_connection_name())
 
         records = result.all_records
+        if returning == "none":
+            return None
+        if returning == "count":
+            return len(records)
+        if returning != "after":
+            return list(records)
         if records:
             parsed = self.model.from_db(cast("dict[str, Any] | list[Any] | None", records[0]))
             if isinstance(parsed, self.model):
@@ -2105,88 +2820,93 @@ class QuerySet(Generic[T]):
                 on_conflict={"login_count": SurrealFunc("login_count += 1")},
             )
         """
-        from .surreal_function import SurrealFunc
-
-        if not instances:
-            return []
-
-        table = self._model_table
-        results: list[T] = []
-
-        # Build a single batch query with semicolons
-        queries: list[str] = []
-        all_variables: dict[str, Any] = {}
-
-        for idx, instance in enumerate(instances):
-            record_id = instance.get_id() if hasattr(instance, "get_id") else getattr(instance, "id", None)
-
-            data = instance.model_dump(exclude_unset=True, by_alias=True)
-            data.pop("id", None)
-
-            if on_conflict:
-                # Use INSERT INTO ... ON DUPLICATE KEY UPDATE
-                obj_parts: list[str] = []
-                if record_id:
-                    _, rid = parse_record_id(str(record_id))
-                    obj_parts.append(f"id: {format_thing(table, rid)}")
-                for field_name, value in data.items():
-                    validate_identifier(field_name, "field name")
-                    if isinstance(value, SurrealFunc):
-                        obj_parts.append(f"{field_name}: {value.expression}")
-                    else:
-                        var_name = f"_bu{idx}_{field_name}"
-                        obj_parts.append(f"{field_name}: ${var_name}")
-                        all_variables[var_name] = value
-
-                conflict_parts: list[str] = []
-                for field_name, value in on_conflict.items():
-                    validate_identifier(field_name, "field name")
-                    if isinstance(value, SurrealFunc):
-                        conflict_parts.append(self._format_conflict_expr(field_name, value))
-                    else:
-                        var_name = f"_oc{idx}_{field_name}"
-                        conflict_parts.append(f"{field_name} = ${var_name}")
-                        all_variables[var_name] = value
-
-                query = f"INSERT INTO {table} {{{', '.join(obj_parts)}}} ON DUPLICATE KEY UPDATE {', '.join(conflict_parts)}"
-            else:
-                # Plain UPSERT SET
-                if record_id:
-                    _, rid = parse_record_id(str(record_id))
-                    thing = format_thing(table, rid)
+        async with deadline_scope(self._timeout):
+            from .surreal_function import SurrealFunc
+
+            if not instances:
+                return []
+
+            table = self._model_table
+            results: list[T] = []
+
+            # Build a single batch query with semicolons
+            queries: list[str] = []
+            all_variables: dict[str, Any] = {}
+            timeout = timeout_clause()
+
+            for idx, instance in enumerate(instances):
+                record_id = instance.get_id() if hasattr(instance, "get_id") else getattr(instance, "id", None)
+
+                data = instance.model_dump(exclude_unset=True, by_alias=True)
+                data.pop("id", None)
+
+                if on_conflict:
+                    # Use INSERT INTO ... ON DUPLICATE KEY UPDATE
+                    obj_parts: list[str] = []
+                    if record_id:
+                        _, rid = parse_record_id(str(record_id))
+                        obj_parts.append(f"id: {format_thing(table, rid)}")
+                    for field_name, value in data.items():
+                        validate_identifier(field_name, "field name")
+                        if isinstance(value, SurrealFunc):
+                            obj_parts.append(f"{field_name}: {value.expression}")
+                        else:
+                            var_name = f"_bu{idx}_{field_name}"
+                            obj_parts.append(f"{field_name}: ${var_name}")
+                            all_variables[var_name] = value
+
+                    conflict_parts: list[str] = []
+                    for field_name, value in on_conflict.items():
+                        validate_identifier(field_name, "field name")
+                        if isinstance(value, SurrealFunc):
+                            conflict_parts.append(self._format_conflict_expr(field_name, value))
+                        else:
+                            var_name = f"_oc{idx}_{field_name}"
+                            conflict_parts.append(f"{field_name} = ${var_name}")
+                            all_variables[var_name] = value
+
+                    query = (
+                        f"INSERT INTO {table} {{{', '.join(obj_parts)}}} ON DUPLICATE KEY UPDATE {', '.join(conflict_parts)}"
+                    )
                 else:
-                    thing = table
-                set_parts: list[str] = []
-                for field_name, value in data.items():
-                    validate_identifier(field_name, "field name")
-                    if isinstance(value, SurrealFunc):
-                        set_parts.append(f"{field_name} = {value.expression}")
+                    # Plain UPSERT SET
+                    if record_id:
+                        _, rid = parse_record_id(str(record_id))
+                        thing = format_thing(table, rid)
                     else:
-                        var_name = f"_bu{idx}_{field_name}"
-                        set_parts.append(f"{field_name} = ${var_name}")
-                        all_variables[var_name] = value
-                query = f"UPSERT {thing} SET {', '.join(set_parts)}"
-
-            queries.append(query + ";")
-
-        full_query = " ".join(queries)
-
-        if atomic:
-            async with await SurrealDBConnectionManager.transaction() as tx:
-                tx_result = await tx.query(remove_quotes_for_variables(full_query), all_variables)
-                for record in tx_result.all_records:
+                        thing = table
+                    set_parts: list[str] = []
+                    for field_name, value in data.items():
+                        validate_identifier(field_name, "field name")
+                        if isinstance(value, SurrealFunc):
+                            set_parts.append(f"{field_name} = {value.expression}")
+                        else:
+                            var_name = f"_bu{idx}_{field_name}"
+                            set_parts.append(f"{field_name} = ${var_name}")
+                            all_variables[var_name] = value
+                    query = f"UPSERT {thing} SET {', '.join(set_parts)}"
+
+                queries.append(f"{query}{timeout};")
+
+            full_query = " ".join(queries)
+
+            if atomic:
+                async with await SurrealDBConnectionManager.transaction() as tx:
+                    tx_result = check_timeout(await tx.query(remove_quotes_for_variables(full_query), all_variables))
+                    for record in tx_result.all_records:
+                        parsed = self.model.from_db(cast("dict[str, Any] | list[Any] | None", record))
+                        if isinstance(parsed, self.model):
+                            results.append(parsed)
+            else:
+                client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
+                q_result = check_timeout(await client.query(remove_quotes_for_variables(full_query), all_variables))
+                SurrealDBConnectionManager._note_write(self.model.get_connection_name())
+                for record in q_result.all_records:
                     parsed = self.model.from_db(cast("dict[str, Any] | list[Any] | None", record))
                     if isinstance(parsed, self.model):
                         results.append(parsed)
-        else:
-            client = await SurrealDBConnectionManager.get_client(self.model.get_connection_name())
-            q_result = await client.query(remove_quotes_for_variables(full_query), all_variables)
-            for record in q_result.all_records:
-                parsed = self.model.from_db(cast("dict[str, Any] | list[Any] | None", record))
-                if isinstance(parsed, self.model):
-                    results.append(parsed)
 
-        return results
+            return results
 
     # ==================== Real-time Methods ====================
 
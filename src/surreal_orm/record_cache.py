@@ -0,0 +1,320 @@
+"""
+Second-level (L2) record cache with live-query invalidation.
+
+:class:`~surreal_orm.cache.QueryCache` caches whole query results and drops
+every entry of a table on any local write; writes made by other processes are
+never seen. ``RecordCache`` instead caches individual records keyed by
+``table:id``, and ``QuerySet.get(id=...)`` reads through it.
+
+Coherence comes from one ``LIVE SELECT`` subscription per cached table (using
+the SDK's :class:`~surreal_sdk.streaming.live_select.LiveSelectStream`): each
+CREATE/UPDATE/DELETE notification drops exactly the affected record, so a write
+from any process only evicts that record. Local writes are also evicted
+immediately through the ``post_save``/``post_update``/``post_delete`` signals.
+The subscription starts in the background with the first cached record, so
+reads never wait for it. Records cached before it runs, or while it cannot be
+started (e.g. no WebSocket access), rely on TTL expiry plus local signal
+invalidation for changes made in that window; a failed subscription is
+retried with exponential backoff.
+
+Example::
+
+    from surreal_orm import RecordCache
+
+    # Call once at startup
+    RecordCache.configure(enabled=True, default_ttl=300, models=[User, Product])
+
+    user = await User.objects().get("alice")   # SELECT, then cached
+    user = await User.objects().get("alice")   # served from the cache
+
+    await RecordCache.stop()  # at shutdown: kill the live subscriptions
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .deadline import _detached_context
+
+if TYPE_CHECKING:
+    from surreal_sdk.streaming.live_select import LiveSelectStream
+
+    from .model_base import BaseSurrealModel
+
+logger = logging.getLogger(__name__)
+
+# Backoff between attempts to (re)start a table's live subscription, in seconds.
+_RETRY_INITIAL = 1.0
+_RETRY_MAX = 60.0
+
+
+@dataclass(slots=True)
+class _RecordEntry:
+    """A cached raw record with its expiration timestamp."""
+
+    record: dict[str, Any]
+    expires_at: float
+
+
+@dataclass
+class _TableWatcher:
+    """The live subscription keeping one table's entries coherent."""
+
+    connection: str
+    table: str
+    task: asyncio.Task[None] | None = None
+    stream: LiveSelectStream | None = None
+
+
+class RecordCache:
+    """
+    Global per-record cache with TTL, FIFO eviction and live invalidation.
+
+    Like ``QueryCache`` this is a class-level singleton; call ``configure()``
+    once at startup. The cache is disabled by default.
+    """
+
+    # ── Configuration ────────────────────────────────────────────────────
+
+    _enabled: bool = False
+    _default_ttl: int = 300  # seconds
+    _max_size: int = 10_000
+    _live_invalidation: bool = True
+    _tables: frozenset[str] | None = None  # None → every model
+
+    # ── State ────────────────────────────────────────────────────────────
+
+    _entries: dict[str, _RecordEntry] = {}
+    _watchers: dict[str, _TableWatcher] = {}
+    _signals_connected: bool = False
+    _hits: int = 0
+    _misses: int = 0
+
+    # ── Public API ───────────────────────────────────────────────────────
+
+    @classmethod
+    def configure(
+        cls,
+        *,
+        enabled: bool = True,
+        default_ttl: int = 300,
+        max_size: int = 10_000,
+        live_invalidation: bool = True,
+        models: Iterable[type[BaseSurrealModel]] | None = None,
+    ) -> None:
+        """
+        Configure the record cache.
+
+        Args:
+            enabled: Whether ``get()`` reads through the cache.
+            default_ttl: Time-to-live in seconds for cached records.
+            max_size: Maximum number of cached records (FIFO eviction).
+            live_invalidation: Start a ``LIVE SELECT`` per cached table to
+                evict records changed by any process.
+            models: Models whose records are cached. ``None`` caches all.
+        """
+        cls._enabled = enabled
+        cls._default_ttl = default_ttl
+        cls._max_size = max_size
+        cls._live_invalidation = live_invalidation
+        cls._tables = None if models is None else frozenset(m.get_table_name() for m in models)
+        cls._connect_signals()
+
+    @classmethod
+    def is_cached_model(cls, model: type[BaseSurrealModel]) -> bool:
+        """Return True if records of ``model`` go through the cache."""
+        return cls._enabled and (cls._tables is None or model.get_table_name() in cls._tables)
+
+    @classmethod
+    def get(cls, model: type[BaseSurrealModel], record_id: str) -> dict[str, Any] | None:
+        """
+        Return a copy of the cached raw record for ``record_id``, or ``None``.
+
+        Expired entries are removed on access.
+        """
+        if not cls.is_cached_model(model):
+            return None
+        key = cls._key(model.get_connection_name(), model.get_table_name(), record_id)
+        entry = cls._entries.get(key)
+        if entry is None or time.monotonic() > entry.expires_at:
+            if entry is not None:
+                cls._entries.pop(key, None)
+            cls._misses += 1
+            return None
+        cls._hits += 1
+        return copy.deepcopy(entry.record)
+
+    @classmethod
+    async def set(cls, model: type[BaseSurrealModel], record_id: str, record: dict[str, Any]) -> None:
+        """
+        Cache the raw ``record`` fetched for ``record_id``.
+
+        The first record of a table starts its live subscription in the
+        background; the record is stored without waiting for it.
+
+        Args:
+            model: The record's model class.
+            record_id: The bare record id.
+            record: The raw record as returned by the server.
+        """
+        if not cls.is_cached_model(model):
+            return
+        connection, table = model.get_connection_name(), model.get_table_name()
+        if cls._live_invalidation:
+            cls._start_watcher(connection, table)
+
+        while len(cls._entries) >= cls._max_size:
+            cls._entries.pop(next(iter(cls._entries)))
+
+        key = cls._key(connection, table, record_id)
+        cls._entries[key] = _RecordEntry(record=copy.deepcopy(record), expires_at=time.monotonic() + cls._default_ttl)
+
+    @classmethod
+    def invalidate(cls, model: type[BaseSurrealModel], record_id: str | None = None) -> int:
+        """
+        Drop one record, or every cached record of ``model``'s table.
+
+        Returns:
+            The number of entries removed.
+        """
+        return cls._drop(model.get_connection_name(), model.get_table_name(), record_id)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all cached records (live subscriptions are kept)."""
+        cls._entries.clear()
+        cls._hits = cls._misses = 0
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Kill every live subscription and clear the cache."""
+        watchers = list(cls._watchers.values())
+        cls._watchers.clear()
+        for watcher in watchers:
+            if watcher.stream is not None:
+                await watcher.stream.stop()
+            if watcher.task is not None:
+                watcher.task.cancel()
+        cls.clear()
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict with ``entries``, ``hits``, ``misses``, ``subscriptions``,
+            ``max_size``, ``default_ttl`` and ``enabled``.
+        """
+        return {
+            "entries": len(cls._entries),
+            "hits": cls._hits,
+            "misses": cls._misses,
+            "subscriptions": sum(1 for w in cls._watchers.values() if w.stream is not None),
+            "max_size": cls._max_size,
+            "default_ttl": cls._default_ttl,
+            "enabled": cls._enabled,
+        }
+
+    # ── Internal ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _key(connection: str, table: str, record_id: str) -> str:
+        return f"{connection}|{table}:{record_id}"
+
+    @classmethod
+    def _drop(cls, connection: str, table: str, record_id: str | None = None) -> int:
+        if record_id is not None:
+            return 1 if cls._entries.pop(cls._key(connection, table, record_id), None) is not None else 0
+        prefix = f"{connection}|{table}:"
+        keys = [key for key in cls._entries if key.startswith(prefix)]
+        for key in keys:
+            del cls._entries[key]
+        return len(keys)
+
+    @classmethod
+    def _start_watcher(cls, connection: str, table: str) -> None:
+        """Start the table's live subscription in the background, once."""
+        name = f"{connection}|{table}"
+        if name not in cls._watchers:
+            watcher = cls._watchers[name] = _TableWatcher(connection=connection, table=table)
+            watcher.task = asyncio.get_running_loop().create_task(cls._watch(watcher), context=_detached_context())
+
+    @classmethod
+    async def _watch(cls, watcher: _TableWatcher) -> None:
+        """Evict records named in the table's live notifications until stopped, restarting on failure."""
+        from surreal_sdk.streaming.live_select import LiveSelectStream
+
+        from .connection_manager import SurrealDBConnectionManager
+
+        async def _on_reconnect(old_id: str, new_id: str) -> None:
+            # Notifications sent while disconnected are lost.
+            cls._drop(watcher.connection, watcher.table)
+
+        delay = _RETRY_INITIAL
+        while True:
+            try:
+                ws = await SurrealDBConnectionManager.get_ws_client(watcher.connection)
+                stream = LiveSelectStream(ws, watcher.table, on_reconnect=_on_reconnect)
+                await stream.start()
+                watcher.stream = stream
+                delay = _RETRY_INITIAL
+                async for change in stream:
+                    cls._drop(watcher.connection, watcher.table, cls._change_record_id(change.result, change.record_id))
+                reason: Exception | str = "subscription ended"
+            except Exception as e:
+                reason = e
+            finally:
+                # Without the subscription the cached records can no longer be trusted.
+                if watcher.stream is not None:
+                    watcher.stream = None
+                    cls._drop(watcher.connection, watcher.table)
+
+            if cls._watchers.get(f"{watcher.connection}|{watcher.table}") is not watcher:
+                return  # stopped
+            logger.warning(
+                f"RecordCache: no live invalidation for '{watcher.table}', using TTL only; retrying in {delay:g}s: {reason}"
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RETRY_MAX)
+
+    @staticmethod
+    def _change_record_id(result: Any, record_id: str) -> str:
+        """Extract the bare record id from a live notification."""
+        from .model_base import _parse_record_id
+        from .utils import parse_record_id
+
+        raw = result.get("id") if isinstance(result, dict) and result.get("id") is not None else record_id
+        if isinstance(raw, str):
+            _, bare = parse_record_id(raw)
+            return bare.removeprefix("⟨").removesuffix("⟩")
+        return _parse_record_id(raw) or ""
+
+    @classmethod
+    def _connect_signals(cls) -> None:
+        """Lazily connect to ORM signals to evict locally written records."""
+        if cls._signals_connected:
+            return
+
+        from .signals import SignalHandler, post_delete, post_save, post_update
+
+        async def _evict(sender: type, **kwargs: Any) -> None:
+            instance = kwargs.get("instance")
+            if instance is not None and instance.get_id():
+                cls._drop(instance.get_connection_name(), instance.get_table_name(), instance.get_id())
+
+        handler: SignalHandler = _evict
+        post_save.connect()(handler)
+        post_update.connect()(handler)
+        post_delete.connect()(handler)
+
+        cls._signals_connected = True
+
+
+__all__ = ["RecordCache"]
@@ -0,0 +1,327 @@
+"""
+Unit of work: collect saves, merges and deletes and flush them in one request.
+
+A request handler that saves a few dozen models otherwise pays one round-trip
+(plus client resolution and logging) per ``save()``. A :class:`Session` records
+the pending writes instead and, on :meth:`Session.flush`, compiles them into a
+single multi-statement query per connection, optionally wrapped in
+``BEGIN``/``COMMIT``. Each statement's variables are prefixed (like
+:class:`~surreal_sdk.transaction.HTTPTransaction` does) so they cannot collide,
+and the records returned by the server are written back to the instances, so
+generated ids and server-side fields are populated after the flush.
+
+Example:
+    ```python
+    from surreal_orm import Session
+
+    async with Session() as session:
+        session.add(order)
+        session.add_all(order_lines)
+        session.merge(customer, last_order_at=SurrealFunc("time::now()"))
+        session.delete(cart)
+    # flushed on exit: one request, one transaction
+
+    print(order.id)  # assigned by the server
+    ```
+
+Signals are sent as for the individual operations: every ``pre_*`` signal fires
+before the request, the ``around_*`` handlers wrap it, and the ``post_*``
+signals fire once the results have been written back. When a flush fails, the
+``post_*`` signals are still sent for the writes that were applied (those of
+other connections, or earlier statements of a non-transactional request), so
+the caches listening to them are invalidated. Persisted instances with no
+changes are not written (see :meth:`BaseSurrealModel.get_dirty_fields`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Literal
+
+from surreal_sdk.transaction import namespace_variables
+
+from . import signals as model_signals
+from .connection_manager import SurrealDBConnectionManager
+from .debug import _elapsed_ms, _log_query, _start_timer
+from .identity_map import _identity_discard
+from .model_base import _UPDATE_NO_RECORD_MSG, SurrealDbError, _statement_results
+from .utils import format_thing
+
+if TYPE_CHECKING:
+    from .model_base import BaseSurrealModel
+    from .surreal_function import SurrealFunc
+
+# Statements whose failure is only a consequence of another statement failing
+# inside the same transaction.
+_NOT_EXECUTED = "not executed due to a failed transaction"
+
+
+@dataclass
+class _PendingWrite:
+    """One recorded operation and, once compiled, its statement."""
+
+    kind: Literal["save", "merge", "delete"]
+    instance: BaseSurrealModel
+    data: dict[str, Any] = field(default_factory=dict)
+    server_values: dict[str, SurrealFunc] | None = None
+    created: bool = False
+    statement: str | None = None
+    variables: dict[str, Any] = field(default_factory=dict)
+    thing: str = ""
+    applied: bool = False
+
+
+class Session:
+    """
+    Unit of work that flushes many model writes in one round-trip.
+
+    Used as an async context manager, the session flushes on a clean exit and
+    discards pending writes when the block raises. It can also be used
+    directly by calling :meth:`flush`.
+
+    Args:
+        transactional: Wrap each flushed request in ``BEGIN TRANSACTION`` /
+            ``COMMIT TRANSACTION`` so either every write applies or none does
+            (default: True). Writes for models on different connections are
+            sent as separate requests and are atomic per connection only.
+    """
+
+    def __init__(self, transactional: bool = True) -> None:
+        self.transactional = transactional
+        self._pending: list[_PendingWrite] = []
+
+    async def __aenter__(self) -> Session:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.discard()
+            return
+        await self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of recorded operations not yet flushed."""
+        return len(self._pending)
+
+    def add(self, instance: BaseSurrealModel, server_values: dict[str, SurrealFunc] | None = None) -> None:
+        """
+        Record a ``save()`` of ``instance``.
+
+        The fields to write are computed at flush time, so changes made after
+        ``add()`` are included. Adding the same instance twice records one save.
+
+        Args:
+            instance: Model instance to create or update.
+            server_values: Field names mapped to :class:`SurrealFunc`
+                expressions, as for :meth:`BaseSurrealModel.save`.
+        """
+        instance._check_not_view()
+        for write in self._pending:
+            if write.kind == "save" and write.instance is instance:
+                if server_values:
+                    write.server_values = {**(write.server_values or {}), **server_values}
+                return
+        self._pending.append(_PendingWrite("save", instance, server_values=server_values))
+
+    def add_all(self, instances: list[BaseSurrealModel]) -> None:
+        """Record a ``save()`` of every instance in ``instances``."""
+        for instance in instances:
+            self.add(instance)
+
+    def merge(self, instance: BaseSurrealModel, **data: Any) -> None:
+        """
+        Record a partial update of a persisted ``instance``.
+
+        Values may be :class:`SurrealFunc` expressions. The instance is updated
+        from the returned record after the flush.
+        """
+        instance._check_not_view()
+        if not instance.get_id():
+            raise SurrealDbError(f"No Id for the data to merge: {data}")
+        self._pending.append(_PendingWrite("merge", instance, data=data))
+
+    def delete(self, instance: BaseSurrealModel) -> None:
+        """Record the deletion of ``instance``."""
+        instance._check_not_view()
+        if not instance.get_id():
+            raise SurrealDbError("Can't delete record without an ID.")
+        self._pending.append(_PendingWrite("delete", instance))
+
+    def discard(self) -> None:
+        """Forget all pending operations without sending them."""
+        self._pending = []
+
+    async def flush(self) -> None:
+        """
+        Send all pending operations, one request per connection.
+
+        Raises:
+            SurrealDbError: If a statement fails, an update matches no record
+                or a delete targets a missing record. With
+                ``transactional=True`` nothing has been written to that
+                connection; the ``post_*`` signals are sent for the writes
+                that were applied before the error is raised.
+        """
+        writes, self._pending = self._pending, []
+        if not writes:
+            return
+
+        for write in writes:
+            await self._send_pre_signal(write)
+            self._compile(write)
+
+        groups: dict[str, list[_PendingWrite]] = {}
+        for write in writes:
+            if write.statement is not None:
+                groups.setdefault(write.instance.get_connection_name(), []).append(write)
+
+        try:
+            async with AsyncExitStack() as stack:
+                for write in writes:
+                    await stack.enter_async_context(self._around_signal(write))
+                # Let every request finish so the applied writes are known.
+                outcomes = await asyncio.gather(
+                    *(self._execute(name, group) for name, group in groups.items()), return_exceptions=True
+                )
+                for outcome in outcomes:
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+        except BaseException:
+            await self._send_post_signals([write for write in writes if write.applied])
+            raise
+        await self._send_post_signals(writes)
+
+    async def _send_post_signals(self, writes: list[_PendingWrite]) -> None:
+        """Start the read-your-writes window and send the ``post_*`` signals of ``writes``."""
+        # gather() runs each request in a task of its own: note the writes here.
+        for name in {write.instance.get_connection_name() for write in writes if write.statement is not None}:
+            SurrealDBConnectionManager._note_write(name)
+        for write in writes:
+            await self._send_post_signal(write)
+
+    @staticmethod
+    def _compile(write: _PendingWrite) -> None:
+        """Build the statement for ``write``; no-op saves get no statement."""
+        instance = write.instance
+        table = instance.get_table_name()
+        record_id = instance.get_id()
+        write.thing = format_thing(table, record_id) if record_id else table
+
+        if write.kind == "delete":
+            write.statement = f"DELETE {write.thing} RETURN BEFORE;"
+            return
+
+        if write.kind == "merge":
+            set_clause, write.variables = instance._build_set_clause(write.data)
+            write.statement = f"UPDATE {write.thing} SET {set_clause};"
+            return
+
+        write.data = instance._build_save_data(write.server_values)
+        if not write.created and not write.data and instance._db_snapshot is not None:
+            return  # unchanged persisted record
+        if write.data:
+            set_clause, write.variables = instance._build_set_clause(write.data)
+            set_clause = f" SET {set_clause}"
+        else:
+            set_clause = ""
+        if write.created:
+            verb = "UPSERT" if record_id else "CREATE"
+        else:
+            verb = "UPDATE"
+        write.statement = f"{verb} {write.thing}{set_clause};"
+
+    async def _execute(self, connection: str, writes: list[_PendingWrite]) -> None:
+        """Send ``writes`` as one request and write the results back."""
+        sql_parts: list[str] = ["BEGIN TRANSACTION;"] if self.transactional else []
+        variables: dict[str, Any] = {}
+        for i, write in enumerate(writes):
+            prefix = f"_s{i}_"
+            sql_parts.append(namespace_variables(write.statement or "", write.variables, prefix))
+            for key, value in write.variables.items():
+                variables[prefix + key] = value
+        if self.transactional:
+            sql_parts.append("COMMIT TRANSACTION;")
+
+        client = await SurrealDBConnectionManager.get_client(connection)
+        sql = "\n".join(sql_parts)
+        start = _start_timer()
+        response = await client.query(sql, variables)
+        _log_query(sql, variables, _elapsed_ms(start))
+
+        results = _statement_results(response.results, len(writes), self.transactional)
+
+        errors: list[str] = []
+        for write, result in zip(writes, results, strict=True):
+            if result.is_error:
+                errors.append(f"{write.thing}: {result.result}")
+                continue
+            records = result.records
+            if not records:
+                if write.kind == "delete":
+                    errors.append(f"Can't delete Record id -> '{write.instance.get_id()}' not found!")
+                elif not write.created:
+                    errors.append(_UPDATE_NO_RECORD_MSG.format(thing=write.thing))
+                continue
+            if write.kind == "delete":
+                _identity_discard(write.instance.__class__, write.instance.get_id() or "")
+            else:
+                write.instance._update_from_db(records[0])
+            write.applied = True
+
+        if errors:
+            if self.transactional:
+                # The transaction was cancelled: none of its writes persisted.
+                for write in writes:
+                    write.applied = False
+            # Inside a failed transaction every other statement reports that it
+            # was not executed; surface the root causes first.
+            errors.sort(key=lambda message: _NOT_EXECUTED in message)
+            raise SurrealDbError(f"Session flush failed: {'; '.join(errors)}")
+
+    @staticmethod
+    async def _send_pre_signal(write: _PendingWrite) -> None:
+        """Send the ``pre_*`` signal for ``write`` and remember whether it creates."""
+        instance = write.instance
+        sender = instance.__class__
+        if write.kind == "save":
+            write.created = not instance._db_persisted
+            await model_signals.pre_save.send(sender=sender, instance=instance, created=write.created, tx=None)
+        elif write.kind == "merge":
+            await model_signals.pre_update.send(sender=sender, instance=instance, update_fields=write.data, tx=None)
+        else:
+            await model_signals.pre_delete.send(sender=sender, instance=instance, tx=None)
+
+    @staticmethod
+    def _around_signal(write: _PendingWrite) -> Any:
+        """Return the ``around_*`` context manager for ``write``."""
+        instance = write.instance
+        sender = instance.__class__
+        if write.kind == "save":
+            return model_signals.around_save.wrap(sender=sender, instance=instance, created=write.created, tx=None)
+        if write.kind == "merge":
+            return model_signals.around_update.wrap(sender=sender, instance=instance, update_fields=write.data, tx=None)
+        return model_signals.around_delete.wrap(sender=sender, instance=instance, tx=None)
+
+    @staticmethod
+    async def _send_post_signal(write: _PendingWrite) -> None:
+        """Send the ``post_*`` signal for ``write``."""
+        instance = write.instance
+        sender = instance.__class__
+        if write.kind == "save":
+            await model_signals.post_save.send(sender=sender, instance=instance, created=write.created, tx=None)
+        elif write.kind == "merge":
+            await model_signals.post_update.send(sender=sender, instance=instance, update_fields=write.data, tx=None)
+        else:
+            await model_signals.post_delete.send(sender=sender, instance=instance, tx=None)
+
+
+__all__ = ["Session"]
@@ -6,6 +6,7 @@ for table types, schema modes, and field types.
 """
 
 from enum import StrEnum
+from typing import Literal
 
 
 class TableType(StrEnum):
@@ -182,6 +183,14 @@ class EncryptionAlgorithm(StrEnum):
     SCRYPT = "scrypt"
 
 
+# What a mutation sends back (``returning=`` on save/merge/upsert/bulk ops):
+# "none" → nothing, "count" → only enough to count/confirm affected records,
+# "diff" → JSON Patch of the changes, "after" → full records, or a list of
+# field names to return only those fields.
+ReturnMode = Literal["none", "count", "diff", "after"]
+Returning = ReturnMode | list[str] | tuple[str, ...]
+
+
 # Type mapping from Python types to SurrealDB types
 # Deprecated: Use FieldType.from_python_type() instead
 PYTHON_TO_SURREAL_TYPE: dict[type, FieldType] = {
@@ -128,6 +128,33 @@ def format_thing(table: str, record_id: str) -> str:
     return f"{table}:{escaped_id}"
 
 
+def return_clause(returning: Any) -> str:
+    """
+    Render the ``RETURN`` clause of a mutation for a ``returning=`` mode.
+
+    Args:
+        returning: ``"none"``, ``"count"``, ``"diff"``, ``"after"`` or a list
+            of field names. ``"count"`` returns only record ids, which is
+            enough to confirm or count the affected records.
+
+    Returns:
+        The clause, e.g. ``"RETURN NONE"`` or ``"RETURN id, name"``.
+
+    Raises:
+        ValueError: If the mode or a field name is invalid.
+    """
+    if isinstance(returning, (list, tuple)):
+        if not returning:
+            raise ValueError("returning= field list must not be empty")
+        for field in returning:
+            validate_identifier(field, "returning field")
+        return "RETURN " + ", ".join(returning)
+    clauses = {"none": "RETURN NONE", "count": "RETURN id", "diff": "RETURN DIFF", "after": "RETURN AFTER"}
+    if returning not in clauses:
+        raise ValueError(f"Invalid returning mode {returning!r}; expected one of {sorted(clauses)} or a list of fields.")
+    return clauses[returning]
+
+
 def parse_record_id(full_id: str) -> tuple[str | None, str]:
     """
     Parse a full record ID (table:id) into table and id parts.
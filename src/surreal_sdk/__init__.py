@@ -15,14 +15,19 @@ Supports:
 
 from typing import Any
 
-from .connection.base import BaseSurrealConnection
+from .connection.base import BaseSurrealConnection, TransferStats
 from .connection.http import HTTPConnection
+from .connection.lanes import current_priority, query_priority
+from .connection.limiter import AdaptiveLimiter
+from .connection.multi_endpoint import MultiEndpointHTTPConnection
 from .connection.pool import ConnectionPool
 from .connection.websocket import WebSocketConnection
 from .exceptions import (
     AuthenticationError,
     ConnectionError,
+    OverloadedError,
     QueryError,
+    QueryTimeoutError,
     SurrealDBError,
     TableNotFoundError,
     TimeoutError,
@@ -47,6 +52,7 @@ from .protocol.cbor import (
 from .protocol.cbor import (
     is_available as cbor_is_available,
 )
+from .protocol.json_codec import JSONCodec, available_json_codecs, get_json_codec
 from .protocol.rpc import RPCError, RPCRequest, RPCResponse
 from .streaming.change_feed import ChangeFeedStream
 from .streaming.live_query import LiveNotification, LiveQuery, LiveQueryManager
@@ -59,7 +65,9 @@ from .streaming.live_select import (
 )
 from .transaction import (
     BaseTransaction,
+    BufferedTransaction,
     HTTPTransaction,
+    PipelinedWebSocketTransaction,
     TransactionStatement,
     WebSocketTransaction,
 )
@@ -80,8 +88,13 @@ __all__ = [
     # Connections
     "BaseSurrealConnection",
     "HTTPConnection",
+    "MultiEndpointHTTPConnection",
     "WebSocketConnection",
     "ConnectionPool",
+    "AdaptiveLimiter",
+    "TransferStats",
+    "query_priority",
+    "current_priority",
     # Streaming - Live Query (callback-based)
     "ChangeFeedStream",
     "LiveQuery",
@@ -97,6 +110,10 @@ __all__ = [
     "RPCRequest",
     "RPCResponse",
     "RPCError",
+    # JSON Codecs
+    "JSONCodec",
+    "get_json_codec",
+    "available_json_codecs",
     # CBOR Types
     "CBOR_AVAILABLE",
     "RecordId",
@@ -115,8 +132,10 @@ __all__ = [
     "DeleteResponse",
     # Transactions
     "BaseTransaction",
+    "BufferedTransaction",
     "HTTPTransaction",
     "WebSocketTransaction",
+    "PipelinedWebSocketTransaction",
     "TransactionStatement",
     # Functions
     "FunctionCall",
@@ -133,6 +152,8 @@ __all__ = [
     "QueryError",
     "TableNotFoundError",
     "TimeoutError",
+    "QueryTimeoutError",
+    "OverloadedError",
     "TransactionError",
     "TransactionConflictError",
 ]
@@ -4,14 +4,22 @@ SurrealDB SDK Connection Module.
 Provides HTTP and WebSocket connection implementations.
 """
 
-from .base import BaseSurrealConnection
+from .base import BaseSurrealConnection, TransferStats
 from .http import HTTPConnection
+from .lanes import current_priority, query_priority
+from .limiter import AdaptiveLimiter
+from .multi_endpoint import MultiEndpointHTTPConnection
 from .pool import ConnectionPool
 from .websocket import WebSocketConnection
 
 __all__ = [
+    "AdaptiveLimiter",
     "BaseSurrealConnection",
     "ConnectionPool",
     "HTTPConnection",
+    "MultiEndpointHTTPConnection",
+    "TransferStats",
     "WebSocketConnection",
+    "current_priority",
+    "query_priority",
 ]
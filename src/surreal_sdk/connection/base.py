@@ -5,6 +5,7 @@ Defines the abstract interface that all connection types must implement.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Self
 
 from ..protocol.rpc import RPCRequest, RPCResponse
@@ -12,6 +13,7 @@ from ..protocol.rpc import RPCRequest, RPCResponse
 if TYPE_CHECKING:
     from ..functions import FunctionNamespace
     from ..transaction import BaseTransaction
+    from .limiter import AdaptiveLimiter
 from ..types import (
     AuthResponse,
     DeleteResponse,
@@ -22,6 +24,54 @@ from ..types import (
 )
 
 
+@dataclass
+class TransferStats:
+    """
+    Per-connection RPC byte counters.
+
+    ``bytes_sent``/``bytes_received`` count encoded payloads (CBOR or JSON)
+    before compression; ``wire_bytes_sent``/``wire_bytes_received`` count what
+    actually crossed the network after compression. Without compression both
+    pairs are equal. WebSocket permessage-deflate runs inside aiohttp, so
+    WebSocket connections only report payload sizes in both pairs.
+    """
+
+    requests: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    wire_bytes_sent: int = 0
+    wire_bytes_received: int = 0
+
+    def record(self, sent: int, received: int, wire_sent: int | None = None, wire_received: int | None = None) -> None:
+        """Record one request/response exchange."""
+        self.record_sent(sent, wire_sent)
+        self.record_received(received, wire_received)
+
+    def record_sent(self, size: int, wire: int | None = None) -> None:
+        """Record an outgoing request of ``size`` payload bytes."""
+        self.requests += 1
+        self.bytes_sent += size
+        self.wire_bytes_sent += size if wire is None else wire
+
+    def record_received(self, size: int, wire: int | None = None) -> None:
+        """Record an incoming message of ``size`` payload bytes."""
+        self.bytes_received += size
+        self.wire_bytes_received += size if wire is None else wire
+
+    @property
+    def compression_ratio(self) -> float:
+        """Wire bytes divided by payload bytes (1.0 means no savings)."""
+        total = self.bytes_sent + self.bytes_received
+        if not total:
+            return 1.0
+        return (self.wire_bytes_sent + self.wire_bytes_received) / total
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        self.requests = self.bytes_sent = self.bytes_received = 0
+        self.wire_bytes_sent = self.wire_bytes_received = 0
+
+
 class BaseSurrealConnection(ABC):
     """
     Abstract base class for SurrealDB connections.
@@ -52,6 +102,9 @@ class BaseSurrealConnection(ABC):
         self._connected = False
         self._authenticated = False
         self._token: str | None = None
+        self.transfer_stats = TransferStats()
+        self.in_flight = 0  # RPC calls awaiting a response
+        self.limiter: AdaptiveLimiter | None = None  # caps in_flight when set
 
     @property
     def is_connected(self) -> bool:
@@ -93,6 +146,14 @@ class BaseSurrealConnection(ABC):
         """
         ...
 
+    async def _send_request(self, request: RPCRequest) -> RPCResponse:
+        """Send an RPC request, counting it in ``in_flight`` until it is answered."""
+        self.in_flight += 1
+        try:
+            return await self._send_rpc(request)
+        finally:
+            self.in_flight -= 1
+
     # Context manager support
 
     async def __aenter__(self) -> Self:
@@ -123,7 +184,11 @@ class BaseSurrealConnection(ABC):
         from ..exceptions import QueryError, TableNotFoundError
 
         request = RPCRequest(method=method, params=params or [])
-        response = await self._send_rpc(request)
+        if self.limiter is not None:
+            async with self.limiter.slot():
+                response = await self._send_request(request)
+        else:
+            response = await self._send_request(request)
 
         if response.is_error:
             message = response.error.message if response.error else "Unknown error"
@@ -5,6 +5,8 @@ Provides stateless HTTP-based connection, ideal for microservices and serverless
 """
 
 import asyncio
+import gzip
+import zlib
 from typing import TYPE_CHECKING, Any, Literal, Self
 
 import httpx
@@ -14,6 +16,7 @@ from .base import BaseSurrealConnection
 if TYPE_CHECKING:
     from ..transaction import HTTPTransaction
 from ..exceptions import ConnectionError, QueryError
+from ..protocol.json_codec import JSONCodec, get_json_codec
 from ..protocol.rpc import RPCRequest, RPCResponse
 from ..types import AuthResponse
 
@@ -25,6 +28,17 @@ from ..types import AuthResponse
 # surface.
 _AUTH_RETRY_BACKOFFS_S: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0)
 
+# Request bodies smaller than this are sent uncompressed by default: below a
+# kilobyte the gzip header and CPU cost outweigh the bandwidth saved.
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+
+def _compress_body(body: bytes, encoding: Literal["gzip", "deflate"]) -> bytes:
+    """Compress an HTTP request body with the given Content-Encoding."""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return zlib.compress(body, 6)
+
 
 class HTTPConnection(BaseSurrealConnection):
     """
@@ -47,6 +61,9 @@ class HTTPConnection(BaseSurrealConnection):
         database: str,
         timeout: float = 30.0,
         protocol: Literal["json", "cbor"] = "cbor",
+        json_codec: str | JSONCodec | None = None,
+        compression: Literal["gzip", "deflate"] | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
     ):
         """
         Initialize HTTP connection.
@@ -59,6 +76,14 @@ class HTTPConnection(BaseSurrealConnection):
             protocol: Serialization protocol ("json" or "cbor").
                       Defaults to "cbor" which properly handles string values
                       that might be misinterpreted as record links (e.g., "data:...").
+            json_codec: JSON codec used when ``protocol="json"`` ("stdlib",
+                        "orjson", "msgspec", "auto" or a ``JSONCodec``).
+                        Defaults to the stdlib encoder.
+            compression: Opt-in RPC body compression ("gzip" or "deflate").
+                         Request bodies are compressed when they reach
+                         ``compression_threshold`` bytes, and compressed
+                         responses are requested via ``Accept-Encoding``.
+            compression_threshold: Minimum request body size (bytes) to compress.
         """
         # Normalize URL to HTTP if needed
         if url.startswith("ws://"):
@@ -68,11 +93,18 @@ class HTTPConnection(BaseSurrealConnection):
 
         if protocol not in ("json", "cbor"):
             raise ValueError(f"Invalid protocol '{protocol}'. Must be 'json' or 'cbor'.")
+        if compression not in (None, "gzip", "deflate"):
+            raise ValueError(f"Invalid compression '{compression}'. Must be 'gzip', 'deflate' or None.")
+        if compression_threshold < 0:
+            raise ValueError("compression_threshold must be >= 0")
 
         super().__init__(url, namespace, database, timeout)
         self._client: httpx.AsyncClient | None = None
         self._request_id = 0
         self.protocol: Literal["json", "cbor"] = protocol
+        self.json_codec: JSONCodec = get_json_codec(json_codec)
+        self.compression: Literal["gzip", "deflate"] | None = compression
+        self.compression_threshold = compression_threshold
         # Last successful signin arguments, retained so a transient auth failure
         # (see ``_send_rpc``) can transparently re-mint a token.
         self._signin_args: dict[str, Any] | None = None
@@ -177,28 +209,14 @@ class HTTPConnection(BaseSurrealConnection):
             try:
                 if self.protocol == "cbor":
                     # Use CBOR encoding which properly handles all data types
-                    headers = {
-                        **self.headers,
-                        "Content-Type": "application/cbor",
-                        "Accept": "application/cbor",
-                    }
-                    response = await self._client.post(
-                        "/rpc",
-                        content=request.to_cbor(),
-                        headers=headers,
-                    )
-                    response.raise_for_status()
+                    response = await self._post_rpc(request.to_cbor(), "application/cbor")
                     return RPCResponse.from_cbor(response.content)
                 else:
                     # Use JSON encoding
-                    headers = {**self.headers, "Content-Type": "application/json"}
-                    response = await self._client.post(
-                        "/rpc",
-                        content=request.to_json(),
-                        headers=headers,
-                    )
-                    response.raise_for_status()
-                    return RPCResponse.from_dict(response.json())
+                    encoded = request.encode_json(self.json_codec)
+                    body = encoded.encode() if isinstance(encoded, str) else encoded
+                    response = await self._post_rpc(body, "application/json")
+                    return RPCResponse.from_json(response.content, self.json_codec)
 
             except httpx.HTTPStatusError as e:
                 last_status_error = e
@@ -229,6 +247,35 @@ class HTTPConnection(BaseSurrealConnection):
             code=last_status_error.response.status_code if last_status_error else 401,
         )
 
+    async def _post_rpc(self, body: bytes, content_type: str) -> httpx.Response:
+        """
+        POST an encoded RPC body to ``/rpc``, compressing it when configured.
+
+        Updates ``transfer_stats`` with payload and on-the-wire byte counts.
+        """
+        assert self._client is not None
+        return await self._post_rpc_to(self._client, body, content_type)
+
+    async def _post_rpc_to(self, client: httpx.AsyncClient, body: bytes, content_type: str) -> httpx.Response:
+        """POST an encoded RPC body to ``/rpc`` through ``client`` (see ``_post_rpc``)."""
+        headers = {**self.headers, "Content-Type": content_type, "Accept": content_type}
+        content = body
+        if self.compression:
+            headers["Accept-Encoding"] = "gzip, deflate"
+            if len(body) >= self.compression_threshold:
+                content = _compress_body(body, self.compression)
+                headers["Content-Encoding"] = self.compression
+
+        response = await client.post("/rpc", content=content, headers=headers)
+        response.raise_for_status()
+        self.transfer_stats.record(
+            sent=len(body),
+            received=len(response.content),
+            wire_sent=len(content),
+            wire_received=response.num_bytes_downloaded,
+        )
+        return response
+
     async def signin(
         self,
         user: str | None = None,
@@ -526,12 +573,17 @@ class HTTPConnection(BaseSurrealConnection):
 
     # Transaction support
 
-    def transaction(self) -> "HTTPTransaction":
+    def transaction(self, max_statements: int | None = None) -> "HTTPTransaction":
         """
         Create a new HTTP transaction.
 
         HTTP transactions batch all statements and execute them atomically on commit.
 
+        Args:
+            max_statements: Split commits larger than this into several
+                BEGIN/COMMIT requests (atomic per chunk only). ``None``
+                sends everything in one request.
+
         Usage:
             async with conn.transaction() as tx:
                 await tx.create("users", {"name": "Alice"})
@@ -543,7 +595,7 @@ class HTTPConnection(BaseSurrealConnection):
         """
         from ..transaction import HTTPTransaction
 
-        return HTTPTransaction(self)
+        return HTTPTransaction(self, max_statements=max_statements)
 
     def _to_thing(self, thing: str) -> Any:
         """
@@ -0,0 +1,197 @@
+"""
+Priority Lanes for SurrealDB SDK.
+
+Requests run in the priority lane of the current context ("interactive" by
+default).  Where requests have to wait for a slot (a ``ConnectionPool`` or an
+``AdaptiveLimiter``), the lanes share the slots by weighted fair queueing, so
+background work cannot crowd out interactive requests.
+
+Usage:
+    async with query_priority("background"):
+        await export_everything(conn)  # waits behind interactive requests
+"""
+
+import asyncio
+import contextvars
+from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+
+DEFAULT_LANE = "interactive"
+# Share of the contended slots each lane gets; unknown lanes weigh 1.
+DEFAULT_LANE_WEIGHTS: Mapping[str, float] = {"interactive": 4.0, "background": 1.0}
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar("query_priority", default=DEFAULT_LANE)
+
+
+def current_priority() -> str:
+    """Return the priority lane of the current context."""
+    return _priority.get()
+
+
+@asynccontextmanager
+async def query_priority(lane: str) -> AsyncIterator[None]:
+    """
+    Run the requests of the block in priority lane ``lane``.
+
+    Async-safe via :mod:`contextvars`: tasks started inside the block inherit
+    the lane, other tasks are unaffected.
+
+    Usage:
+        async with query_priority("background"):
+            await nightly_export()
+    """
+    if not lane:
+        raise ValueError("lane must be a non-empty string")
+    token = _priority.set(lane)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class FairQueue:
+    """
+    Request slots shared by priority lanes.
+
+    Up to ``limit`` requests hold a slot at once.  When requests wait, free
+    slots go to the lanes in proportion to their weights (start-time fair
+    queueing) and in FIFO order within a lane.  ``lane_limits`` optionally
+    caps the slots a lane may hold, even when others are free.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        lane_weights: Mapping[str, float] | None = None,
+        lane_limits: Mapping[str, int] | None = None,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            limit: Number of slots.
+            lane_weights: Weight of each lane (defaults to ``DEFAULT_LANE_WEIGHTS``).
+            lane_limits: Maximum slots held by each lane (unlisted lanes are uncapped).
+        """
+        weights = dict(DEFAULT_LANE_WEIGHTS if lane_weights is None else lane_weights)
+        if any(weight <= 0 for weight in weights.values()):
+            raise ValueError("Lane weights must be > 0")
+        if lane_limits and any(cap < 1 for cap in lane_limits.values()):
+            raise ValueError("Lane limits must be >= 1")
+
+        self.lane_weights = weights
+        self.lane_limits = dict(lane_limits or {})
+        self._limit = float(limit)
+        self.in_flight = 0
+        self.lane_in_flight: dict[str, int] = {}
+        self._waiters: dict[str, deque[asyncio.Future[None]]] = {}
+        self._finish: dict[str, float] = {}  # virtual finish time of each lane's last grant
+        self._clock = 0.0  # virtual start time of the last grant
+
+    @property
+    def limit(self) -> int:
+        """Number of requests allowed to hold a slot at once."""
+        return int(self._limit)
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def acquire(self, timeout: float | None = None, *, lane: str | None = None) -> None:
+        """
+        Wait for a slot.
+
+        Args:
+            timeout: Seconds to wait at most (None: no limit).
+            lane: Priority lane (defaults to the lane of the current context).
+
+        Raises:
+            TimeoutError: If no slot was granted within ``timeout``.
+        """
+        lane = lane or current_priority()
+        if self.in_flight < self.limit and self._lane_has_room(lane) and not self._waiters.get(lane):
+            self._grant(lane)
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(lane, deque()).append(waiter)
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                return  # granted a slot just as the deadline passed
+            self._remove(lane, waiter)
+            raise
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(lane=lane)  # pass the granted slot on
+            else:
+                self._remove(lane, waiter)
+            raise
+
+    def release(self, *, lane: str | None = None) -> None:
+        """Free the slot held by a request of ``lane`` (defaults to the current lane)."""
+        lane = lane or current_priority()
+        self.in_flight -= 1
+        held = self.lane_in_flight.get(lane, 0)
+        if held > 1:
+            self.lane_in_flight[lane] = held - 1
+        else:
+            self.lane_in_flight.pop(lane, None)
+        self._wake()
+
+    def lane_stats(self) -> dict[str, dict[str, int]]:
+        """Return ``in_flight`` and ``queued`` per lane that is busy or waiting."""
+        lanes = set(self.lane_in_flight) | set(self._waiters)
+        return {
+            lane: {"in_flight": self.lane_in_flight.get(lane, 0), "queued": len(self._waiters.get(lane, ()))}
+            for lane in sorted(lanes)
+        }
+
+    def _lane_has_room(self, lane: str) -> bool:
+        cap = self.lane_limits.get(lane)
+        return cap is None or self.lane_in_flight.get(lane, 0) < cap
+
+    def _grant(self, lane: str) -> None:
+        self.in_flight += 1
+        self.lane_in_flight[lane] = self.lane_in_flight.get(lane, 0) + 1
+        start = max(self._finish.get(lane, 0.0), self._clock)
+        self._clock = start
+        self._finish[lane] = start + 1 / self.lane_weights.get(lane, 1.0)
+
+    def _next_lane(self) -> str | None:
+        """The waiting lane with room whose next request starts first in virtual time."""
+        ready = [lane for lane in self._waiters if self._lane_has_room(lane)]
+        if not ready:
+            return None
+        return min(ready, key=lambda lane: max(self._finish.get(lane, 0.0), self._clock))
+
+    def _wake(self) -> None:
+        """Hand free slots to the waiting requests."""
+        while self.in_flight < self.limit:
+            lane = self._next_lane()
+            if lane is None:
+                return
+            waiters = self._waiters[lane]
+            waiter = waiters.popleft()
+            if not waiters:
+                del self._waiters[lane]
+            if waiter.done():
+                continue
+            self._grant(lane)
+            waiter.set_result(None)
+
+    def _remove(self, lane: str, waiter: asyncio.Future[None]) -> None:
+        waiters = self._waiters.get(lane)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+        if not waiters:
+            del self._waiters[lane]
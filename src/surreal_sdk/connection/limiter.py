@@ -0,0 +1,218 @@
+"""
+Adaptive Concurrency Limiter for SurrealDB SDK.
+
+Caps the number of RPC requests in flight on a connection, adjusting the cap
+to the latency the server answers with, and sheds the requests that cannot
+get a slot in time.
+"""
+
+import asyncio
+import math
+import time
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from typing import Any, Literal
+
+from ..exceptions import OverloadedError
+from .lanes import FairQueue, current_priority
+
+# Weight of a new sample in the recent-latency EWMA.
+_SHORT_ALPHA = 0.2
+# Weight of a new sample in the baseline (no-load) latency EWMA.
+_BASELINE_ALPHA = 0.01
+
+
+class AdaptiveLimiter(FairQueue):
+    """
+    Adaptive concurrency limit for one connection (or a pool of them).
+
+    The limit grows while latency stays close to the baseline (the latency
+    measured without load) and shrinks when latency climbs or requests fail,
+    so the server is kept busy without being pushed into overload:
+
+    - ``"aimd"``: +1 per request answered within ``tolerance`` times the
+      baseline, multiplied by ``backoff`` otherwise.
+    - ``"gradient"``: moves towards ``limit * baseline * tolerance / latency``
+      plus a ``sqrt(limit)`` headroom, smoothed by ``smoothing``.
+
+    Requests beyond the limit wait for up to ``queue_timeout`` seconds, queued
+    per priority lane (see :func:`query_priority`); those still waiting then,
+    or arriving when ``max_queue`` requests already wait, fail fast with
+    :class:`OverloadedError`.
+
+    Usage:
+        limiter = AdaptiveLimiter(initial_limit=20, max_limit=200, queue_timeout=0.5)
+        conn = HTTPConnection("http://localhost:8000", "ns", "db")
+        conn.limiter = limiter  # or ConnectionPool(..., limiter=limiter)
+        ...
+        limiter.stats()  # limit, in_flight, queued, accepted, shed, ...
+    """
+
+    def __init__(
+        self,
+        *,
+        algorithm: Literal["aimd", "gradient"] = "gradient",
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        queue_timeout: float = 1.0,
+        max_queue: int | None = None,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        smoothing: float = 0.2,
+        lane_weights: Mapping[str, float] | None = None,
+        lane_limits: Mapping[str, int] | None = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            algorithm: "aimd" or "gradient" (see the class docstring).
+            initial_limit: Concurrency limit before any latency is measured.
+            min_limit: Lowest value the limit can shrink to.
+            max_limit: Highest value the limit can grow to.
+            queue_timeout: Seconds a request may wait for a slot before being shed.
+            max_queue: Maximum number of waiting requests (None: unbounded).
+            tolerance: Latency, as a multiple of the baseline, still considered healthy.
+            backoff: Factor applied to the limit when a request fails or,
+                     with "aimd", is slower than ``tolerance`` allows.
+            smoothing: Weight of each new "gradient" estimate (0-1].
+            lane_weights: Share of the slots each priority lane gets when
+                          requests queue (see ``query_priority()``).
+            lane_limits: Maximum requests in flight per priority lane.
+        """
+        if algorithm not in ("aimd", "gradient"):
+            raise ValueError(f"Invalid algorithm '{algorithm}'. Must be 'aimd' or 'gradient'.")
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if queue_timeout < 0:
+            raise ValueError("queue_timeout must be >= 0")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+        if tolerance < 1:
+            raise ValueError("tolerance must be >= 1")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be > 0 and < 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be > 0 and <= 1")
+
+        super().__init__(initial_limit, lane_weights=lane_weights, lane_limits=lane_limits)
+        self.algorithm = algorithm
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_queue
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.smoothing = smoothing
+
+        self.accepted = 0
+        self.shed = 0
+        self.dropped = 0  # requests that failed in transport
+        self.latency: float | None = None  # EWMA of recent latency, in seconds
+        self.baseline: float | None = None  # latency without load, in seconds
+
+    async def acquire(self, timeout: float | None = None, *, lane: str | None = None) -> None:
+        """
+        Wait for a slot.
+
+        Args:
+            timeout: Seconds to wait at most (defaults to ``queue_timeout``).
+            lane: Priority lane (defaults to the lane of the current context).
+
+        Raises:
+            OverloadedError: If no slot frees up in time or the queue is full.
+        """
+        if self.max_queue is not None and self.queued >= self.max_queue and self.in_flight >= self.limit:
+            self.shed += 1
+            raise OverloadedError(f"Concurrency limit reached ({self.limit} in flight, {self.queued} queued)")
+        try:
+            await super().acquire(self.queue_timeout if timeout is None else timeout, lane=lane)
+        except TimeoutError:
+            self.shed += 1
+            raise OverloadedError(f"No request slot freed up in time ({self.limit} in flight)") from None
+        self.accepted += 1
+
+    def release(self, latency: float | None = None, *, dropped: bool = False, lane: str | None = None) -> None:
+        """
+        Free a slot and adapt the limit.
+
+        Args:
+            latency: Seconds the request took, or None to leave the limit unchanged.
+            dropped: Whether the request failed in transport (shrinks the limit).
+            lane: Priority lane of the request (defaults to the current lane).
+        """
+        if dropped:
+            self.dropped += 1
+            self._limit = max(self.min_limit, self._limit * self.backoff)
+        elif latency is not None:
+            self._adapt(latency, self.in_flight)
+        super().release(lane=lane)
+
+    @asynccontextmanager
+    async def slot(self, timeout: float | None = None) -> AsyncGenerator[None, None]:
+        """
+        Hold a slot for the duration of one request, timing it.
+
+        Usage:
+            async with limiter.slot():
+                response = await send(request)
+        """
+        lane = current_priority()
+        await self.acquire(timeout, lane=lane)
+        start = time.perf_counter()
+        try:
+            yield
+        except asyncio.CancelledError:
+            self.release(lane=lane)
+            raise
+        except Exception:
+            self.release(time.perf_counter() - start, dropped=True, lane=lane)
+            raise
+        else:
+            self.release(time.perf_counter() - start, lane=lane)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return limiter statistics.
+
+        Returns:
+            Dict with ``algorithm``, ``limit``, ``in_flight``, ``queued``,
+            ``accepted``, ``shed``, ``dropped``, ``latency_ms``,
+            ``baseline_ms`` and ``lanes`` (in flight and queued per lane).
+        """
+        return {
+            "algorithm": self.algorithm,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "accepted": self.accepted,
+            "shed": self.shed,
+            "dropped": self.dropped,
+            "latency_ms": self.latency * 1000 if self.latency is not None else None,
+            "baseline_ms": self.baseline * 1000 if self.baseline is not None else None,
+            "lanes": self.lane_stats(),
+        }
+
+    def _adapt(self, latency: float, in_flight: int) -> None:
+        if self.latency is None or self.baseline is None:
+            self.latency = self.baseline = latency
+            return
+        self.latency = _SHORT_ALPHA * latency + (1 - _SHORT_ALPHA) * self.latency
+        # The baseline follows lower latencies at once and higher ones slowly,
+        # so it tracks the no-load latency even when that drifts.
+        self.baseline = min(latency, _BASELINE_ALPHA * latency + (1 - _BASELINE_ALPHA) * self.baseline)
+        # Only grow a limit that is actually used.
+        saturated = in_flight * 2 >= self._limit
+
+        if self.algorithm == "aimd":
+            if latency > self.baseline * self.tolerance:
+                self._limit *= self.backoff
+            elif saturated:
+                self._limit += 1
+        else:
+            gradient = max(0.5, min(1.0, self.baseline * self.tolerance / self.latency))
+            estimate = self._limit * gradient + math.sqrt(self._limit)
+            if estimate < self._limit or saturated:
+                self._limit = (1 - self.smoothing) * self._limit + self.smoothing * estimate
+        self._limit = max(self.min_limit, min(self.max_limit, self._limit))
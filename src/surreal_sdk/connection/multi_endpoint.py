@@ -0,0 +1,318 @@
+"""
+Multi-Endpoint HTTP Connection for SurrealDB SDK.
+
+Balances RPC requests across the nodes of a SurrealDB cluster and fails
+over when one of them is down.
+"""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Literal, Self
+
+import httpx
+
+from ..exceptions import AuthenticationError, ConnectionError
+from ..protocol.json_codec import JSONCodec
+from ..types import AuthResponse
+from .http import DEFAULT_COMPRESSION_THRESHOLD, HTTPConnection
+
+# Errors raised before the request reached the server: safe to retry elsewhere.
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout)
+# Gateway answers meaning the node cannot serve requests right now.
+_UNAVAILABLE_STATUSES = (502, 503, 504)
+# Of those, the answers given before the request was forwarded: safe to retry
+# elsewhere.  A 502/504 may come after the node already ran the request.
+_NOT_FORWARDED_STATUSES = (503,)
+
+
+@dataclass
+class Endpoint:
+    """State of one node behind a :class:`MultiEndpointHTTPConnection`."""
+
+    url: str
+    client: httpx.AsyncClient | None = None
+    healthy: bool = True
+    latency: float | None = None  # EWMA of request latency, in seconds
+    in_flight: int = 0
+    requests: int = 0
+    failures: int = 0
+    last_error: str | None = None
+
+
+class MultiEndpointHTTPConnection(HTTPConnection):
+    """
+    HTTP connection spreading requests over several SurrealDB nodes.
+
+    Each RPC request goes to one healthy endpoint, picked round-robin or by
+    lowest latency.  An endpoint that cannot be reached, or answers 502/503/
+    504, is ejected.  The request is retried on another endpoint only when it
+    never reached the failed one: on connect errors and 503.  A background task probes every endpoint's
+    ``/health`` and ejects or re-admits it accordingly.
+
+    The nodes must share their storage (a cluster), so a token obtained from
+    one node is valid on all of them.  Non-RPC calls (``sql()``, ``rest_*``,
+    ``health()``) use the first healthy endpoint.
+
+    Usage:
+        conn = MultiEndpointHTTPConnection(
+            ["http://db1:8000", "http://db2:8000", "http://db3:8000"], "ns", "db",
+            strategy="least_latency",
+        )
+        await conn.connect()
+        await conn.signin("root", "root")
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        namespace: str,
+        database: str,
+        timeout: float = 30.0,
+        protocol: Literal["json", "cbor"] = "cbor",
+        json_codec: str | JSONCodec | None = None,
+        compression: Literal["gzip", "deflate"] | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        *,
+        strategy: Literal["round_robin", "least_latency"] = "round_robin",
+        health_interval: float = 5.0,
+        ewma_alpha: float = 0.3,
+    ):
+        """
+        Initialize the multi-endpoint connection.
+
+        Args:
+            urls: SurrealDB HTTP URLs of the cluster nodes
+            namespace: Target namespace
+            database: Target database
+            timeout: Request timeout in seconds
+            protocol: Serialization protocol ("json" or "cbor")
+            json_codec: JSON codec used when ``protocol="json"``
+            compression: Opt-in RPC body compression ("gzip" or "deflate")
+            compression_threshold: Minimum request body size (bytes) to compress
+            strategy: "round_robin" cycles over healthy endpoints;
+                      "least_latency" picks the lowest latency EWMA, weighted
+                      by the requests already in flight on each endpoint.
+            health_interval: Seconds between ``/health`` probes (0 disables them).
+            ewma_alpha: Weight of the newest latency sample in the EWMA (0-1].
+        """
+        if not urls:
+            raise ValueError("At least one endpoint URL is required")
+        if strategy not in ("round_robin", "least_latency"):
+            raise ValueError(f"Invalid strategy '{strategy}'. Must be 'round_robin' or 'least_latency'.")
+        if not 0 < ewma_alpha <= 1:
+            raise ValueError("ewma_alpha must be > 0 and <= 1")
+        if health_interval < 0:
+            raise ValueError("health_interval must be >= 0")
+
+        super().__init__(
+            urls[0],
+            namespace,
+            database,
+            timeout=timeout,
+            protocol=protocol,
+            json_codec=json_codec,
+            compression=compression,
+            compression_threshold=compression_threshold,
+        )
+        self.endpoints = [Endpoint(_http_url(url).rstrip("/")) for url in urls]
+        self.strategy = strategy
+        self.health_interval = health_interval
+        self.ewma_alpha = ewma_alpha
+        self._cursor = 0
+        self._health_task: asyncio.Task[None] | None = None
+
+    async def connect(self) -> Self:
+        """Create a client per endpoint and start health probing. Returns self for fluent API."""
+        if self._connected:
+            return self
+
+        for endpoint in self.endpoints:
+            endpoint.client = httpx.AsyncClient(
+                base_url=endpoint.url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=0, max_connections=100),
+            )
+        self._client = self.endpoints[0].client
+        self._connected = True
+        if self.health_interval:
+            self._health_task = asyncio.create_task(self._health_loop())
+        return self
+
+    async def close(self) -> None:
+        """Stop health probing and close every endpoint client."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        for endpoint in self.endpoints:
+            if endpoint.client is not None:
+                await endpoint.client.aclose()
+                endpoint.client = None
+        self._client = None
+        self._connected = False
+        self._authenticated = False
+
+    async def signin(
+        self,
+        user: str | None = None,
+        password: str | None = None,
+        namespace: str | None = None,
+        database: str | None = None,
+        access: str | None = None,
+        **credentials: Any,
+    ) -> AuthResponse:
+        """
+        Authenticate against the first reachable endpoint.
+
+        The token is then sent to every endpoint.  Unreachable endpoints are
+        ejected and the next one is tried.
+        """
+        error: AuthenticationError | None = None
+        for endpoint in self._candidates(set()):
+            self._client = endpoint.client
+            try:
+                return await super().signin(user, password, namespace, database, access, **credentials)
+            except AuthenticationError as e:
+                if not isinstance(e.__context__, httpx.RequestError):
+                    raise
+                self._eject(endpoint, e.__context__)
+                error = e
+        assert error is not None
+        raise error
+
+    async def check_health(self) -> None:
+        """Probe every endpoint's ``/health`` once, ejecting or re-admitting it."""
+        await asyncio.gather(*(self._probe(endpoint) for endpoint in self.endpoints))
+
+    def endpoint_stats(self) -> list[dict[str, Any]]:
+        """
+        Return per-endpoint statistics.
+
+        Returns:
+            One dict per endpoint with ``url``, ``healthy``, ``latency_ms``,
+            ``in_flight``, ``requests``, ``failures`` and ``last_error``.
+        """
+        return [
+            {
+                "url": e.url,
+                "healthy": e.healthy,
+                "latency_ms": e.latency * 1000 if e.latency is not None else None,
+                "in_flight": e.in_flight,
+                "requests": e.requests,
+                "failures": e.failures,
+                "last_error": e.last_error,
+            }
+            for e in self.endpoints
+        ]
+
+    async def _post_rpc(self, body: bytes, content_type: str) -> httpx.Response:
+        """POST the RPC body to a chosen endpoint, failing over to the others."""
+        if not self._connected:
+            raise ConnectionError("Not connected. Call connect() first.")
+
+        tried: set[str] = set()
+        error: Exception | None = None
+        while True:
+            endpoint = self._choose(tried)
+            if endpoint is None:
+                break
+            tried.add(endpoint.url)
+            assert endpoint.client is not None
+            endpoint.in_flight += 1
+            start = time.perf_counter()
+            try:
+                response = await self._post_rpc_to(endpoint.client, body, content_type)
+            except _NOT_SENT as e:
+                self._eject(endpoint, e)
+                error = e
+                continue
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in _UNAVAILABLE_STATUSES:
+                    raise
+                self._eject(endpoint, e)
+                if e.response.status_code not in _NOT_FORWARDED_STATUSES:
+                    raise
+                error = e
+                continue
+            except httpx.RequestError as e:
+                # The server may have run the request: do not retry it.
+                self._eject(endpoint, e)
+                raise
+            finally:
+                endpoint.in_flight -= 1
+            self._observe(endpoint, time.perf_counter() - start)
+            return response
+
+        if error is None:
+            raise ConnectionError("No endpoint available")
+        raise error
+
+    def _candidates(self, tried: set[str]) -> list[Endpoint]:
+        """Untried endpoints, healthy ones only unless every endpoint is ejected."""
+        untried = [e for e in self.endpoints if e.url not in tried]
+        return [e for e in untried if e.healthy] or untried
+
+    def _choose(self, tried: set[str]) -> Endpoint | None:
+        candidates = self._candidates(tried)
+        if not candidates:
+            return None
+        if self.strategy == "least_latency":
+            # Unmeasured endpoints (latency None) are tried first.
+            return min(candidates, key=lambda e: (e.latency or 0.0) * (e.in_flight + 1))
+        self._cursor += 1
+        return candidates[self._cursor % len(candidates)]
+
+    def _observe(self, endpoint: Endpoint, elapsed: float) -> None:
+        """Record a successful request (re-admitting the endpoint if it was ejected)."""
+        endpoint.requests += 1
+        if endpoint.latency is None:
+            endpoint.latency = elapsed
+        else:
+            endpoint.latency = self.ewma_alpha * elapsed + (1 - self.ewma_alpha) * endpoint.latency
+        if not endpoint.healthy:
+            self._admit(endpoint)
+
+    def _eject(self, endpoint: Endpoint, error: BaseException) -> None:
+        endpoint.failures += 1
+        endpoint.last_error = f"{type(error).__name__}: {error}"
+        endpoint.healthy = False
+        endpoint.latency = None  # measured afresh once re-admitted
+        if self._client is endpoint.client:
+            healthy = [e for e in self.endpoints if e.healthy]
+            if healthy:
+                self._client = healthy[0].client
+
+    def _admit(self, endpoint: Endpoint) -> None:
+        endpoint.healthy = True
+        if not any(e.healthy and e.client is self._client for e in self.endpoints):
+            self._client = endpoint.client
+
+    async def _probe(self, endpoint: Endpoint) -> None:
+        if endpoint.client is None:
+            return
+        try:
+            response = await endpoint.client.get("/health")
+        except httpx.HTTPError as e:
+            if endpoint.healthy:
+                self._eject(endpoint, e)
+            return
+        if response.status_code == 200:
+            if not endpoint.healthy:
+                self._admit(endpoint)
+        elif endpoint.healthy:
+            self._eject(endpoint, ConnectionError(f"Health check returned {response.status_code}"))
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await self.check_health()
+
+
+def _http_url(url: str) -> str:
+    """Normalize a WebSocket URL to HTTP, like ``HTTPConnection`` does."""
+    if url.startswith("ws://"):
+        return url.replace("ws://", "http://", 1)
+    if url.startswith("wss://"):
+        return url.replace("wss://", "https://", 1)
+    return url
@@ -6,7 +6,7 @@ Provides connection pooling for both HTTP and WebSocket connections.
 
 import asyncio
 from collections import deque
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Mapping
 from contextlib import asynccontextmanager
 from typing import Any, Self
 
@@ -14,6 +14,8 @@ from ..exceptions import ConnectionError
 from ..types import DeleteResponse, QueryResponse, RecordResponse, RecordsResponse
 from .base import BaseSurrealConnection
 from .http import HTTPConnection
+from .lanes import FairQueue, current_priority
+from .limiter import AdaptiveLimiter
 from .websocket import WebSocketConnection
 
 
@@ -22,7 +24,9 @@ class ConnectionPool:
     Connection pool for SurrealDB connections.
 
     Manages a pool of reusable connections for improved performance
-    in high-throughput scenarios.
+    in high-throughput scenarios.  When callers wait for a connection, the
+    priority lanes (see ``query_priority()``) share the connections by
+    weighted fair queueing.
     """
 
     def __init__(
@@ -33,6 +37,9 @@ class ConnectionPool:
         size: int = 10,
         connection_type: str = "http",
         timeout: float = 30.0,
+        limiter: AdaptiveLimiter | None = None,
+        lane_weights: Mapping[str, float] | None = None,
+        lane_limits: Mapping[str, int] | None = None,
         **kwargs: Any,
     ):
         """
@@ -45,6 +52,10 @@ class ConnectionPool:
             size: Maximum pool size
             connection_type: "http" or "websocket"
             timeout: Connection timeout in seconds
+            limiter: Adaptive concurrency limit shared by all pool connections
+            lane_weights: Share of the connections each priority lane gets
+                          when callers wait (see ``query_priority()``)
+            lane_limits: Maximum connections held per priority lane
             **kwargs: Additional connection arguments
         """
         if size <= 0:
@@ -56,12 +67,13 @@ class ConnectionPool:
         self.size = size
         self.connection_type = connection_type
         self.timeout = timeout
+        self.limiter = limiter
         self.kwargs = kwargs
 
         self._pool: deque[BaseSurrealConnection] = deque()
         self._in_use: set[BaseSurrealConnection] = set()
         self._lock = asyncio.Lock()
-        self._semaphore = asyncio.Semaphore(size)
+        self._slots = FairQueue(size, lane_weights=lane_weights, lane_limits=lane_limits)
         self._closed = False
         self._credentials: tuple[str, str] | None = None
 
@@ -75,8 +87,9 @@ class ConnectionPool:
 
     def _create_connection(self) -> BaseSurrealConnection:
         """Create a new connection instance."""
+        conn: BaseSurrealConnection
         if self.connection_type == "websocket":
-            return WebSocketConnection(
+            conn = WebSocketConnection(
                 self.url,
                 self.namespace,
                 self.database,
@@ -84,12 +97,14 @@ class ConnectionPool:
                 **self.kwargs,
             )
         else:
-            return HTTPConnection(
+            conn = HTTPConnection(
                 self.url,
                 self.namespace,
                 self.database,
                 timeout=self.timeout,
             )
+        conn.limiter = self.limiter
+        return conn
 
     async def _init_connection(self, conn: BaseSurrealConnection) -> None:
         """Initialize a connection."""
@@ -133,7 +148,8 @@ class ConnectionPool:
 
         conn: BaseSurrealConnection | None = None
 
-        await self._semaphore.acquire()
+        lane = current_priority()
+        await self._slots.acquire(lane=lane)
         try:
             async with self._lock:
                 # Try to get an existing connection from pool
@@ -154,12 +170,12 @@ class ConnectionPool:
                         conn = self._create_connection()
                         await self._init_connection(conn)
                     else:
-                        # Should not happen with semaphore, but just in case
+                        # Should not happen with the slot queue, but just in case
                         raise RuntimeError("No connection available")
 
                 self._in_use.add(conn)
         except BaseException:
-            self._semaphore.release()
+            self._slots.release(lane=lane)
             raise
 
         try:
@@ -174,7 +190,7 @@ class ConnectionPool:
                         await conn.close()
                     except Exception:
                         pass
-            self._semaphore.release()
+            self._slots.release(lane=lane)
 
     async def close(self) -> None:
         """Close all connections in the pool."""
@@ -207,6 +223,15 @@ class ConnectionPool:
         """Number of connections currently in use."""
         return len(self._in_use)
 
+    @property
+    def waiting(self) -> int:
+        """Number of callers waiting for a connection."""
+        return self._slots.queued
+
+    def lane_stats(self) -> dict[str, dict[str, int]]:
+        """Connections held (``in_flight``) and callers waiting (``queued``) per priority lane."""
+        return self._slots.lane_stats()
+
     @property
     def total(self) -> int:
         """Total number of connections (available + in use)."""
@@ -5,11 +5,10 @@ Provides stateful WebSocket-based connection for real-time features.
 """
 
 import asyncio
-import json
 import random
 import re
 from collections.abc import Callable, Coroutine
-from typing import TYPE_CHECKING, Any, Self
+from typing import TYPE_CHECKING, Any, Literal, Self, overload
 
 import aiohttp
 from aiohttp import ClientWSTimeout
@@ -18,15 +17,25 @@ from .base import BaseSurrealConnection
 
 if TYPE_CHECKING:
     from ..streaming.live_select import LiveSelectStream, LiveSubscriptionParams
-    from ..transaction import WebSocketTransaction
+    from ..transaction import PipelinedWebSocketTransaction, WebSocketTransaction
 import builtins
 
 from ..exceptions import ConnectionError, LiveQueryError, TimeoutError
 from ..protocol import cbor as cbor_module
+from ..protocol.json_codec import JSONCodec, get_json_codec
 from ..protocol.rpc import RPCRequest, RPCResponse
 
 _SAFE_TABLE_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+# zlib window size requested for permessage-deflate (aiohttp's ``compress``).
+_WS_DEFLATE_WBITS = 15
+
+
+def _utf8_len(text: str) -> int:
+    """Return the UTF-8 size of ``text``, without encoding it when it is ASCII (a constant-time check)."""
+    return len(text) if text.isascii() else len(text.encode())
+
+
 # Type alias for live query callbacks
 LiveCallback = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
 
@@ -50,6 +59,8 @@ class WebSocketConnection(BaseSurrealConnection):
         reconnect_interval: float = 1.0,
         max_reconnect_attempts: int = 5,
         protocol: str = "cbor",
+        json_codec: str | JSONCodec | None = None,
+        compression: bool = False,
     ):
         """
         Initialize WebSocket connection.
@@ -67,6 +78,12 @@ class WebSocketConnection(BaseSurrealConnection):
                 handles binary data and avoids string interpretation issues
                 (e.g., 'data:xxx' values being interpreted as record links).
                 Use "json" only for debugging or compatibility reasons.
+            json_codec: JSON codec used when ``protocol="json"`` ("stdlib",
+                "orjson", "msgspec", "auto" or a ``JSONCodec``).
+                Defaults to the stdlib encoder.
+            compression: Negotiate permessage-deflate (RFC 7692) with the server.
+                Once negotiated every message is compressed; small-message
+                thresholds are not configurable at the WebSocket layer.
         """
         # Normalize URL to WebSocket
         if url.startswith("http://"):
@@ -84,6 +101,8 @@ class WebSocketConnection(BaseSurrealConnection):
         if protocol not in ("json", "cbor"):
             raise ValueError(f"Invalid protocol '{protocol}'. Must be 'json' or 'cbor'.")
         self.protocol = protocol
+        self.json_codec: JSONCodec = get_json_codec(json_codec)
+        self.compression = compression
 
         self.auto_reconnect = auto_reconnect
         self.reconnect_interval = reconnect_interval
@@ -120,6 +139,7 @@ class WebSocketConnection(BaseSurrealConnection):
                 self.url,
                 timeout=ClientWSTimeout(ws_close=self.timeout),
                 protocols=[self.protocol],  # Use configured protocol (json or cbor)
+                compress=_WS_DEFLATE_WBITS if self.compression else 0,
             )
             self._connected = True
 
@@ -195,9 +215,11 @@ class WebSocketConnection(BaseSurrealConnection):
         try:
             async for msg in self._ws:
                 if msg.type == aiohttp.WSMsgType.TEXT:
+                    self.transfer_stats.record_received(_utf8_len(msg.data))
                     await self._handle_message_json(msg.data)
                 elif msg.type == aiohttp.WSMsgType.BINARY:
                     # CBOR protocol uses binary messages
+                    self.transfer_stats.record_received(len(msg.data))
                     await self._handle_message_cbor(msg.data)
                 elif (
                     msg.type == aiohttp.WSMsgType.ERROR
@@ -217,8 +239,11 @@ class WebSocketConnection(BaseSurrealConnection):
     async def _handle_message_json(self, data: str) -> None:
         """Handle incoming JSON WebSocket message."""
         try:
-            message = json.loads(data)
-        except json.JSONDecodeError:
+            message = self.json_codec.loads(data)
+        except ValueError:
+            # Malformed frame (every codec's decode error is a ValueError).
+            return
+        if not isinstance(message, dict):
             return
 
         await self._process_message(message)
@@ -295,6 +320,7 @@ class WebSocketConnection(BaseSurrealConnection):
                     self.url,
                     timeout=ClientWSTimeout(ws_close=self.timeout),
                     protocols=[self.protocol],  # Use configured protocol
+                    compress=_WS_DEFLATE_WBITS if self.compression else 0,
                 )
                 self._connected = True
                 self._reader_task = asyncio.create_task(self._read_loop())
@@ -414,9 +440,18 @@ class WebSocketConnection(BaseSurrealConnection):
         try:
             # Send request using configured protocol
             if self.protocol == "cbor":
-                await self._ws.send_bytes(request.to_cbor())
+                data = request.to_cbor()
+                self.transfer_stats.record_sent(len(data))
+                await self._ws.send_bytes(data)
             else:
-                await self._ws.send_str(request.to_json())
+                payload = request.encode_json(self.json_codec)
+                if isinstance(payload, bytes):
+                    # Fast codecs already produce UTF-8: send it as a text frame as is.
+                    self.transfer_stats.record_sent(len(payload))
+                    await self._ws.send_frame(payload, aiohttp.WSMsgType.TEXT)
+                else:
+                    self.transfer_stats.record_sent(_utf8_len(payload))
+                    await self._ws.send_str(payload)
 
             # Wait for response with timeout
             response = await asyncio.wait_for(future, timeout=self.timeout)
@@ -425,6 +460,10 @@ class WebSocketConnection(BaseSurrealConnection):
         except builtins.TimeoutError:
             self._pending.pop(request.id, None)
             raise TimeoutError(f"Request timed out after {self.timeout}s")
+        except asyncio.CancelledError:
+            # The caller gave up: drop the pending slot so the late response is discarded.
+            self._pending.pop(request.id, None)
+            raise
         except Exception as e:
             self._pending.pop(request.id, None)
             raise ConnectionError(f"Request failed: {e}")
@@ -528,13 +567,22 @@ class WebSocketConnection(BaseSurrealConnection):
 
     # Transaction support
 
-    def transaction(self) -> "WebSocketTransaction":
+    @overload
+    def transaction(self, pipelined: Literal[False] = False) -> "WebSocketTransaction": ...
+
+    @overload
+    def transaction(self, pipelined: Literal[True]) -> "PipelinedWebSocketTransaction": ...
+
+    def transaction(self, pipelined: bool = False) -> "WebSocketTransaction | PipelinedWebSocketTransaction":
         """
         Create a new WebSocket transaction.
 
         WebSocket transactions use server-side state with BEGIN/COMMIT/ROLLBACK.
         Operations are executed immediately within the transaction context.
 
+        With ``pipelined=True`` statements are buffered instead and sent as a
+        single BEGIN/COMMIT query on commit (one round-trip, results deferred).
+
         Usage:
             async with conn.transaction() as tx:
                 await tx.create("users", {"name": "Alice"})
@@ -544,8 +592,10 @@ class WebSocketConnection(BaseSurrealConnection):
         Returns:
             WebSocketTransaction context manager
         """
-        from ..transaction import WebSocketTransaction
+        from ..transaction import PipelinedWebSocketTransaction, WebSocketTransaction
 
+        if pipelined:
+            return PipelinedWebSocketTransaction(self)
         return WebSocketTransaction(self)
 
     # Live Select Stream API
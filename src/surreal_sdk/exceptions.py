@@ -67,6 +67,36 @@ class TimeoutError(SurrealDBError):
     pass
 
 
+class QueryTimeoutError(TimeoutError):
+    """Raised when a query exceeds its ``TIMEOUT`` clause or deadline.
+
+    SurrealDB stops executing a statement once its ``TIMEOUT`` elapses and
+    reports an error for it instead of results::
+
+        try:
+            rows = await User.objects().timeout(2).exec()
+        except QueryTimeoutError:
+            ...
+    """
+
+    _PATTERNS = [
+        "exceeded the timeout",
+        "query timed out",
+    ]
+
+    @staticmethod
+    def is_query_timeout(message: str) -> bool:
+        """Check if an error message indicates a query timeout."""
+        msg = message.lower()
+        return any(p in msg for p in QueryTimeoutError._PATTERNS)
+
+
+class OverloadedError(SurrealDBError):
+    """Raised when a request is shed by a concurrency limiter instead of being sent."""
+
+    pass
+
+
 class ValidationError(SurrealDBError):
     """Raised when data validation fails."""
 
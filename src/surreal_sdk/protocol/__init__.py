@@ -20,6 +20,16 @@ from .cbor import (
 from .cbor import (
     is_available as cbor_is_available,
 )
+from .json_codec import (
+    MSGSPEC_AVAILABLE,
+    ORJSON_AVAILABLE,
+    JSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    available_json_codecs,
+    get_json_codec,
+)
 from .rpc import RPCError, RPCRequest, RPCResponse
 
 __all__ = [
@@ -27,6 +37,15 @@ __all__ = [
     "RPCRequest",
     "RPCResponse",
     "RPCError",
+    # JSON codecs
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "ORJSON_AVAILABLE",
+    "MSGSPEC_AVAILABLE",
+    "available_json_codecs",
+    "get_json_codec",
     # CBOR
     "CBOR_AVAILABLE",
     "RecordId",
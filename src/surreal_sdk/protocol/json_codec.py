@@ -0,0 +1,207 @@
+"""
+Pluggable JSON codecs for the SurrealDB JSON protocol.
+
+CBOR is the recommended wire format, but some deployments must speak JSON
+for interoperability. The JSON path used to be hard-wired to the standard
+library encoder, which is the slowest part of the JSON transport. This module
+defines a small codec interface so a faster backend can be selected per
+connection:
+
+- ``"stdlib"``: :mod:`json` with :class:`SurrealJSONEncoder` (always available)
+- ``"orjson"``: `orjson <https://github.com/ijl/orjson>`_ (optional)
+- ``"msgspec"``: `msgspec <https://jcristharif.com/msgspec/>`_ (optional)
+- ``"auto"``: the fastest installed backend, falling back to ``"stdlib"``
+
+All codecs produce equivalent JSON for SurrealDB types: datetime/date/time as
+ISO 8601 strings (UTC may be rendered as ``Z`` or ``+00:00``), UUID as string,
+Decimal as number, and ``None`` values inside dicts omitted (JSON ``null`` maps
+to SurrealDB ``NULL``, which ``option<T>`` fields on SCHEMAFULL tables reject).
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from typing import Any
+
+from .rpc import SurrealJSONEncoder, _strip_none_values
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    MSGSPEC_AVAILABLE = False
+
+
+class JSONCodec(ABC):
+    """
+    Interface for JSON encoders/decoders used by the JSON protocol.
+
+    ``dumps`` may return either ``str`` or ``bytes``; callers that need text
+    (e.g. WebSocket text frames) decode bytes as UTF-8.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, obj: Any, *, strip_none: bool = False) -> str | bytes:
+        """
+        Serialize ``obj`` to JSON.
+
+        Args:
+            obj: Value to serialize
+            strip_none: Omit dict keys whose value is ``None``
+        """
+        ...
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """
+        Deserialize JSON text or bytes.
+
+        Raises:
+            ValueError: If ``data`` is not valid JSON (the backends' decode
+                errors all subclass it).
+        """
+        ...
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """JSON codec backed by the standard library :mod:`json` module."""
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any, *, strip_none: bool = False) -> str:
+        if strip_none:
+            obj = _strip_none_values(obj)
+        return json.dumps(obj, cls=SurrealJSONEncoder)
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+
+def _decimal_default(obj: Any) -> Any:
+    """Fallback hook for types the fast backends do not encode natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec backed by orjson.
+
+    datetime, date, time and UUID are encoded natively; Decimal goes through
+    a ``default`` hook. Non-string dict keys are accepted like the stdlib codec.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not ORJSON_AVAILABLE:
+            raise ImportError("orjson is not installed. Install it with: pip install orjson")
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, *, strip_none: bool = False) -> bytes:
+        if strip_none:
+            obj = _strip_none_values(obj)
+        return orjson.dumps(obj, default=_decimal_default, option=self._option)
+
+    def loads(self, data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    JSON codec backed by msgspec.
+
+    datetime, date, time and UUID are encoded natively; Decimal is encoded as
+    a JSON number to match the stdlib codec.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec is not installed. Install it with: pip install msgspec")
+        self._encoder = msgspec.json.Encoder(enc_hook=_decimal_default, decimal_format="number")
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any, *, strip_none: bool = False) -> bytes:
+        if strip_none:
+            obj = _strip_none_values(obj)
+        return self._encoder.encode(obj)
+
+    def loads(self, data: str | bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    "stdlib": StdlibJSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+_instances: dict[str, JSONCodec] = {}
+
+
+def available_json_codecs() -> list[str]:
+    """Return the names of the JSON codecs usable in this environment."""
+    names = ["stdlib"]
+    if ORJSON_AVAILABLE:
+        names.append("orjson")
+    if MSGSPEC_AVAILABLE:
+        names.append("msgspec")
+    return names
+
+
+def get_json_codec(codec: str | JSONCodec | None = None) -> JSONCodec:
+    """
+    Resolve a codec name (or instance) to a :class:`JSONCodec`.
+
+    Args:
+        codec: ``"stdlib"``, ``"orjson"``, ``"msgspec"``, ``"auto"``, a
+            ``JSONCodec`` instance, or ``None`` for the stdlib codec.
+
+    Returns:
+        A shared codec instance (codecs are stateless and thread-safe).
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the requested backend is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    name = codec or "stdlib"
+    if name == "auto":
+        name = "orjson" if ORJSON_AVAILABLE else "msgspec" if MSGSPEC_AVAILABLE else "stdlib"
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}'. Must be one of: auto, {', '.join(_CODECS)}.")
+    instance = _instances.get(name)
+    if instance is None:
+        instance = _instances[name] = _CODECS[name]()
+    return instance
+
+
+__all__ = [
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "ORJSON_AVAILABLE",
+    "MSGSPEC_AVAILABLE",
+    "available_json_codecs",
+    "get_json_codec",
+]
@@ -9,11 +9,15 @@ import json
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from decimal import Decimal
-from typing import Any
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from . import cbor as cbor_module
 
+if TYPE_CHECKING:
+    from .json_codec import JSONCodec
+
 
 def _strip_none_values(data: Any) -> Any:
     """
@@ -23,16 +27,32 @@ def _strip_none_values(data: Any) -> Any:
     SurrealDB's ``option<T>`` on SCHEMAFULL tables rejects ``NULL`` — it expects
     ``NONE`` (absent field).  Since JSON has no ``NONE`` concept, the safest
     approach is to omit keys whose value is ``None``.
+
+    Containers with nothing to strip are returned as-is and scalars are not
+    visited, so the common case walks the payload without copying it.
     """
     if isinstance(data, dict):
-        return {k: _strip_none_values(v) for k, v in data.items() if v is not None}
-    if isinstance(data, list):
-        return [_strip_none_values(item) for item in data]
-    if isinstance(data, tuple):
-        return tuple(_strip_none_values(item) for item in data)
+        copy: dict[Any, Any] | None = None
+        for index, (key, value) in enumerate(data.items()):
+            new = _strip_none_values(value) if isinstance(value, _CONTAINERS) else value
+            if copy is None:
+                if new is value and value is not None:
+                    continue
+                copy = dict(islice(data.items(), index))
+            if new is not None:
+                copy[key] = new
+        return data if copy is None else copy
+    if isinstance(data, (list, tuple)):
+        items = [_strip_none_values(item) if isinstance(item, _CONTAINERS) else item for item in data]
+        if all(new is old for new, old in zip(items, data, strict=True)):
+            return data
+        return items if isinstance(data, list) else tuple(items)
     return data
 
 
+_CONTAINERS = (dict, list, tuple)
+
+
 class SurrealJSONEncoder(json.JSONEncoder):
     """
     Custom JSON encoder for SurrealDB types.
@@ -83,16 +103,31 @@ class RPCRequest:
             "params": self.params if isinstance(self.params, list) else [self.params],
         }
 
-    def to_json(self) -> str:
+    def to_json(self, codec: "JSONCodec | None" = None) -> str:
         """Serialize to JSON string with custom encoder for datetime, UUID, etc.
 
         None values inside params are stripped (omitted) because JSON ``null``
         maps to SurrealDB ``NULL``, which is rejected by ``option<T>`` on
         SCHEMAFULL tables.  Omitting the key produces ``NONE`` (absent).
+
+        Args:
+            codec: JSON codec to use (defaults to the stdlib encoder)
+        """
+        encoded = self.encode_json(codec)
+        return encoded if isinstance(encoded, str) else encoded.decode()
+
+    def encode_json(self, codec: "JSONCodec | None" = None) -> str | bytes:
+        """
+        Serialize to JSON using ``codec``, returning its native output type.
+
+        Fast codecs produce ``bytes`` directly, which transports that accept
+        binary bodies (HTTP) can send without an extra decode step.
         """
-        data = self.to_dict()
-        data["params"] = _strip_none_values(data["params"])
-        return json.dumps(data, cls=SurrealJSONEncoder)
+        if codec is None:
+            data = self.to_dict()
+            data["params"] = _strip_none_values(data["params"])
+            return json.dumps(data, cls=SurrealJSONEncoder)
+        return codec.dumps(self.to_dict(), strip_none=True)
 
     def to_cbor(self) -> bytes:
         """
@@ -241,9 +276,9 @@ class RPCResponse:
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> "RPCResponse":
-        """Parse from JSON string."""
-        data = json.loads(json_str)
+    def from_json(cls, json_str: str | bytes, codec: "JSONCodec | None" = None) -> "RPCResponse":
+        """Parse from JSON string or bytes, optionally with a specific codec."""
+        data = codec.loads(json_str) if codec is not None else json.loads(json_str)
         return cls.from_dict(data)
 
     @classmethod
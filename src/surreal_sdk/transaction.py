@@ -13,6 +13,24 @@ from .exceptions import TransactionError
 
 _SAFE_THING_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*(:[a-zA-Z0-9_`]+)?$")
 
+# Tokenizer for variable namespacing: string literals are matched (and left
+# untouched) so ``'$name'`` inside a string is not rewritten; group 1 captures
+# the name of a ``$variable`` reference. Matching the whole identifier keeps
+# ``$_sv_a`` from clobbering ``$_sv_ab``.
+_TX_TOKEN_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def namespace_variables(sql: str, names: dict[str, Any], prefix: str) -> str:
+    """Prefix every ``$name`` reference in ``sql`` whose name is in ``names``, in one pass."""
+
+    def _rewrite(match: re.Match[str]) -> str:
+        name = match.group(1)
+        if name is None or name not in names:
+            return match.group(0)
+        return f"${prefix}{name}"
+
+    return _TX_TOKEN_RE.sub(_rewrite, sql)
+
 
 def _validate_thing(thing: str, context: str = "thing") -> None:
     """Validate a table or thing reference."""
@@ -176,31 +194,30 @@ class BaseTransaction(ABC):
         ...
 
 
-class HTTPTransaction(BaseTransaction):
+class BufferedTransaction(BaseTransaction):
     """
-    HTTP-based transaction that batches statements.
-
-    Since HTTP is stateless, all statements are collected and
-    executed as a single atomic query on commit.
+    Transaction that batches statements and sends them on commit.
 
-    The statements are wrapped in BEGIN TRANSACTION / COMMIT TRANSACTION
-    and sent as a single request.
+    Statements are collected client-side and executed as a single atomic
+    query on commit, wrapped in BEGIN TRANSACTION / COMMIT TRANSACTION.
+    Each operation returns an empty placeholder response; the real
+    per-statement results are returned by :meth:`commit`.
     """
 
     @property
     def defers_results(self) -> bool:
-        """HTTP transactions buffer statements; results are known only at commit."""
+        """Buffered transactions queue statements; results are known only at commit."""
         return True
 
     async def _begin(self) -> None:
-        """Mark transaction as active (no server call needed for HTTP)."""
+        """Mark transaction as active (no server call needed until commit)."""
         if self._active:
             raise TransactionError("Transaction already active")
         self._active = True
         self._statements = []
 
     async def commit(self) -> "QueryResponse":
-        """Execute all queued statements atomically."""
+        """Execute all queued statements atomically in one request."""
         from .types import QueryResponse
 
         if not self.is_active:
@@ -212,31 +229,32 @@ class HTTPTransaction(BaseTransaction):
             self._active = False
             return QueryResponse(results=[], raw=[])
 
-        # Build batched query with BEGIN/COMMIT wrapper
-        sql_parts = ["BEGIN TRANSACTION;"]
-        all_vars: dict[str, Any] = {}
-
-        for i, stmt in enumerate(self._statements):
-            # Work on a copy to avoid mutating the original statement
-            namespaced_sql = stmt.sql
-            # Namespace variables to avoid conflicts between statements
-            for key, val in stmt.vars.items():
-                namespaced_key = f"tx_{i}_{key}"
-                all_vars[namespaced_key] = val
-                namespaced_sql = namespaced_sql.replace(f"${key}", f"${namespaced_key}")
-            sql_parts.append(namespaced_sql)
-
-        sql_parts.append("COMMIT TRANSACTION;")
-        full_sql = "\n".join(sql_parts)
-
+        full_sql, all_vars = self._assemble(self._statements, 0)
         try:
             result = await self._connection.query(full_sql, all_vars)
-            self._committed = True
-            self._active = False
-            return result
         except Exception as e:
             self._active = False
             raise TransactionError(f"Transaction commit failed: {e}")
+        self._committed = True
+        self._active = False
+        return result
+
+    @staticmethod
+    def _assemble(statements: list[TransactionStatement], offset: int) -> tuple[str, dict[str, Any]]:
+        """Build one BEGIN/COMMIT request, namespacing each statement's variables."""
+        sql_parts = ["BEGIN TRANSACTION;"]
+        all_vars: dict[str, Any] = {}
+        for i, stmt in enumerate(statements, start=offset):
+            if not stmt.vars:
+                sql_parts.append(stmt.sql)
+                continue
+            # Namespace variables to avoid conflicts between statements
+            prefix = f"tx_{i}_"
+            for key, val in stmt.vars.items():
+                all_vars[prefix + key] = val
+            sql_parts.append(namespace_variables(stmt.sql, stmt.vars, prefix))
+        sql_parts.append("COMMIT TRANSACTION;")
+        return "\n".join(sql_parts), all_vars
 
     async def rollback(self) -> None:
         """Discard queued statements (no server call needed for HTTP)."""
@@ -351,6 +369,69 @@ class HTTPTransaction(BaseTransaction):
         return RecordResponse(record=None, raw=None)
 
 
+class HTTPTransaction(BufferedTransaction):
+    """
+    HTTP-based transaction that batches statements.
+
+    Since HTTP is stateless, all statements are collected and
+    executed as a single atomic query on commit.
+
+    The statements are wrapped in BEGIN TRANSACTION / COMMIT TRANSACTION
+    and sent as a single request.
+
+    Very large transactions can be split with ``max_statements``: each chunk
+    is sent as its own BEGIN/COMMIT request, in order, and commit stops at the
+    first failing chunk. Atomicity then holds per chunk only, so chunking is
+    opt-in.
+    """
+
+    def __init__(self, connection: "BaseSurrealConnection", max_statements: int | None = None):
+        if max_statements is not None and max_statements < 1:
+            raise ValueError("max_statements must be >= 1")
+        super().__init__(connection)
+        self.max_statements = max_statements
+
+    async def commit(self) -> "QueryResponse":
+        """Execute all queued statements atomically, chunked by ``max_statements``."""
+        from .types import QueryResponse
+
+        statements = self._statements
+        if not self.max_statements or len(statements) <= self.max_statements:
+            return await super().commit()
+        if not self.is_active:
+            raise TransactionError("Transaction not active")
+
+        size = self.max_statements
+        chunks = [statements[start : start + size] for start in range(0, len(statements), size)]
+
+        results: list[Any] = []
+        raw: list[Any] = []
+        offset = 0
+        for n, chunk in enumerate(chunks):
+            full_sql, all_vars = self._assemble(chunk, offset)
+            offset += len(chunk)
+            try:
+                result = await self._connection.query(full_sql, all_vars)
+            except Exception as e:
+                self._active = False
+                raise TransactionError(f"Transaction commit failed: {e}{self._chunk_note(n, len(chunks))}")
+            if not result.is_ok:
+                self._active = False
+                errors = "; ".join(str(r.result) for r in result.results if not r.is_ok)
+                raise TransactionError(f"Transaction commit failed: {errors}{self._chunk_note(n, len(chunks))}")
+            results.extend(result.results)
+            raw.extend(result.raw)
+
+        self._committed = True
+        self._active = False
+        return QueryResponse(results=results, raw=raw)
+
+    @staticmethod
+    def _chunk_note(failed: int, total: int) -> str:
+        """Describe partial progress when a chunked commit fails."""
+        return f" (chunk {failed + 1} of {total}; {failed} earlier chunk(s) already committed)"
+
+
 class WebSocketTransaction(BaseTransaction):
     """
     WebSocket-based transaction with server-side state.
@@ -448,3 +529,16 @@ class WebSocketTransaction(BaseTransaction):
         if not self.is_active:
             raise TransactionError("Transaction not active")
         return await self._connection.relate(from_thing, relation, to_thing, data)
+
+
+class PipelinedWebSocketTransaction(BufferedTransaction):
+    """
+    WebSocket transaction that buffers statements and sends them in one frame.
+
+    The immediate :class:`WebSocketTransaction` costs one round-trip per
+    statement (plus BEGIN and COMMIT) while holding server-side transaction
+    state open. This variant queues statements client-side like
+    :class:`HTTPTransaction` and sends a single BEGIN/COMMIT query on commit,
+    so an N-statement transaction costs one round-trip. Per-statement results
+    are deferred until :meth:`commit`.
+    """
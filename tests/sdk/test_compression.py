@@ -0,0 +1,124 @@
+"""Tests for transport compression and per-connection byte counters."""
+
+import gzip
+import zlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from src.surreal_sdk.connection.base import TransferStats
+from src.surreal_sdk.connection.http import HTTPConnection
+from src.surreal_sdk.connection.websocket import WebSocketConnection
+from src.surreal_sdk.exceptions import ConnectionError
+from src.surreal_sdk.protocol import cbor as cbor_module
+from src.surreal_sdk.protocol.rpc import RPCRequest
+
+
+def _mock_client(response_payload: bytes, downloaded: int) -> MagicMock:
+    """Build an httpx.AsyncClient stand-in returning a fixed response."""
+    response = MagicMock()
+    response.content = response_payload
+    response.num_bytes_downloaded = downloaded
+    client = MagicMock()
+    client.post = AsyncMock(return_value=response)
+    return client
+
+
+class TestTransferStats:
+    """Tests for the TransferStats counters."""
+
+    def test_record_without_compression(self) -> None:
+        stats = TransferStats()
+        stats.record(sent=100, received=50)
+        assert stats.requests == 1
+        assert (stats.bytes_sent, stats.wire_bytes_sent) == (100, 100)
+        assert (stats.bytes_received, stats.wire_bytes_received) == (50, 50)
+        assert stats.compression_ratio == 1.0
+
+    def test_compression_ratio(self) -> None:
+        stats = TransferStats()
+        stats.record(sent=1000, received=1000, wire_sent=200, wire_received=300)
+        assert stats.compression_ratio == pytest.approx(0.25)
+
+    def test_reset(self) -> None:
+        stats = TransferStats()
+        stats.record_sent(10)
+        stats.record_received(20)
+        stats.reset()
+        assert stats == TransferStats()
+
+
+class TestHTTPCompression:
+    """Tests for opt-in HTTP request/response compression."""
+
+    def test_disabled_by_default(self) -> None:
+        conn = HTTPConnection("http://localhost:8000", "ns", "db")
+        assert conn.compression is None
+
+    def test_invalid_compression_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Invalid compression"):
+            HTTPConnection("http://localhost:8000", "ns", "db", compression="br")  # type: ignore[arg-type]
+
+    def test_negative_threshold_rejected(self) -> None:
+        with pytest.raises(ValueError, match="compression_threshold"):
+            HTTPConnection("http://localhost:8000", "ns", "db", compression="gzip", compression_threshold=-1)
+
+    @pytest.mark.parametrize(
+        "encoding, decompress",
+        [("gzip", gzip.decompress), ("deflate", zlib.decompress)],
+    )
+    async def test_large_body_is_compressed(self, encoding: str, decompress: object) -> None:
+        conn = HTTPConnection("http://localhost:8000", "ns", "db", compression=encoding, compression_threshold=64)  # type: ignore[arg-type]
+        payload = cbor_module.encode({"id": 1, "result": []})
+        conn._client = _mock_client(payload, downloaded=len(payload))
+
+        request = RPCRequest.query("CREATE doc SET body = $b", {"b": "x" * 4096})
+        await conn._send_rpc(request)
+
+        kwargs = conn._client.post.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == encoding
+        assert kwargs["headers"]["Accept-Encoding"] == "gzip, deflate"
+        assert decompress(kwargs["content"]) == request.to_cbor()  # type: ignore[operator]
+        assert conn.transfer_stats.wire_bytes_sent < conn.transfer_stats.bytes_sent
+
+    async def test_small_body_is_not_compressed(self) -> None:
+        conn = HTTPConnection("http://localhost:8000", "ns", "db", compression="gzip")
+        payload = cbor_module.encode({"id": 1, "result": "pong"})
+        conn._client = _mock_client(payload, downloaded=len(payload))
+
+        await conn._send_rpc(RPCRequest(method="ping"))
+
+        headers = conn._client.post.call_args.kwargs["headers"]
+        assert "Content-Encoding" not in headers
+        assert headers["Accept-Encoding"] == "gzip, deflate"
+
+    async def test_counts_compressed_response_bytes(self) -> None:
+        conn = HTTPConnection("http://localhost:8000", "ns", "db")
+        payload = cbor_module.encode({"id": 1, "result": ["row"] * 100})
+        conn._client = _mock_client(payload, downloaded=40)
+
+        await conn._send_rpc(RPCRequest(method="ping"))
+
+        stats = conn.transfer_stats
+        assert stats.requests == 1
+        assert stats.bytes_received == len(payload)
+        assert stats.wire_bytes_received == 40
+        assert "Content-Encoding" not in conn._client.post.call_args.kwargs["headers"]
+
+
+class TestWebSocketCompression:
+    """Tests for permessage-deflate negotiation."""
+
+    @pytest.mark.parametrize("enabled, expected", [(False, 0), (True, 15)])
+    async def test_connect_negotiates_deflate(self, enabled: bool, expected: int) -> None:
+        conn = WebSocketConnection("ws://localhost:8000", "ns", "db", compression=enabled, auto_reconnect=False)
+        session = MagicMock()
+        session.ws_connect = AsyncMock(side_effect=aiohttp.ClientError("stop"))
+        session.close = AsyncMock()
+
+        with patch("src.surreal_sdk.connection.websocket.aiohttp.ClientSession", return_value=session):
+            with pytest.raises(ConnectionError):
+                await conn.connect()
+
+        assert session.ws_connect.call_args.kwargs["compress"] == expected
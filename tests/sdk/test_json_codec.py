@@ -0,0 +1,180 @@
+"""Tests for the pluggable JSON protocol codecs."""
+
+import json
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from src.surreal_sdk.connection.http import HTTPConnection
+from src.surreal_sdk.connection.websocket import WebSocketConnection
+from src.surreal_sdk.protocol.json_codec import (
+    MSGSPEC_AVAILABLE,
+    ORJSON_AVAILABLE,
+    JSONCodec,
+    StdlibJSONCodec,
+    available_json_codecs,
+    get_json_codec,
+)
+from src.surreal_sdk.protocol.rpc import RPCRequest, RPCResponse
+
+SAMPLE: dict[str, Any] = {
+    "when": datetime(2024, 1, 15, 10, 30, 0, 123456, tzinfo=UTC),
+    "day": date(2024, 1, 15),
+    "at": time(10, 30),
+    "price": Decimal("19.5"),
+    "uid": UUID("12345678-1234-5678-1234-567812345678"),
+    "nested": {"keep": 1, "drop": None, "items": [{"a": None, "b": 2}]},
+    "optional": None,
+}
+
+EXPECTED: dict[str, Any] = {
+    "when": "2024-01-15T10:30:00.123456+00:00",
+    "day": "2024-01-15",
+    "at": "10:30:00",
+    "price": 19.5,
+    "uid": "12345678-1234-5678-1234-567812345678",
+    "nested": {"keep": 1, "items": [{"b": 2}]},
+}
+
+FAST_CODECS = [
+    pytest.param("orjson", marks=pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")),
+    pytest.param("msgspec", marks=pytest.mark.skipif(not MSGSPEC_AVAILABLE, reason="msgspec not installed")),
+]
+
+
+class TestCodecSelection:
+    """Tests for get_json_codec()."""
+
+    def test_default_is_stdlib(self) -> None:
+        assert isinstance(get_json_codec(), StdlibJSONCodec)
+        assert get_json_codec(None).name == "stdlib"
+
+    def test_instances_are_shared(self) -> None:
+        assert get_json_codec("stdlib") is get_json_codec("stdlib")
+
+    def test_auto_picks_available_backend(self) -> None:
+        assert get_json_codec("auto").name in available_json_codecs()
+
+    def test_instance_passthrough(self) -> None:
+        codec = StdlibJSONCodec()
+        assert get_json_codec(codec) is codec
+
+    def test_unknown_name_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_json_codec("yaml")
+
+    @pytest.mark.skipif(ORJSON_AVAILABLE, reason="orjson installed")
+    def test_missing_backend_raises_import_error(self) -> None:
+        with pytest.raises(ImportError, match="orjson"):
+            get_json_codec("orjson")
+
+
+class TestStdlibCodec:
+    """Tests for the stdlib JSON codec."""
+
+    def test_surreal_types_and_none_stripping(self) -> None:
+        encoded = get_json_codec("stdlib").dumps(SAMPLE, strip_none=True)
+        assert json.loads(encoded) == EXPECTED
+
+    def test_none_kept_without_strip(self) -> None:
+        encoded = get_json_codec("stdlib").dumps({"a": None})
+        assert json.loads(encoded) == {"a": None}
+
+    def test_matches_legacy_to_json(self) -> None:
+        request = RPCRequest.create("users:1", {"name": "Alice", "age": None, "when": SAMPLE["when"]}, request_id=3)
+        assert request.to_json(get_json_codec("stdlib")) == request.to_json()
+
+
+@pytest.mark.parametrize("name", FAST_CODECS)
+class TestFastCodecs:
+    """Fast backends must produce the same documents as the stdlib codec."""
+
+    def test_surreal_types_and_none_stripping(self, name: str) -> None:
+        decoded = json.loads(get_json_codec(name).dumps(SAMPLE, strip_none=True))
+        # UTC may be rendered as "Z" or "+00:00"; both are valid ISO 8601.
+        assert datetime.fromisoformat(decoded.pop("when")) == SAMPLE["when"]
+        assert decoded == {k: v for k, v in EXPECTED.items() if k != "when"}
+
+    def test_roundtrip(self, name: str) -> None:
+        codec = get_json_codec(name)
+        assert codec.loads(codec.dumps({"id": 1, "result": [{"x": "y"}]})) == {"id": 1, "result": [{"x": "y"}]}
+
+    def test_malformed_input_raises_value_error(self, name: str) -> None:
+        with pytest.raises(ValueError):
+            get_json_codec(name).loads(b'{"id": 1,')
+
+    def test_request_to_json_returns_text(self, name: str) -> None:
+        request = RPCRequest.query("SELECT * FROM $t", {"t": "users", "skip": None})
+        text = request.to_json(get_json_codec(name))
+        assert isinstance(text, str)
+        assert json.loads(text) == json.loads(request.to_json())
+
+
+class TestRPCIntegration:
+    """Tests for codec use in RPCRequest/RPCResponse."""
+
+    def test_custom_codec_is_used(self) -> None:
+        class UpperCodec(StdlibJSONCodec):
+            name = "upper"
+
+            def dumps(self, obj: Any, *, strip_none: bool = False) -> str:
+                return super().dumps(obj, strip_none=strip_none).upper()
+
+        text = RPCRequest(method="ping", id=1).to_json(UpperCodec())
+        assert '"METHOD": "PING"' in text
+
+    def test_response_from_json_bytes(self) -> None:
+        response = RPCResponse.from_json(b'{"id": 4, "result": [1, 2]}', get_json_codec("stdlib"))
+        assert response.id == 4
+        assert response.result == [1, 2]
+
+
+class TestConnectionCodec:
+    """Tests for per-connection codec selection."""
+
+    def test_http_default_codec(self) -> None:
+        conn = HTTPConnection("http://localhost:8000", "ns", "db", protocol="json")
+        assert conn.json_codec.name == "stdlib"
+
+    def test_ws_codec_by_instance(self) -> None:
+        codec = StdlibJSONCodec()
+        conn = WebSocketConnection("ws://localhost:8000", "ns", "db", protocol="json", json_codec=codec)
+        assert conn.json_codec is codec
+
+    def test_invalid_codec_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            HTTPConnection("http://localhost:8000", "ns", "db", json_codec="nope")
+
+    async def test_ws_ignores_malformed_messages(self) -> None:
+        conn = WebSocketConnection("ws://localhost:8000", "ns", "db", protocol="json")
+        conn._process_message = AsyncMock()  # type: ignore[method-assign]
+
+        await conn._handle_message_json('{"id": 1,')
+        await conn._handle_message_json("[1, 2]")
+        conn._process_message.assert_not_called()
+
+        await conn._handle_message_json('{"id": 1, "result": true}')
+        conn._process_message.assert_awaited_once_with({"id": 1, "result": True})
+
+    async def test_http_send_rpc_uses_codec(self) -> None:
+        codec = MagicMock(spec=JSONCodec)
+        codec.dumps.return_value = b'{"id":1,"method":"ping","params":[]}'
+        codec.loads.return_value = {"id": 1, "result": True}
+
+        conn = HTTPConnection("http://localhost:8000", "ns", "db", protocol="json", json_codec=codec)
+        http_response = MagicMock()
+        http_response.content = b'{"id":1,"result":true}'
+        conn._client = MagicMock()
+        conn._client.post = AsyncMock(return_value=http_response)
+
+        response = await conn._send_rpc(RPCRequest(method="ping"))
+
+        assert response.result is True
+        codec.dumps.assert_called_once()
+        assert codec.dumps.call_args.kwargs == {"strip_none": True}
+        codec.loads.assert_called_once_with(b'{"id":1,"result":true}')
+        assert conn._client.post.call_args.kwargs["content"] == b'{"id":1,"method":"ping","params":[]}'
@@ -0,0 +1,161 @@
+"""Tests for priority lanes and weighted fair queueing."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.surreal_sdk.connection.lanes import DEFAULT_LANE, FairQueue, current_priority, query_priority
+from src.surreal_sdk.connection.limiter import AdaptiveLimiter
+from src.surreal_sdk.connection.pool import ConnectionPool
+from src.surreal_sdk.exceptions import OverloadedError
+
+
+class TestQueryPriority:
+    async def test_sets_and_restores_lane(self) -> None:
+        assert current_priority() == DEFAULT_LANE
+
+        async with query_priority("background"):
+            assert current_priority() == "background"
+
+        assert current_priority() == DEFAULT_LANE
+
+    async def test_tasks_inherit_lane(self) -> None:
+        async with query_priority("background"):
+            lane = await asyncio.create_task(asyncio.sleep(0, current_priority()))
+
+        assert lane == "background"
+
+    async def test_empty_lane_raises(self) -> None:
+        with pytest.raises(ValueError):
+            async with query_priority(""):
+                pass
+
+
+async def _grant_order(queue: FairQueue, lanes: list[str]) -> list[str]:
+    """Queue one waiter per entry of ``lanes`` behind a held slot, then release slots one by one."""
+    await queue.acquire(lane="holder")
+    order: list[str] = []
+
+    async def wait(lane: str) -> None:
+        await queue.acquire(lane=lane)
+        order.append(lane)
+
+    tasks = [asyncio.create_task(wait(lane)) for lane in lanes]
+    await asyncio.sleep(0)
+    queue.release(lane="holder")
+    for _ in lanes:
+        await asyncio.sleep(0)
+        queue.release(lane=order[-1])
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestFairQueue:
+    async def test_lanes_share_slots_by_weight(self) -> None:
+        queue = FairQueue(1, lane_weights={"interactive": 4, "background": 1})
+
+        order = await _grant_order(queue, ["background"] * 10 + ["interactive"] * 10)
+
+        assert order[:5].count("interactive") == 4
+        assert order[:10].count("interactive") == 8
+
+    async def test_equal_weights_alternate(self) -> None:
+        queue = FairQueue(1, lane_weights={"a": 1, "b": 1})
+
+        order = await _grant_order(queue, ["a", "a", "a", "b", "b", "b"])
+
+        assert order == ["a", "b", "a", "b", "a", "b"]
+
+    async def test_fifo_within_lane(self) -> None:
+        queue = FairQueue(1)
+        await queue.acquire()
+        order: list[int] = []
+
+        async def wait(i: int) -> None:
+            await queue.acquire()
+            order.append(i)
+            queue.release()
+
+        tasks = [asyncio.create_task(wait(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        queue.release()
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2]
+
+    async def test_lane_limit_caps_lane_with_free_slots(self) -> None:
+        queue = FairQueue(4, lane_limits={"background": 1})
+        await queue.acquire(lane="background")
+
+        with pytest.raises(TimeoutError):
+            await queue.acquire(0.01, lane="background")
+        await queue.acquire(0.01, lane="interactive")
+
+        assert queue.lane_stats() == {
+            "background": {"in_flight": 1, "queued": 0},
+            "interactive": {"in_flight": 1, "queued": 0},
+        }
+
+    async def test_capped_lane_resumes_when_its_slot_frees(self) -> None:
+        queue = FairQueue(4, lane_limits={"background": 1})
+        await queue.acquire(lane="background")
+        waiter = asyncio.create_task(queue.acquire(lane="background"))
+        await asyncio.sleep(0)
+        assert queue.lane_stats()["background"]["queued"] == 1
+
+        queue.release(lane="background")
+        await waiter
+
+        assert queue.lane_in_flight == {"background": 1}
+
+    @pytest.mark.parametrize("kwargs", [{"lane_weights": {"a": 0}}, {"lane_limits": {"a": 0}}])
+    def test_invalid_arguments(self, kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError):
+            FairQueue(1, **kwargs)
+
+
+class TestLimiterLanes:
+    async def test_limiter_uses_current_lane(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=4, lane_limits={"background": 1})
+
+        async with query_priority("background"):
+            async with limiter.slot():
+                assert limiter.stats()["lanes"] == {"background": {"in_flight": 1, "queued": 0}}
+                with pytest.raises(OverloadedError):
+                    await limiter.acquire(0.01)
+
+        assert limiter.stats()["lanes"] == {}
+        assert limiter.shed == 1
+
+
+class TestPoolLanes:
+    async def test_pool_serves_lanes_by_weight(self) -> None:
+        pool = ConnectionPool("http://localhost:8000", "t", "t", size=1, lane_weights={"interactive": 2, "background": 1})
+        conn = MagicMock()
+        conn.is_connected = True
+        conn.close = AsyncMock()
+        pool._create_connection = MagicMock(return_value=conn)  # type: ignore[method-assign]
+        pool._init_connection = AsyncMock()  # type: ignore[method-assign]
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def use(lane: str) -> None:
+            async with query_priority(lane):
+                async with pool.acquire():
+                    order.append(lane)
+                    if lane == "holder":
+                        await release.wait()
+
+        holder = asyncio.create_task(use("holder"))
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(use(lane)) for lane in ["background"] * 3 + ["interactive"] * 3]
+        await asyncio.sleep(0)
+        assert pool.waiting == 6
+
+        release.set()
+        await asyncio.gather(holder, *tasks)
+
+        assert order[1:4].count("interactive") == 2
+        assert pool.lane_stats() == {}
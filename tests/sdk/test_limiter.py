@@ -0,0 +1,190 @@
+"""Tests for the adaptive concurrency limiter."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.surreal_sdk.connection.http import HTTPConnection
+from src.surreal_sdk.connection.limiter import AdaptiveLimiter
+from src.surreal_sdk.connection.pool import ConnectionPool
+from src.surreal_sdk.exceptions import ConnectionError, OverloadedError
+from src.surreal_sdk.protocol.rpc import RPCRequest, RPCResponse
+
+
+class TestConfiguration:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"algorithm": "vegas"},
+            {"min_limit": 0},
+            {"initial_limit": 5, "max_limit": 4},
+            {"queue_timeout": -1},
+            {"max_queue": -1},
+            {"tolerance": 0.5},
+            {"backoff": 1.0},
+            {"smoothing": 0},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(**kwargs)
+
+    def test_initial_stats(self) -> None:
+        stats = AdaptiveLimiter(initial_limit=5).stats()
+
+        assert stats["limit"] == 5
+        assert stats["in_flight"] == stats["queued"] == stats["shed"] == 0
+        assert stats["latency_ms"] is None
+
+
+class TestQueueing:
+    async def test_requests_beyond_limit_wait_for_a_slot(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+        assert not waiter.done()
+
+        limiter.release()
+        await waiter
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+    async def test_waiters_past_deadline_are_shed(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=1, queue_timeout=0.01)
+        await limiter.acquire()
+
+        with pytest.raises(OverloadedError):
+            await limiter.acquire()
+
+        assert limiter.stats()["shed"] == 1
+        assert limiter.queued == 0
+
+    async def test_full_queue_rejects_immediately(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=1, max_queue=0)
+        await limiter.acquire()
+
+        with pytest.raises(OverloadedError, match="queued"):
+            await limiter.acquire(timeout=10)
+
+        assert limiter.shed == 1
+
+    async def test_queue_is_fifo(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        await limiter.acquire()
+        order: list[int] = []
+
+        async def wait(i: int) -> None:
+            await limiter.acquire()
+            order.append(i)
+
+        tasks = [asyncio.create_task(wait(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        for _ in range(3):
+            limiter.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2]
+
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.queued == 0
+        limiter.release()
+        assert limiter.in_flight == 0
+
+
+class TestAdaptation:
+    def _run(self, limiter: AdaptiveLimiter, latency: float, in_flight: int) -> None:
+        """Complete a request while ``in_flight`` requests are outstanding."""
+        limiter.in_flight = in_flight
+        limiter.release(latency)
+
+    @pytest.mark.parametrize("algorithm", ["aimd", "gradient"])
+    def test_limit_grows_while_latency_is_stable(self, algorithm: Any) -> None:
+        limiter = AdaptiveLimiter(algorithm=algorithm, initial_limit=10)
+        for _ in range(20):
+            self._run(limiter, 0.01, limiter.limit)
+
+        assert limiter.limit > 10
+
+    @pytest.mark.parametrize("algorithm", ["aimd", "gradient"])
+    def test_limit_shrinks_when_latency_climbs(self, algorithm: Any) -> None:
+        limiter = AdaptiveLimiter(algorithm=algorithm, initial_limit=50)
+        self._run(limiter, 0.01, 50)
+        for _ in range(20):
+            self._run(limiter, 0.2, 50)
+
+        assert limiter.limit < 50
+        assert limiter.stats()["baseline_ms"] < limiter.stats()["latency_ms"]
+
+    def test_idle_limit_does_not_grow(self) -> None:
+        limiter = AdaptiveLimiter(algorithm="aimd", initial_limit=10)
+        for _ in range(20):
+            self._run(limiter, 0.01, 1)
+
+        assert limiter.limit == 10
+
+    def test_limit_stays_within_bounds(self) -> None:
+        limiter = AdaptiveLimiter(algorithm="aimd", initial_limit=4, min_limit=2, max_limit=6)
+        for _ in range(20):
+            self._run(limiter, 0.01, limiter.limit)
+        assert limiter.limit == 6
+
+        for _ in range(50):
+            limiter.in_flight = 1
+            limiter.release(dropped=True)
+        assert limiter.limit == 2
+        assert limiter.dropped == 50
+
+
+class TestConnectionIntegration:
+    async def test_rpc_goes_through_limiter(self) -> None:
+        connection = HTTPConnection("http://localhost:8000", "t", "t")
+        connection.limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+        peak = 0
+
+        async def send(request: RPCRequest) -> Any:
+            nonlocal peak
+            peak = max(peak, connection.in_flight)
+            await asyncio.sleep(0.01)
+            return RPCResponse(id=request.id, result="ok")
+
+        connection._send_rpc = send  # type: ignore[method-assign]
+        await asyncio.gather(*(connection.rpc("ping") for _ in range(6)))
+
+        assert peak == 2
+        assert connection.limiter.accepted == 6
+        assert connection.limiter.in_flight == 0
+
+    async def test_transport_errors_shrink_limit(self) -> None:
+        connection = HTTPConnection("http://localhost:8000", "t", "t")
+        connection.limiter = AdaptiveLimiter(initial_limit=10)
+
+        async def send(request: RPCRequest) -> Any:
+            raise ConnectionError("Request failed")
+
+        connection._send_rpc = send  # type: ignore[method-assign]
+        with pytest.raises(ConnectionError):
+            await connection.rpc("ping")
+
+        assert connection.limiter.limit == 9
+        assert connection.limiter.in_flight == 0
+
+    def test_pool_shares_limiter(self) -> None:
+        limiter = AdaptiveLimiter()
+        pool = ConnectionPool("http://localhost:8000", "t", "t", size=2, limiter=limiter)
+
+        assert pool._create_connection().limiter is limiter
+        assert pool._create_connection().limiter is limiter
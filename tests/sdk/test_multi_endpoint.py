@@ -0,0 +1,173 @@
+"""Tests for the multi-endpoint HTTP connection."""
+
+import json
+from collections.abc import AsyncGenerator
+
+import httpx
+import pytest
+
+from src.surreal_sdk.connection.multi_endpoint import MultiEndpointHTTPConnection
+from src.surreal_sdk.exceptions import ConnectionError, QueryError
+
+URLS = ["http://db1:8000", "http://db2:8000", "http://db3:8000"]
+
+
+class Cluster:
+    """Fake cluster answering RPC and health requests per node."""
+
+    def __init__(self) -> None:
+        self.down: set[str] = set()
+        self.unavailable: set[str] = set()
+        self.rpc_calls: list[str] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        node = request.url.host
+        if node in self.down:
+            raise httpx.ConnectError("connection refused", request=request)
+        if node in self.unavailable:
+            return httpx.Response(503, text="unavailable")
+        if request.url.path == "/health":
+            return httpx.Response(200)
+        if request.url.path == "/signin":
+            return httpx.Response(200, json={"token": f"token-{node}"})
+        self.rpc_calls.append(node)
+        return httpx.Response(200, content=json.dumps({"id": 1, "result": node}).encode())
+
+
+@pytest.fixture
+def cluster() -> Cluster:
+    return Cluster()
+
+
+@pytest.fixture
+async def conn(cluster: Cluster) -> AsyncGenerator[MultiEndpointHTTPConnection, None]:
+    connection = MultiEndpointHTTPConnection(URLS, "ns", "db", protocol="json", health_interval=0)
+    await connection.connect()
+    for endpoint in connection.endpoints:
+        assert endpoint.client is not None
+        await endpoint.client.aclose()
+        endpoint.client = httpx.AsyncClient(base_url=endpoint.url, transport=httpx.MockTransport(cluster.handle))
+    connection._client = connection.endpoints[0].client
+    yield connection
+    await connection.close()
+
+
+class TestConfiguration:
+    def test_requires_urls(self) -> None:
+        with pytest.raises(ValueError, match="At least one endpoint"):
+            MultiEndpointHTTPConnection([], "ns", "db")
+
+    def test_invalid_strategy(self) -> None:
+        with pytest.raises(ValueError, match="Invalid strategy"):
+            MultiEndpointHTTPConnection(URLS, "ns", "db", strategy="random")  # type: ignore[arg-type]
+
+    def test_urls_normalized(self) -> None:
+        connection = MultiEndpointHTTPConnection(["ws://db1:8000/", "wss://db2:8000"], "ns", "db")
+        assert [e.url for e in connection.endpoints] == ["http://db1:8000", "https://db2:8000"]
+
+    async def test_not_connected(self) -> None:
+        connection = MultiEndpointHTTPConnection(URLS, "ns", "db", health_interval=0)
+        with pytest.raises(ConnectionError):
+            await connection.rpc("ping")
+
+
+class TestBalancing:
+    async def test_round_robin_spreads_requests(self, conn: MultiEndpointHTTPConnection, cluster: Cluster) -> None:
+        for _ in range(6):
+            await conn.rpc("ping")
+
+        assert sorted(cluster.rpc_calls) == ["db1", "db1", "db2", "db2", "db3", "db3"]
+
+    async def test_least_latency_prefers_fastest(self, conn: MultiEndpointHTTPConnection, cluster: Cluster) -> None:
+        conn.strategy = "least_latency"
+        for endpoint, latency in zip(conn.endpoints, (0.05, 0.01, 0.03), strict=True):
+            endpoint.latency = latency
+
+        await conn.rpc("ping")
+
+        assert cluster.rpc_calls == ["db2"]
+
+    async def test_latency_ewma(self, conn: MultiEndpointHTTPConnection) -> None:
+        endpoint = conn.endpoints[0]
+        conn._observe(endpoint, 1.0)
+        conn._observe(endpoint, 0.0)
+
+        assert endpoint.latency == pytest.approx(0.7)
+        assert endpoint.requests == 2
+
+
+class TestFailover:
+    async def test_unreachable_node_is_ejected(self, conn: MultiEndpointHTTPConnection, cluster: Cluster) -> None:
+        cluster.down.add("db2")
+        for _ in range(6):
+            assert await conn.rpc("ping") in ("db1", "db3")
+
+        stats = {s["url"]: s for s in conn.endpoint_stats()}
+        assert not stats["http://db2:8000"]["healthy"]
+        assert stats["http://db2:8000"]["failures"] == 1
+        assert "db2" not in cluster.rpc_calls
+
+    async def test_unavailable_status_fails_over(self, conn: MultiEndpointHTTPConnection, cluster: Cluster) -> None:
+        cluster.unavailable.update({"db1", "db2"})
+
+        assert await conn.rpc("ping") == "db3"
+
+    @pytest.mark.parametrize("status", [502, 504])
+    async def test_gateway_errors_are_not_retried(self, conn: MultiEndpointHTTPConnection, status: int) -> None:
+        """A gateway may answer 502/504 after forwarding the request, so it is never re-sent."""
+        calls: list[str] = []
+
+        def gateway(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.host)
+            return httpx.Response(status, text="bad gateway")
+
+        for endpoint in conn.endpoints:
+            endpoint.client = httpx.AsyncClient(base_url=endpoint.url, transport=httpx.MockTransport(gateway))
+
+        with pytest.raises(QueryError):
+            await conn.rpc("ping")
+        assert calls == ["db2"]
+        assert [e.healthy for e in conn.endpoints] == [True, False, True]
+
+    async def test_all_nodes_down(self, conn: MultiEndpointHTTPConnection, cluster: Cluster) -> None:
+        cluster.down.update({"db1", "db2", "db3"})
+
+        with pytest.raises(ConnectionError):
+            await conn.rpc("ping")
+
+    async def test_other_http_errors_are_not_retried(self, conn: MultiEndpointHTTPConnection) -> None:
+        def reject(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, text="bad request")
+
+        for endpoint in conn.endpoints:
+            endpoint.client = httpx.AsyncClient(base_url=endpoint.url, transport=httpx.MockTransport(reject))
+
+        with pytest.raises(QueryError):
+            await conn.rpc("ping")
+        assert all(e.healthy for e in conn.endpoints)
+
+    async def test_signin_skips_unreachable_node(self, conn: MultiEndpointHTTPConnection, cluster: Cluster) -> None:
+        cluster.down.add("db1")
+
+        response = await conn.signin("root", "root")
+
+        assert response.token == "token-db2"
+        assert not conn.endpoints[0].healthy
+
+
+class TestHealthChecks:
+    async def test_probe_ejects_and_readmits(self, conn: MultiEndpointHTTPConnection, cluster: Cluster) -> None:
+        cluster.unavailable.add("db3")
+        await conn.check_health()
+        assert [e.healthy for e in conn.endpoints] == [True, True, False]
+
+        cluster.unavailable.clear()
+        await conn.check_health()
+        assert all(e.healthy for e in conn.endpoints)
+
+    async def test_non_rpc_calls_move_off_ejected_node(self, conn: MultiEndpointHTTPConnection, cluster: Cluster) -> None:
+        cluster.down.add("db1")
+        await conn.check_health()
+
+        assert conn._client is conn.endpoints[1].client
+        assert await conn.health()
@@ -6,7 +6,9 @@ import pytest
 
 from src.surreal_sdk.exceptions import TransactionError
 from src.surreal_sdk.transaction import (
+    BufferedTransaction,
     HTTPTransaction,
+    PipelinedWebSocketTransaction,
     TransactionStatement,
     WebSocketTransaction,
 )
@@ -201,6 +203,68 @@ class TestHTTPTransaction:
         sql = call_args[0][0]
         assert "RELATE users:1->follows->users:2" in sql
 
+    @pytest.mark.asyncio
+    async def test_commit_namespaces_prefix_sharing_variables(self, mock_connection: MagicMock) -> None:
+        """Variables sharing a prefix ($_sv_a / $_sv_ab) are rewritten independently."""
+        tx = HTTPTransaction(mock_connection)
+        await tx._begin()
+        await tx.query("UPDATE users:1 SET a = $_sv_a, ab = $_sv_ab", {"_sv_a": 1, "_sv_ab": 2})
+        await tx.commit()
+
+        sql, vars = mock_connection.query.call_args[0]
+        assert "a = $tx_0__sv_a, ab = $tx_0__sv_ab" in sql
+        assert vars == {"tx_0__sv_a": 1, "tx_0__sv_ab": 2}
+
+    @pytest.mark.asyncio
+    async def test_commit_leaves_unbound_and_quoted_variables(self, mock_connection: MagicMock) -> None:
+        """Only bound variables outside string literals are namespaced."""
+        tx = HTTPTransaction(mock_connection)
+        await tx._begin()
+        await tx.query("UPDATE users:1 SET note = '$name', name = $name, at = $now", {"name": "Al"})
+        await tx.commit()
+
+        sql = mock_connection.query.call_args[0][0]
+        assert "note = '$name', name = $tx_0_name, at = $now" in sql
+
+    @pytest.mark.asyncio
+    async def test_commit_chunks_large_transactions(self, mock_connection: MagicMock) -> None:
+        """max_statements splits the commit into ordered BEGIN/COMMIT chunks."""
+        tx = HTTPTransaction(mock_connection, max_statements=2)
+        await tx._begin()
+        for i in range(5):
+            await tx.query(f"UPDATE users:{i} SET n = $n", {"n": i})
+
+        result = await tx.commit()
+
+        assert tx.is_committed
+        assert mock_connection.query.call_count == 3
+        sql, vars = mock_connection.query.call_args_list[2][0]
+        assert sql.startswith("BEGIN TRANSACTION;") and sql.endswith("COMMIT TRANSACTION;")
+        assert vars == {"tx_4_n": 4}
+        assert len(result.results) == 3
+
+    @pytest.mark.asyncio
+    async def test_chunked_commit_stops_at_failed_chunk(self, mock_connection: MagicMock) -> None:
+        """A failing chunk aborts the commit and reports partial progress."""
+        ok = QueryResponse(results=[QueryResult(status=ResponseStatus.OK, time="1ms", result=None)], raw=[])
+        failed = QueryResponse(results=[QueryResult(status=ResponseStatus.ERR, time="1ms", result="boom")], raw=[])
+        mock_connection.query = AsyncMock(side_effect=[ok, failed, ok])
+        tx = HTTPTransaction(mock_connection, max_statements=1)
+        await tx._begin()
+        for i in range(3):
+            await tx.query(f"DELETE users:{i}")
+
+        with pytest.raises(TransactionError, match="chunk 2 of 3; 1 earlier"):
+            await tx.commit()
+
+        assert mock_connection.query.call_count == 2
+        assert not tx.is_committed
+
+    def test_invalid_max_statements(self, mock_connection: MagicMock) -> None:
+        """max_statements must be positive."""
+        with pytest.raises(ValueError, match="max_statements"):
+            HTTPTransaction(mock_connection, max_statements=0)
+
 
 class TestWebSocketTransaction:
     """Tests for WebSocketTransaction class."""
@@ -307,6 +371,79 @@ class TestWebSocketTransaction:
         mock_connection.create.assert_called_once()
 
 
+class TestPipelinedWebSocketTransaction:
+    """Tests for the buffered (pipelined) WebSocket transaction mode."""
+
+    @pytest.fixture
+    def mock_connection(self) -> MagicMock:
+        """Create a mock WebSocket connection."""
+        conn = MagicMock()
+        conn.query = AsyncMock(
+            return_value=QueryResponse(
+                results=[QueryResult(status=ResponseStatus.OK, time="1ms", result=[{"id": "users:1"}])] * 3,
+                raw=[],
+            )
+        )
+        conn.create = AsyncMock()
+        return conn
+
+    @pytest.mark.asyncio
+    async def test_statements_sent_in_single_round_trip(self, mock_connection: MagicMock) -> None:
+        """BEGIN, every statement and COMMIT go out as one query on commit."""
+        tx = PipelinedWebSocketTransaction(mock_connection)
+        async with tx:
+            await tx.create("users:1", {"name": "Alice"})
+            await tx.update("users:2", {"name": "Bob"})
+            await tx.query("DELETE users:3")
+            mock_connection.query.assert_not_called()
+
+        mock_connection.query.assert_called_once()
+        mock_connection.create.assert_not_called()
+        sql = mock_connection.query.call_args[0][0]
+        assert sql.startswith("BEGIN TRANSACTION;")
+        assert sql.endswith("COMMIT TRANSACTION;")
+        assert tx.is_committed
+
+    @pytest.mark.asyncio
+    async def test_results_deferred_until_commit(self, mock_connection: MagicMock) -> None:
+        """Operations return placeholders; commit returns the real results."""
+        tx = PipelinedWebSocketTransaction(mock_connection)
+        await tx._begin()
+        placeholder = await tx.create("users:1", {"name": "Alice"})
+
+        result = await tx.commit()
+
+        assert tx.defers_results
+        assert placeholder.record is None
+        assert len(result.results) == 3
+
+    @pytest.mark.asyncio
+    async def test_rollback_sends_nothing(self, mock_connection: MagicMock) -> None:
+        """Nothing reaches the server when a pipelined transaction is rolled back."""
+        tx = PipelinedWebSocketTransaction(mock_connection)
+        await tx._begin()
+        await tx.query("DELETE users:1")
+        await tx.rollback()
+
+        mock_connection.query.assert_not_called()
+        assert tx.is_rolled_back
+
+    def test_connection_selects_mode(self) -> None:
+        """WebSocketConnection.transaction(pipelined=...) picks the mode."""
+        from src.surreal_sdk.connection.websocket import WebSocketConnection
+
+        conn = WebSocketConnection("ws://localhost:8000", "ns", "db")
+        assert type(conn.transaction()) is WebSocketTransaction
+        assert isinstance(conn.transaction(pipelined=True), PipelinedWebSocketTransaction)
+
+    def test_not_an_http_transaction(self, mock_connection: MagicMock) -> None:
+        """The pipeline shares buffering with HTTP but none of its chunking."""
+        tx = PipelinedWebSocketTransaction(mock_connection)
+        assert isinstance(tx, BufferedTransaction)
+        assert not isinstance(tx, HTTPTransaction)
+        assert not hasattr(tx, "max_statements")
+
+
 class TestTransactionError:
     """Tests for TransactionError exception."""
 
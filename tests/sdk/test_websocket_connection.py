@@ -1,11 +1,15 @@
 """Tests for WebSocket connection module."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
+from unittest.mock import AsyncMock
 
+import aiohttp
 import pytest
 
 from src.surreal_sdk.connection.websocket import WebSocketConnection
+from src.surreal_sdk.protocol.rpc import RPCRequest
 
 
 class TestWebSocketConnection:
@@ -63,6 +67,41 @@ class TestWebSocketConnection:
         assert conn._next_request_id() == 2
         assert conn._next_request_id() == 3
 
+    async def test_cancelled_request_drops_pending(self) -> None:
+        """Test that cancelling the caller forgets the in-flight request."""
+        conn = WebSocketConnection("ws://localhost:8000", "ns", "db", protocol="json")
+        conn._ws = AsyncMock()
+        conn._connected = True
+
+        task = asyncio.create_task(conn._send_rpc(RPCRequest(method="query", params=["SLEEP 10s;"])))
+        await asyncio.sleep(0)
+        assert len(conn._pending) == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert conn._pending == {}
+
+    async def test_sent_bytes_count_utf8(self) -> None:
+        """Test that JSON requests are counted in encoded bytes, not characters."""
+        pytest.importorskip("orjson")
+        conn = WebSocketConnection("ws://localhost:8000", "ns", "db", protocol="json", json_codec="orjson")
+        conn._ws = AsyncMock()
+        conn._connected = True
+
+        task = asyncio.create_task(conn._send_rpc(RPCRequest(method="query", params=["RETURN 'héllo ✓';"])))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # The codec's bytes go out as a text frame without a decode/encode round trip.
+        conn._ws.send_str.assert_not_called()
+        sent, opcode = conn._ws.send_frame.call_args[0]
+        assert opcode == aiohttp.WSMsgType.TEXT
+        assert conn.transfer_stats.bytes_sent == len(sent) > len(sent.decode())
+
     def test_live_queries_property(self) -> None:
         """Test live_queries property."""
         conn = WebSocketConnection("ws://localhost:8000", "ns", "db")
@@ -0,0 +1,139 @@
+"""Unit tests for the write-combining Accumulator."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm.accumulator import Accumulator
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict, SurrealDbError
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Post(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="post")
+    id: str | None = None
+    views: int = 0
+    viewers: list[str] = []
+
+
+def _client(status: ResponseStatus = ResponseStatus.OK) -> AsyncMock:
+    client = AsyncMock()
+    client.query = AsyncMock(
+        return_value=QueryResponse(results=[QueryResult(status=status, result="boom", time="1ms")], raw=[])
+    )
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.accumulator.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+class TestAccumulator:
+    async def test_increments_are_summed(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with Accumulator(Post) as counters:
+                for _ in range(100):
+                    counters.increment("p1", "views")
+                counters.increment("post:p1", "views", 5)
+
+        client.query.assert_awaited_once()
+        sql, variables = client.query.call_args[0]
+        assert sql == "UPDATE post:p1 SET views += $_a0 RETURN NONE;"
+        assert variables == {"_a0": 105}
+
+    async def test_identical_increments_share_a_statement(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with Accumulator(Post) as counters:
+                counters.increment("a", "views")
+                counters.increment("b", "views")
+                counters.increment("c", "views", 2)
+
+        sql = client.query.call_args[0][0]
+        assert sql.split("\n") == [
+            "UPDATE [post:a, post:b] SET views += $_a0 RETURN NONE;",
+            "UPDATE post:c SET views += $_a1 RETURN NONE;",
+        ]
+
+    async def test_array_operations_are_combined_in_order(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with Accumulator(Post) as counters:
+                counters.set_add("p1", "viewers", "u1")
+                counters.set_add("p1", "viewers", "u2")
+                counters.set_add("p1", "viewers", "u1")
+                counters.remove("p1", "viewers", "u0")
+                counters.increment("p1", "views")
+
+        sql, variables = client.query.call_args[0]
+        assert sql == "UPDATE post:p1 SET viewers += $_a0, viewers += $_a1, viewers -= $_a2, views += $_a3 RETURN NONE;"
+        assert variables == {"_a0": "u1", "_a1": "u2", "_a2": "u0", "_a3": 1}
+
+    async def test_append_matches_atomic_append(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with Accumulator(Post) as counters:
+                counters.append("p1", "viewers", "u1")
+                counters.append("p1", "viewers", "u1")
+
+        sql, variables = client.query.call_args[0]
+        assert sql == (
+            "UPDATE post:p1 SET viewers = array::append(viewers, $_a0), viewers = array::append(viewers, $_a1) RETURN NONE;"
+        )
+        assert variables == {"_a0": "u1", "_a1": "u1"}
+
+    async def test_flushes_after_max_delay(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            counters = Accumulator(Post, max_delay_ms=10)
+            counters.increment("p1", "views")
+            assert counters.pending == 1
+            await asyncio.sleep(0.05)
+
+        client.query.assert_awaited_once()
+        assert counters.pending == 0
+
+    async def test_max_records_triggers_flush(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            counters = Accumulator(Post, max_delay_ms=60_000, max_records=2)
+            counters.increment("a", "views")
+            counters.increment("b", "views")
+            await asyncio.sleep(0)
+            await counters.flush()
+
+        client.query.assert_awaited_once()
+
+    async def test_flush_on_exit_after_error(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            with pytest.raises(RuntimeError):
+                async with Accumulator(Post) as counters:
+                    counters.increment("p1", "views")
+                    raise RuntimeError("handler failed")
+
+        client.query.assert_awaited_once()
+
+    async def test_mixing_increment_and_array_ops_rejected(self) -> None:
+        with _patch_client(_client()):
+            async with Accumulator(Post) as counters:
+                counters.increment("p1", "views")
+                with pytest.raises(ValueError, match="increment"):
+                    counters.append("p1", "views", 1)
+
+    async def test_flush_error_is_raised(self) -> None:
+        client = _client(ResponseStatus.ERR)
+        with _patch_client(client):
+            counters = Accumulator(Post)
+            counters.increment("p1", "views")
+            with pytest.raises(SurrealDbError, match="boom"):
+                await counters.flush()
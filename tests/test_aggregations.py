@@ -1,5 +1,8 @@
 """Tests for ORM v0.3.0 features: aggregations and GROUP BY."""
 
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from pydantic import Field
 
@@ -11,7 +14,9 @@ from src.surreal_orm.aggregations import (
     Min,
     Sum,
 )
+from src.surreal_orm.cache import QueryCache
 from src.surreal_orm.model_base import BaseSurrealModel
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
 
 
 class Order(BaseSurrealModel):
@@ -265,3 +270,78 @@ def test_connection_manager_has_transaction_method() -> None:
 
     assert hasattr(SurrealDBConnectionManager, "transaction")
     assert callable(SurrealDBConnectionManager.transaction)
+
+
+# ==================== aggregate() Tests ====================
+
+
+def _aggregate_client(records: list[dict[str, Any]]) -> AsyncMock:
+    client = AsyncMock()
+    client.query = AsyncMock(
+        return_value=QueryResponse(results=[QueryResult(status=ResponseStatus.OK, result=records, time="1ms")], raw=records)
+    )
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.query_set.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+def test_compile_aggregate_query_single_group_all() -> None:
+    """All aggregations share one GROUP ALL statement and the WHERE clause."""
+    qs = Order.objects().filter(status="paid")
+    query = qs._compile_aggregate_query({"n": Count(), "total": Sum("amount"), "hi": Max("amount")})
+    assert query == (
+        "SELECT count() AS n, math::sum(amount) AS total, math::max(amount) AS hi FROM Order WHERE status = $_f0 GROUP ALL;"
+    )
+    assert qs._variables == {"_f0": "paid"}
+
+
+def test_compile_aggregate_query_validation() -> None:
+    """Empty, non-Aggregation and unsafe aliases are rejected."""
+    with pytest.raises(ValueError, match="at least one"):
+        Order.objects()._compile_aggregate_query({})
+    with pytest.raises(ValueError, match="must be an Aggregation"):
+        Order.objects()._compile_aggregate_query({"n": "count()"})  # type: ignore[dict-item]
+    with pytest.raises(ValueError, match="Invalid aggregate alias"):
+        Order.objects()._compile_aggregate_query({"n; DELETE": Count()})
+
+
+@pytest.mark.asyncio
+async def test_aggregate_returns_dict_in_one_query() -> None:
+    """aggregate() sends one query and maps each alias to its value."""
+    client = _aggregate_client([{"n": 3, "total": 30.0, "avg": 10.0, "lo": 5.0}])
+    with _patch_client(client):
+        stats = await Order.objects().aggregate(n=Count(), total=Sum("amount"), avg=Avg("amount"), lo=Min("amount"))
+
+    client.query.assert_awaited_once()
+    assert stats == {"n": 3, "total": 30.0, "avg": 10.0, "lo": 5.0}
+
+
+@pytest.mark.asyncio
+async def test_aggregate_empty_set_defaults() -> None:
+    """With no matching records Count/Sum are 0 and the others None."""
+    with _patch_client(_aggregate_client([])):
+        stats = await Order.objects().aggregate(n=Count(), total=Sum("amount"), hi=Max("amount"))
+    assert stats == {"n": 0, "total": 0, "hi": None}
+
+
+@pytest.mark.asyncio
+async def test_aggregate_uses_query_cache() -> None:
+    """A cached aggregate() is served without a second query."""
+    QueryCache.clear()
+    QueryCache.configure(enabled=True)
+    client = _aggregate_client([{"n": 2}])
+    try:
+        with _patch_client(client):
+            first = await Order.objects().cache(ttl=30).aggregate(n=Count())
+            second = await Order.objects().cache(ttl=30).aggregate(n=Count())
+    finally:
+        QueryCache.clear()
+
+    assert first == second == {"n": 2}
+    client.query.assert_awaited_once()
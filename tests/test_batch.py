@@ -0,0 +1,191 @@
+"""Unit tests for surreal_orm.batch() multi-query execution."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm import QueryTimeoutError, query_deadline
+from src.surreal_orm.aggregations import Count, Max
+from src.surreal_orm.batch import batch
+from src.surreal_orm.cache import QueryCache
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict, SurrealDbError
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Order(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="order")
+    id: str | None = None
+    status: str
+    amount: float
+
+
+def _ok(result: Any) -> QueryResult:
+    return QueryResult(status=ResponseStatus.OK, result=result, time="1ms")
+
+
+def _client(*results: QueryResult) -> AsyncMock:
+    client = AsyncMock()
+    client.query = AsyncMock(return_value=QueryResponse(results=list(results), raw=[]))
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.batch.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache() -> Any:
+    QueryCache.clear()
+    QueryCache.configure(enabled=True)
+    yield
+    QueryCache.clear()
+
+
+class TestBatchExecution:
+    """batch() sends one request and splits the results per item."""
+
+    async def test_single_round_trip_with_typed_results(self) -> None:
+        client = _client(
+            _ok([{"id": "order:1", "status": "open", "amount": 5.0}]),
+            _ok([{"count": 7}]),
+            _ok([{"total": 120.5}]),
+            _ok([{"average": None}]),
+        )
+        with _patch_client(client):
+            orders, paid, revenue, avg = await batch(
+                Order.objects().filter(status="open"),
+                Order.objects().filter(status="paid").count(),
+                Order.objects().filter(status="paid").sum("amount"),
+                Order.objects().avg("amount"),
+            )
+
+        client.query.assert_awaited_once()
+        assert isinstance(orders[0], Order) and orders[0].amount == 5.0
+        assert paid == 7
+        assert revenue == 120.5
+        assert avg is None
+
+    async def test_variables_are_namespaced_per_item(self) -> None:
+        client = _client(_ok([{"count": 1}]), _ok([{"count": 2}]))
+        with _patch_client(client):
+            await batch(
+                Order.objects().filter(status="open").count(),
+                Order.objects().filter(status="paid").count(),
+            )
+
+        sql, variables = client.query.call_args[0]
+        assert "status = $_b0__f0" in sql
+        assert "status = $_b1__f0" in sql
+        assert variables == {"_b0__f0": "open", "_b1__f0": "paid"}
+
+    async def test_first_returns_instance_or_raises(self) -> None:
+        client = _client(_ok([{"id": "order:1", "status": "open", "amount": 1.0}]), _ok([]))
+        with _patch_client(client):
+            with pytest.raises(Order.DoesNotExist):
+                await batch(Order.objects().first(), Order.objects().filter(status="none").first())
+
+        sql = client.query.call_args[0][0]
+        assert sql.count("LIMIT 1") == 2
+
+    async def test_first_leaves_caller_queryset_unchanged(self) -> None:
+        client = _client(_ok([{"id": "order:1", "status": "open", "amount": 1.0}]))
+        qs = Order.objects().filter(status="open")
+        with _patch_client(client):
+            await batch(qs.first())
+
+        assert qs._limit is None
+
+    def test_batchable_methods_are_not_wrapped(self) -> None:
+        from src.surreal_orm.query_set import QuerySet
+
+        assert not hasattr(QuerySet.count, "__wrapped__")
+
+    async def test_aggregate_item(self) -> None:
+        client = _client(_ok([{"n": 4, "hi": 9.0}]))
+        with _patch_client(client):
+            (stats,) = await batch(Order.objects().aggregate(n=Count(), hi=Max("amount")))
+
+        assert stats == {"n": 4, "hi": 9.0}
+        assert "GROUP ALL" in client.query.call_args[0][0]
+
+    async def test_unsupported_call_rejected(self) -> None:
+        with pytest.raises(TypeError, match="cannot defer"):
+            await batch(Order.objects().bulk_delete())
+
+    async def test_non_queryset_rejected(self) -> None:
+        with pytest.raises(TypeError, match="must be QuerySets"):
+            await batch("SELECT * FROM order")  # type: ignore[arg-type]
+
+    async def test_items_are_deferred_from_their_queryset(self) -> None:
+        client = _client(_ok([{"total": 3.0}]))
+        qs = Order.objects().filter(status="paid")
+        with _patch_client(client):
+            (total,) = await batch(qs.sum(field="amount"))
+
+        assert total == 3.0
+        assert "math::sum(amount)" in client.query.call_args[0][0]
+
+    async def test_cached_items_are_not_sent(self) -> None:
+        records = [{"id": "order:1", "status": "open", "amount": 2.0}]
+        client = _client(_ok(records), _ok([{"count": 1}]))
+        with _patch_client(client):
+            first, _ = await batch(Order.objects().cache(ttl=60), Order.objects().cache(ttl=60).count())
+            client.query.reset_mock()
+            client.query.return_value = QueryResponse(results=[_ok([{"count": 3}])], raw=[])
+            again, count = await batch(Order.objects().cache(ttl=60), Order.objects().count())
+
+        assert again[0].id == first[0].id
+        assert count == 3
+        sql = client.query.call_args[0][0]
+        assert "count()" in sql and "SELECT * FROM order" not in sql
+
+
+class TestBatchErrors:
+    """Failed statements and deadlines surface as exceptions."""
+
+    async def test_failed_statement_raises(self) -> None:
+        client = _client(_ok([{"count": 1}]), QueryResult(status=ResponseStatus.ERR, result="Permission denied", time="1ms"))
+        with _patch_client(client):
+            with pytest.raises(SurrealDbError, match="Permission denied"):
+                await batch(Order.objects().count(), Order.objects().count())
+
+    async def test_missing_results_raise(self) -> None:
+        client = _client(_ok([{"count": 1}]))
+        with _patch_client(client):
+            with pytest.raises(SurrealDbError, match="Expected 2 statement result"):
+                await batch(Order.objects().count(), Order.objects().count())
+
+    async def test_item_timeout_bounds_the_request(self) -> None:
+        client = _client(_ok([{"count": 1}]), _ok([{"count": 2}]))
+        with _patch_client(client):
+            await batch(Order.objects().count(), Order.objects().timeout(5).count())
+
+        sql = client.query.call_args[0][0]
+        assert sql.count(" TIMEOUT ") == 2
+
+    async def test_server_timeout_raises(self) -> None:
+        timed_out = QueryResult(
+            status=ResponseStatus.ERR, result="The query was not executed because it exceeded the timeout", time="1ms"
+        )
+        client = _client(timed_out)
+        with _patch_client(client):
+            with pytest.raises(QueryTimeoutError):
+                await batch(Order.objects().timeout(1).count())
+
+    async def test_expired_deadline_is_not_sent(self) -> None:
+        client = _client(_ok([{"count": 1}]))
+        with _patch_client(client):
+            async with query_deadline(0.01):
+                await asyncio.sleep(0.02)
+                with pytest.raises(QueryTimeoutError):
+                    await batch(Order.objects().count())
+
+        client.query.assert_not_called()
@@ -0,0 +1,199 @@
+"""Unit tests for the BufferedWriter write-behind buffer."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm.buffered_writer import BufferedWriter
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict, SurrealDbError
+from src.surreal_orm.surreal_function import SurrealFunc
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Reading(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="reading")
+    id: str | None = None
+    sensor: str
+    value: float = 0.0
+
+
+def _client() -> AsyncMock:
+    """A client answering INSERT with generated ids and every UPSERT with OK."""
+
+    async def query(sql: str, variables: dict[str, Any]) -> QueryResponse:
+        results = []
+        for statement in sql.split("\n"):
+            if statement.startswith("INSERT"):
+                rows = variables["_w_rows"]
+                records = [{"id": f"reading:gen{i}", **row} for i, row in enumerate(rows)]
+                results.append(QueryResult(status=ResponseStatus.OK, result=records, time="1ms"))
+            elif "reading:bad" in statement:
+                results.append(QueryResult(status=ResponseStatus.ERR, result="denied", time="1ms"))
+            else:
+                results.append(QueryResult(status=ResponseStatus.OK, result=[], time="1ms"))
+        return QueryResponse(results=results, raw=[])
+
+    client = AsyncMock()
+    client.query = AsyncMock(side_effect=query)
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.buffered_writer.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+class TestBufferedWriter:
+    async def test_concurrent_saves_share_one_request(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with BufferedWriter(Reading, max_batch=100, max_delay_ms=10) as writer:
+                readings = [Reading(sensor=f"s{i}", value=i) for i in range(5)]
+                await asyncio.gather(*(writer.save(r) for r in readings))
+
+        client.query.assert_awaited_once()
+        assert client.query.call_args[0][0] == "INSERT INTO reading $_w_rows RETURN id;"
+        assert [r.get_id() for r in readings] == [f"gen{i}" for i in range(5)]
+
+    async def test_full_batch_is_sent_without_waiting(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            writer = BufferedWriter(Reading, max_batch=2, max_delay_ms=60_000)
+            await asyncio.wait_for(
+                asyncio.gather(writer.upsert("a", {"value": 1}), writer.upsert("b", {"value": 2})),
+                timeout=1,
+            )
+            await writer.close()
+
+        client.query.assert_awaited_once()
+
+    async def test_repeated_writes_collapse(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with BufferedWriter(Reading, max_delay_ms=10) as writer:
+                await asyncio.gather(
+                    writer.upsert("s1", {"value": 1.0}),
+                    writer.upsert("reading:s1", {"value": 2.0, "sensor": "s1"}),
+                )
+
+        sql, variables = client.query.call_args[0]
+        assert sql == "UPSERT reading:s1 SET value = $_w0__sv_value, sensor = $_w0__sv_sensor RETURN NONE;"
+        assert variables == {"_w0__sv_value": 2.0, "_w0__sv_sensor": "s1"}
+
+    async def test_expression_writes_are_not_merged(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with BufferedWriter(Reading, max_delay_ms=10) as writer:
+                await asyncio.gather(
+                    writer.upsert("a", {"value": SurrealFunc("value + 1")}),
+                    writer.upsert("a", {"value": SurrealFunc("value + 1")}),
+                    writer.upsert("a", {"sensor": "s1"}),
+                )
+
+        client.query.assert_awaited_once()
+        sql = client.query.call_args[0][0]
+        assert sql.split("\n") == [
+            "UPSERT reading:a SET value = value + 1 RETURN NONE;",
+            "UPSERT reading:a SET value = value + 1, sensor = $_w1__sv_sensor RETURN NONE;",
+        ]
+
+    async def test_expression_after_value_keeps_order(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with BufferedWriter(Reading, max_delay_ms=10) as writer:
+                await asyncio.gather(
+                    writer.upsert("a", {"value": 5}),
+                    writer.upsert("b", {"value": 1}),
+                    writer.upsert("a", {"value": SurrealFunc("value * 2")}),
+                )
+
+        statements = client.query.call_args[0][0].split("\n")
+        assert [statement.split(" SET ")[0] for statement in statements] == [
+            "UPSERT reading:a",
+            "UPSERT reading:b",
+            "UPSERT reading:a",
+        ]
+        assert statements[2] == "UPSERT reading:a SET value = value * 2 RETURN NONE;"
+
+    async def test_invalid_field_name_is_rejected_on_submit(self) -> None:
+        writer = BufferedWriter(Reading)
+        with pytest.raises(ValueError, match="field name"):
+            await writer.submit_upsert("a", {"value; DELETE reading": 1})
+        assert writer.pending == 0
+
+    async def test_build_failure_fails_every_caller(self) -> None:
+        client = _client()
+        with (
+            _patch_client(client),
+            patch.object(Reading, "_build_set_clause", side_effect=ValueError("boom")),
+        ):
+            writer = BufferedWriter(Reading, max_delay_ms=10)
+            first = await writer.submit_upsert("a", {"value": 1})
+            second = await writer.submit_upsert("b", {"value": 2})
+            await asyncio.wait_for(writer.close(), timeout=1)
+
+        client.query.assert_not_awaited()
+        for future in (first, second):
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+
+    async def test_failed_statement_fails_only_its_callers(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with BufferedWriter(Reading, max_delay_ms=10) as writer:
+                ok = await writer.submit_upsert("good", {"value": 1})
+                bad = await writer.submit_upsert("bad", {"value": 1})
+                await writer.flush()
+
+        assert ok.result() is None
+        with pytest.raises(SurrealDbError, match="denied"):
+            bad.result()
+
+    async def test_backpressure_waits_for_space(self) -> None:
+        client = _client()
+        release = asyncio.Event()
+        answer = client.query.side_effect
+
+        async def slow_query(sql: str, variables: dict[str, Any]) -> QueryResponse:
+            await release.wait()
+            return await answer(sql, variables)
+
+        client.query.side_effect = slow_query
+        with _patch_client(client):
+            writer = BufferedWriter(Reading, max_batch=1, max_pending=1, max_delay_ms=10)
+            await writer.submit_upsert("a", {"value": 1})  # sent at once, stuck in flight
+            await writer.submit_upsert("b", {"value": 1})  # fills the buffer
+            blocked = asyncio.create_task(writer.submit_upsert("c", {"value": 1}))
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+            release.set()
+            await asyncio.wait_for(blocked, timeout=1)
+            await writer.close()
+
+        assert client.query.await_count == 3
+
+    async def test_unchanged_instance_is_not_written(self) -> None:
+        client = _client()
+        reading = Reading.from_db({"id": "reading:r1", "sensor": "s1", "value": 1.0})
+        with _patch_client(client):
+            async with BufferedWriter(Reading) as writer:
+                await writer.save(reading)
+                reading.value = 2.0
+                await writer.save(reading)
+
+        client.query.assert_awaited_once()
+        assert client.query.call_args[0][0] == "UPSERT reading:r1 SET value = $_w0__sv_value RETURN NONE;"
+        assert not reading.is_dirty()
+
+    async def test_closed_writer_rejects_writes(self) -> None:
+        writer = BufferedWriter(Reading)
+        await writer.close()
+        with pytest.raises(SurrealDbError, match="closed"):
+            await writer.upsert("a", {"value": 1})
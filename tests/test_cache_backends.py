@@ -0,0 +1,168 @@
+"""Unit tests for shared QueryCache backends and cross-process invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm import signals
+from src.surreal_orm.cache import QueryCache
+from src.surreal_orm.cache_backends import CacheInvalidation, LocalCacheBackend
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_orm.record_cache import RecordCache, _RecordEntry
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Note(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="note")
+    id: str | None = None
+    text: str = ""
+
+
+@pytest.fixture
+def backend() -> Iterator[LocalCacheBackend]:
+    backend = LocalCacheBackend()
+    QueryCache.clear()
+    QueryCache.configure(backend=backend)
+    yield backend
+    QueryCache.configure()
+    QueryCache.clear()
+
+
+def _client() -> AsyncMock:
+    rows = [{"id": "note:a", "text": "hello"}]
+    client = AsyncMock()
+    client.query = AsyncMock(
+        return_value=QueryResponse(results=[QueryResult(status=ResponseStatus.OK, result=rows, time="1ms")], raw=[])
+    )
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.query_set.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+async def _drain() -> None:
+    await asyncio.gather(*QueryCache._broadcast_tasks)
+
+
+class TestSharedTier:
+    async def test_other_process_reads_shared_entry(self, backend: LocalCacheBackend) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Note.objects().cache().exec()
+            QueryCache.clear()  # a second process: empty local store, same backend
+            notes = await Note.objects().cache().exec()
+
+        client.query.assert_awaited_once()
+        assert isinstance(notes[0], Note)
+        assert notes[0].text == "hello"
+
+    async def test_invalidation_clears_shared_tier(self, backend: LocalCacheBackend) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Note.objects().cache().exec()
+            QueryCache.invalidate(Note)
+            await _drain()
+            QueryCache.clear()
+            await Note.objects().cache().exec()
+
+        assert client.query.await_count == 2
+
+    async def test_deletion_only_drops_shared_entries_containing_it(self, backend: LocalCacheBackend) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Note.objects().cache().exec()
+            note = Note.from_db({"id": "note:z"})
+            await signals.post_delete.send(sender=Note, instance=note, tx=None)
+            await _drain()
+            QueryCache.clear()
+            await Note.objects().cache().exec()
+            await signals.post_delete.send(sender=Note, instance=Note.from_db({"id": "note:a"}), tx=None)
+            await _drain()
+            QueryCache.clear()
+            await Note.objects().cache().exec()
+
+        assert client.query.await_count == 2
+
+    async def test_update_drops_the_shared_table(self, backend: LocalCacheBackend) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Note.objects().cache().exec()
+            note = Note.from_db({"id": "note:z"})
+            await signals.post_save.send(sender=Note, instance=note, created=False, tx=None)
+            await _drain()
+            QueryCache.clear()
+            await Note.objects().cache().exec()
+
+        assert client.query.await_count == 2
+
+    async def test_local_backend_invalidates_by_record(self) -> None:
+        backend = LocalCacheBackend()
+        await backend.set("with-a", b"1", "note", 60, frozenset({"a"}))
+        await backend.set("with-b", b"2", "note", 60, frozenset({"b"}))
+        await backend.set("unknown", b"3", "note", 60)
+
+        await backend.invalidate("note", ["a"])
+
+        assert await backend.get("with-a") is None
+        assert await backend.get("with-b") == b"2"
+        assert await backend.get("unknown") is None
+
+    async def test_backend_failure_falls_back_to_database(self, backend: LocalCacheBackend) -> None:
+        client = _client()
+        with patch.object(backend, "get", AsyncMock(side_effect=ConnectionError("down"))), _patch_client(client):
+            notes = await Note.objects().cache().exec()
+
+        assert notes[0].text == "hello"
+
+    async def test_result_racing_invalidation_not_shared(self, backend: LocalCacheBackend) -> None:
+        async def compute() -> Any:
+            QueryCache.invalidate(Note)
+            return [{"id": "note:a"}]
+
+        async def build(records: list[Any]) -> Any:
+            return records
+
+        await QueryCache.get_or_compute("k", compute, "note", build=build)
+        await _drain()
+        assert await backend.get("k") is None
+
+
+class TestBroadcast:
+    async def test_local_write_is_published(self, backend: LocalCacheBackend) -> None:
+        received: list[CacheInvalidation] = []
+        backend.subscribe(received.append)
+
+        await signals.post_save.send(sender=Note, instance=Note.from_db({"id": "note:a"}), created=False, tx=None)
+        await _drain()
+
+        assert set(received) == {CacheInvalidation(table="note", record_ids=("a",), origin=QueryCache._origin)}
+
+    async def test_remote_invalidation_evicts_local_entries(self, backend: LocalCacheBackend) -> None:
+        QueryCache.set("k", ["cached"], "note")
+        RecordCache._entries[RecordCache._key("default", "note", "a")] = _RecordEntry({"id": "note:a"}, time.monotonic() + 60)
+
+        await backend.publish(CacheInvalidation(table="note", record_ids=("a",), origin="worker-2"))
+
+        assert QueryCache.get("k") is None
+        assert RecordCache._key("default", "note", "a") not in RecordCache._entries
+
+    async def test_own_messages_are_ignored(self, backend: LocalCacheBackend) -> None:
+        QueryCache.set("k", ["cached"], "note")
+        await backend.publish(CacheInvalidation(table="note", origin=QueryCache._origin))
+
+        assert QueryCache.get("k") == ["cached"]
+
+    def test_message_round_trip(self) -> None:
+        message = CacheInvalidation(table="note", record_ids=("a", "b"), connection="replica", origin="p1")
+        assert CacheInvalidation.from_bytes(message.to_bytes()) == message
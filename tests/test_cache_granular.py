@@ -0,0 +1,169 @@
+"""Unit tests for record-granular QueryCache invalidation."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm import signals
+from src.surreal_orm.cache import QueryCache
+from src.surreal_orm.cache_backends import CacheInvalidation, LocalCacheBackend
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_orm.q import Q
+from src.surreal_orm.query_set import _filter_could_match
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Post(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="post")
+    id: str | None = None
+    status: str = "draft"
+    score: int = 0
+    tags: list[str] = []
+
+
+ROWS = [
+    {"id": "post:d1", "status": "draft", "score": 1, "tags": []},
+    {"id": "post:p1", "status": "published", "score": 5, "tags": ["db"]},
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_cache() -> Iterator[None]:
+    QueryCache.clear()
+    QueryCache.configure()
+    yield
+    QueryCache.configure()
+    QueryCache.clear()
+
+
+def _client() -> AsyncMock:
+    """A client evaluating only the ``status = $_f0`` filter."""
+
+    async def query(sql: str, variables: dict[str, Any]) -> QueryResponse:
+        rows = [r for r in ROWS if "_f0" not in variables or r["status"] == variables["_f0"]]
+        return QueryResponse(results=[QueryResult(status=ResponseStatus.OK, result=rows, time="1ms")], raw=[])
+
+    client = AsyncMock()
+    client.query = AsyncMock(side_effect=query)
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.query_set.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+async def _warm(*querysets: Any) -> None:
+    with _patch_client(_client()):
+        for qs in querysets:
+            await qs.exec()
+
+
+async def _saved(record: dict[str, Any]) -> None:
+    await signals.post_save.send(sender=Post, instance=Post.from_db(record), created=False, tx=None)
+
+
+class TestGranularInvalidation:
+    async def test_write_evicts_only_matching_entries(self) -> None:
+        await _warm(Post.objects().filter(status="draft").cache(), Post.objects().filter(status="published").cache())
+        assert QueryCache.stats()["entries"] == 2
+
+        await _saved({"id": "post:p2", "status": "published"})
+
+        assert QueryCache.stats()["entries"] == 1
+        assert len(QueryCache._table_keys["post"]) == 1
+
+    async def test_entry_containing_record_is_evicted(self) -> None:
+        await _warm(Post.objects().filter(status="published").cache())
+
+        # p1 no longer matches, but the cached result still contains it.
+        await _saved({"id": "post:p1", "status": "draft"})
+
+        assert QueryCache.stats()["entries"] == 0
+
+    async def test_delete_only_evicts_entries_containing_record(self) -> None:
+        await _warm(Post.objects().filter(status="draft").cache(), Post.objects().filter(status="published").cache())
+
+        await signals.post_delete.send(sender=Post, instance=Post.from_db({"id": "post:d1"}), tx=None)
+
+        assert QueryCache.stats()["entries"] == 1
+
+    async def test_complex_queries_fall_back_to_table_flush(self) -> None:
+        await _warm(
+            Post.objects().filter(Q(status="draft") | Q(score__gt=3)).cache(),
+            Post.objects().filter(status="draft").offset(1).cache(),
+        )
+
+        await _saved({"id": "post:x", "status": "archived", "score": 0})
+
+        assert QueryCache.stats()["entries"] == 0
+
+    async def test_partial_record_counts_as_possible_match(self) -> None:
+        await _warm(Post.objects().filter(status="draft").cache())
+
+        # Only "score" is known: the stored status could be "draft".
+        await _saved({"id": "post:x", "score": 3})
+
+        assert QueryCache.stats()["entries"] == 0
+
+    async def test_racing_write_only_blocks_affected_results(self) -> None:
+        async def build(records: list[Any]) -> Any:
+            return records
+
+        def compute_with_write(record: dict[str, Any]) -> Any:
+            async def compute() -> Any:
+                QueryCache.invalidate_record(Post, "post:p9", record)
+                return [{"id": "post:d1", "status": "draft"}]
+
+            return compute
+
+        def is_draft(record: dict[str, Any]) -> bool:
+            return _filter_could_match(record, "status", "exact", "draft")
+
+        await QueryCache.get_or_compute(
+            "a", compute_with_write({"status": "published"}), "post", build=build, predicate=is_draft
+        )
+        assert QueryCache.get("a") is not None
+
+        await QueryCache.get_or_compute("b", compute_with_write({"status": "draft"}), "post", build=build, predicate=is_draft)
+        assert QueryCache.get("b") is None
+
+    async def test_remote_delete_is_granular(self) -> None:
+        backend = LocalCacheBackend()
+        QueryCache.configure(backend=backend)
+        await _warm(Post.objects().filter(status="draft").cache(), Post.objects().filter(status="published").cache())
+
+        await backend.publish(CacheInvalidation(table="post", record_ids=("p1",), deleted=True, origin="worker-2"))
+        assert QueryCache.stats()["entries"] == 1
+
+        # A remote save carries no field values, so every entry may be affected.
+        await backend.publish(CacheInvalidation(table="post", record_ids=("zz",), origin="worker-2"))
+        assert QueryCache.stats()["entries"] == 0
+
+
+class TestFilterCouldMatch:
+    @pytest.mark.parametrize(
+        ("record", "field", "lookup", "value", "expected"),
+        [
+            ({"score": 5}, "score", "gt", 3, True),
+            ({"score": 1}, "score", "gt", 3, False),
+            ({"score": 1}, "score", "in", [2, 3], False),
+            ({"score": 1}, "score", "exact", "1", True),  # mismatched types: unsure
+            ({}, "score", "exact", 1, True),  # unknown field: unsure
+            ({"tags": ["db", "orm"]}, "tags", "containsany", ["x", "orm"], True),
+            ({"tags": ["db"]}, "tags", "contains", "orm", False),
+            ({"title": "Hello"}, "title", "istartswith", "he", True),
+            ({"meta": {"lang": "en"}}, "meta.lang", "exact", "fr", False),
+            ({"id": "p1"}, "id", "in", ["post:p1"], True),
+            ({"status": None}, "status", "isnull", False, False),
+        ],
+    )
+    def test_lookups(self, record: dict[str, Any], field: str, lookup: str, value: Any, expected: bool) -> None:
+        assert _filter_could_match(record, field, lookup, value) is expected
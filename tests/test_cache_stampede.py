@@ -0,0 +1,171 @@
+"""Unit tests for QueryCache single-flight, stale-while-revalidate and TTL jitter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm.cache import QueryCache
+from src.surreal_orm.deadline import query_deadline, remaining_time
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Article(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="article")
+    id: str | None = None
+    title: str = ""
+
+
+@pytest.fixture(autouse=True)
+def reset_cache() -> None:
+    QueryCache.clear()
+    QueryCache.configure()
+
+
+def _slow_client(titles: list[str]) -> AsyncMock:
+    """A client that answers after a short delay with the next title of ``titles``."""
+    answers = iter(titles)
+
+    async def query(sql: str, variables: dict[str, Any]) -> QueryResponse:
+        await asyncio.sleep(0.01)
+        rows = [{"id": "article:a", "title": next(answers)}]
+        return QueryResponse(results=[QueryResult(status=ResponseStatus.OK, result=rows, time="1ms")], raw=[])
+
+    client = AsyncMock()
+    client.query = AsyncMock(side_effect=query)
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.query_set.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+def _expire(key: str) -> None:
+    entry = QueryCache._cache[key]
+    entry.stale_until -= entry.expires_at - time.monotonic() + 1
+    entry.expires_at = time.monotonic() - 1
+
+
+class TestSingleFlight:
+    async def test_concurrent_misses_share_one_query(self) -> None:
+        client = _slow_client(["first", "second"])
+        with _patch_client(client):
+            results = await asyncio.gather(*(Article.objects().cache(ttl=60).exec() for _ in range(10)))
+
+        assert client.query.await_count == 1
+        assert all(r[0].title == "first" for r in results)
+        # Every caller gets its own objects.
+        assert len({id(r[0]) for r in results}) == 10
+
+    async def test_failure_reaches_every_waiter(self) -> None:
+        calls = 0
+
+        async def compute() -> Any:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(QueryCache.get_or_compute("k", compute, "t") for _ in range(3)), return_exceptions=True
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert QueryCache.stats()["inflight"] == 0
+
+    async def test_can_be_disabled(self) -> None:
+        QueryCache.configure(single_flight=False)
+        client = _slow_client(["a", "b", "c"])
+        with _patch_client(client):
+            await asyncio.gather(*(Article.objects().cache().exec() for _ in range(3)))
+
+        assert client.query.await_count == 3
+
+    async def test_result_racing_invalidation_is_not_stored(self) -> None:
+        async def compute() -> Any:
+            QueryCache.invalidate(Article)  # a write lands while the query runs
+            return ["old"]
+
+        assert await QueryCache.get_or_compute("k", compute, "article") == ["old"]
+        assert QueryCache.get("k") is None
+
+
+class TestStaleWhileRevalidate:
+    async def test_stale_entry_served_while_refreshing(self) -> None:
+        client = _slow_client(["v1", "v2"])
+        with _patch_client(client):
+            first = await Article.objects().cache(ttl=60, stale_ttl=30).exec()
+            key = next(iter(QueryCache._cache))
+            _expire(key)
+
+            stale = await asyncio.gather(*(Article.objects().cache(ttl=60, stale_ttl=30).exec() for _ in range(5)))
+            assert [r[0].title for r in stale] == ["v1"] * 5
+            await asyncio.gather(*QueryCache._refresh_tasks)
+            fresh = await Article.objects().cache(ttl=60, stale_ttl=30).exec()
+
+        assert first[0].title == "v1"
+        assert fresh[0].title == "v2"
+        assert client.query.await_count == 2
+
+    async def test_without_window_expired_entry_is_recomputed(self) -> None:
+        client = _slow_client(["v1", "v2"])
+        with _patch_client(client):
+            await Article.objects().cache(ttl=60).exec()
+            _expire(next(iter(QueryCache._cache)))
+            result = await Article.objects().cache(ttl=60).exec()
+
+        assert result[0].title == "v2"
+
+    async def test_failed_refresh_keeps_stale_entry(self) -> None:
+        QueryCache.set("k", ["v1"], "t", ttl=60, stale_ttl=30)
+        _expire("k")
+
+        async def failing() -> Any:
+            raise RuntimeError("db down")
+
+        assert await QueryCache.get_or_compute("k", failing, "t") == ["v1"]
+        await asyncio.gather(*QueryCache._refresh_tasks)
+        assert await QueryCache.get_or_compute("k", failing, "t") == ["v1"]
+
+    async def test_refresh_does_not_inherit_the_callers_deadline(self) -> None:
+        QueryCache.set("k", ["v1"], "t", ttl=60, stale_ttl=30)
+        _expire("k")
+        deadlines: list[float | None] = []
+
+        async def compute() -> Any:
+            deadlines.append(remaining_time())
+            return ["v2"]
+
+        async with query_deadline(5):
+            assert await QueryCache.get_or_compute("k", compute, "t") == ["v1"]
+        await asyncio.gather(*QueryCache._refresh_tasks)
+
+        assert deadlines == [None]
+        assert await QueryCache.get_or_compute("k", compute, "t") == ["v2"]
+
+
+class TestJitter:
+    def test_ttl_is_spread(self) -> None:
+        now = time.monotonic()
+        for i in range(50):
+            QueryCache.set(f"k{i}", i, "t", ttl=100, jitter=0.2)
+        lifetimes = [entry.expires_at - now for entry in QueryCache._cache.values()]
+
+        assert all(79 <= life <= 121 for life in lifetimes)
+        assert len({round(life) for life in lifetimes}) > 1
+
+    def test_invalid_jitter(self) -> None:
+        with pytest.raises(ValueError, match="jitter"):
+            QueryCache.configure(jitter=1.5)
+        with pytest.raises(ValueError, match="jitter"):
+            Article.objects().cache(jitter=-0.1)
@@ -0,0 +1,221 @@
+"""Unit tests for dirty-field tracking in BaseSurrealModel.save()."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pydantic import Field
+
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_orm.surreal_function import SurrealFunc
+from src.surreal_sdk.types import QueryResponse, QueryResult, RecordResponse, RecordsResponse, ResponseStatus
+
+
+class Profile(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="profile", server_fields=["updated_at"])
+    id: str | None = None
+    name: str
+    age: int = 0
+    tags: list[str] = Field(default_factory=list)
+    display: str = Field(default="", alias="display_name")
+    updated_at: str | None = None
+
+
+class UntrackedProfile(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="profile", track_changes=False)
+    id: str | None = None
+    name: str
+    age: int = 0
+
+
+def _client() -> AsyncMock:
+    client = AsyncMock()
+    client.merge = AsyncMock(return_value=RecordsResponse(records=[{"id": "profile:alice"}], raw=[]))
+    client.create = AsyncMock(return_value=RecordResponse(record={"id": "profile:new", "name": "Bob", "age": 3}, raw=None))
+    client.query = AsyncMock(
+        return_value=QueryResponse(
+            results=[QueryResult(status=ResponseStatus.OK, result=[{"id": "profile:alice"}], time="1ms")], raw=[]
+        )
+    )
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.model_base.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+def _loaded() -> Profile:
+    record = {"id": "profile:alice", "name": "Alice", "age": 30, "tags": ["a"], "display_name": "Al", "updated_at": "x"}
+    profile = Profile.from_db(record)
+    assert isinstance(profile, Profile)
+    return profile
+
+
+class TestDirtyFields:
+    def test_loaded_instance_is_clean(self) -> None:
+        profile = _loaded()
+        assert profile.get_dirty_fields() == {}
+        assert not profile.is_dirty()
+
+    def test_reassigning_same_value_is_clean(self) -> None:
+        profile = _loaded()
+        profile.name = "Alice"
+        assert "name" in profile.model_fields_set
+        assert not profile.is_dirty()
+
+    def test_changed_fields_reported_by_alias(self) -> None:
+        profile = _loaded()
+        profile.age = 31
+        profile.display = "Ally"
+        assert profile.get_dirty_fields() == {"age": 31, "display_name": "Ally"}
+
+    def test_nested_mutation_detected(self) -> None:
+        profile = _loaded()
+        profile.tags.append("b")
+        assert profile.get_dirty_fields() == {"tags": ["a", "b"]}
+
+    def test_server_fields_ignored(self) -> None:
+        profile = _loaded()
+        profile.updated_at = "y"
+        assert not profile.is_dirty()
+
+    def test_new_instance_reports_set_fields(self) -> None:
+        assert Profile(name="Bob").get_dirty_fields() == {"name": "Bob"}
+
+
+class TestSaveSendsOnlyChanges:
+    async def test_only_changed_fields_sent(self) -> None:
+        profile = _loaded()
+        profile.name = "Alice"
+        profile.age = 31
+        client = _client()
+        with _patch_client(client):
+            await profile.save()
+
+        client.merge.assert_awaited_once_with("profile:alice", {"age": 31})
+
+    async def test_unchanged_save_skips_request(self) -> None:
+        profile = _loaded()
+        profile.name = "Alice"
+        client = _client()
+        with _patch_client(client):
+            result = await profile.save()
+
+        assert result is profile
+        client.merge.assert_not_called()
+        client.query.assert_not_called()
+
+    async def test_second_save_is_noop(self) -> None:
+        profile = _loaded()
+        profile.age = 40
+        client = _client()
+        with _patch_client(client):
+            await profile.save()
+            await profile.save()
+
+        assert client.merge.await_count == 1
+
+    async def test_server_values_force_write(self) -> None:
+        profile = _loaded()
+        client = _client()
+        with _patch_client(client):
+            await profile.save(server_values={"updated_at_ping": SurrealFunc("time::now()")})
+
+        client.query.assert_awaited_once()
+        assert "updated_at_ping = time::now()" in client.query.call_args[0][0]
+
+    async def test_created_instance_becomes_clean(self) -> None:
+        profile = Profile(name="Bob", age=3)
+        client = _client()
+        with _patch_client(client):
+            await profile.save()
+
+        client.create.assert_awaited_once()
+        assert profile.id == "new"
+        assert not profile.is_dirty()
+
+    async def test_transaction_keeps_snapshot_until_commit(self) -> None:
+        profile = _loaded()
+        profile.age = 50
+        tx = MagicMock()
+        tx.defers_results = True
+        tx.merge = AsyncMock(return_value=RecordsResponse(records=[], raw=[]))
+
+        await profile.save(tx=tx)
+
+        tx.merge.assert_awaited_once_with("profile:alice", {"age": 50})
+        assert profile.get_dirty_fields() == {"age": 50}
+
+
+class TestPartialLoads:
+    def _partial(self) -> Profile:
+        profile = Profile.from_db({"id": "profile:alice", "name": "Alice"}, partial=True)
+        assert isinstance(profile, Profile)
+        return profile
+
+    def test_unloaded_fields_are_not_written_unless_set(self) -> None:
+        profile = self._partial()
+        assert profile.get_dirty_fields() == {}
+
+        profile.age = 0  # the default, but the stored value is unknown
+        assert profile.get_dirty_fields() == {"age": 0}
+
+    async def test_saved_unloaded_field_becomes_clean(self) -> None:
+        profile = self._partial()
+        profile.age = 0
+        client = _client()
+        with _patch_client(client):
+            await profile.save()
+            await profile.save()
+
+        client.merge.assert_awaited_once_with("profile:alice", {"age": 0})
+        assert profile.get_dirty_fields() == {}
+
+    async def test_select_loads_are_partial(self) -> None:
+        client = _client()
+        client.query = AsyncMock(
+            return_value=QueryResponse(
+                results=[QueryResult(status=ResponseStatus.OK, result=[{"id": "profile:bob", "name": "Bob"}], time="1ms")],
+                raw=[],
+            )
+        )
+        with patch(
+            "src.surreal_orm.query_set.SurrealDBConnectionManager.get_client", new_callable=AsyncMock, return_value=client
+        ):
+            [profile] = await Profile.objects().select("name").exec()
+
+        profile.tags = []
+        assert profile.get_dirty_fields() == {"tags": []}
+
+
+class TestMergeMirroring:
+    async def test_mirrored_values_are_clean(self) -> None:
+        profile = _loaded()
+        client = _client()
+        with _patch_client(client):
+            await profile.merge(returning="none", age=41)
+            assert profile.age == 41
+            assert profile.get_dirty_fields() == {}
+            await profile.save()
+
+        client.query.assert_awaited_once()
+        client.merge.assert_not_called()
+
+
+class TestTrackingDisabled:
+    async def test_set_fields_always_sent(self) -> None:
+        profile = UntrackedProfile.from_db({"id": "profile:alice", "name": "Alice", "age": 30})
+        assert isinstance(profile, UntrackedProfile)
+        profile.name = "Alice"
+        client = _client()
+        with _patch_client(client):
+            await profile.save()
+            await profile.save()
+
+        assert client.merge.await_count == 2
+        client.merge.assert_awaited_with("profile:alice", {"name": "Alice"})
@@ -0,0 +1,214 @@
+"""Unit tests for query timeouts and deadlines."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.surreal_orm import QueryTimeoutError, query_deadline
+from src.surreal_orm.connection_manager import SurrealDBConnectionManager
+from src.surreal_orm.deadline import check_timeout, remaining_time, timeout_clause, with_timeout
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Item(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="item")
+    id: str | None = None
+    name: str = ""
+
+
+def _response(*results: QueryResult) -> QueryResponse:
+    return QueryResponse(results=list(results), raw=[])
+
+
+def _ok(result: Any) -> QueryResult:
+    return QueryResult(status=ResponseStatus.OK, result=result, time="1ms")
+
+
+TIMED_OUT = QueryResult(
+    status=ResponseStatus.ERR, result="The query was not executed because it exceeded the timeout", time="1ms"
+)
+
+
+@pytest.fixture
+def client() -> Iterator[MagicMock]:
+    manager = SurrealDBConnectionManager
+    registries: list[dict[str, Any]] = [manager._configs, manager._clients]
+    saved = [dict(registry) for registry in registries]
+    manager._configs.clear()
+    manager._clients.clear()
+    manager.add_connection("default", url="http://localhost:8000", user="root", password="root", namespace="t", database="t")
+    mock = AsyncMock()
+    mock.is_connected = True
+    mock.in_flight = 0
+    mock.delay = 0.0
+    mock.response = _response(_ok([{"id": "item:a", "name": "a"}]))
+
+    async def query(*args: Any, **kwargs: Any) -> QueryResponse:
+        await asyncio.sleep(mock.delay)
+        return mock.response
+
+    mock.query = AsyncMock(side_effect=query)
+    manager._clients["default"] = mock
+    yield mock
+
+    for registry, values in zip(registries, saved, strict=True):
+        registry.clear()
+        registry.update(values)
+
+
+def _sql(client: MagicMock) -> str:
+    return str(client.query.call_args.args[0])
+
+
+class TestQueryDeadline:
+    async def test_sets_tightens_and_restores(self) -> None:
+        assert remaining_time() is None
+
+        async with query_deadline(10):
+            outer = remaining_time()
+            async with query_deadline(60):
+                assert remaining_time() == pytest.approx(outer, abs=0.1)
+            async with query_deadline(1):
+                assert remaining_time() == pytest.approx(1, abs=0.1)
+
+        assert remaining_time() is None
+
+    async def test_tasks_inherit_deadline(self) -> None:
+        async with query_deadline(5):
+            left = await asyncio.create_task(asyncio.sleep(0, remaining_time()))
+
+        assert left == pytest.approx(5, abs=0.1)
+
+    async def test_non_positive_raises(self) -> None:
+        with pytest.raises(ValueError):
+            async with query_deadline(0):
+                pass
+
+    async def test_timeout_clause(self) -> None:
+        assert timeout_clause() == ""
+        assert with_timeout("SELECT * FROM item;") == "SELECT * FROM item;"
+
+        async with query_deadline(1.5):
+            assert timeout_clause() in (" TIMEOUT 1500ms", " TIMEOUT 1499ms")
+            assert with_timeout("LET $a = 1; SELECT * FROM item;").startswith("LET $a = 1; SELECT * FROM item TIMEOUT 1")
+            assert with_timeout("SELECT * FROM item ;").endswith("ms;")
+
+    def test_check_timeout(self) -> None:
+        ok = _response(_ok([]))
+        assert check_timeout(ok) is ok
+
+        with pytest.raises(QueryTimeoutError, match="exceeded the timeout"):
+            check_timeout(_response(_ok([]), TIMED_OUT))
+
+    def test_is_query_timeout(self) -> None:
+        assert QueryTimeoutError.is_query_timeout("The query was not executed because it exceeded the timeout")
+        assert not QueryTimeoutError.is_query_timeout("Specify a namespace to use")
+
+
+class TestQuerySetTimeout:
+    async def test_no_timeout_by_default(self, client: MagicMock) -> None:
+        await Item.objects().exec()
+
+        assert "TIMEOUT" not in _sql(client)
+
+    async def test_exec_sends_timeout_clause(self, client: MagicMock) -> None:
+        items = await Item.objects().filter(name="a").timeout(5).exec()
+
+        assert items[0].name == "a"
+        assert _sql(client).endswith("ms;")
+        assert " TIMEOUT 4" in _sql(client) or " TIMEOUT 5000ms" in _sql(client)
+
+    async def test_count_sends_timeout_clause(self, client: MagicMock) -> None:
+        client.response = _response(_ok([{"count": 3}]))
+
+        assert await Item.objects().timeout(2).count() == 3
+        assert "GROUP ALL TIMEOUT " in _sql(client)
+
+    async def test_bulk_delete_count_places_timeout_inside(self, client: MagicMock) -> None:
+        client.response = _response(_ok(2))
+
+        assert await Item.objects().filter(name="a").timeout(2).bulk_delete() == 2
+        assert "RETURN VALUE id TIMEOUT " in _sql(client)
+        assert _sql(client).endswith("ms));")
+
+    async def test_bulk_upsert_bounds_every_statement(self, client: MagicMock) -> None:
+        client.response = _response(_ok([{"id": "item:a", "name": "a"}]), _ok([{"id": "item:b", "name": "b"}]))
+
+        await Item.objects().timeout(2).bulk_upsert([Item(id="a", name="a"), Item(id="b", name="b")])
+
+        assert _sql(client).count(" TIMEOUT ") == 2
+
+    async def test_invalid_timeout(self) -> None:
+        with pytest.raises(ValueError):
+            Item.objects().timeout(0)
+
+
+class TestDeadlinePropagation:
+    async def test_context_deadline_applies_to_queries(self, client: MagicMock) -> None:
+        async with query_deadline(3):
+            await Item.objects().exec()
+
+        assert " TIMEOUT " in _sql(client)
+
+    async def test_tighter_context_deadline_wins(self, client: MagicMock) -> None:
+        async with query_deadline(0.5):
+            await Item.objects().timeout(60).exec()
+
+        clause = _sql(client).rsplit(" TIMEOUT ", 1)[1]
+        assert int(clause.removesuffix("ms;")) <= 500
+
+    async def test_expired_deadline_is_not_sent(self, client: MagicMock) -> None:
+        async with query_deadline(0.01):
+            await asyncio.sleep(0.02)
+            with pytest.raises(QueryTimeoutError):
+                await Item.objects().exec()
+
+        client.query.assert_not_called()
+
+    async def test_server_timeout_raises(self, client: MagicMock) -> None:
+        client.response = _response(TIMED_OUT)
+
+        with pytest.raises(QueryTimeoutError):
+            await Item.objects().timeout(1).exec()
+
+
+class TestCancellation:
+    async def test_slow_query_is_cancelled(self, client: MagicMock) -> None:
+        client.delay = 5.0
+        started = time.monotonic()
+
+        with pytest.raises(QueryTimeoutError):
+            await Item.objects().timeout(0.05).exec()
+
+        assert time.monotonic() - started < 1.0
+
+    async def test_cancelling_caller_cancels_request(self, client: MagicMock) -> None:
+        client.delay = 5.0
+        sent = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def query(*args: Any, **kwargs: Any) -> QueryResponse:
+            sent.set()
+            try:
+                await asyncio.sleep(client.delay)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return client.response
+
+        client.query = AsyncMock(side_effect=query)
+        task = asyncio.create_task(Item.objects().exec())
+        await sent.wait()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert cancelled.is_set()
@@ -0,0 +1,190 @@
+"""Unit tests for the on-disk QueryCache tier."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm import signals
+from src.surreal_orm.cache import QueryCache
+from src.surreal_orm.disk_cache import DiskCacheTier
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Product(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="product")
+    id: str | None = None
+    kind: str = ""
+    name: str = ""
+
+
+ROWS = [
+    {"id": "product:a", "kind": "book", "name": "Dune"},
+    {"id": "product:b", "kind": "game", "name": "Go"},
+]
+
+
+@pytest.fixture
+def tier(tmp_path: Path) -> Iterator[DiskCacheTier]:
+    tier = DiskCacheTier(tmp_path / "cache.bin")
+    yield tier
+    tier.close()
+
+
+@pytest.fixture
+def spilling(tier: DiskCacheTier) -> Iterator[DiskCacheTier]:
+    QueryCache.clear()
+    QueryCache.configure(max_size=1, disk_tier=tier)
+    yield tier
+    QueryCache.configure()
+    QueryCache.clear()
+
+
+def _client() -> AsyncMock:
+    async def query(sql: str, variables: dict[str, Any]) -> QueryResponse:
+        rows = [r for r in ROWS if r["kind"] == variables.get("_f0")]
+        return QueryResponse(results=[QueryResult(status=ResponseStatus.OK, result=rows, time="1ms")], raw=[])
+
+    client = AsyncMock()
+    client.query = AsyncMock(side_effect=query)
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.query_set.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+class TestDiskCacheTier:
+    def test_round_trip(self, tier: DiskCacheTier) -> None:
+        tier.put("k", b"payload" * 100, "product", frozenset({"a"}), time.time() + 60)
+
+        assert tier.get("k") == b"payload" * 100
+        assert tier.stats()["bytes"] < 700  # compressed
+
+    def test_expired_entries_are_misses(self, tier: DiskCacheTier) -> None:
+        tier.put("k", b"v", "product", None, time.time() + 60)
+        tier._index["k"].expires_at = time.time() - 1
+
+        assert tier.get("k") is None
+        assert tier.stats()["entries"] == 0
+
+    def test_survives_reopen(self, tier: DiskCacheTier, tmp_path: Path) -> None:
+        tier.put("a", b"1", "product", frozenset({"a"}), time.time() + 60)
+        tier.put("b", b"2", "product", None, time.time() + 60)
+        tier.put("old", b"3", "product", None, time.time() + 0.01)
+        tier.discard("b")
+        tier.close()
+        time.sleep(0.02)
+
+        reopened = DiskCacheTier(tmp_path / "cache.bin")
+        try:
+            assert reopened.get("a") == b"1"
+            assert reopened.get("b") is None
+            assert reopened.get("old") is None
+            assert reopened.entries("product") == [("a", frozenset({"a"}), None)]
+        finally:
+            reopened.close()
+
+    def test_truncated_tail_is_dropped(self, tier: DiskCacheTier, tmp_path: Path) -> None:
+        tier.put("a", b"1", "product", None, time.time() + 60)
+        tier.close()
+        with open(tmp_path / "cache.bin", "ab") as f:
+            f.write(b"SQC1\x01partial")
+
+        reopened = DiskCacheTier(tmp_path / "cache.bin")
+        try:
+            assert reopened.get("a") == b"1"
+            assert reopened.stats()["file_bytes"] == reopened.stats()["bytes"]
+        finally:
+            reopened.close()
+
+    def test_oldest_entries_dropped_beyond_max_bytes(self, tmp_path: Path) -> None:
+        tier = DiskCacheTier(tmp_path / "small.bin", max_bytes=300, compression_level=0)
+        try:
+            for key in ("a", "b", "c"):
+                tier.put(key, b"x" * 100, "product", None, time.time() + 60)
+
+            assert tier.get("a") is None
+            assert tier.get("c") is not None
+            assert tier.stats()["bytes"] <= 300
+        finally:
+            tier.close()
+
+    def test_compaction_reclaims_dead_space(self, tier: DiskCacheTier, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("src.surreal_orm.disk_cache._COMPACT_MIN_BYTES", 0)
+        for i in range(20):
+            tier.put("k", str(i).encode() * 50, "product", None, time.time() + 60)
+
+        assert tier.stats()["file_bytes"] < 2 * tier.stats()["bytes"] + 100
+        assert tier.get("k") == b"19" * 50
+
+
+class TestSpilling:
+    async def test_evicted_entry_is_promoted_from_disk(self, spilling: DiskCacheTier) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Product.objects().filter(kind="book").cache().exec()
+            await Product.objects().filter(kind="game").cache().exec()  # spills "book"
+            books = await Product.objects().filter(kind="book").cache().exec()
+
+        assert client.query.await_count == 2
+        assert isinstance(books[0], Product)
+        assert books[0].name == "Dune"
+        stats = QueryCache.stats()
+        assert stats["disk"]["hits"] == 1
+        assert stats["memory"]["misses"] == 3
+
+    async def test_warm_start_from_previous_file(self, spilling: DiskCacheTier, tmp_path: Path) -> None:
+        with _patch_client(_client()):
+            await Product.objects().filter(kind="book").cache().exec()
+            await Product.objects().filter(kind="game").cache().exec()
+        spilling.close()
+
+        restarted = DiskCacheTier(tmp_path / "cache.bin")
+        QueryCache._cache.clear()
+        QueryCache._table_keys.clear()
+        QueryCache.configure(max_size=1, disk_tier=restarted)
+        client = _client()
+        try:
+            with _patch_client(client):
+                books = await Product.objects().filter(kind="book").cache().exec()
+        finally:
+            QueryCache.configure()
+            restarted.close()
+
+        client.query.assert_not_awaited()
+        assert books[0].name == "Dune"
+
+    async def test_write_evicts_spilled_entry(self, spilling: DiskCacheTier) -> None:
+        with _patch_client(_client()):
+            await Product.objects().filter(kind="book").cache().exec()
+            await Product.objects().filter(kind="game").cache().exec()
+
+        await signals.post_save.send(
+            sender=Product, instance=Product.from_db({"id": "product:c", "kind": "game"}), created=False, tx=None
+        )
+        assert spilling.stats()["entries"] == 1  # "book" cannot match
+
+        await signals.post_save.send(
+            sender=Product, instance=Product.from_db({"id": "product:a", "kind": "book"}), created=False, tx=None
+        )
+        assert spilling.stats()["entries"] == 0
+
+    async def test_table_invalidation_reaches_disk(self, spilling: DiskCacheTier) -> None:
+        with _patch_client(_client()):
+            await Product.objects().filter(kind="book").cache().exec()
+            await Product.objects().filter(kind="game").cache().exec()
+
+        QueryCache.invalidate(Product)
+
+        assert spilling.stats()["entries"] == 0
@@ -145,6 +145,15 @@ class TestJSONNoneStripping:
         result = _strip_none_values(data)
         assert result == {}
 
+    def test_strip_none_returns_unchanged_payload_as_is(self) -> None:
+        """Payloads without None values are not copied."""
+        data = {"user": {"name": "Alice", "tags": ["a", None]}, "items": ({"x": 1},)}
+        assert _strip_none_values(data) is data
+
+    def test_strip_none_inside_tuples(self) -> None:
+        """Dicts inside tuples are stripped and the tuple type is kept."""
+        assert _strip_none_values(({"a": None, "b": 1}, 2)) == ({"b": 1}, 2)
+
     def test_rpc_request_to_json_strips_none(self) -> None:
         """RPCRequest.to_json() should strip None from params."""
         request = RPCRequest(
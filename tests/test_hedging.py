@@ -0,0 +1,215 @@
+"""Unit tests for hedged reads."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.surreal_orm.connection_manager import SurrealDBConnectionManager
+from src.surreal_orm.hedging import HedgedReads
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+NAMES = ("default", "replica1", "replica2")
+
+
+class Item(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="item")
+    id: str | None = None
+    name: str = ""
+
+
+def _response(name: str) -> QueryResponse:
+    return QueryResponse(
+        results=[QueryResult(status=ResponseStatus.OK, result=[{"id": "item:a", "name": name}], time="1ms")], raw=[]
+    )
+
+
+def _client(name: str, delay: float = 0.0) -> MagicMock:
+    client = AsyncMock()
+    client.is_connected = True
+    client.in_flight = 0
+    client.delay = delay
+
+    async def query(*args: Any, **kwargs: Any) -> QueryResponse:
+        await asyncio.sleep(client.delay)
+        return _response(name)
+
+    client.query = AsyncMock(side_effect=query)
+    return client
+
+
+@pytest.fixture
+def clients() -> Iterator[dict[str, MagicMock]]:
+    manager = SurrealDBConnectionManager
+    registries: list[dict[str, Any]] = [manager._configs, manager._clients, manager._replicas, manager._read_your_writes]
+    saved = [dict(registry) for registry in registries]
+    manager._configs.clear()
+    manager._clients.clear()
+    for name in NAMES:
+        manager.add_connection(name, url="http://localhost:8000", user="root", password="root", namespace="t", database="t")
+        manager._clients[name] = _client(name)
+    HedgedReads.reset()
+    HedgedReads.configure(enabled=True, initial_delay=0.01, min_delay=0.0, budget=1.0)
+    yield {name: manager._clients[name] for name in NAMES}
+
+    HedgedReads.configure(enabled=False)
+    HedgedReads.reset()
+    for registry, values in zip(registries, saved, strict=True):
+        registry.clear()
+        registry.update(values)
+
+
+@pytest.fixture
+def policy() -> Iterator[type[HedgedReads]]:
+    HedgedReads.reset()
+    yield HedgedReads
+    HedgedReads.configure(enabled=False)
+    HedgedReads.reset()
+
+
+class TestHedging:
+    async def test_fast_read_is_not_hedged(self, clients: dict[str, MagicMock]) -> None:
+        items = await Item.objects().exec()
+
+        assert items[0].name == "default"
+        assert HedgedReads.stats()["hedged"] == 0
+        assert HedgedReads.stats()["reads"] == 1
+
+    async def test_slow_read_is_hedged_and_hedge_wins(self, clients: dict[str, MagicMock]) -> None:
+        slow = clients["default"]
+        slow.delay = 1.0
+
+        async def query(*args: Any, **kwargs: Any) -> QueryResponse:
+            # Only the first attempt is slow.
+            delay, slow.delay = slow.delay, 0.0
+            await asyncio.sleep(delay)
+            return _response("default")
+
+        slow.query = AsyncMock(side_effect=query)
+
+        items = await asyncio.wait_for(Item.objects().exec(), timeout=0.5)
+
+        assert items[0].name == "default"
+        assert slow.query.await_count == 2
+        stats = HedgedReads.stats()
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["win_rate"] == 1.0
+
+    async def test_lost_primary_is_sampled(self, clients: dict[str, MagicMock]) -> None:
+        SurrealDBConnectionManager.set_replicas("default", ["replica1", "replica2"])
+        clients["replica1"].delay = 1.0
+        clients["replica2"].in_flight = 1  # replica1 is picked first
+
+        await asyncio.wait_for(Item.objects().exec(), timeout=0.5)
+        await asyncio.sleep(0)  # let the cancelled primary finish
+
+        samples = sorted(HedgedReads._latencies["default"])
+        assert len(samples) == 2
+        assert samples[1] >= HedgedReads.delay("default")
+
+    async def test_hedge_goes_to_another_replica(self, clients: dict[str, MagicMock]) -> None:
+        SurrealDBConnectionManager.set_replicas("default", ["replica1", "replica2"])
+        clients["replica1"].delay = 1.0
+        clients["replica2"].in_flight = 1  # replica1 is picked first
+
+        items = await asyncio.wait_for(Item.objects().exec(), timeout=0.5)
+
+        assert items[0].name == "replica2"
+        assert clients["default"].query.await_count == 0
+        assert HedgedReads.stats()["hedge_wins"] == 1
+
+    async def test_budget_limits_hedges(self, clients: dict[str, MagicMock]) -> None:
+        HedgedReads.configure(enabled=True, initial_delay=0.001, min_delay=0.0, budget=0.0)
+        clients["default"].delay = 0.02
+
+        await Item.objects().exec()
+
+        stats = HedgedReads.stats()
+        assert stats["hedged"] == 0
+        assert stats["budget_denied"] == 1
+        assert clients["default"].query.await_count == 1
+
+    async def test_error_on_both_attempts_is_raised(self, clients: dict[str, MagicMock]) -> None:
+        async def fail(*args: Any, **kwargs: Any) -> QueryResponse:
+            await asyncio.sleep(0.02)
+            raise RuntimeError("boom")
+
+        clients["default"].query = AsyncMock(side_effect=fail)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await Item.objects().exec()
+
+
+class TestOptIn:
+    async def test_disabled_by_default(self, clients: dict[str, MagicMock]) -> None:
+        HedgedReads.configure(enabled=False)
+        clients["default"].delay = 0.03
+
+        await Item.objects().exec()
+
+        assert clients["default"].query.await_count == 1
+        assert HedgedReads.stats()["reads"] == 0
+
+    async def test_queryset_opt_out(self, clients: dict[str, MagicMock]) -> None:
+        clients["default"].delay = 0.03
+
+        await Item.objects().hedge(False).exec()
+
+        assert clients["default"].query.await_count == 1
+
+    async def test_queryset_opt_in(self, clients: dict[str, MagicMock]) -> None:
+        HedgedReads.configure(enabled=False, initial_delay=0.01, min_delay=0.0, budget=1.0)
+
+        await Item.objects().hedge().count()
+
+        assert HedgedReads.stats()["reads"] == 1
+
+
+class TestDelay:
+    def test_initial_delay_until_enough_samples(self, policy: type[HedgedReads]) -> None:
+        HedgedReads.configure(enabled=False, initial_delay=0.5, min_delay=0.0)
+        for _ in range(19):
+            HedgedReads._record("conn", 0.01)
+
+        assert HedgedReads.delay("conn") == 0.5
+
+    def test_percentile_of_recent_latencies(self, policy: type[HedgedReads]) -> None:
+        HedgedReads.configure(enabled=False, percentile=90, min_delay=0.0)
+        for i in range(1, 101):
+            HedgedReads._record("conn", i / 1000)
+
+        assert HedgedReads.delay("conn") == pytest.approx(0.091, abs=0.016)
+
+    def test_min_delay_floor(self, policy: type[HedgedReads]) -> None:
+        HedgedReads.configure(enabled=False, min_delay=0.02)
+        for _ in range(20):
+            HedgedReads._record("conn", 0.001)
+
+        assert HedgedReads.delay("conn") == 0.02
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"percentile": 0}, {"percentile": 101}, {"budget": 1.5}, {"min_delay": -1}, {"window": 0}],
+    )
+    def test_invalid_configuration(self, policy: type[HedgedReads], kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError):
+            HedgedReads.configure(**kwargs)
+
+
+class TestReplicaExclusion:
+    def test_exclude_picks_other_replica(self, clients: dict[str, MagicMock]) -> None:
+        SurrealDBConnectionManager.set_replicas("default", ["replica1", "replica2"])
+
+        for _ in range(3):
+            assert SurrealDBConnectionManager.get_read_connection_name("default", exclude="replica1") == "replica2"
+
+    def test_exclude_ignored_without_alternative(self, clients: dict[str, MagicMock]) -> None:
+        SurrealDBConnectionManager.set_replicas("default", ["replica1"])
+
+        assert SurrealDBConnectionManager.get_read_connection_name("default", exclude="replica1") == "replica1"
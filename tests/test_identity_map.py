@@ -0,0 +1,152 @@
+"""Unit tests for the request-scoped IdentityMap."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from src.surreal_orm.cache import QueryCache
+from src.surreal_orm.identity_map import IdentityMap
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_sdk.types import DeleteResponse, QueryResponse, QueryResult, RecordsResponse, ResponseStatus
+
+
+class Author(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="author")
+    id: str | None = None
+    name: str
+
+
+class Member(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="member")
+    id: str | None = None
+    name: str
+    age: int = 0
+
+
+class AuthorSummary(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="author")
+    id: str | None = None
+
+
+ALICE = {"id": "author:alice", "name": "Alice"}
+
+
+def _client() -> AsyncMock:
+    client = AsyncMock()
+    client.select = AsyncMock(return_value=RecordsResponse(records=[ALICE], raw=[ALICE]))
+    client.query = AsyncMock(
+        return_value=QueryResponse(results=[QueryResult(status=ResponseStatus.OK, result=[ALICE], time="1ms")], raw=[])
+    )
+    client.delete = AsyncMock(return_value=DeleteResponse(deleted=[ALICE], raw=[]))
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.connection_manager.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+class TestIdentityMap:
+    async def test_repeated_loads_share_instance(self) -> None:
+        async with IdentityMap() as identity:
+            first = Author.from_db(dict(ALICE))
+            second = Author.from_db(dict(ALICE))
+
+        assert first is second
+        assert identity.hits == 1
+        assert "author:alice" in identity
+
+    def test_inactive_map_creates_new_instances(self) -> None:
+        assert Author.from_db(dict(ALICE)) is not Author.from_db(dict(ALICE))
+
+    async def test_get_by_id_served_without_query(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with IdentityMap():
+                loaded = await Author.objects().filter(name="Alice").first()
+                again = await Author.objects().get(id="alice")
+                by_thing = await Author.objects().get("author:alice")
+
+        client.query.assert_awaited_once()
+        client.select.assert_not_called()
+        assert loaded is again is by_thing
+
+    async def test_loaded_instance_keeps_local_changes(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with IdentityMap():
+                author = await Author.objects().get("alice")
+                author.name = "Changed"
+                reloaded = await Author.objects().filter(name="Alice").exec()
+
+        assert reloaded[0] is author
+        assert author.name == "Changed"
+
+    async def test_other_model_on_same_table_not_shared(self) -> None:
+        async with IdentityMap():
+            author = Author.from_db(dict(ALICE))
+            summary = AuthorSummary.from_db(dict(ALICE))
+
+        assert isinstance(summary, AuthorSummary)
+        assert summary is not author
+
+    async def test_delete_discards_instance(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with IdentityMap() as identity:
+                author = await Author.objects().get("alice")
+                await author.delete()
+                assert len(identity) == 0
+                await Author.objects().get("alice")
+
+        assert client.select.await_count == 2
+
+    async def test_maps_are_isolated_per_task(self) -> None:
+        async def load() -> Any:
+            async with IdentityMap():
+                return Author.from_db(dict(ALICE))
+
+        first, second = await asyncio.gather(load(), load())
+        assert first is not second
+
+    async def test_partial_load_is_not_served_by_get(self) -> None:
+        client = _client()
+        client.query.return_value = QueryResponse(
+            results=[QueryResult(status=ResponseStatus.OK, result=[{"id": "member:a", "name": "A"}], time="1ms")], raw=[]
+        )
+        client.select.return_value = RecordsResponse(records=[{"id": "member:a", "name": "A", "age": 42}], raw=[])
+        with _patch_client(client):
+            async with IdentityMap() as identity:
+                [partial] = await Member.objects().select("id", "name").exec()
+                assert len(identity) == 0
+                full = await Member.objects().get("a")
+                again = await Member.objects().get("a")
+
+        client.select.assert_awaited_once()
+        assert full is not partial
+        assert full.age == 42
+        assert again is full
+
+    async def test_cached_result_excludes_unsaved_changes(self) -> None:
+        QueryCache.clear()
+        QueryCache.configure(enabled=True)
+        client = _client()
+        try:
+            with _patch_client(client):
+                async with IdentityMap():
+                    [author] = await Author.objects().cache(ttl=60).exec()
+                    author.name = "UNSAVED"
+                    [same] = await Author.objects().cache(ttl=60).exec()
+                async with IdentityMap():
+                    [other] = await Author.objects().cache(ttl=60).exec()
+        finally:
+            QueryCache.clear()
+
+        client.query.assert_awaited_once()
+        assert same is author
+        assert other.name == "Alice"
@@ -0,0 +1,145 @@
+"""Unit tests for QuerySet.in_bulk()."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm import QueryTimeoutError, query_deadline
+from src.surreal_orm.identity_map import IdentityMap
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_orm.record_cache import RecordCache
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Account(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="account")
+    id: str | None = None
+    name: str
+    active: bool = True
+
+
+def _client() -> AsyncMock:
+    """A client answering each SELECT with records for the ids it names."""
+
+    async def query(sql: str, variables: dict[str, Any]) -> QueryResponse:
+        listed = sql[sql.index("[") + 1 : sql.index("]")].split(", ")
+        records = [
+            {"id": thing, "name": thing.split(":", 1)[1].strip("`"), "active": True}
+            for thing in listed
+            if "missing" not in thing
+        ]
+        return QueryResponse(results=[QueryResult(status=ResponseStatus.OK, result=records, time="1ms")], raw=[])
+
+    client = AsyncMock()
+    client.query = AsyncMock(side_effect=query)
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.query_set.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+class TestInBulk:
+    async def test_direct_record_lookup(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            found = await Account.objects().in_bulk(["alice", "account:bob", "missing", "alice"])
+
+        sql = client.query.call_args[0][0]
+        assert sql == "SELECT * FROM [account:alice, account:bob, account:missing];"
+        assert set(found) == {"alice", "bob"}
+        assert isinstance(found["bob"], Account)
+        assert found["bob"].name == "bob"
+
+    async def test_chunks_run_concurrently(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            found = await Account.objects().in_bulk([f"a{i}" for i in range(5)], chunk_size=2)
+
+        assert client.query.await_count == 3
+        assert len(found) == 5
+
+    async def test_ids_are_escaped(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Account.objects().in_bulk(["7abc", "with-dash"])
+
+        assert "[account:`7abc`, account:`with-dash`]" in client.query.call_args[0][0]
+
+    async def test_filters_are_applied(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Account.objects().filter(active=True).in_bulk(["alice"])
+
+        sql, variables = client.query.call_args[0]
+        assert sql == "SELECT * FROM [account:alice] WHERE active = $_f0;"
+        assert variables == {"_f0": True}
+
+    async def test_empty_ids(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            assert await Account.objects().in_bulk([]) == {}
+        client.query.assert_not_called()
+
+    async def test_invalid_chunk_size(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            await Account.objects().in_bulk(["a"], chunk_size=0)
+
+    async def test_identity_map_hits_are_not_queried(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with IdentityMap():
+                alice = Account.from_db({"id": "account:alice", "name": "alice"})
+                found = await Account.objects().in_bulk(["alice", "bob"])
+
+        assert found["alice"] is alice
+        assert client.query.call_args[0][0] == "SELECT * FROM [account:bob];"
+
+    async def test_reads_through_record_cache(self) -> None:
+        RecordCache.configure(enabled=True, models=[Account], live_invalidation=False)
+        try:
+            client = _client()
+            with _patch_client(client):
+                await Account.objects().in_bulk(["alice", "bob"])
+                found = await Account.objects().in_bulk(["alice", "bob", "carol"])
+        finally:
+            await RecordCache.stop()
+            RecordCache.configure(enabled=False)
+
+        assert set(found) == {"alice", "bob", "carol"}
+        assert client.query.call_args[0][0] == "SELECT * FROM [account:carol];"
+
+    async def test_select_and_fetch_shape_the_query(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with IdentityMap():
+                Account.from_db({"id": "account:alice", "name": "alice"})
+                found = await Account.objects().select("name").fetch("owner").in_bulk(["alice"])
+
+        assert client.query.call_args[0][0] == "SELECT id, name FROM [account:alice] FETCH owner;"
+        assert found["alice"].name == "alice"
+
+    async def test_timeout_is_sent(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Account.objects().timeout(5).in_bulk(["alice"])
+
+        assert " TIMEOUT " in client.query.call_args[0][0]
+
+    async def test_expired_deadline_raises(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with query_deadline(0.01):
+                await asyncio.sleep(0.02)
+                with pytest.raises(QueryTimeoutError):
+                    await Account.objects().in_bulk(["alice"])
+
+        client.query.assert_not_called()
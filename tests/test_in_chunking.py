@@ -0,0 +1,161 @@
+"""Unit tests for automatic chunking of oversized ``__in`` / ``__not_in`` filters."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from src.surreal_orm.aggregations import Avg, Count, Max, Min, Sum
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Item(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="item", in_chunk_size=3)
+    id: str | None = None
+    code: int
+    rank: int = 0
+
+
+class Unchunked(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="unchunked")
+    id: str | None = None
+    code: int
+
+
+ROWS = [{"id": f"item:i{code}", "code": code, "rank": (code * 7) % 10} for code in range(10)]
+
+
+def _client() -> AsyncMock:
+    """A client evaluating the IN / NOT IN variable, ORDER BY / LIMIT and GROUP ALL aggregates of each query."""
+
+    async def query(sql: str, variables: dict[str, Any]) -> QueryResponse:
+        codes = variables["_f0"]
+        if "NOT IN" in sql:
+            rows = [r for r in ROWS if r["code"] not in codes]
+        else:
+            rows = [r for r in ROWS if r["code"] in codes]
+        if "ORDER BY rank DESC" in sql:
+            rows.sort(key=lambda r: r["rank"], reverse=True)
+        if " LIMIT " in sql:
+            rows = rows[: int(sql.split(" LIMIT ")[1].split()[0].rstrip(";"))]
+        if "GROUP ALL" in sql:
+            functions = {"sum": sum, "min": min, "max": max, "mean": lambda v: sum(v) / len(v)}
+            group: dict[str, Any] = {}
+            for expr, function, field, alias in re.findall(r"(count\(\)|math::(\w+)\((\w+)\)) AS (\w+)", sql):
+                values = [r[field] for r in rows] if field else []
+                group[alias] = len(rows) if expr == "count()" else functions[function](values) if values else None
+            if sql.startswith("SELECT count() FROM"):
+                group["count"] = len(rows)
+            rows = [group] if rows else []
+        return QueryResponse(results=[QueryResult(status=ResponseStatus.OK, result=rows, time="1ms")], raw=[])
+
+    client = AsyncMock()
+    client.query = AsyncMock(side_effect=query)
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.query_set.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+class TestInChunking:
+    async def test_small_list_is_one_query(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            items = await Item.objects().filter(code__in=[1, 2, 3]).exec()
+
+        assert client.query.await_count == 1
+        assert [i.code for i in items] == [1, 2, 3]
+
+    async def test_large_in_list_is_split(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            items = await Item.objects().filter(code__in=[1, 2, 3, 4, 5, 6, 7, 2]).exec()
+
+        chunks = [call.args[1]["_f0"] for call in client.query.call_args_list]
+        assert chunks == [[1, 2, 3], [4, 5, 6], [7]]
+        assert sorted(i.code for i in items) == [1, 2, 3, 4, 5, 6, 7]
+
+    async def test_order_and_limit_preserved(self) -> None:
+        client = _client()
+        codes = list(range(10))
+        with _patch_client(client):
+            items = await Item.objects().filter(code__in=codes).order_by("-rank").offset(1).limit(3).exec()
+
+        expected = sorted(ROWS, key=lambda r: r["rank"], reverse=True)[1:4]
+        assert [i.code for i in items] == [r["code"] for r in expected]
+        for call in client.query.call_args_list:
+            assert "LIMIT 4" in call.args[0]
+            assert "START" not in call.args[0]
+
+    async def test_not_in_list_is_not_split(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            items = await Item.objects().filter(code__not_in=[0, 1, 2, 3, 4, 5, 6]).order_by("-rank").limit(2).exec()
+
+        remaining = sorted((r for r in ROWS if r["code"] > 6), key=lambda r: r["rank"], reverse=True)
+        assert client.query.await_count == 1
+        assert [i.code for i in items] == [r["code"] for r in remaining[:2]]
+
+    async def test_other_filters_kept_in_every_chunk(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Item.objects().filter(code__in=list(range(6)), rank__gte=0).exec()
+
+        for call in client.query.call_args_list:
+            assert call.args[0] == "SELECT * FROM item WHERE code IN $_f0 AND rank >= $_f1;"
+            assert call.args[1]["_f1"] == 0
+
+    async def test_count_adds_chunk_counts(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            total = await Item.objects().filter(code__in=[1, 2, 3, 4, 5, 6, 7]).count()
+
+        assert client.query.await_count == 3
+        assert total == 7
+
+    async def test_scalar_aggregates_combine_chunks(self) -> None:
+        client = _client()
+        codes = [1, 2, 3, 4, 5, 6, 7]
+        ranks = [r["rank"] for r in ROWS if r["code"] in codes]
+        with _patch_client(client):
+            assert await Item.objects().filter(code__in=codes).sum("rank") == sum(ranks)
+            assert await Item.objects().filter(code__in=codes).min("rank") == min(ranks)
+            assert await Item.objects().filter(code__in=codes).max("rank") == max(ranks)
+
+        assert client.query.await_count == 9
+
+    async def test_avg_sends_list_whole(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Item.objects().filter(code__in=[1, 2, 3, 4, 5, 6, 7]).avg("rank")
+            await Item.objects().filter(code__in=[1, 2, 3, 4, 5, 6, 7]).aggregate(a=Avg("rank"))
+
+        assert client.query.await_count == 2
+
+    async def test_aggregate_combines_chunks(self) -> None:
+        client = _client()
+        codes = [1, 2, 3, 4, 5, 6, 7]
+        ranks = [r["rank"] for r in ROWS if r["code"] in codes]
+        with _patch_client(client):
+            stats = (
+                await Item.objects()
+                .filter(code__in=codes)
+                .aggregate(n=Count(), total=Sum("rank"), lo=Min("rank"), hi=Max("rank"))
+            )
+
+        assert client.query.await_count == 3
+        assert stats == {"n": 7, "total": sum(ranks), "lo": min(ranks), "hi": max(ranks)}
+
+    async def test_chunking_is_opt_in(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            await Unchunked.objects().filter(code__in=list(range(50_000))).exec()
+
+        assert client.query.await_count == 1
@@ -13,6 +13,7 @@ import pytest
 
 from surreal_orm.connection_config import ConnectionConfig
 from surreal_orm.connection_manager import SurrealDBConnectionManager
+from surreal_sdk import AdaptiveLimiter, HTTPConnection
 
 # ---------------------------------------------------------------------------
 # Fixture: clean registry before each test
@@ -26,11 +27,13 @@ def _clean_registry():
     saved_configs = dict(SurrealDBConnectionManager._configs)
     saved_clients = dict(SurrealDBConnectionManager._clients)
     saved_ws_clients = dict(SurrealDBConnectionManager._ws_clients)
+    saved_limiters = dict(SurrealDBConnectionManager._limiters)
 
     # Clear
     SurrealDBConnectionManager._configs.clear()
     SurrealDBConnectionManager._clients.clear()
     SurrealDBConnectionManager._ws_clients.clear()
+    SurrealDBConnectionManager._limiters.clear()
     SurrealDBConnectionManager._clear_legacy_vars()
 
     yield
@@ -44,6 +47,8 @@ def _clean_registry():
     SurrealDBConnectionManager._configs.update(saved_configs)
     SurrealDBConnectionManager._clients.update(saved_clients)
     SurrealDBConnectionManager._ws_clients.update(saved_ws_clients)
+    SurrealDBConnectionManager._limiters.clear()
+    SurrealDBConnectionManager._limiters.update(saved_limiters)
     # Re-sync legacy vars if default was in saved configs
     if "default" in saved_configs:
         SurrealDBConnectionManager._sync_legacy_vars(saved_configs["default"])
@@ -381,6 +386,50 @@ class TestGetClientErrors:
             await SurrealDBConnectionManager.get_ws_client("nonexistent")
 
 
+# ===========================================================================
+# Concurrency limits
+# ===========================================================================
+
+
+class TestConcurrencyLimit:
+    def _add(self, name: str = "default") -> None:
+        SurrealDBConnectionManager.add_connection(
+            name, url="http://localhost:8000", user="root", password="root", namespace="ns", database="db"
+        )
+
+    def test_unknown_connection_raises(self):
+        with pytest.raises(ValueError, match="Unknown connection"):
+            SurrealDBConnectionManager.set_concurrency_limit("nonexistent", AdaptiveLimiter())
+
+    def test_set_and_remove(self):
+        self._add()
+        limiter = AdaptiveLimiter()
+        SurrealDBConnectionManager.set_concurrency_limit("default", limiter)
+        assert SurrealDBConnectionManager.get_concurrency_limit() is limiter
+
+        SurrealDBConnectionManager.set_concurrency_limit("default", None)
+        assert SurrealDBConnectionManager.get_concurrency_limit() is None
+
+    def test_applies_to_existing_client(self):
+        self._add()
+        client = HTTPConnection("http://localhost:8000", "ns", "db")
+        SurrealDBConnectionManager._clients["default"] = client
+        limiter = AdaptiveLimiter()
+
+        SurrealDBConnectionManager.set_concurrency_limit("default", limiter)
+
+        assert client.limiter is limiter
+
+    @pytest.mark.asyncio
+    async def test_removed_with_connection(self):
+        self._add("analytics")
+        SurrealDBConnectionManager.set_concurrency_limit("analytics", AdaptiveLimiter())
+
+        await SurrealDBConnectionManager.remove_connection("analytics")
+
+        assert SurrealDBConnectionManager.get_concurrency_limit("analytics") is None
+
+
 # ===========================================================================
 # Legacy individual setters
 # ===========================================================================
@@ -0,0 +1,165 @@
+"""Unit tests for read-replica routing with read-your-writes consistency."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.surreal_orm.connection_manager import SurrealDBConnectionManager
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_sdk import HTTPConnection
+from src.surreal_sdk.protocol.rpc import RPCRequest, RPCResponse
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+NAMES = ("default", "replica1", "replica2")
+
+
+class Item(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="item")
+    id: str | None = None
+    name: str = ""
+
+
+def _client() -> MagicMock:
+    client = AsyncMock()
+    client.is_connected = True
+    client.in_flight = 0
+    client.query = AsyncMock(
+        return_value=QueryResponse(
+            results=[QueryResult(status=ResponseStatus.OK, result=[{"id": "item:a", "name": "a"}], time="1ms")], raw=[]
+        )
+    )
+    return client
+
+
+@pytest.fixture
+def clients() -> Iterator[dict[str, MagicMock]]:
+    manager = SurrealDBConnectionManager
+    registries: list[dict[str, Any]] = [manager._configs, manager._clients, manager._replicas, manager._read_your_writes]
+    saved = [dict(registry) for registry in registries]
+    manager._configs.clear()
+    manager._clients.clear()
+    for name in NAMES:
+        manager.add_connection(name, url="http://localhost:8000", user="root", password="root", namespace="t", database="t")
+        manager._clients[name] = _client()
+    manager.set_replicas("default", ["replica1", "replica2"])
+    yield {name: manager._clients[name] for name in NAMES}
+
+    for registry, values in zip(registries, saved, strict=True):
+        registry.clear()
+        registry.update(values)
+
+
+def _queried(clients: dict[str, MagicMock]) -> list[str]:
+    return [name for name, client in clients.items() if client.query.await_count]
+
+
+class TestReadRouting:
+    async def test_reads_go_to_replicas(self, clients: dict[str, MagicMock]) -> None:
+        items = await Item.objects().exec()
+
+        assert items[0].name == "a"
+        assert clients["default"].query.await_count == 0
+        assert len(_queried(clients)) == 1
+
+    async def test_least_outstanding_replica_is_chosen(self, clients: dict[str, MagicMock]) -> None:
+        clients["replica1"].in_flight = 3
+        for _ in range(4):
+            await Item.objects().filter(name="a").exec()
+
+        assert _queried(clients) == ["replica2"]
+
+    async def test_idle_replicas_share_reads(self, clients: dict[str, MagicMock]) -> None:
+        await Item.objects().exec()
+        await Item.objects().exec()
+
+        assert _queried(clients) == ["replica1", "replica2"]
+
+    async def test_connection_without_replicas_is_unchanged(self, clients: dict[str, MagicMock]) -> None:
+        assert SurrealDBConnectionManager.get_read_connection_name("replica1") == "replica1"
+
+
+class TestReadYourWrites:
+    async def test_reads_stick_to_primary_after_write(self, clients: dict[str, MagicMock]) -> None:
+        SurrealDBConnectionManager.set_replicas("default", ["replica1", "replica2"], read_your_writes=0.05)
+        await Item(id="a", name="a").save()
+
+        await Item.objects().exec()
+        assert _queried(clients) == ["default"]
+
+        await asyncio.sleep(0.06)
+        assert SurrealDBConnectionManager.get_read_connection_name("default") != "default"
+
+    async def test_window_starts_when_write_completes(self, clients: dict[str, MagicMock]) -> None:
+        SurrealDBConnectionManager.set_replicas("default", ["replica1", "replica2"], read_your_writes=0.05)
+
+        async def slow_upsert(*args: Any) -> None:
+            await asyncio.sleep(0.06)
+
+        clients["default"].upsert = AsyncMock(side_effect=slow_upsert)
+        await Item(id="a", name="a").save()
+
+        assert SurrealDBConnectionManager.get_read_connection_name("default") == "default"
+
+    async def test_committed_transaction_starts_window(self, clients: dict[str, MagicMock]) -> None:
+        async with await SurrealDBConnectionManager.transaction() as tx:
+            await Item(id="a", name="a").save(tx=tx)
+            assert SurrealDBConnectionManager.get_read_connection_name() != "default"
+
+        assert SurrealDBConnectionManager.get_read_connection_name() == "default"
+
+    async def test_window_is_per_context(self, clients: dict[str, MagicMock]) -> None:
+        await asyncio.create_task(Item(id="a", name="a").save())
+
+        assert SurrealDBConnectionManager.get_read_connection_name() != "default"
+
+    async def test_reads_do_not_start_window(self, clients: dict[str, MagicMock]) -> None:
+        await SurrealDBConnectionManager.get_read_client("default")
+
+        assert SurrealDBConnectionManager.get_read_connection_name() != "default"
+
+    async def test_raw_queries_do_not_start_window(self, clients: dict[str, MagicMock]) -> None:
+        await Item.raw_query("SELECT * FROM item")
+
+        assert SurrealDBConnectionManager.get_read_connection_name() != "default"
+
+
+class TestConfiguration:
+    def test_unknown_connection_raises(self, clients: dict[str, MagicMock]) -> None:
+        with pytest.raises(ValueError, match="Unknown connection"):
+            SurrealDBConnectionManager.set_replicas("default", ["missing"])
+
+    def test_negative_window_raises(self, clients: dict[str, MagicMock]) -> None:
+        with pytest.raises(ValueError):
+            SurrealDBConnectionManager.set_replicas("default", ["replica1"], read_your_writes=-1)
+
+    def test_empty_list_disables_routing(self, clients: dict[str, MagicMock]) -> None:
+        SurrealDBConnectionManager.set_replicas("default", [])
+
+        assert SurrealDBConnectionManager.get_replicas() == ()
+        assert SurrealDBConnectionManager.get_read_connection_name() == "default"
+
+    async def test_removed_replica_leaves_rotation(self, clients: dict[str, MagicMock]) -> None:
+        await SurrealDBConnectionManager.remove_connection("replica1")
+
+        assert SurrealDBConnectionManager.get_replicas() == ("replica2",)
+
+
+class TestInFlightCounter:
+    async def test_rpc_counts_requests_in_flight(self) -> None:
+        connection = HTTPConnection("http://localhost:8000", "t", "t")
+        seen: list[int] = []
+
+        async def send(request: RPCRequest) -> Any:
+            seen.append(connection.in_flight)
+            return RPCResponse(id=request.id, result="ok")
+
+        connection._send_rpc = send  # type: ignore[method-assign]
+        await connection.rpc("ping")
+
+        assert seen == [1]
+        assert connection.in_flight == 0
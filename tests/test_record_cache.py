@@ -0,0 +1,210 @@
+"""Unit tests for the RecordCache second-level cache."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict
+from src.surreal_orm.record_cache import RecordCache
+from src.surreal_sdk.types import QueryResponse, QueryResult, RecordsResponse, ResponseStatus
+
+
+class Product(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="product")
+    id: str | None = None
+    name: str
+    price: float = 0.0
+
+
+class Review(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="review")
+    id: str | None = None
+    text: str
+
+
+LAMP = {"id": "product:lamp", "name": "Lamp", "price": 20.0}
+
+
+def _client() -> AsyncMock:
+    client = AsyncMock()
+    client.select = AsyncMock(return_value=RecordsResponse(records=[dict(LAMP)], raw=[]))
+    client.merge = AsyncMock(return_value=RecordsResponse(records=[dict(LAMP)], raw=[]))
+    return client
+
+
+def _ws() -> MagicMock:
+    """A WebSocket stand-in accepting LIVE SELECT queries."""
+    ws = MagicMock()
+    ws._live_callbacks = {}
+    ws.query = AsyncMock(
+        return_value=QueryResponse(
+            results=[QueryResult(status=ResponseStatus.OK, result="live-1", time="1ms")],
+            raw=[],
+        )
+    )
+    ws.kill = AsyncMock()
+    return ws
+
+
+def _patch_clients(client: AsyncMock, ws: Any) -> Any:
+    manager = "src.surreal_orm.connection_manager.SurrealDBConnectionManager"
+    get_ws = AsyncMock(return_value=ws) if not isinstance(ws, Exception) else AsyncMock(side_effect=ws)
+    return (
+        patch(f"{manager}.get_client", new_callable=AsyncMock, return_value=client),
+        patch(f"{manager}.get_ws_client", get_ws),
+    )
+
+
+@pytest.fixture(autouse=True)
+async def _reset_cache() -> Any:
+    RecordCache.configure(enabled=True, default_ttl=60, models=[Product])
+    yield
+    await RecordCache.stop()
+    RecordCache.configure(enabled=False)
+
+
+async def _settle() -> None:
+    """Let the background watcher tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _notify(ws: MagicMock, action: str, record: dict[str, Any]) -> None:
+    await _settle()
+    await ws._live_callbacks["live-1"]({"id": "live-1", "action": action, "result": record})
+    # Let the watcher task consume the notification.
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestReadThrough:
+    async def test_second_get_is_served_from_cache(self) -> None:
+        client, ws = _client(), _ws()
+        p_client, p_ws = _patch_clients(client, ws)
+        with p_client, p_ws:
+            await Product.objects().get("lamp")  # cached, starts the subscription
+            await Product.objects().get("lamp")  # cached
+            cached = await Product.objects().get(id="lamp")
+            await _settle()
+
+        assert client.select.await_count == 1
+        assert cached.name == "Lamp"
+        assert "LIVE SELECT * FROM product" in ws.query.call_args[0][0]
+        assert RecordCache.stats()["subscriptions"] == 1
+
+    async def test_uncached_models_bypass(self) -> None:
+        client, ws = _client(), _ws()
+        client.select.return_value = RecordsResponse(records=[{"id": "review:1", "text": "ok"}], raw=[])
+        p_client, p_ws = _patch_clients(client, ws)
+        with p_client, p_ws:
+            await Review.objects().get("r1")
+            await Review.objects().get("r1")
+
+        assert client.select.await_count == 2
+        ws.query.assert_not_called()
+
+    async def test_cached_copies_are_independent(self) -> None:
+        client, ws = _client(), _ws()
+        p_client, p_ws = _patch_clients(client, ws)
+        with p_client, p_ws:
+            await Product.objects().get("lamp")
+            await Product.objects().get("lamp")
+            first = await Product.objects().get("lamp")
+            first.name = "Changed"
+            second = await Product.objects().get("lamp")
+
+        assert second.name == "Lamp"
+
+
+class TestInvalidation:
+    async def test_live_notification_evicts_record(self) -> None:
+        client, ws = _client(), _ws()
+        p_client, p_ws = _patch_clients(client, ws)
+        with p_client, p_ws:
+            await Product.objects().get("lamp")
+            await Product.objects().get("lamp")
+            await _notify(ws, "UPDATE", {"id": "product:lamp", "name": "Lamp", "price": 25.0})
+            await Product.objects().get("lamp")
+
+        assert client.select.await_count == 2
+
+    async def test_notification_for_other_record_keeps_entry(self) -> None:
+        client, ws = _client(), _ws()
+        p_client, p_ws = _patch_clients(client, ws)
+        with p_client, p_ws:
+            await Product.objects().get("lamp")
+            await Product.objects().get("lamp")
+            await _notify(ws, "DELETE", {"id": "product:chair"})
+            await Product.objects().get("lamp")
+
+        assert client.select.await_count == 1
+
+    async def test_local_save_evicts_record(self) -> None:
+        client, ws = _client(), _ws()
+        p_client, p_ws = _patch_clients(client, ws)
+        with p_client, p_ws:
+            await Product.objects().get("lamp")
+            lamp = await Product.objects().get("lamp")
+            lamp.price = 30.0
+            await lamp.save()
+            await Product.objects().get("lamp")
+
+        assert client.select.await_count == 2
+
+    async def test_without_websocket_falls_back_to_ttl(self) -> None:
+        client = _client()
+        p_client, p_ws = _patch_clients(client, ConnectionError("no ws"))
+        with p_client, p_ws:
+            await Product.objects().get("lamp")
+            await Product.objects().get("lamp")
+
+        assert client.select.await_count == 1
+        assert RecordCache.stats()["subscriptions"] == 0
+
+    async def test_first_get_does_not_wait_for_subscription(self) -> None:
+        client, ws = _client(), _ws()
+        started = asyncio.Event()
+
+        async def slow_ws(*args: Any) -> MagicMock:
+            await started.wait()
+            return ws
+
+        p_client, _ = _patch_clients(client, ws)
+        p_ws = patch("src.surreal_orm.connection_manager.SurrealDBConnectionManager.get_ws_client", slow_ws)
+        with p_client, p_ws:
+            await asyncio.wait_for(Product.objects().get("lamp"), timeout=1)
+            await Product.objects().get("lamp")
+            started.set()
+            await _settle()
+
+        assert client.select.await_count == 1
+        assert RecordCache.stats()["subscriptions"] == 1
+
+    async def test_failed_subscription_is_retried(self) -> None:
+        client, ws = _client(), _ws()
+        get_ws = AsyncMock(side_effect=[ConnectionError("down"), ConnectionError("down"), ws])
+        p_client, _ = _patch_clients(client, ws)
+        with (
+            p_client,
+            patch("src.surreal_orm.connection_manager.SurrealDBConnectionManager.get_ws_client", get_ws),
+            patch("src.surreal_orm.record_cache._RETRY_INITIAL", 0.001),
+        ):
+            await Product.objects().get("lamp")
+            for _ in range(50):
+                if RecordCache.stats()["subscriptions"]:
+                    break
+                await asyncio.sleep(0.005)
+
+        assert get_ws.await_count == 3
+        assert RecordCache.stats()["subscriptions"] == 1
+
+    async def test_manual_invalidate(self) -> None:
+        RecordCache.configure(enabled=True, models=[Product], live_invalidation=False)
+        await RecordCache.set(Product, "lamp", dict(LAMP))
+        assert RecordCache.get(Product, "lamp") == LAMP
+        assert RecordCache.invalidate(Product) == 1
+        assert RecordCache.get(Product, "lamp") is None
@@ -0,0 +1,167 @@
+"""Unit tests for the ``returning=`` option of mutations."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict, SurrealDbError
+from src.surreal_orm.utils import return_clause
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Doc(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="doc")
+    id: str | None = None
+    title: str
+    views: int = 0
+    updated_at: str | None = None
+
+
+def _ok(*results: Any) -> QueryResponse:
+    return QueryResponse(
+        results=[QueryResult(status=ResponseStatus.OK, result=r, time="1ms") for r in results],
+        raw=[],
+    )
+
+
+def _client(response: QueryResponse) -> AsyncMock:
+    client = AsyncMock()
+    client.query = AsyncMock(return_value=response)
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.connection_manager.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+class TestReturnClause:
+    @pytest.mark.parametrize(
+        ("returning", "clause"),
+        [("none", "RETURN NONE"), ("count", "RETURN id"), ("diff", "RETURN DIFF"), (["id", "title"], "RETURN id, title")],
+    )
+    def test_modes(self, returning: Any, clause: str) -> None:
+        assert return_clause(returning) == clause
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="returning mode"):
+            return_clause("everything")
+        with pytest.raises(ValueError, match="returning field"):
+            return_clause(["title; DELETE doc"])
+
+
+class TestBulkOperations:
+    async def test_bulk_delete_counts_on_server(self) -> None:
+        client = _client(_ok(1_000_000))
+        with _patch_client(client):
+            deleted = await Doc.objects().filter(views=0).bulk_delete()
+
+        assert deleted == 1_000_000
+        assert client.query.call_args[0][0] == "RETURN array::len((DELETE FROM doc WHERE views = $_f0 RETURN VALUE id));"
+
+    async def test_atomic_bulk_update_is_one_request(self) -> None:
+        client = _client(_ok(None, 3, None))
+        with _patch_client(client):
+            updated = await Doc.objects().filter(views=0).bulk_update({"title": "x"}, atomic=True)
+
+        assert updated == 3
+        client.query.assert_awaited_once()
+        sql = client.query.call_args[0][0]
+        assert sql.startswith("BEGIN TRANSACTION; RETURN array::len((UPDATE doc SET title = $_bu0")
+        assert sql.endswith("COMMIT TRANSACTION;")
+
+    async def test_atomic_result_without_transaction_results(self) -> None:
+        client = _client(_ok(3))
+        with _patch_client(client):
+            assert await Doc.objects().bulk_update({"title": "x"}, atomic=True) == 3
+
+    async def test_unexpected_result_count_raises(self) -> None:
+        client = _client(_ok(3, 4))
+        with _patch_client(client):
+            with pytest.raises(SurrealDbError, match="Expected 1 statement result"):
+                await Doc.objects().bulk_delete()
+
+    async def test_bulk_update_returning_none(self) -> None:
+        client = _client(_ok([]))
+        with _patch_client(client):
+            assert await Doc.objects().bulk_update({"views": 1}, returning="none") is None
+
+        assert client.query.call_args[0][0] == "UPDATE doc SET views = $_bu0 RETURN NONE;"
+
+    async def test_bulk_update_returning_fields(self) -> None:
+        client = _client(_ok([{"id": "doc:a"}, {"id": "doc:b"}]))
+        with _patch_client(client):
+            records = await Doc.objects().bulk_update({"views": 1}, returning=["id"])
+
+        assert records == [{"id": "doc:a"}, {"id": "doc:b"}]
+        assert client.query.call_args[0][0].endswith("RETURN id;")
+
+    async def test_error_is_raised(self) -> None:
+        client = _client(QueryResponse(results=[QueryResult(status=ResponseStatus.ERR, result="denied")], raw=[]))
+        with _patch_client(client):
+            with pytest.raises(SurrealDbError, match="denied"):
+                await Doc.objects().bulk_delete()
+
+    async def test_upsert_returning_none(self) -> None:
+        client = _client(_ok([]))
+        with _patch_client(client):
+            result = await Doc.objects().upsert({"title": "x"}, id="doc:a", returning="none")
+
+        assert result is None
+        assert client.query.call_args[0][0] == "UPSERT doc:a SET title = $_up_title RETURN NONE;"
+
+
+class TestSingleRecord:
+    async def test_save_returning_fields_applies_them(self) -> None:
+        client = _client(_ok([{"id": "doc:a", "updated_at": "now"}]))
+        doc = Doc.from_db({"id": "doc:a", "title": "Old"})
+        doc.title = "New"
+        with _patch_client(client):
+            await doc.save(returning=["updated_at"])
+
+        assert client.query.call_args[0][0] == "UPDATE doc:a SET title = $_sv_title RETURN updated_at;"
+        assert doc.updated_at == "now"
+        assert not doc.is_dirty()
+
+    async def test_create_without_id_still_gets_id(self) -> None:
+        client = _client(_ok([{"id": "doc:gen"}]))
+        doc = Doc(title="Fresh")
+        with _patch_client(client):
+            await doc.save(returning="none")
+
+        assert client.query.call_args[0][0].endswith("RETURN id;")
+        assert doc.get_id() == "gen"
+
+    async def test_save_returning_none_skips_guard(self) -> None:
+        client = _client(_ok([]))
+        doc = Doc.from_db({"id": "doc:a", "title": "Old"})
+        doc.title = "New"
+        with _patch_client(client):
+            await doc.save(returning="none")
+
+        assert client.query.call_args[0][0].endswith("RETURN NONE;")
+
+    async def test_merge_returning_after_replaces_refresh(self) -> None:
+        client = _client(_ok([{"id": "doc:a", "title": "T", "views": 7}]))
+        doc = Doc.from_db({"id": "doc:a", "title": "T"})
+        with _patch_client(client):
+            await doc.merge(returning="after", views=7)
+
+        client.query.assert_awaited_once()
+        assert client.query.call_args[0][0] == "UPDATE doc:a SET views = $_sv_views RETURN AFTER;"
+        assert doc.views == 7
+
+    async def test_merge_returning_diff_sets_values_locally(self) -> None:
+        client = _client(_ok([[{"op": "replace", "path": "/views", "value": 2}]]))
+        doc = Doc.from_db({"id": "doc:a", "title": "T"})
+        with _patch_client(client):
+            await doc.merge(returning="diff", views=2)
+
+        client.query.assert_awaited_once()
+        assert doc.views == 2
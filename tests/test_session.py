@@ -0,0 +1,262 @@
+"""Unit tests for the Session unit of work."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.surreal_orm import signals
+from src.surreal_orm.model_base import BaseSurrealModel, SurrealConfigDict, SurrealDbError
+from src.surreal_orm.session import Session
+from src.surreal_orm.surreal_function import SurrealFunc
+from src.surreal_sdk.types import QueryResponse, QueryResult, ResponseStatus
+
+
+class Item(BaseSurrealModel):
+    model_config = SurrealConfigDict(table_name="item", server_fields=["created_at"])
+    id: str | None = None
+    name: str
+    qty: int = 0
+    created_at: str | None = None
+
+
+def _ok(result: Any) -> QueryResult:
+    return QueryResult(status=ResponseStatus.OK, result=result, time="1ms")
+
+
+def _err(message: str) -> QueryResult:
+    return QueryResult(status=ResponseStatus.ERR, result=message, time="1ms")
+
+
+def _client(*results: QueryResult) -> AsyncMock:
+    client = AsyncMock()
+    client.query = AsyncMock(return_value=QueryResponse(results=list(results), raw=[]))
+    return client
+
+
+def _patch_client(client: AsyncMock) -> Any:
+    return patch(
+        "src.surreal_orm.session.SurrealDBConnectionManager.get_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+def _loaded(record_id: str, qty: int = 1) -> Item:
+    item = Item.from_db({"id": f"item:{record_id}", "name": record_id, "qty": qty, "created_at": "t0"})
+    assert isinstance(item, Item)
+    return item
+
+
+class TestFlush:
+    async def test_one_transactional_request(self) -> None:
+        new = Item(name="new", qty=2)
+        changed = _loaded("a")
+        changed.qty = 5
+        gone = _loaded("b")
+        client = _client(
+            _ok([{"id": "item:xyz", "name": "new", "qty": 2, "created_at": "t1"}]),
+            _ok([{"id": "item:a", "name": "a", "qty": 5, "created_at": "t0"}]),
+            _ok([{"id": "item:b", "name": "b", "qty": 1}]),
+        )
+        with _patch_client(client):
+            async with Session() as session:
+                session.add(new)
+                session.add(changed)
+                session.delete(gone)
+                assert session.pending == 3
+
+        client.query.assert_awaited_once()
+        sql, variables = client.query.call_args[0]
+        assert sql.splitlines() == [
+            "BEGIN TRANSACTION;",
+            "CREATE item SET name = $_s0__sv_name, qty = $_s0__sv_qty;",
+            "UPDATE item:a SET qty = $_s1__sv_qty;",
+            "DELETE item:b RETURN BEFORE;",
+            "COMMIT TRANSACTION;",
+        ]
+        assert variables == {"_s0__sv_name": "new", "_s0__sv_qty": 2, "_s1__sv_qty": 5}
+        assert new.id == "xyz"
+        assert new.created_at == "t1"
+        assert not new.is_dirty()
+
+    async def test_non_transactional(self) -> None:
+        client = _client(_ok([{"id": "item:a", "name": "a"}]))
+        with _patch_client(client):
+            async with Session(transactional=False) as session:
+                session.add(Item(id="a", name="a"))
+
+        sql = client.query.call_args[0][0]
+        assert sql == "UPSERT item:a SET name = $_s0__sv_name;"
+
+    async def test_unchanged_instances_are_skipped(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            async with Session() as session:
+                session.add(_loaded("a"))
+
+        client.query.assert_not_called()
+
+    async def test_same_instance_added_once(self) -> None:
+        item = Item(name="x")
+        session = Session()
+        session.add(item)
+        session.add(item)
+        assert session.pending == 1
+
+    async def test_merge_with_server_function(self) -> None:
+        item = _loaded("a")
+        client = _client(_ok([{"id": "item:a", "name": "renamed", "qty": 1}]))
+        with _patch_client(client):
+            async with Session() as session:
+                session.merge(item, name="renamed", touched=SurrealFunc("time::now()"))
+
+        sql = client.query.call_args[0][0]
+        assert "UPDATE item:a SET name = $_s0__sv_name, touched = time::now();" in sql
+        assert item.name == "renamed"
+
+    async def test_exception_discards_pending(self) -> None:
+        client = _client()
+        with _patch_client(client):
+            with pytest.raises(RuntimeError):
+                async with Session() as session:
+                    session.add(Item(name="x"))
+                    raise RuntimeError("boom")
+
+        client.query.assert_not_called()
+        assert session.pending == 0
+
+    async def test_begin_commit_results_are_skipped(self) -> None:
+        item = Item(name="x")
+        client = _client(_ok(None), _ok([{"id": "item:1", "name": "x"}]), _ok(None))
+        with _patch_client(client):
+            async with Session() as session:
+                session.add(item)
+
+        assert item.id == "1"
+
+
+class TestErrors:
+    async def test_result_count_mismatch_raises(self) -> None:
+        client = _client(_ok(None), _ok([{"id": "item:1", "name": "x"}]))
+        with _patch_client(client):
+            with pytest.raises(SurrealDbError, match="Expected 1 statement result"):
+                async with Session() as session:
+                    session.add(Item(name="x"))
+
+    async def test_failed_statement_raises_root_cause(self) -> None:
+        client = _client(
+            _err("The query was not executed due to a failed transaction"),
+            _err("Found 'x' for field `qty`, but expected a int"),
+        )
+        with _patch_client(client):
+            with pytest.raises(SurrealDbError, match=r"Session flush failed: item:b: Found 'x'"):
+                async with Session() as session:
+                    fine = _loaded("a")
+                    fine.qty = 2
+                    session.add(fine)
+                    broken = _loaded("b")
+                    broken.qty = 3
+                    session.add(broken)
+
+    async def test_update_without_record_raises(self) -> None:
+        item = _loaded("a")
+        item.qty = 9
+        client = _client(_ok([]))
+        with _patch_client(client):
+            with pytest.raises(SurrealDbError, match="no record"):
+                async with Session() as session:
+                    session.add(item)
+
+    async def test_delete_missing_record_raises(self) -> None:
+        client = _client(_ok([]))
+        with _patch_client(client):
+            with pytest.raises(SurrealDbError, match="not found"):
+                async with Session() as session:
+                    session.delete(_loaded("a"))
+
+    def test_delete_requires_id(self) -> None:
+        with pytest.raises(SurrealDbError):
+            Session().delete(Item(name="x"))
+
+
+class TestSignals:
+    async def test_signals_wrap_the_flush(self) -> None:
+        events: list[str] = []
+
+        async def pre(sender: Any, instance: Item, **kwargs: Any) -> None:
+            events.append(f"pre:{instance.name}")
+
+        async def around(sender: Any, instance: Item, **kwargs: Any) -> AsyncIterator[None]:
+            events.append(f"before:{instance.name}")
+            yield
+            events.append(f"after:{instance.name}")
+
+        async def post(sender: Any, instance: Item, created: bool, **kwargs: Any) -> None:
+            events.append(f"post:{instance.name}:{created}")
+
+        signals.pre_save.connect(Item)(pre)
+        signals.around_save.connect(Item)(around)
+        signals.post_save.connect(Item)(post)
+        client = _client(_ok([{"id": "item:1", "name": "a"}]), _ok([{"id": "item:2", "name": "b"}]))
+        try:
+            with _patch_client(client):
+                async with Session() as session:
+                    session.add(Item(name="a"))
+                    session.add(Item(name="b"))
+        finally:
+            signals.pre_save.disconnect(pre, Item)
+            signals.around_save.disconnect(around, Item)
+            signals.post_save.disconnect(post, Item)
+
+        assert events == [
+            "pre:a",
+            "pre:b",
+            "before:a",
+            "before:b",
+            "after:b",
+            "after:a",
+            "post:a:True",
+            "post:b:True",
+        ]
+
+    async def test_failed_flush_signals_applied_writes(self) -> None:
+        posted: list[str] = []
+
+        async def post(sender: Any, instance: Item, **kwargs: Any) -> None:
+            posted.append(instance.name)
+
+        signals.post_save.connect(Item)(post)
+        client = _client(_ok([{"id": "item:a", "name": "a", "qty": 2}]), _err("boom"))
+        try:
+            with _patch_client(client):
+                with pytest.raises(SurrealDbError, match="boom"):
+                    async with Session(transactional=False) as session:
+                        session.add(Item(id="a", name="a", qty=2))
+                        session.add(Item(id="b", name="b", qty=3))
+        finally:
+            signals.post_save.disconnect(post, Item)
+
+        assert posted == ["a"]
+
+    async def test_failed_transaction_sends_no_post_signals(self) -> None:
+        posted: list[str] = []
+
+        async def post(sender: Any, instance: Item, **kwargs: Any) -> None:
+            posted.append(instance.name)
+
+        signals.post_save.connect(Item)(post)
+        client = _client(_err("The query was not executed due to a failed transaction"), _err("boom"))
+        try:
+            with _patch_client(client):
+                with pytest.raises(SurrealDbError, match="boom"):
+                    async with Session() as session:
+                        session.add(Item(id="a", name="a"))
+                        session.add(Item(id="b", name="b"))
+        finally:
+            signals.post_save.disconnect(post, Item)
+
+        assert posted == []